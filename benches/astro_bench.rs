@@ -217,6 +217,49 @@ fn bench_astro_wrappers(c: &mut Criterion) {
     group.bench_function(BenchmarkId::new("get_earth_obstruction_angles", "teme"), |b| {
         b.iter(|| saal::astro::get_earth_obstruction_angles(black_box(&teme_pos), black_box(&teme_pos)));
     });
+    let sensor_positions: Vec<[f64; 3]> = (0..10)
+        .map(|i| {
+            let angle = i as f64 * 0.6;
+            [6378.0 * angle.cos(), 6378.0 * angle.sin(), 0.0]
+        })
+        .collect();
+    let sat_positions: Vec<[f64; 3]> = (0..1000)
+        .map(|i| {
+            let angle = i as f64 * 0.0063;
+            [7000.0 * angle.cos(), 7000.0 * angle.sin(), 500.0 * (3.0 * angle).sin()]
+        })
+        .collect();
+    group.bench_function(BenchmarkId::new("get_earth_obstruction_angles_batch", "10x1000"), |b| {
+        b.iter(|| saal::astro::get_earth_obstruction_angles_batch(black_box(&sensor_positions), &sat_positions));
+    });
+    group.bench_function(BenchmarkId::new("get_earth_obstruction_angles_loop", "10x1000"), |b| {
+        b.iter(|| {
+            black_box(&sensor_positions)
+                .iter()
+                .flat_map(|sensor| {
+                    sat_positions
+                        .iter()
+                        .map(move |sat| saal::astro::get_earth_obstruction_angles(sat, sensor))
+                })
+                .collect::<Vec<_>>()
+        });
+    });
+    group.bench_function(BenchmarkId::new("get_line_of_sight_matrix", "10x1000"), |b| {
+        b.iter(|| saal::astro::get_line_of_sight_matrix(black_box(&sensor_positions), &sat_positions, 0.0));
+    });
+    group.bench_function(BenchmarkId::new("get_line_of_sight_matrix", "1000x1000"), |b| {
+        b.iter(|| saal::astro::get_line_of_sight_matrix(black_box(&sat_positions), &sat_positions, 0.0));
+    });
+    let keps = vec![kep; 1000];
+    group.bench_function(BenchmarkId::new("keplerian_to_cartesian_batch", "n=1000"), |b| {
+        b.iter(|| saal::astro::keplerian_to_cartesian_batch(black_box(&keps)));
+    });
+    if saal::astro::load_sun_moon_cache(ds50_utc, ds50_utc + 10.0, 1.0).is_ok() {
+        group.bench_function(BenchmarkId::new("get_cached_sun_and_moon_position", "ds50=8431"), |b| {
+            b.iter(|| saal::astro::get_cached_sun_and_moon_position(black_box(ds50_utc + 0.3)));
+        });
+        saal::astro::clear_sun_moon_cache();
+    }
 
     group.finish();
 }
@@ -1,5 +1,5 @@
-use criterion::{BenchmarkId, Criterion, black_box, criterion_group, criterion_main};
-use saal::obs::ParsedB3;
+use criterion::{BenchmarkId, Criterion, Throughput, black_box, criterion_group, criterion_main};
+use saal::obs::{ObsConverter, ParsedB3};
 
 const B3_CARD: &str = "U0001151013352142520112J85202 2220398         -01207880+03706326+05814970 9 4  10001100011";
 
@@ -41,9 +41,68 @@ fn bench_obs_wrappers(c: &mut Criterion) {
         let parsed = base_parsed_b3(saal::obs::EQUINOX_OBSYEAR);
         b.iter(|| parsed.get_line());
     });
+    group.bench_function(BenchmarkId::new("b3_to_csv", "card"), |b| {
+        let mut converter = ObsConverter::new();
+        b.iter(|| converter.b3_to_csv(black_box(B3_CARD)));
+    });
+
+    group.finish();
+}
+
+fn bench_obs_simulate(c: &mut Criterion) {
+    let mut group = c.benchmark_group("obs_simulate");
+
+    let epoch = 27757.54791667;
+    saal::sensor::load_file("tests/data/sensors.dat").expect("load_file failed");
+    saal::sensor::prune_missing_locations().expect("prune_missing_locations failed");
+    let sen_keys = saal::sensor::get_keys(saal::IDX_ORDER_READ);
+    let sat_keys: Vec<i64> = (0..20)
+        .map(|i| {
+            let line_1 = format!(
+                "1 {:05}U 15058A   25363.54791667 +.00012345  10000-1  20000-1 4  900",
+                33300 + i
+            );
+            let line_2 = format!(
+                "2 {:05}  30.0000 {:>8.4} 0005000  60.0000  70.0000  8.2345678012345",
+                33300 + i,
+                18.0 * i as f64
+            );
+            let sat_key = saal::tle::load_lines(&line_1, &line_2);
+            saal::sgp4::load(sat_key).expect("sgp4 load failed");
+            sat_key
+        })
+        .collect();
+    let output_path = std::env::temp_dir().join(format!("obs_bench_simulate_{}.b3", std::process::id()));
+    let output_path = output_path.to_str().expect("temp path is not UTF-8");
+
+    let count = saal::obs::simulate(&sat_keys, &sen_keys, epoch, epoch + 1.0, 60.0, 2, Some(42))
+        .expect("simulate failed")
+        .len();
+    group.throughput(Throughput::Elements(count as u64));
+    group.bench_function(BenchmarkId::new("simulate", "1 day"), |b| {
+        b.iter(|| saal::obs::simulate(black_box(&sat_keys), &sen_keys, epoch, epoch + 1.0, 60.0, 2, Some(42)));
+    });
+    group.bench_function(BenchmarkId::new("simulate_to_file", "1 day"), |b| {
+        b.iter(|| {
+            saal::obs::simulate_to_file(
+                black_box(&sat_keys),
+                &sen_keys,
+                epoch,
+                epoch + 1.0,
+                60.0,
+                2,
+                output_path,
+                Some(42),
+            )
+        });
+    });
 
     group.finish();
+    let _ = std::fs::remove_file(output_path);
+    let _ = saal::sgp4::clear();
+    let _ = saal::tle::clear();
+    let _ = saal::sensor::clear();
 }
 
-criterion_group!(benches, bench_obs_wrappers);
+criterion_group!(benches, bench_obs_wrappers, bench_obs_simulate);
 criterion_main!(benches);
@@ -0,0 +1,106 @@
+//! Rust side of the scaling suite driven by `benchmarks/scaling.py`.
+//!
+//! Each invocation runs one case against files synthesised by the driver and prints one JSON object with the
+//! per-phase item counts and wall-clock seconds; the driver measures peak RSS of the process itself.
+//!
+//! ```bash
+//! scaling_bench catalog <tle_file> <start_ds50_utc> <stop_ds50_utc> <step_minutes>
+//! scaling_bench obs <b3_file>
+//! ```
+use std::env;
+use std::process::ExitCode;
+use std::time::Instant;
+
+struct Phase {
+    name: &'static str,
+    items: usize,
+    errors: usize,
+    seconds: f64,
+}
+
+fn timed_phase(name: &'static str, f: impl FnOnce() -> Result<(usize, usize), String>) -> Result<Phase, String> {
+    let started = Instant::now();
+    let (items, errors) = f()?;
+    Ok(Phase {
+        name,
+        items,
+        errors,
+        seconds: started.elapsed().as_secs_f64(),
+    })
+}
+
+fn run_catalog(tle_file: &str, start: f64, stop: f64, step: f64) -> Result<Vec<Phase>, String> {
+    let load = timed_phase("tle_load", || {
+        let count = saal::tle::load_file(tle_file)?;
+        Ok((count as usize, 0))
+    })?;
+    let keys = saal::tle::get_keys(saal::IDX_ORDER_READ);
+    let init = timed_phase("sgp4_load", || {
+        let errors = keys.iter().filter(|&&key| saal::sgp4::load(key).is_err()).count();
+        Ok((keys.len(), errors))
+    })?;
+    let ephemeris = timed_phase("ephemeris", || {
+        let (mut states, mut errors) = (0, 0);
+        for &key in &keys {
+            match saal::sgp4::get_ephemeris(key, start, stop, step, saal::sgp4::SGP4_EPHEM_ECI) {
+                Ok(ephem) => states += ephem.len() / 7,
+                Err(_) => errors += 1,
+            }
+        }
+        Ok((states, errors))
+    })?;
+    Ok(vec![load, init, ephemeris])
+}
+
+fn run_obs(b3_file: &str) -> Result<Vec<Phase>, String> {
+    let load = timed_phase("obs_load", || {
+        saal::obs::load_file(b3_file)?;
+        Ok((saal::obs::get_count() as usize, 0))
+    })?;
+    let parse = timed_phase("obs_parse", || Ok((saal::obs::parse_all()?.len(), 0)))?;
+    Ok(vec![load, parse])
+}
+
+fn parse_f64(value: &str) -> Result<f64, String> {
+    value.parse().map_err(|_| format!("Expected a number, got '{}'", value))
+}
+
+fn run(args: &[String]) -> Option<Result<Vec<Phase>, String>> {
+    match args {
+        [case, tle_file, start, stop, step] if case == "catalog" => Some(
+            parse_f64(start)
+                .and_then(|start| Ok((start, parse_f64(stop)?, parse_f64(step)?)))
+                .and_then(|(start, stop, step)| run_catalog(tle_file, start, stop, step)),
+        ),
+        [case, b3_file] if case == "obs" => Some(run_obs(b3_file)),
+        _ => None,
+    }
+}
+
+fn main() -> ExitCode {
+    // `cargo bench` passes `--bench`; cases only come from the driver.
+    let args: Vec<String> = env::args().skip(1).filter(|arg| arg != "--bench").collect();
+    let Some(result) = run(&args) else {
+        println!("scaling_bench: run the scaling suite with `python benchmarks/scaling.py --paths rust`");
+        return ExitCode::SUCCESS;
+    };
+    match result {
+        Ok(phases) => {
+            let phases: Vec<String> = phases
+                .iter()
+                .map(|phase| {
+                    format!(
+                        "{{\"name\": \"{}\", \"items\": {}, \"errors\": {}, \"seconds\": {}}}",
+                        phase.name, phase.items, phase.errors, phase.seconds
+                    )
+                })
+                .collect();
+            println!("{{\"phases\": [{}]}}", phases.join(", "));
+            ExitCode::SUCCESS
+        }
+        Err(e) => {
+            eprintln!("scaling_bench: {}", e);
+            ExitCode::FAILURE
+        }
+    }
+}
@@ -0,0 +1,113 @@
+use criterion::{BenchmarkId, Criterion, black_box, criterion_group, criterion_main};
+use saal::GetSetString;
+
+const LINE_1: &str = "1 11111U 98067A   25363.54791667 +.00012345  10000-1  20000-1 0 0900";
+const LINE_2: &str = "2 11111  30.0000  40.0000 0005000  60.0000  70.0000  1.2345678012345";
+const B3_CARD: &str = "U0001151013352142520112J85202 2220398         -01207880+03706326+05814970 9 4  10001100011";
+
+// Marshalling as done before the pooled buffers: fresh heap buffers per call and a copy before trimming.
+fn allocating_get_lines(sat_key: i64) -> (String, String) {
+    let mut line_1 = GetSetString::new();
+    let mut line_2 = GetSetString::new();
+    unsafe { saal::tle::TleGetLines(sat_key, line_1.pointer(), line_2.pointer()) };
+    (line_1.value().trim().to_string(), line_2.value().trim().to_string())
+}
+
+fn allocating_ds50_to_dtg20(ds50: f64) -> String {
+    let mut inout = GetSetString::new();
+    unsafe { saal::time::UTCToDTG20(ds50, inout.pointer()) };
+    inout.value()
+}
+
+fn read_obs_strings(obs_key: i64, sec_char: &mut GetSetString, obs_type: &mut GetSetString) -> (String, String) {
+    let (mut sat_num, mut sen_num, mut track_ind, mut astat, mut site_tag, mut spadoc_tag) = (0, 0, 0, 0, 0, 0);
+    let mut values = [0.0; 8];
+    let (mut pos, mut vel, mut ext) = ([0.0; 3], [0.0; 3], [0.0; 128]);
+    let [
+        epoch,
+        el_or_dec,
+        az_or_ra,
+        range,
+        range_rate,
+        el_rate,
+        az_rate,
+        range_accel,
+    ] = &mut values;
+    unsafe {
+        saal::obs::ObsGetAllFields(
+            obs_key,
+            sec_char.pointer(),
+            &mut sat_num,
+            &mut sen_num,
+            epoch,
+            el_or_dec,
+            az_or_ra,
+            range,
+            range_rate,
+            el_rate,
+            az_rate,
+            range_accel,
+            obs_type.pointer(),
+            &mut track_ind,
+            &mut astat,
+            &mut site_tag,
+            &mut spadoc_tag,
+            &mut pos,
+            &mut vel,
+            &mut ext,
+        )
+    };
+    (sec_char.as_str().trim().to_string(), obs_type.as_str().into_owned())
+}
+
+fn bench_string_marshalling(c: &mut Criterion) {
+    let mut group = c.benchmark_group("strings");
+
+    let sat_key = saal::tle::load_lines(LINE_1, LINE_2);
+    assert!(sat_key > 0, "load_lines failed");
+    assert_eq!(
+        saal::tle::get_lines(sat_key).expect("get_lines failed"),
+        allocating_get_lines(sat_key)
+    );
+    group.bench_function(BenchmarkId::new("get_lines", "allocating"), |b| {
+        b.iter(|| allocating_get_lines(black_box(sat_key)));
+    });
+    group.bench_function(BenchmarkId::new("get_lines", "pooled"), |b| {
+        b.iter(|| saal::tle::get_lines(black_box(sat_key)));
+    });
+    group.bench_function(BenchmarkId::new("get_lines", "borrowed"), |b| {
+        b.iter(|| saal::tle::with_lines(black_box(sat_key), |line_1, line_2| line_1.len() + line_2.len()));
+    });
+    saal::tle::remove(sat_key);
+
+    let ds50 = 27757.54791667;
+    assert_eq!(saal::time::ds50_to_dtg20(ds50), allocating_ds50_to_dtg20(ds50));
+    group.bench_function(BenchmarkId::new("ds50_to_dtg20", "allocating"), |b| {
+        b.iter(|| allocating_ds50_to_dtg20(black_box(ds50)));
+    });
+    group.bench_function(BenchmarkId::new("ds50_to_dtg20", "pooled"), |b| {
+        b.iter(|| saal::time::ds50_to_dtg20(black_box(ds50)));
+    });
+
+    let obs_key = saal::with_str(B3_CARD, |card| unsafe { saal::obs::ObsAddFrB3Card(card.pointer()) });
+    assert!(obs_key > 0, "ObsAddFrB3Card failed");
+    group.bench_function(BenchmarkId::new("parse_key fields", "allocating"), |b| {
+        b.iter(|| read_obs_strings(black_box(obs_key), &mut GetSetString::new(), &mut GetSetString::new()));
+    });
+    group.bench_function(BenchmarkId::new("parse_key fields", "pooled"), |b| {
+        b.iter(|| {
+            saal::with_buffers(|[sec_char, obs_type]: &mut [GetSetString; 2]| {
+                read_obs_strings(black_box(obs_key), sec_char, obs_type)
+            })
+        });
+    });
+    group.bench_function(BenchmarkId::new("parse_key", "pooled"), |b| {
+        b.iter(|| saal::obs::parse_key(black_box(obs_key)));
+    });
+    saal::obs::remove(obs_key);
+
+    group.finish();
+}
+
+criterion_group!(benches, bench_string_marshalling);
+criterion_main!(benches);
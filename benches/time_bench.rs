@@ -69,6 +69,43 @@ fn bench_time_wrappers(c: &mut Criterion) {
         b.iter(saal::time::constants_loaded);
     });
 
+    let grid: Vec<f64> = (0..10_000).map(|i| ds50 + i as f64 / 1440.0).collect();
+    group.bench_function(BenchmarkId::new("utc_to_tai", "scalar n=10000"), |b| {
+        b.iter(|| {
+            black_box(&grid)
+                .iter()
+                .map(|&ds50_utc| saal::time::utc_to_tai(ds50_utc))
+                .collect::<Vec<f64>>()
+        });
+    });
+    group.bench_function(BenchmarkId::new("utc_to_tai_batch", "n=10000"), |b| {
+        b.iter(|| saal::time::utc_to_tai_batch(black_box(&grid)));
+    });
+    group.bench_function(BenchmarkId::new("ds50_to_dtg20", "scalar n=10000"), |b| {
+        b.iter(|| {
+            black_box(&grid)
+                .iter()
+                .map(|&ds50_utc| saal::time::ds50_to_dtg20(ds50_utc))
+                .collect::<Vec<String>>()
+        });
+    });
+    group.bench_function(BenchmarkId::new("ds50_to_dtg20_batch", "n=10000"), |b| {
+        b.iter(|| saal::time::ds50_to_dtg20_batch(black_box(&grid)));
+    });
+    let dtg20s = saal::time::ds50_to_dtg20_batch(&grid);
+    group.bench_function(BenchmarkId::new("dtg_to_ds50_batch", "n=10000"), |b| {
+        b.iter(|| saal::time::dtg_to_ds50_batch(black_box(&dtg20s)));
+    });
+    group.bench_function(BenchmarkId::new("get_greenwich_angles", "n=10000"), |b| {
+        b.iter(|| saal::time::get_greenwich_angles(black_box(&grid), None).unwrap());
+    });
+    group.bench_function(BenchmarkId::new("get_cached_greenwich_table", "n=10000"), |b| {
+        b.iter(|| saal::time::get_cached_greenwich_table(black_box(&grid), None).unwrap());
+    });
+    group.bench_function(BenchmarkId::new("ds50_to_ymd_components_batch", "n=10000"), |b| {
+        b.iter(|| saal::time::ds50_to_ymd_components_batch(black_box(&grid)));
+    });
+
     group.finish();
 }
 
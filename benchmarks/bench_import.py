@@ -0,0 +1,39 @@
+from __future__ import annotations
+
+import os
+import statistics
+import subprocess
+import sys
+
+from pytest_benchmark.fixture import BenchmarkFixture
+
+# Median wall time budget for a cold `import pysaal` in a fresh interpreter, interpreter start-up excluded.
+IMPORT_BUDGET_MS = float(os.getenv("PYSAAL_IMPORT_BUDGET_MS", "150"))
+RUNS = 7
+
+_TIMED_IMPORT = "import time; t = time.perf_counter(); import pysaal; print((time.perf_counter() - t) * 1000.0)"
+_TIMED_WARMUP = (
+    "import time; import pysaal; t = time.perf_counter(); pysaal.warmup(); print((time.perf_counter() - t) * 1000.0)"
+)
+
+
+def _import_ms(statement: str = _TIMED_IMPORT) -> float:
+    result = subprocess.run([sys.executable, "-c", statement], check=True, capture_output=True, text=True)
+    return float(result.stdout.strip().splitlines()[-1])
+
+
+def test_bench_import_pysaal(benchmark: BenchmarkFixture) -> None:
+    benchmark.pedantic(_import_ms, rounds=RUNS, iterations=1)
+
+
+def test_import_within_budget() -> None:
+    samples = [_import_ms() for _ in range(RUNS)]
+    median = statistics.median(samples)
+    assert median <= IMPORT_BUDGET_MS, (
+        f"import pysaal took {median:.1f} ms (median of {RUNS}), budget is {IMPORT_BUDGET_MS:.0f} ms; "
+        "check for eager initialisation or heavy imports on the import path"
+    )
+
+
+def test_bench_warmup(benchmark: BenchmarkFixture) -> None:
+    benchmark.pedantic(_import_ms, args=(_TIMED_WARMUP,), rounds=RUNS, iterations=1)
@@ -49,3 +49,7 @@ def test_bench_obs_parse_line(benchmark: BenchmarkFixture, obs_iface: ObsInterfa
 
 def test_bench_obs_get_line(benchmark: BenchmarkFixture, parsed_b3: ParsedB3) -> None:
     benchmark(parsed_b3.get_line)
+
+
+def test_bench_obs_b3_to_csv(benchmark: BenchmarkFixture, obs_iface: ObsInterface) -> None:
+    benchmark(obs_iface.b3_to_csv, B3_CARD)
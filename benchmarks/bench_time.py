@@ -13,6 +13,11 @@ def time_iface() -> TimeInterface:
     return TimeInterface()
 
 
+@pytest.fixture(scope="module")
+def ds50_grid() -> list[float]:
+    return [8431.0 + i / 1440.0 for i in range(10_000)]
+
+
 @pytest.fixture(scope="module")
 def time_constants_path() -> str:
     return str(resources.files("saal").joinpath("assets", "time_constants.dat"))
@@ -104,3 +109,34 @@ def test_bench_time_constants_loaded(benchmark: BenchmarkFixture, time_iface: Ti
 
 def test_bench_time_time_constants_loaded(benchmark: BenchmarkFixture, time_iface: TimeInterface) -> None:
     benchmark(time_iface.time_constants_loaded)
+
+
+def test_bench_time_utc_to_tai_scalar_loop(
+    benchmark: BenchmarkFixture, time_iface: TimeInterface, ds50_grid: list[float]
+) -> None:
+    benchmark(lambda: [time_iface.utc_to_tai(ds50) for ds50 in ds50_grid])
+
+
+def test_bench_time_utc_to_tai_batch(
+    benchmark: BenchmarkFixture, time_iface: TimeInterface, ds50_grid: list[float]
+) -> None:
+    benchmark(time_iface.utc_to_tai_batch, ds50_grid)
+
+
+def test_bench_time_ds50_to_ymd_components_batch(
+    benchmark: BenchmarkFixture, time_iface: TimeInterface, ds50_grid: list[float]
+) -> None:
+    benchmark(time_iface.ds50_to_ymd_components_batch, ds50_grid)
+
+
+def test_bench_time_ds50_to_dtg20_batch(
+    benchmark: BenchmarkFixture, time_iface: TimeInterface, ds50_grid: list[float]
+) -> None:
+    benchmark(time_iface.ds50_to_dtg20_batch, ds50_grid)
+
+
+def test_bench_time_dtg_to_ds50_batch(
+    benchmark: BenchmarkFixture, time_iface: TimeInterface, ds50_grid: list[float]
+) -> None:
+    dtgs = time_iface.ds50_to_dtg20_batch(ds50_grid)
+    benchmark(time_iface.dtg_to_ds50_batch, dtgs)
@@ -0,0 +1,346 @@
+"""Scaling benchmarks for catalog loading, SGP4 propagation, ephemeris generation and B3 parsing.
+
+The suite synthesises deterministic TLE catalogs and B3 observation files, runs every case in a fresh process for the
+Rust (``benches/scaling_bench.rs``) and Python paths, and records throughput per phase plus the peak RSS of each
+process. Results are compared against ``benchmarks/scaling_baseline.json``; a throughput drop or RSS growth beyond the
+baseline's threshold fails the run. Cases without a baseline entry are only reported with a warning, so the suite
+passes until a baseline has been recorded. Everything runs offline once the SAAL assets are in place.
+
+Example:
+    python benchmarks/scaling.py --quick
+    python benchmarks/scaling.py --paths python --sizes 1000,10000 --obs-sizes 100000
+    python benchmarks/scaling.py --update-baseline
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import platform
+import random
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Any, Iterable, Iterator, Optional
+
+ROOT = Path(__file__).resolve().parents[1]
+BASELINE_PATH = Path(__file__).resolve().with_name("scaling_baseline.json")
+B3_TEMPLATES = ROOT / "tests" / "data" / "test-b3-obs.txt"
+
+CATALOG_SIZES = [1_000, 10_000, 50_000]
+OBS_SIZES = [100_000, 1_000_000, 10_000_000]
+SPANS_DAYS = [1.0, 7.0]
+STEPS_MINUTES = [1.0, 10.0]
+DEFAULT_SPAN_DAYS = 1.0
+DEFAULT_STEP_MINUTES = 10.0
+DEFAULT_THRESHOLD = 0.25
+
+# All synthetic elsets share the 2025 day 1 epoch, which is ds50 UTC 27395.0.
+EPOCH_FIELD = "25001.00000000"
+EPOCH_DS50 = 27395.0
+SEED = 20250101
+
+
+def _checksum(line: str) -> int:
+    return sum(int(c) if c.isdigit() else c == "-" for c in line) % 10
+
+
+def _mean_motion(rng: random.Random) -> float:
+    regime = rng.random()
+    if regime < 0.8:
+        return rng.uniform(12.0, 16.0)
+    if regime < 0.9:
+        return rng.uniform(2.0, 6.0)
+    return rng.uniform(0.99, 1.01)
+
+
+def synthesize_tles(count: int, seed: int = SEED) -> Iterator[tuple[str, str]]:
+    """Yield ``count`` deterministic SGP4 elsets spread over LEO, MEO and GEO."""
+    if count > 99_999:
+        raise ValueError("Synthetic catalogs use 5-digit satellite numbers (at most 99999 elsets)")
+    rng = random.Random(seed)
+    for sat_num in range(1, count + 1):
+        b_star = rng.randint(10_000, 99_999)
+        line_1 = f"1 {sat_num:05d}U 25001A   {EPOCH_FIELD}  .00000929  00000+0  {b_star:05d}-4 0  999"
+        line_2 = (
+            f"2 {sat_num:05d} {rng.uniform(0.0, 180.0):8.4f} {rng.uniform(0.0, 360.0):8.4f} "
+            f"{rng.randint(1, 20_000):07d} {rng.uniform(0.0, 360.0):8.4f} {rng.uniform(0.0, 360.0):8.4f} "
+            f"{_mean_motion(rng):11.8f}{rng.randint(0, 99_999):05d}"
+        )
+        yield line_1 + str(_checksum(line_1)), line_2 + str(_checksum(line_2))
+
+
+def synthesize_b3(count: int) -> Iterator[str]:
+    """Yield ``count`` unique B3 cards built by re-numbering the satellites of the test observations."""
+    templates = [line.rstrip("\n") for line in B3_TEMPLATES.read_text().splitlines() if line.strip()]
+    if count > len(templates) * 99_999:
+        raise ValueError(f"At most {len(templates) * 99_999} unique synthetic observations are available")
+    for i in range(count):
+        template = templates[i % len(templates)]
+        yield f"{template[0]}{i // len(templates) + 1:05d}{template[6:]}"
+
+
+def _write_lines(path: Path, lines: Iterable[str]) -> Path:
+    tmp_path = path.with_suffix(path.suffix + ".tmp")
+    with tmp_path.open("w") as file:
+        file.writelines(line + "\n" for line in lines)
+    tmp_path.replace(path)
+    return path
+
+
+def catalog_file(data_dir: Path, count: int) -> Path:
+    path = data_dir / f"catalog-{count}-{SEED}.tle"
+    if not path.exists():
+        _write_lines(path, (line for tle in synthesize_tles(count) for line in tle))
+    return path
+
+
+def obs_file(data_dir: Path, count: int) -> Path:
+    path = data_dir / f"obs-{count}.b3"
+    if not path.exists():
+        _write_lines(path, synthesize_b3(count))
+    return path
+
+
+def _timed_phase(name: str, run: Any) -> dict[str, Any]:
+    started = time.perf_counter()
+    items, errors = run()
+    return {"name": name, "items": items, "errors": errors, "seconds": time.perf_counter() - started}
+
+
+def python_catalog(tle_file: str, start: float, stop: float, step: float) -> list[dict[str, Any]]:
+    from pysaal import MainInterface, SGP4Interface, TLEInterface
+
+    tle_iface = TLEInterface()
+    sgp4_iface = SGP4Interface()
+    load = _timed_phase("tle_load", lambda: (tle_iface.load_file(tle_file), 0))
+    keys = tle_iface.get_keys(MainInterface.IDX_ORDER_READ)
+
+    def init() -> tuple[int, int]:
+        errors = 0
+        for key in keys:
+            try:
+                sgp4_iface.load(key)
+            except RuntimeError:
+                errors += 1
+        return len(keys), errors
+
+    def ephemeris() -> tuple[int, int]:
+        states = errors = 0
+        for key in keys:
+            try:
+                states += len(sgp4_iface.get_ephemeris(key, start, stop, step, SGP4Interface.SGP4_EPHEM_ECI)) // 7
+            except RuntimeError:
+                errors += 1
+        return states, errors
+
+    return [load, _timed_phase("sgp4_load", init), _timed_phase("ephemeris", ephemeris)]
+
+
+def python_obs(b3_file: str) -> list[dict[str, Any]]:
+    from pysaal import ObsInterface
+
+    obs_iface = ObsInterface()
+
+    def load() -> tuple[int, int]:
+        obs_iface.load_file(b3_file)
+        return obs_iface.get_count(), 0
+
+    return [_timed_phase("obs_load", load), _timed_phase("obs_parse", lambda: (len(obs_iface.parse_all()), 0))]
+
+
+def _worker(args: list[str]) -> None:
+    case, *params = args
+    if case == "catalog":
+        phases = python_catalog(params[0], float(params[1]), float(params[2]), float(params[3]))
+    else:
+        phases = python_obs(params[0])
+    print(json.dumps({"phases": phases}))
+
+
+def build_rust_bench() -> str:
+    """Build ``benches/scaling_bench.rs`` in release mode and return the executable path."""
+    output = subprocess.run(
+        ["cargo", "bench", "--bench", "scaling_bench", "--no-run", "--offline", "--message-format=json"],
+        cwd=ROOT,
+        check=True,
+        capture_output=True,
+        text=True,
+    ).stdout
+    for line in output.splitlines():
+        message = json.loads(line)
+        if message.get("reason") == "compiler-artifact" and message["target"]["name"] == "scaling_bench":
+            if message.get("executable"):
+                return str(message["executable"])
+    raise RuntimeError("cargo did not report a scaling_bench executable")
+
+
+def run_case(command: list[str]) -> tuple[list[dict[str, Any]], float]:
+    """Run one case in a child process and return its phases and peak RSS in MiB."""
+    proc = subprocess.Popen(command, cwd=ROOT, stdout=subprocess.PIPE, text=True)
+    assert proc.stdout is not None
+    stdout = proc.stdout.read()
+    _, status, usage = os.wait4(proc.pid, 0)
+    proc.returncode = os.waitstatus_to_exitcode(status)
+    if proc.returncode != 0:
+        raise RuntimeError(f"{' '.join(command)} exited with {proc.returncode}")
+    # ru_maxrss is reported in KiB on Linux.
+    return json.loads(stdout.strip().splitlines()[-1])["phases"], usage.ru_maxrss / 1024.0
+
+
+def _format_float(value: float) -> str:
+    return f"{value:g}"
+
+
+def cases(sizes: list[int], obs_sizes: list[int], spans: list[float], steps: list[float]) -> list[tuple[str, dict]]:
+    """Catalog-size sweep at the default span/step, span/step sweep on the smallest catalog, then the obs sweep."""
+    catalog_params = [(size, DEFAULT_SPAN_DAYS, DEFAULT_STEP_MINUTES) for size in sizes]
+    catalog_params += [(min(sizes), span, step) for span in spans for step in steps]
+    result = []
+    for size, span, step in dict.fromkeys(catalog_params):
+        result.append(("catalog", {"n": size, "span": span, "step": step}))
+    result += [("obs", {"n": size}) for size in obs_sizes]
+    return result
+
+
+def _case_label(case: str, params: dict) -> str:
+    if case == "catalog":
+        return f"n={params['n']},span={_format_float(params['span'])}d,step={_format_float(params['step'])}m"
+    return f"n={params['n']}"
+
+
+def run_suite(
+    paths: list[str],
+    sizes: list[int],
+    obs_sizes: list[int],
+    spans: list[float],
+    steps: list[float],
+    data_dir: Path,
+    rust_bin: Optional[str],
+) -> dict[str, dict[str, float]]:
+    if "rust" in paths and rust_bin is None:
+        rust_bin = build_rust_bench()
+    results: dict[str, dict[str, float]] = {}
+    for case, params in cases(sizes, obs_sizes, spans, steps):
+        if case == "catalog":
+            start = EPOCH_DS50
+            args = [
+                "catalog",
+                str(catalog_file(data_dir, params["n"])),
+                repr(start),
+                repr(start + params["span"]),
+                repr(params["step"]),
+            ]
+        else:
+            args = ["obs", str(obs_file(data_dir, params["n"]))]
+        for path in paths:
+            command = [str(rust_bin), *args] if path == "rust" else [sys.executable, __file__, "--worker", *args]
+            phases, peak_rss_mb = run_case(command)
+            for phase in phases:
+                key = f"{path}/{case}/{phase['name']}/{_case_label(case, params)}"
+                seconds = max(phase["seconds"], 1e-9)
+                results[key] = {
+                    "items": phase["items"],
+                    "errors": phase["errors"],
+                    "seconds": round(seconds, 6),
+                    "throughput": round(phase["items"] / seconds, 3),
+                    "peak_rss_mb": round(peak_rss_mb, 1),
+                }
+                print(
+                    f"{key:<70} {results[key]['throughput']:>14,.0f}/s {results[key]['peak_rss_mb']:>9.1f} MiB",
+                    flush=True,
+                )
+    return results
+
+
+def compare(results: dict[str, dict[str, float]], baseline: dict[str, Any], threshold: float) -> list[str]:
+    """Return a description of every result that regressed past ``threshold`` relative to the baseline."""
+    regressions = []
+    for key, expected in baseline.get("results", {}).items():
+        current = results.get(key)
+        if current is None:
+            continue
+        if current["throughput"] < expected["throughput"] * (1.0 - threshold):
+            regressions.append(
+                f"{key}: throughput {current['throughput']:,.0f}/s vs baseline {expected['throughput']:,.0f}/s"
+            )
+        if current["peak_rss_mb"] > expected["peak_rss_mb"] * (1.0 + threshold):
+            regressions.append(
+                f"{key}: peak RSS {current['peak_rss_mb']:.1f} MiB vs baseline {expected['peak_rss_mb']:.1f} MiB"
+            )
+    return regressions
+
+
+def _int_list(value: str) -> list[int]:
+    return [int(float(item)) for item in value.split(",") if item]
+
+
+def _float_list(value: str) -> list[float]:
+    return [float(item) for item in value.split(",") if item]
+
+
+def main(argv: Optional[list[str]] = None) -> int:
+    argv = sys.argv[1:] if argv is None else argv
+    if argv[:1] == ["--worker"]:
+        _worker(argv[1:])
+        return 0
+
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--paths", type=lambda v: v.split(","), default=["rust", "python"])
+    parser.add_argument("--sizes", type=_int_list, default=CATALOG_SIZES, help="TLE catalog sizes")
+    parser.add_argument("--obs-sizes", type=_int_list, default=OBS_SIZES, help="B3 observation counts")
+    parser.add_argument("--spans", type=_float_list, default=SPANS_DAYS, help="ephemeris spans in days")
+    parser.add_argument("--steps", type=_float_list, default=STEPS_MINUTES, help="ephemeris steps in minutes")
+    parser.add_argument("--quick", action="store_true", help="smallest catalog and obs file only")
+    parser.add_argument("--data-dir", type=Path, default=Path(tempfile.gettempdir()) / "pysaal-scaling")
+    parser.add_argument("--rust-bin", help="prebuilt scaling_bench executable (skips the cargo build)")
+    parser.add_argument("--baseline", type=Path, default=BASELINE_PATH)
+    parser.add_argument("--threshold", type=float, help="allowed relative regression (default: from the baseline)")
+    parser.add_argument("--output", type=Path, help="write the results JSON here")
+    parser.add_argument("--update-baseline", action="store_true", help="store these results as the new baseline")
+    args = parser.parse_args(argv)
+
+    baseline = json.loads(args.baseline.read_text()) if args.baseline.exists() else {}
+
+    if args.quick:
+        args.sizes, args.obs_sizes = args.sizes[:1], args.obs_sizes[:1]
+    args.data_dir.mkdir(parents=True, exist_ok=True)
+    results = run_suite(args.paths, args.sizes, args.obs_sizes, args.spans, args.steps, args.data_dir, args.rust_bin)
+
+    threshold = args.threshold if args.threshold is not None else baseline.get("threshold", DEFAULT_THRESHOLD)
+    document = {
+        "threshold": threshold,
+        "machine": {
+            "platform": platform.platform(),
+            "processor": platform.machine(),
+            "cpu_count": os.cpu_count(),
+            "python": platform.python_version(),
+        },
+        "results": results,
+    }
+    if args.output is not None:
+        args.output.write_text(json.dumps(document, indent=2, sort_keys=True) + "\n")
+    if args.update_baseline:
+        merged = {**baseline.get("results", {}), **results}
+        args.baseline.write_text(json.dumps({**document, "results": merged}, indent=2, sort_keys=True) + "\n")
+        print(f"Baseline updated: {args.baseline}")
+        return 0
+
+    missing = sorted(results.keys() - baseline.get("results", {}).keys())
+    if missing:
+        print(
+            f"WARNING: no baseline for {len(missing)} of {len(results)} cases in {args.baseline}; "
+            "record them with --update-baseline.",
+            file=sys.stderr,
+        )
+    regressions = compare(results, baseline, threshold)
+    for regression in regressions:
+        print(f"REGRESSION {regression}")
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,19 +1,15 @@
 from __future__ import annotations
 
 import os
-import logging
-from importlib import resources
-
-_logger = logging.getLogger(__name__)
 
 
 def _set_asset_directory() -> None:
 
     asset_dir = os.getenv("SAAL_ASSET_DIRECTORY")
     if asset_dir is None:
-        pkg_dir = resources.files("pysaal")
-        _logger.debug("Setting SAAL_ASSET_DIRECTORY to %s", pkg_dir)
-        os.environ.setdefault("SAAL_ASSET_DIRECTORY", str(pkg_dir))
+        # The asset directory is this package; avoid importing importlib.resources/logging on the import path.
+        pkg_dir = os.path.dirname(os.path.abspath(__file__))
+        os.environ.setdefault("SAAL_ASSET_DIRECTORY", pkg_dir)
     elif not os.path.exists(asset_dir):
         raise FileNotFoundError(f"SAAL_ASSET_DIRECTORY '{asset_dir}' does not exist.")
 
@@ -21,28 +17,56 @@ def _set_asset_directory() -> None:
 _set_asset_directory()
 from ._pysaal import (  # type: ignore  # noqa: E402
     AstroInterface,
+    FramePlan,
+    SunMoonCacheLoad,
     MainInterface,
     EnvironmentInterface,
+    EarthConstants,
+    EnvironmentProfile,
     SGP4Interface,
     TimeInterface,
+    TimingTable,
+    GreenwichTable,
     TLEInterface,
     ParsedTLE,
     ObsInterface,
     SensorInterface,
     ParsedB3,
     ParsedSensor,
+    SaalError,
+    PropagationError,
+    warmup,
+    stats,
+    reset_stats,
+    enable_stats,
+    stats_enabled,
+    export_stats,
 )
 
 __all__ = [
     "MainInterface",
     "AstroInterface",
+    "FramePlan",
+    "SunMoonCacheLoad",
     "EnvironmentInterface",
+    "EarthConstants",
+    "EnvironmentProfile",
     "SGP4Interface",
     "TimeInterface",
+    "TimingTable",
+    "GreenwichTable",
     "TLEInterface",
     "ParsedTLE",
     "ObsInterface",
     "ParsedB3",
     "SensorInterface",
     "ParsedSensor",
+    "SaalError",
+    "PropagationError",
+    "warmup",
+    "stats",
+    "reset_stats",
+    "enable_stats",
+    "stats_enabled",
+    "export_stats",
 ]
@@ -1,9 +1,16 @@
 // This wrapper file was generated automatically by the GenDllWrappers program.
 #![allow(non_snake_case)]
 #![allow(dead_code)]
+use std::collections::VecDeque;
 use std::os::raw::c_char;
+use std::sync::atomic::{AtomicU64, Ordering};
+use std::sync::{Arc, LazyLock, Mutex, MutexGuard, RwLock};
+use std::thread::JoinHandle;
 
-use super::{GetSetString, environment, get_last_error_message, time};
+use super::{
+    ensure_jpl_ephemeris, ensure_time_constants, environment, get_last_error_message, mark_jpl_ephemeris_ready, stats,
+    time, with_buffer, with_str,
+};
 
 unsafe extern "C" {
     //  Retrieves information about the current version of AstroFunc.dll. The information is placed in the string parameter you pass in.
@@ -536,21 +543,34 @@ pub static YROFEQNX_1950: isize = 3;
 
 // ========================= End of auto generated code ==========================
 
+// Covariance transforms accepted by [`transform_covariances`]
+pub const COV_TEME_TO_UVW: i32 = 0;
+pub const COV_UVW_TO_TEME: i32 = 1;
+pub const COV_EQNX_TO_UVW: i32 = 2;
+pub const COV_UVW_TO_EQNX: i32 = 3;
+pub const COV_TEME_TO_EFG: i32 = 4;
+pub const COV_EFG_TO_TEME: i32 = 5;
+
+// Reference frames accepted by the batch conversions, ordered along the J2000 <-> TEME <-> EFG <-> ECR chain
+pub const FRAME_J2000: i32 = 0;
+pub const FRAME_TEME: i32 = 1;
+pub const FRAME_EFG: i32 = 2;
+pub const FRAME_ECR: i32 = 3;
+
 pub fn get_dll_info() -> String {
-    let mut info = GetSetString::new();
-    unsafe {
-        AstroFuncGetInfo(info.pointer());
-    }
-    info.value()
+    with_buffer(|info| {
+        stats::timed("AstroFuncGetInfo", || unsafe { AstroFuncGetInfo(info.pointer()) });
+        info.value()
+    })
 }
 
 pub fn position_velocity_mu_to_equinoctial(posvel: &[f64; 6], mu: f64) -> [f64; XA_EQNX_SIZE] {
     let mut xa_eqnx = [0.0; XA_EQNX_SIZE];
     let pos = [posvel[0], posvel[1], posvel[2]];
     let vel = [posvel[3], posvel[4], posvel[5]];
-    unsafe {
+    stats::timed("PosVelMuToEqnx", || unsafe {
         PosVelMuToEqnx(&pos, &vel, mu, &mut xa_eqnx);
-    }
+    });
     xa_eqnx
 }
 
@@ -558,21 +578,21 @@ pub fn position_velocity_to_equinoctial(posvel: &[f64; 6]) -> [f64; XA_EQNX_SIZE
     let mut xa_eqnx = [0.0; XA_EQNX_SIZE];
     let pos = [posvel[0], posvel[1], posvel[2]];
     let vel = [posvel[3], posvel[4], posvel[5]];
-    unsafe {
+    stats::timed("PosVelToEqnx", || unsafe {
         PosVelToEqnx(&pos, &vel, &mut xa_eqnx);
-    }
+    });
     xa_eqnx
 }
 pub fn sma_to_mean_motion(semi_major_axis: f64) -> f64 {
-    unsafe { AToN(semi_major_axis) }
+    stats::timed("AToN", || unsafe { AToN(semi_major_axis) })
 }
 
 pub fn keplerian_to_cartesian(xa_kep: &[f64; XA_KEP_SIZE]) -> [f64; 6] {
     let mut pos = [0.0; 3];
     let mut vel = [0.0; 3];
-    unsafe {
+    stats::timed("KepToPosVel", || unsafe {
         KepToPosVel(xa_kep, &mut pos, &mut vel);
-    }
+    });
     [pos[0], pos[1], pos[2], vel[0], vel[1], vel[2]]
 }
 
@@ -580,19 +600,25 @@ pub fn cartesian_to_keplerian(posvel: &[f64; 6]) -> [f64; XA_KEP_SIZE] {
     let mut xa_kep = [0.0; XA_KEP_SIZE];
     let pos = [posvel[0], posvel[1], posvel[2]];
     let vel = [posvel[3], posvel[4], posvel[5]];
-    unsafe {
+    stats::timed("PosVelToKep", || unsafe {
         PosVelToKep(&pos, &vel, &mut xa_kep);
-    }
+    });
     xa_kep
 }
 
 pub fn set_jpl_ephemeris_file_path(file_path: &str) {
-    let mut jpl_path: GetSetString = file_path.into();
     let ds50_start = time::year_doy_to_ds50(1960, 1.0);
     let ds50_stop = time::year_doy_to_ds50(2050, 1.0);
-    unsafe {
-        JplSetParameters(jpl_path.pointer(), ds50_start, ds50_stop);
+    {
+        let _jpl = lock_jpl();
+        with_str(file_path, |jpl_path| {
+            stats::timed("JplSetParameters", || unsafe {
+                JplSetParameters(jpl_path.pointer(), ds50_start, ds50_stop)
+            })
+        });
     }
+    mark_jpl_ephemeris_ready();
+    clear_sun_moon_cache();
 }
 
 pub fn j2000_to_teme(ds50_utc: f64, j2000_posvel: &[f64; 6]) -> [f64; 6] {
@@ -601,9 +627,9 @@ pub fn j2000_to_teme(ds50_utc: f64, j2000_posvel: &[f64; 6]) -> [f64; 6] {
     let pos_j2000 = [j2000_posvel[0], j2000_posvel[1], j2000_posvel[2]];
     let vel_j2000 = [j2000_posvel[3], j2000_posvel[4], j2000_posvel[5]];
     let ds50_tai = time::utc_to_tai(ds50_utc);
-    unsafe {
+    stats::timed("RotJ2KToDate", || unsafe {
         RotJ2KToDate(0, 106, ds50_tai, &pos_j2000, &vel_j2000, &mut pos_teme, &mut vel_teme);
-    }
+    });
     [
         pos_teme[0],
         pos_teme[1],
@@ -628,9 +654,9 @@ pub fn teme_to_j2000(ds50_utc: f64, teme_posvel: &[f64; 6]) -> [f64; 6] {
     let ds50_tai = time::utc_to_tai(ds50_utc);
     let pos = [teme_posvel[0], teme_posvel[1], teme_posvel[2]];
     let vel = [teme_posvel[3], teme_posvel[4], teme_posvel[5]];
-    unsafe {
+    stats::timed("RotDateToJ2K", || unsafe {
         RotDateToJ2K(0, 106, ds50_tai, &pos, &vel, &mut pos_j2000, &mut vel_j2000);
-    }
+    });
     [
         pos_j2000[0],
         pos_j2000[1],
@@ -642,24 +668,26 @@ pub fn teme_to_j2000(ds50_utc: f64, teme_posvel: &[f64; 6]) -> [f64; 6] {
 }
 
 pub fn teme_to_efg(ds50_utc: f64, teme_posvel: &[f64; 6]) -> [f64; 6] {
+    let _ = ensure_time_constants();
     let mut pos_efg = [0.0; 3];
     let mut vel_efg = [0.0; 3];
     let pos = [teme_posvel[0], teme_posvel[1], teme_posvel[2]];
     let vel = [teme_posvel[3], teme_posvel[4], teme_posvel[5]];
-    unsafe {
+    stats::timed("ECIToEFGTime", || unsafe {
         ECIToEFGTime(ds50_utc, &pos, &vel, &mut pos_efg, &mut vel_efg);
-    }
+    });
     [pos_efg[0], pos_efg[1], pos_efg[2], vel_efg[0], vel_efg[1], vel_efg[2]]
 }
 
 pub fn efg_to_ecr(ds50_utc: f64, efg_posvel: &[f64; 6]) -> [f64; 6] {
+    let _ = ensure_time_constants();
     let mut pos_ecr = [0.0; 3];
     let mut vel_ecr = [0.0; 3];
     let pos_efg = [efg_posvel[0], efg_posvel[1], efg_posvel[2]];
     let vel_efg = [efg_posvel[3], efg_posvel[4], efg_posvel[5]];
-    unsafe {
+    stats::timed("EFGToECRTime", || unsafe {
         EFGToECRTime(ds50_utc, &pos_efg, &vel_efg, &mut pos_ecr, &mut vel_ecr);
-    }
+    });
     [pos_ecr[0], pos_ecr[1], pos_ecr[2], vel_ecr[0], vel_ecr[1], vel_ecr[2]]
 }
 
@@ -668,24 +696,26 @@ pub fn teme_to_ecr(ds50_utc: f64, teme_posvel: &[f64; 6]) -> [f64; 6] {
 }
 
 pub fn ecr_to_efg(ds50_utc: f64, ecr_posvel: &[f64; 6]) -> [f64; 6] {
+    let _ = ensure_time_constants();
     let mut pos_efg = [0.0; 3];
     let mut vel_efg = [0.0; 3];
     let pos_ecr = [ecr_posvel[0], ecr_posvel[1], ecr_posvel[2]];
     let vel_ecr = [ecr_posvel[3], ecr_posvel[4], ecr_posvel[5]];
-    unsafe {
+    stats::timed("ECRToEFGTime", || unsafe {
         ECRToEFGTime(ds50_utc, &pos_ecr, &vel_ecr, &mut pos_efg, &mut vel_efg);
-    }
+    });
     [pos_efg[0], pos_efg[1], pos_efg[2], vel_efg[0], vel_efg[1], vel_efg[2]]
 }
 
 pub fn efg_to_teme(ds50_utc: f64, efg_posvel: &[f64; 6]) -> [f64; 6] {
+    let _ = ensure_time_constants();
     let mut pos_teme = [0.0; 3];
     let mut vel_teme = [0.0; 3];
     let pos_efg = [efg_posvel[0], efg_posvel[1], efg_posvel[2]];
     let vel_efg = [efg_posvel[3], efg_posvel[4], efg_posvel[5]];
-    unsafe {
+    stats::timed("EFGToECITime", || unsafe {
         EFGToECITime(ds50_utc, &pos_efg, &vel_efg, &mut pos_teme, &mut vel_teme);
-    }
+    });
     [
         pos_teme[0],
         pos_teme[1],
@@ -708,83 +738,467 @@ pub fn efg_to_j2000(ds50_utc: f64, efg_posvel: &[f64; 6]) -> [f64; 6] {
     teme_to_j2000(ds50_utc, &efg_to_teme(ds50_utc, efg_posvel))
 }
 
+fn validate_frame(frame: i32) -> Result<(), String> {
+    match frame {
+        FRAME_J2000 | FRAME_TEME | FRAME_EFG | FRAME_ECR => Ok(()),
+        _ => Err(format!("Unsupported frame: {}", frame)),
+    }
+}
+
+fn frame_step(from_frame: i32, to_frame: i32, ds50_utc: f64, posvel: &[f64; 6]) -> Result<[f64; 6], String> {
+    match (from_frame, to_frame) {
+        (FRAME_J2000, FRAME_TEME) => Ok(j2000_to_teme(ds50_utc, posvel)),
+        (FRAME_TEME, FRAME_J2000) => Ok(teme_to_j2000(ds50_utc, posvel)),
+        (FRAME_TEME, FRAME_EFG) => Ok(teme_to_efg(ds50_utc, posvel)),
+        (FRAME_EFG, FRAME_TEME) => Ok(efg_to_teme(ds50_utc, posvel)),
+        (FRAME_EFG, FRAME_ECR) => Ok(efg_to_ecr(ds50_utc, posvel)),
+        (FRAME_ECR, FRAME_EFG) => Ok(ecr_to_efg(ds50_utc, posvel)),
+        _ => Err(format!(
+            "No direct conversion from frame {} to frame {}",
+            from_frame, to_frame
+        )),
+    }
+}
+
+/// Convert one state between any two `FRAME_*` frames, stepping along the J2000/TEME/EFG/ECR chain.
+pub fn convert_frame(from_frame: i32, to_frame: i32, ds50_utc: f64, posvel: &[f64; 6]) -> Result<[f64; 6], String> {
+    validate_frame(from_frame)?;
+    validate_frame(to_frame)?;
+    let mut frame = from_frame;
+    let mut state = *posvel;
+    while frame != to_frame {
+        let next = if to_frame > frame { frame + 1 } else { frame - 1 };
+        state = frame_step(frame, next, ds50_utc, &state)?;
+        frame = next;
+    }
+    Ok(state)
+}
+
+// Rows sharing an epoch before a batch conversion builds a rotation (six conversions) instead of converting each row
+const ROTATION_MIN_ROWS: usize = 6;
+const ROTATION_CACHE_SIZE: usize = 64;
+
+type RotationKey = (i32, i32, u64);
+
+#[derive(Default)]
+struct RotationCache {
+    entries: VecDeque<(RotationKey, [[f64; 6]; 6])>,
+}
+
+impl RotationCache {
+    fn get(&mut self, key: RotationKey) -> Option<[[f64; 6]; 6]> {
+        let index = self.entries.iter().position(|(entry_key, _)| *entry_key == key)?;
+        let entry = self.entries.remove(index)?;
+        self.entries.push_front(entry);
+        Some(entry.1)
+    }
+
+    fn insert(&mut self, key: RotationKey, rotation: [[f64; 6]; 6]) {
+        if self.entries.len() == ROTATION_CACHE_SIZE {
+            self.entries.pop_back();
+        }
+        self.entries.push_front((key, rotation));
+    }
+}
+
+static ROTATION_CACHE: LazyLock<Mutex<RotationCache>> = LazyLock::new(|| Mutex::new(RotationCache::default()));
+
+fn find_rotation(from_frame: i32, to_frame: i32, ds50_utc: f64) -> Option<[[f64; 6]; 6]> {
+    let mut cache = ROTATION_CACHE.lock().unwrap_or_else(|e| e.into_inner());
+    cache.get((from_frame, to_frame, ds50_utc.to_bits()))
+}
+
+fn cached_rotation(from_frame: i32, to_frame: i32, ds50_utc: f64) -> Result<[[f64; 6]; 6], String> {
+    if let Some(rotation) = find_rotation(from_frame, to_frame, ds50_utc) {
+        return Ok(rotation);
+    }
+    let rotation = get_frame_rotation(from_frame, to_frame, ds50_utc)?;
+    let mut cache = ROTATION_CACHE.lock().unwrap_or_else(|e| e.into_inner());
+    cache.insert((from_frame, to_frame, ds50_utc.to_bits()), rotation);
+    Ok(rotation)
+}
+
+/// Drop the cached frame rotations.  Called when time constants or the fundamental catalog change.
+pub fn clear_rotation_cache() {
+    ROTATION_CACHE.lock().unwrap_or_else(|e| e.into_inner()).entries.clear();
+}
+
+fn rotate_state(rotation: &[[f64; 6]; 6], posvel: &[f64; 6]) -> [f64; 6] {
+    rotation.map(|row| row.iter().zip(posvel).map(|(a, b)| a * b).sum())
+}
+
+/// Build the 6x6 matrix taking a state from `from_frame` to `to_frame` at `ds50_utc`.
+///
+/// Each column is the SAAL conversion of a unit basis state, so the matrix carries the precession, nutation, Earth
+/// rotation and polar motion terms of [`convert_frame`], including the velocity coupling of rotating frames.
+pub fn get_frame_rotation(from_frame: i32, to_frame: i32, ds50_utc: f64) -> Result<[[f64; 6]; 6], String> {
+    let mut rotation = [[0.0; 6]; 6];
+    for column in 0..6 {
+        let mut basis = [0.0; 6];
+        basis[column] = 1.0;
+        let image = convert_frame(from_frame, to_frame, ds50_utc, &basis)?;
+        for (row, value) in image.iter().enumerate() {
+            rotation[row][column] = *value;
+        }
+    }
+    Ok(rotation)
+}
+
+/// Frame rotations precomputed for a set of epochs.
+///
+/// Building a plan costs six SAAL conversions per epoch.  Applying it is a 6x6 matrix product per state, which is
+/// much cheaper than [`convert_frame`] when many states share an epoch.
+#[derive(Clone, Debug)]
+pub struct FramePlan {
+    pub from_frame: i32,
+    pub to_frame: i32,
+    pub epochs: Vec<f64>,
+    pub rotations: Vec<[[f64; 6]; 6]>,
+}
+
+impl FramePlan {
+    pub fn new(from_frame: i32, to_frame: i32, ds50_utcs: &[f64]) -> Result<Self, String> {
+        let rotations = ds50_utcs
+            .iter()
+            .map(|&ds50_utc| cached_rotation(from_frame, to_frame, ds50_utc))
+            .collect::<Result<Vec<_>, String>>()?;
+        Ok(FramePlan {
+            from_frame,
+            to_frame,
+            epochs: ds50_utcs.to_vec(),
+            rotations,
+        })
+    }
+
+    /// Convert one state at the plan epoch `epoch_index`.
+    pub fn apply(&self, epoch_index: usize, posvel: &[f64; 6]) -> Result<[f64; 6], String> {
+        match self.rotations.get(epoch_index) {
+            Some(rotation) => Ok(rotate_state(rotation, posvel)),
+            None => Err(format!(
+                "Epoch index {} out of range for {} epochs",
+                epoch_index,
+                self.rotations.len()
+            )),
+        }
+    }
+
+    /// Convert states in place.  A plan with one epoch applies to every row, otherwise row `i` uses epoch `i`.
+    pub fn apply_in_place(&self, posvels: &mut [[f64; 6]]) -> Result<(), String> {
+        if self.rotations.len() != 1 && self.rotations.len() != posvels.len() {
+            return Err(format!(
+                "Plan has {} epochs but {} states were given",
+                self.rotations.len(),
+                posvels.len()
+            ));
+        }
+        let shared = self.rotations.len() == 1;
+        for (i, posvel) in posvels.iter_mut().enumerate() {
+            *posvel = rotate_state(&self.rotations[if shared { 0 } else { i }], posvel);
+        }
+        Ok(())
+    }
+}
+
+/// Convert many states between `FRAME_*` frames in place.
+///
+/// `ds50_utcs` holds either one epoch shared by every row or one epoch per row.  Runs of rows sharing an epoch are
+/// rotated with a cached [`get_frame_rotation`] matrix; a small LRU keeps the rotations of recent epochs.
+pub fn convert_frames_in_place(
+    from_frame: i32,
+    to_frame: i32,
+    ds50_utcs: &[f64],
+    posvels: &mut [[f64; 6]],
+) -> Result<(), String> {
+    validate_frame(from_frame)?;
+    validate_frame(to_frame)?;
+    if ds50_utcs.len() != 1 && ds50_utcs.len() != posvels.len() {
+        return Err(format!(
+            "Expected 1 or {} epochs, got {}",
+            posvels.len(),
+            ds50_utcs.len()
+        ));
+    }
+    let shared = ds50_utcs.len() == 1;
+    let mut start = 0;
+    while start < posvels.len() {
+        let ds50_utc = ds50_utcs[if shared { 0 } else { start }];
+        let end = if shared {
+            posvels.len()
+        } else {
+            start + ds50_utcs[start..].iter().take_while(|&&t| t == ds50_utc).count()
+        };
+        let rows = &mut posvels[start..end];
+        let rotation = if rows.len() >= ROTATION_MIN_ROWS {
+            Some(cached_rotation(from_frame, to_frame, ds50_utc)?)
+        } else {
+            find_rotation(from_frame, to_frame, ds50_utc)
+        };
+        match rotation {
+            Some(rotation) => {
+                for posvel in rows.iter_mut() {
+                    *posvel = rotate_state(&rotation, posvel);
+                }
+            }
+            None => {
+                for posvel in rows.iter_mut() {
+                    *posvel = convert_frame(from_frame, to_frame, ds50_utc, posvel)?;
+                }
+            }
+        }
+        start = end;
+    }
+    Ok(())
+}
+
+/// Convert many states between `FRAME_*` frames into a new vector.  See [`convert_frames_in_place`].
+pub fn convert_frames(
+    from_frame: i32,
+    to_frame: i32,
+    ds50_utcs: &[f64],
+    posvels: &[[f64; 6]],
+) -> Result<Vec<[f64; 6]>, String> {
+    let mut converted = posvels.to_vec();
+    convert_frames_in_place(from_frame, to_frame, ds50_utcs, &mut converted)?;
+    Ok(converted)
+}
+
 pub fn kozai_to_brouwer(eccentricity: f64, inclination: f64, mean_motion: f64) -> f64 {
-    unsafe { KozaiToBrouwer(eccentricity, inclination, mean_motion) }
+    stats::timed("KozaiToBrouwer", || unsafe {
+        KozaiToBrouwer(eccentricity, inclination, mean_motion)
+    })
 }
 
 pub fn brouwer_to_kozai(eccentricity: f64, inclination: f64, mean_motion: f64) -> f64 {
-    unsafe { BrouwerToKozai(eccentricity, inclination, mean_motion) }
+    stats::timed("BrouwerToKozai", || unsafe {
+        BrouwerToKozai(eccentricity, inclination, mean_motion)
+    })
 }
 
 pub fn mean_motion_to_sma(mean_motion: f64) -> f64 {
-    unsafe { NToA(mean_motion) }
+    stats::timed("NToA", || unsafe { NToA(mean_motion) })
 }
 
 pub fn lla_to_teme(ds50_utc: f64, pos_lla: &[f64; 3]) -> [f64; 3] {
+    let _ = ensure_time_constants();
     let mut pos_teme = [0.0; 3];
-    unsafe {
+    stats::timed("LLHToXYZTime", || unsafe {
         LLHToXYZTime(ds50_utc, pos_lla, &mut pos_teme);
-    }
+    });
     pos_teme
 }
 
 pub fn topo_meme_to_teme(yr_of_equinox: i32, ds50_utc: f64, ra: f64, dec: f64) -> (f64, f64) {
+    let _ = ensure_time_constants();
     let mut ra_out = 0.0;
     let mut dec_out = 0.0;
-    unsafe {
+    stats::timed("RotRADec_EqnxToDate", || unsafe {
         RotRADec_EqnxToDate(106, yr_of_equinox, ds50_utc, ra, dec, &mut ra_out, &mut dec_out);
-    }
+    });
     (ra_out, dec_out)
 }
 
 pub fn topo_teme_to_meme(yr_of_equinox: i32, ds50_utc: f64, ra: f64, dec: f64) -> (f64, f64) {
+    let _ = ensure_time_constants();
     let mut ra_out = 0.0;
     let mut dec_out = 0.0;
-    unsafe {
+    stats::timed("RotRADec_DateToEqnx", || unsafe {
         RotRADec_DateToEqnx(106, yr_of_equinox, ds50_utc, ra, dec, &mut ra_out, &mut dec_out);
-    }
+    });
     (ra_out, dec_out)
 }
 
 pub fn llh_to_efg(pos_lla: &[f64; 3]) -> [f64; 3] {
     let mut pos_efg = [0.0; 3];
-    unsafe {
+    stats::timed("LLHToEFGPos", || unsafe {
         LLHToEFGPos(pos_lla, &mut pos_efg);
-    }
+    });
     pos_efg
 }
 
 pub fn osculating_to_mean(xa_osc: &[f64; XA_KEP_SIZE]) -> [f64; XA_KEP_SIZE] {
     let mut xa_mean = [0.0; XA_KEP_SIZE];
-    unsafe {
+    stats::timed("KepOscToMean", || unsafe {
         KepOscToMean(xa_osc, &mut xa_mean);
-    }
+    });
     xa_mean
 }
 
 pub fn equinoctial_to_keplerian(xa_eqnx: &[f64; XA_EQNX_SIZE]) -> [f64; XA_KEP_SIZE] {
     let mut xa_kep = [0.0; XA_KEP_SIZE];
-    unsafe {
+    stats::timed("EqnxToKep", || unsafe {
         EqnxToKep(xa_eqnx, &mut xa_kep);
-    }
+    });
     xa_kep
 }
 
 pub fn keplerian_to_equinoctial(xa_kep: &[f64; XA_KEP_SIZE]) -> [f64; XA_EQNX_SIZE] {
     let mut xa_eqnx = [0.0; XA_EQNX_SIZE];
-    unsafe {
+    stats::timed("KepToEqnx", || unsafe {
         KepToEqnx(xa_kep, &mut xa_eqnx);
-    }
+    });
     xa_eqnx
 }
 
+fn converted_row<const N: usize>(input: &[f64], output: [f64; N]) -> Option<[f64; N]> {
+    let valid =
+        input.iter().all(|x| x.is_finite()) && output.iter().all(|x| x.is_finite()) && output.iter().any(|&x| x != 0.0);
+    valid.then_some(output)
+}
+
+fn convert_rows<const N: usize, const M: usize>(
+    rows: &[[f64; N]],
+    convert: impl Fn(usize, &[f64; N]) -> [f64; M],
+) -> (Vec<[f64; M]>, Vec<bool>) {
+    let mut converted = Vec::with_capacity(rows.len());
+    let mut failed = Vec::with_capacity(rows.len());
+    for (i, row) in rows.iter().enumerate() {
+        match converted_row(row, convert(i, row)) {
+            Some(output) => {
+                converted.push(output);
+                failed.push(false);
+            }
+            None => {
+                converted.push([f64::NAN; M]);
+                failed.push(true);
+            }
+        }
+    }
+    (converted, failed)
+}
+
+fn validate_row_values(name: &str, values: &[f64], rows: usize) -> Result<(), String> {
+    if values.len() == 1 || values.len() == rows {
+        Ok(())
+    } else {
+        Err(format!(
+            "Expected 1 or {} values for {}, got {}",
+            rows,
+            name,
+            values.len()
+        ))
+    }
+}
+
+fn row_value(values: &[f64], i: usize) -> f64 {
+    values[if values.len() == 1 { 0 } else { i }]
+}
+
+/// Convert many Keplerian element sets to TEME position/velocity.
+///
+/// Like the other `*_batch` element conversions, this returns the converted rows and a mask flagging rows that could
+/// not be converted (non-finite input, or non-finite or all-zero output).  Flagged rows are filled with NaN.
+pub fn keplerian_to_cartesian_batch(xa_keps: &[[f64; XA_KEP_SIZE]]) -> (Vec<[f64; 6]>, Vec<bool>) {
+    convert_rows(xa_keps, |_, xa_kep| keplerian_to_cartesian(xa_kep))
+}
+
+/// Convert many position/velocity states to Keplerian elements, with one shared or per-row `mu` (km^3/s^2).
+///
+/// Without `mu` the environment's Earth constant is used.
+pub fn cartesian_to_keplerian_batch(
+    posvels: &[[f64; 6]],
+    mu: Option<&[f64]>,
+) -> Result<(Vec<[f64; XA_KEP_SIZE]>, Vec<bool>), String> {
+    match mu {
+        None => Ok(convert_rows(posvels, |_, posvel| cartesian_to_keplerian(posvel))),
+        Some(mu) => {
+            validate_row_values("mu", mu, posvels.len())?;
+            Ok(convert_rows(posvels, |i, posvel| {
+                let mut xa_kep = [0.0; XA_KEP_SIZE];
+                let pos = [posvel[0], posvel[1], posvel[2]];
+                let vel = [posvel[3], posvel[4], posvel[5]];
+                stats::timed("PosVelMuToKep", || unsafe {
+                    PosVelMuToKep(&pos, &vel, row_value(mu, i), &mut xa_kep);
+                });
+                xa_kep
+            }))
+        }
+    }
+}
+
+/// Convert many position/velocity states to equinoctial elements, with one shared or per-row `mu` (km^3/s^2).
+pub fn position_velocity_to_equinoctial_batch(
+    posvels: &[[f64; 6]],
+    mu: Option<&[f64]>,
+) -> Result<(Vec<[f64; XA_EQNX_SIZE]>, Vec<bool>), String> {
+    match mu {
+        None => Ok(convert_rows(posvels, |_, posvel| {
+            position_velocity_to_equinoctial(posvel)
+        })),
+        Some(mu) => {
+            validate_row_values("mu", mu, posvels.len())?;
+            Ok(convert_rows(posvels, |i, posvel| {
+                position_velocity_mu_to_equinoctial(posvel, row_value(mu, i))
+            }))
+        }
+    }
+}
+
+pub fn keplerian_to_equinoctial_batch(xa_keps: &[[f64; XA_KEP_SIZE]]) -> (Vec<[f64; XA_EQNX_SIZE]>, Vec<bool>) {
+    convert_rows(xa_keps, |_, xa_kep| keplerian_to_equinoctial(xa_kep))
+}
+
+pub fn equinoctial_to_keplerian_batch(xa_eqnxs: &[[f64; XA_EQNX_SIZE]]) -> (Vec<[f64; XA_KEP_SIZE]>, Vec<bool>) {
+    convert_rows(xa_eqnxs, |_, xa_eqnx| equinoctial_to_keplerian(xa_eqnx))
+}
+
+pub fn osculating_to_mean_batch(xa_oscs: &[[f64; XA_KEP_SIZE]]) -> (Vec<[f64; XA_KEP_SIZE]>, Vec<bool>) {
+    convert_rows(xa_oscs, |_, xa_osc| osculating_to_mean(xa_osc))
+}
+
+fn convert_mean_motions(
+    eccentricities: &[f64],
+    inclinations: &[f64],
+    mean_motions: &[f64],
+    convert: fn(f64, f64, f64) -> f64,
+) -> Result<(Vec<f64>, Vec<bool>), String> {
+    validate_row_values("eccentricity", eccentricities, mean_motions.len())?;
+    validate_row_values("inclination", inclinations, mean_motions.len())?;
+    let rows: Vec<[f64; 3]> = (0..mean_motions.len())
+        .map(|i| {
+            [
+                row_value(eccentricities, i),
+                row_value(inclinations, i),
+                mean_motions[i],
+            ]
+        })
+        .collect();
+    let (converted, failed) = convert_rows(&rows, |_, &[eccentricity, inclination, mean_motion]| {
+        [convert(eccentricity, inclination, mean_motion)]
+    });
+    Ok((converted.into_iter().map(|[n]| n).collect(), failed))
+}
+
+/// Convert many Kozai mean motions to Brouwer; eccentricity and inclination may be shared or per-row.
+pub fn kozai_to_brouwer_batch(
+    eccentricities: &[f64],
+    inclinations: &[f64],
+    mean_motions: &[f64],
+) -> Result<(Vec<f64>, Vec<bool>), String> {
+    convert_mean_motions(eccentricities, inclinations, mean_motions, kozai_to_brouwer)
+}
+
+/// Convert many Brouwer mean motions to Kozai; eccentricity and inclination may be shared or per-row.
+pub fn brouwer_to_kozai_batch(
+    eccentricities: &[f64],
+    inclinations: &[f64],
+    mean_motions: &[f64],
+) -> Result<(Vec<f64>, Vec<bool>), String> {
+    convert_mean_motions(eccentricities, inclinations, mean_motions, brouwer_to_kozai)
+}
+
+pub fn mean_motion_to_sma_batch(mean_motions: &[f64]) -> (Vec<f64>, Vec<bool>) {
+    let rows: Vec<[f64; 1]> = mean_motions.iter().map(|&n| [n]).collect();
+    let (converted, failed) = convert_rows(&rows, |_, &[n]| [mean_motion_to_sma(n)]);
+    (converted.into_iter().map(|[a]| a).collect(), failed)
+}
+
 pub fn covariance_equinoctial_to_uvw(teme_posvel: &[f64; 6], cov_eqnx: &[[f64; 6]; 6]) -> [[f64; 6]; 6] {
     let mut cov_uvw = [[0.0; 6]; 6];
     let pos = [teme_posvel[0], teme_posvel[1], teme_posvel[2]];
     let vel = [teme_posvel[3], teme_posvel[4], teme_posvel[5]];
-    unsafe {
+    stats::timed("CovMtxEqnxToUVW", || unsafe {
         CovMtxEqnxToUVW(&pos, &vel, cov_eqnx, &mut cov_uvw);
-    }
+    });
     cov_uvw
 }
 
@@ -792,32 +1206,365 @@ pub fn covariance_uvw_to_teme(teme_posvel: &[f64; 6], cov_uvw: &[[f64; 6]; 6]) -
     let mut cov_teme = [[0.0; 6]; 6];
     let pos = [teme_posvel[0], teme_posvel[1], teme_posvel[2]];
     let vel = [teme_posvel[3], teme_posvel[4], teme_posvel[5]];
-    unsafe {
+    stats::timed("CovMtxUVWToECI", || unsafe {
         CovMtxUVWToECI(&pos, &vel, cov_uvw, &mut cov_teme);
-    }
+    });
     cov_teme
 }
 
+pub fn covariance_teme_to_uvw(teme_posvel: &[f64; 6], cov_teme: &[[f64; 6]; 6]) -> [[f64; 6]; 6] {
+    let mut cov_uvw = [[0.0; 6]; 6];
+    let pos = [teme_posvel[0], teme_posvel[1], teme_posvel[2]];
+    let vel = [teme_posvel[3], teme_posvel[4], teme_posvel[5]];
+    stats::timed("CovMtxECIToUVW", || unsafe {
+        CovMtxECIToUVW(&pos, &vel, cov_teme, &mut cov_uvw);
+    });
+    cov_uvw
+}
+
+pub fn covariance_uvw_to_equinoctial(teme_posvel: &[f64; 6], cov_uvw: &[[f64; 6]; 6]) -> [[f64; 6]; 6] {
+    let mut cov_eqnx = [[0.0; 6]; 6];
+    let pos = [teme_posvel[0], teme_posvel[1], teme_posvel[2]];
+    let vel = [teme_posvel[3], teme_posvel[4], teme_posvel[5]];
+    stats::timed("CovMtxUVWToEqnx", || unsafe {
+        CovMtxUVWToEqnx(&pos, &vel, cov_uvw, &mut cov_eqnx);
+    });
+    cov_eqnx
+}
+
+pub fn covariance_teme_to_efg(ds50_utc: f64, cov_teme: &[[f64; 6]; 6]) -> [[f64; 6]; 6] {
+    let mut cov_efg = [[0.0; 6]; 6];
+    let theta_g = time::get_greenwich_angle(time::utc_to_ut1(ds50_utc));
+    stats::timed("CovMtxECIToEFG", || unsafe {
+        CovMtxECIToEFG(theta_g, cov_teme, &mut cov_efg);
+    });
+    cov_efg
+}
+
+pub fn covariance_efg_to_teme(ds50_utc: f64, cov_efg: &[[f64; 6]; 6]) -> [[f64; 6]; 6] {
+    let mut cov_teme = [[0.0; 6]; 6];
+    let theta_g = time::get_greenwich_angle(time::utc_to_ut1(ds50_utc));
+    stats::timed("CovMtxEFGToECI", || unsafe {
+        CovMtxEFGToECI(theta_g, cov_efg, &mut cov_teme);
+    });
+    cov_teme
+}
+
+/// Rotate a 9x9 (state plus drag/SRP/consider) TEME covariance to equinoctial elements.
+pub fn covariance_teme_to_equinoctial(teme_posvel: &[f64; 6], cov_teme: &[[f64; 9]; 9]) -> [[f64; 9]; 9] {
+    let mut cov_eqnx = [[0.0; 9]; 9];
+    let pos = [teme_posvel[0], teme_posvel[1], teme_posvel[2]];
+    let vel = [teme_posvel[3], teme_posvel[4], teme_posvel[5]];
+    stats::timed("CovMtxECIToEqnx", || unsafe {
+        CovMtxECIToEqnx(&pos, &vel, cov_teme, &mut cov_eqnx);
+    });
+    cov_eqnx
+}
+
+/// Propagate a 9x9 covariance with a 6x9 state transition matrix (row-major in `state_array`).
+///
+/// The full covariance is scaled by `rms` squared, and `consider` is applied to the drag term.
+pub fn propagate_covariance(rms: f64, consider: f64, state_array: &[f64; 54], cov: &[[f64; 9]; 9]) -> [[f64; 6]; 6] {
+    let mut prop_cov = [[0.0; 6]; 6];
+    stats::timed("PropCovFrState", || unsafe {
+        PropCovFrState(rms, consider, state_array, cov, &mut prop_cov);
+    });
+    prop_cov
+}
+
+/// Pack a symmetric 6x6 matrix into its 21-element lower triangle.
+pub fn matrix_to_lta21(matrix: &[[f64; 6]; 6]) -> [f64; 21] {
+    let mut lta21 = [0.0; 21];
+    stats::timed("Mtx6x6ToLTA21", || unsafe {
+        Mtx6x6ToLTA21(matrix, &mut lta21);
+    });
+    lta21
+}
+
+/// Unpack a 21-element lower triangle into a symmetric 6x6 matrix.
+pub fn lta21_to_matrix(lta21: &[f64; 21]) -> [[f64; 6]; 6] {
+    let mut matrix = [[0.0; 6]; 6];
+    stats::timed("LTA21ToMtx6x6", || unsafe {
+        LTA21ToMtx6x6(lta21, &mut matrix);
+    });
+    matrix
+}
+
+fn transform_covariance(transform: i32, teme_posvel: &[f64; 6], ds50_utc: f64, cov: &[[f64; 6]; 6]) -> [[f64; 6]; 6] {
+    match transform {
+        COV_TEME_TO_UVW => covariance_teme_to_uvw(teme_posvel, cov),
+        COV_UVW_TO_TEME => covariance_uvw_to_teme(teme_posvel, cov),
+        COV_EQNX_TO_UVW => covariance_equinoctial_to_uvw(teme_posvel, cov),
+        COV_UVW_TO_EQNX => covariance_uvw_to_equinoctial(teme_posvel, cov),
+        COV_TEME_TO_EFG => covariance_teme_to_efg(ds50_utc, cov),
+        _ => covariance_efg_to_teme(ds50_utc, cov),
+    }
+}
+
+fn validate_covariance_inputs(
+    transform: i32,
+    teme_posvels: &[[f64; 6]],
+    ds50_utcs: &[f64],
+    rows: usize,
+) -> Result<(), String> {
+    match transform {
+        COV_TEME_TO_UVW | COV_UVW_TO_TEME | COV_EQNX_TO_UVW | COV_UVW_TO_EQNX if teme_posvels.len() != rows => {
+            Err(format!("Expected {} TEME states, got {}", rows, teme_posvels.len()))
+        }
+        COV_TEME_TO_UVW | COV_UVW_TO_TEME | COV_EQNX_TO_UVW | COV_UVW_TO_EQNX => Ok(()),
+        COV_TEME_TO_EFG | COV_EFG_TO_TEME => validate_row_values("epochs", ds50_utcs, rows),
+        _ => Err(format!("Unsupported covariance transform: {}", transform)),
+    }
+}
+
+/// Apply a `COV_*` transform to many 6x6 covariances.
+///
+/// UVW and equinoctial transforms use one TEME state per matrix; EFG transforms use one shared epoch or one epoch
+/// per matrix, and the unused input may be empty.
+pub fn transform_covariances(
+    transform: i32,
+    teme_posvels: &[[f64; 6]],
+    ds50_utcs: &[f64],
+    covs: &[[[f64; 6]; 6]],
+) -> Result<Vec<[[f64; 6]; 6]>, String> {
+    validate_covariance_inputs(transform, teme_posvels, ds50_utcs, covs.len())?;
+    Ok(covs
+        .iter()
+        .enumerate()
+        .map(|(i, cov)| {
+            let teme_posvel = teme_posvels.get(i).unwrap_or(&[0.0; 6]);
+            let ds50_utc = ds50_utcs
+                .get(if ds50_utcs.len() == 1 { 0 } else { i })
+                .copied()
+                .unwrap_or(0.0);
+            transform_covariance(transform, teme_posvel, ds50_utc, cov)
+        })
+        .collect())
+}
+
+/// Apply a `COV_*` transform to many covariances packed as 21-element lower triangles.  See [`transform_covariances`].
+pub fn transform_covariances_lta21(
+    transform: i32,
+    teme_posvels: &[[f64; 6]],
+    ds50_utcs: &[f64],
+    lta21s: &[[f64; 21]],
+) -> Result<Vec<[f64; 21]>, String> {
+    validate_covariance_inputs(transform, teme_posvels, ds50_utcs, lta21s.len())?;
+    Ok(lta21s
+        .iter()
+        .enumerate()
+        .map(|(i, lta21)| {
+            let teme_posvel = teme_posvels.get(i).unwrap_or(&[0.0; 6]);
+            let ds50_utc = ds50_utcs
+                .get(if ds50_utcs.len() == 1 { 0 } else { i })
+                .copied()
+                .unwrap_or(0.0);
+            matrix_to_lta21(&transform_covariance(
+                transform,
+                teme_posvel,
+                ds50_utc,
+                &lta21_to_matrix(lta21),
+            ))
+        })
+        .collect())
+}
+
+pub fn covariance_teme_to_equinoctial_batch(
+    teme_posvels: &[[f64; 6]],
+    covs: &[[[f64; 9]; 9]],
+) -> Result<Vec<[[f64; 9]; 9]>, String> {
+    if teme_posvels.len() != covs.len() {
+        return Err(format!(
+            "Expected {} TEME states, got {}",
+            covs.len(),
+            teme_posvels.len()
+        ));
+    }
+    Ok(teme_posvels
+        .iter()
+        .zip(covs)
+        .map(|(teme_posvel, cov)| covariance_teme_to_equinoctial(teme_posvel, cov))
+        .collect())
+}
+
+/// Propagate many covariances with [`propagate_covariance`] and shared `rms`/`consider` values.
+pub fn propagate_covariances(
+    rms: f64,
+    consider: f64,
+    state_arrays: &[[f64; 54]],
+    covs: &[[[f64; 9]; 9]],
+) -> Result<Vec<[[f64; 6]; 6]>, String> {
+    if state_arrays.len() != covs.len() {
+        return Err(format!(
+            "Expected {} state matrices, got {}",
+            covs.len(),
+            state_arrays.len()
+        ));
+    }
+    Ok(state_arrays
+        .iter()
+        .zip(covs)
+        .map(|(state_array, cov)| propagate_covariance(rms, consider, state_array, cov))
+        .collect())
+}
+
 pub fn gst_ra_dec_to_az_el(gst: f64, lla: &[f64; 3], ra: f64, dec: f64) -> [f64; 2] {
     let mut az = 0.0;
     let mut el = 0.0;
-    unsafe {
+    stats::timed("RaDecToAzEl", || unsafe {
         RaDecToAzEl(gst, lla[0], lla[1], ra, dec, &mut az, &mut el);
-    }
+    });
 
     [az, el]
 }
 
 pub fn time_ra_dec_to_az_el(ds50_utc: f64, lla: &[f64; 3], ra: f64, dec: f64) -> [f64; 2] {
+    let _ = ensure_time_constants();
     let mut az = 0.0;
     let mut el = 0.0;
-    unsafe {
+    stats::timed("RaDecToAzElTime", || unsafe {
         RaDecToAzElTime(ds50_utc, lla[0], lla[1], ra, dec, &mut az, &mut el);
-    }
+    });
 
     [az, el]
 }
 
+pub fn time_az_el_to_ra_dec(ds50_utc: f64, lla: &[f64; 3], az: f64, el: f64) -> [f64; 2] {
+    let _ = ensure_time_constants();
+    let mut ra = 0.0;
+    let mut dec = 0.0;
+    stats::timed("AzElToRaDecTime", || unsafe {
+        AzElToRaDecTime(ds50_utc, lla[0], lla[1], az, el, &mut ra, &mut dec);
+    });
+
+    [ra, dec]
+}
+
+/// Return the annual aberration (delta RA, delta Dec) in degrees for a TEME RA/Dec.
+pub fn get_annual_aberration(ds50_utc: f64, ra: f64, dec: f64) -> (f64, f64) {
+    let _ = ensure_time_constants();
+    let mut ra_delta = 0.0;
+    let mut dec_delta = 0.0;
+    stats::timed("AberrationAnnual", || unsafe {
+        AberrationAnnual(ra, dec, ds50_utc, &mut ra_delta, &mut dec_delta);
+    });
+    (ra_delta, dec_delta)
+}
+
+/// Return the diurnal aberration (delta RA, delta Dec) in degrees for a ground sensor at `sensor_teme_pos`.
+pub fn get_diurnal_aberration(ds50_utc: f64, sensor_teme_pos: &[f64; 3], ra: f64, dec: f64) -> (f64, f64) {
+    let _ = ensure_time_constants();
+    let mut ra_delta = 0.0;
+    let mut dec_delta = 0.0;
+    stats::timed("AberrationDiurnal", || unsafe {
+        AberrationDiurnal(ra, dec, ds50_utc, sensor_teme_pos, &mut ra_delta, &mut dec_delta);
+    });
+    (ra_delta, dec_delta)
+}
+
+fn remove_aberration(ds50_utc: f64, lla: &[f64; 3], ra: f64, dec: f64) -> (f64, f64) {
+    let (annual_ra, annual_dec) = get_annual_aberration(ds50_utc, ra, dec);
+    let (diurnal_ra, diurnal_dec) = get_diurnal_aberration(ds50_utc, &lla_to_teme(ds50_utc, lla), ra, dec);
+    (
+        (ra - annual_ra - diurnal_ra).rem_euclid(360.0),
+        dec - annual_dec - diurnal_dec,
+    )
+}
+
+fn validate_angle_columns(ds50_utcs: &[f64], first: &[f64], second: &[f64]) -> Result<(), String> {
+    if first.len() != second.len() {
+        return Err(format!(
+            "Angle columns differ in length: {} and {}",
+            first.len(),
+            second.len()
+        ));
+    }
+    validate_row_values("epochs", ds50_utcs, first.len())
+}
+
+/// Rotate many RA/Dec pairs (deg) from MEME of `yr_of_equinox` to TEME of date, with shared or per-row epochs.
+pub fn topo_meme_to_teme_batch(
+    yr_of_equinox: i32,
+    ds50_utcs: &[f64],
+    ras: &[f64],
+    decs: &[f64],
+) -> Result<(Vec<f64>, Vec<f64>), String> {
+    validate_angle_columns(ds50_utcs, ras, decs)?;
+    Ok((0..ras.len())
+        .map(|i| topo_meme_to_teme(yr_of_equinox, row_value(ds50_utcs, i), ras[i], decs[i]))
+        .unzip())
+}
+
+/// Rotate many RA/Dec pairs (deg) from TEME of date to MEME of `yr_of_equinox`, with shared or per-row epochs.
+pub fn topo_teme_to_meme_batch(
+    yr_of_equinox: i32,
+    ds50_utcs: &[f64],
+    ras: &[f64],
+    decs: &[f64],
+) -> Result<(Vec<f64>, Vec<f64>), String> {
+    validate_angle_columns(ds50_utcs, ras, decs)?;
+    Ok((0..ras.len())
+        .map(|i| topo_teme_to_meme(yr_of_equinox, row_value(ds50_utcs, i), ras[i], decs[i]))
+        .unzip())
+}
+
+/// Convert many topocentric RA/Dec pairs (deg) seen from a sensor at `lla` to azimuth/elevation (deg).
+///
+/// With `yr_of_equinox`, inputs are MEME of that equinox and are first rotated to TEME of date.  With `aberration`,
+/// the SAAL annual and diurnal aberration offsets are removed from the inputs so the outputs are geometric.
+pub fn ra_dec_to_az_el_batch(
+    ds50_utcs: &[f64],
+    lla: &[f64; 3],
+    ras: &[f64],
+    decs: &[f64],
+    yr_of_equinox: Option<i32>,
+    aberration: bool,
+) -> Result<(Vec<f64>, Vec<f64>), String> {
+    validate_angle_columns(ds50_utcs, ras, decs)?;
+    Ok((0..ras.len())
+        .map(|i| {
+            let ds50_utc = row_value(ds50_utcs, i);
+            let (mut ra, mut dec) = match yr_of_equinox {
+                Some(yr_of_equinox) => topo_meme_to_teme(yr_of_equinox, ds50_utc, ras[i], decs[i]),
+                None => (ras[i], decs[i]),
+            };
+            if aberration {
+                (ra, dec) = remove_aberration(ds50_utc, lla, ra, dec);
+            }
+            let [az, el] = time_ra_dec_to_az_el(ds50_utc, lla, ra, dec);
+            (az, el)
+        })
+        .unzip())
+}
+
+/// Convert many azimuth/elevation pairs (deg) seen from a sensor at `lla` to topocentric RA/Dec (deg).
+///
+/// Outputs are TEME of date, or MEME of `yr_of_equinox` when given.  With `aberration`, the SAAL annual and diurnal
+/// aberration offsets are removed before the equinox rotation.
+pub fn az_el_to_ra_dec_batch(
+    ds50_utcs: &[f64],
+    lla: &[f64; 3],
+    azs: &[f64],
+    els: &[f64],
+    yr_of_equinox: Option<i32>,
+    aberration: bool,
+) -> Result<(Vec<f64>, Vec<f64>), String> {
+    validate_angle_columns(ds50_utcs, azs, els)?;
+    Ok((0..azs.len())
+        .map(|i| {
+            let ds50_utc = row_value(ds50_utcs, i);
+            let [mut ra, mut dec] = time_az_el_to_ra_dec(ds50_utc, lla, azs[i], els[i]);
+            if aberration {
+                (ra, dec) = remove_aberration(ds50_utc, lla, ra, dec);
+            }
+            match yr_of_equinox {
+                Some(yr_of_equinox) => topo_teme_to_meme(yr_of_equinox, ds50_utc, ra, dec),
+                None => (ra, dec),
+            }
+        })
+        .unzip())
+}
+
 pub fn horizon_to_teme(
     lst: f64,
     lat: f64,
@@ -827,9 +1574,9 @@ pub fn horizon_to_teme(
     let mut teme_pos = [0.0; 3];
     let mut teme_vel = [0.0; 3];
 
-    unsafe {
+    stats::timed("RAEToECI", || unsafe {
         RAEToECI(lst, lat, xa_rae, sensor_teme, &mut teme_pos, &mut teme_vel);
-    }
+    });
 
     if teme_pos.iter().all(|&x| x == 0.0) && teme_vel.iter().all(|&x| x == 0.0) {
         Err(get_last_error_message())
@@ -845,19 +1592,62 @@ pub fn horizon_to_teme(
     }
 }
 
+/// Convert a geodetic position to TEME with a precomputed Greenwich angle, e.g. from a [`time::GreenwichTable`].
+pub fn gst_lla_to_teme(gst: f64, pos_lla: &[f64; 3]) -> [f64; 3] {
+    let mut pos_teme = [0.0; 3];
+    stats::timed("LLHToXYZ", || unsafe {
+        LLHToXYZ(gst, pos_lla, &mut pos_teme);
+    });
+    pos_teme
+}
+
 pub fn gst_teme_to_lla(gst: f64, teme_pos: &[f64; 3]) -> [f64; 3] {
     let mut pos_lla = [0.0; 3];
-    unsafe {
+    stats::timed("XYZToLLH", || unsafe {
         XYZToLLH(gst, teme_pos, &mut pos_lla);
-    }
+    });
     pos_lla
 }
 
+/// Rotate a TEME position into EFG about the pole by a Greenwich angle (radians); like `XYZToLLH`, polar motion is
+/// ignored.
+pub fn gst_teme_to_efg_position(gst: f64, teme_pos: &[f64; 3]) -> [f64; 3] {
+    let (sin_g, cos_g) = gst.sin_cos();
+    [
+        cos_g * teme_pos[0] + sin_g * teme_pos[1],
+        -sin_g * teme_pos[0] + cos_g * teme_pos[1],
+        teme_pos[2],
+    ]
+}
+
+/// Geodetic `[latitude, longitude, height]` (degrees, degrees in [0, 360), km) of an EFG position on an ellipsoid
+/// with equatorial `radius` (km) and `flattening`, computed natively without a DLL call.
+pub fn ellipsoid_efg_to_lla(efg_pos: &[f64; 3], radius: f64, flattening: f64) -> [f64; 3] {
+    let e2 = flattening * (2.0 - flattening);
+    let [x, y, z] = *efg_pos;
+    let p = x.hypot(y);
+    let mut lat = z.atan2(p * (1.0 - e2));
+    let mut height = 0.0;
+    for _ in 0..10 {
+        let (sin_lat, cos_lat) = lat.sin_cos();
+        let n = radius / (1.0 - e2 * sin_lat * sin_lat).sqrt();
+        height = p * cos_lat + z * sin_lat - radius * (1.0 - e2 * sin_lat * sin_lat).sqrt();
+        let next = z.atan2(p * (1.0 - e2 * n / (n + height)));
+        if (next - lat).abs() < 1.0e-14 {
+            lat = next;
+            break;
+        }
+        lat = next;
+    }
+    [lat.to_degrees(), y.atan2(x).to_degrees().rem_euclid(360.0), height]
+}
+
 pub fn time_teme_to_lla(ds50_utc: f64, teme_pos: &[f64; 3]) -> [f64; 3] {
+    let _ = ensure_time_constants();
     let mut pos_lla = [0.0; 3];
-    unsafe {
+    stats::timed("XYZToLLHTime", || unsafe {
         XYZToLLHTime(ds50_utc, teme_pos, &mut pos_lla);
-    }
+    });
     pos_lla
 }
 
@@ -866,9 +1656,9 @@ pub fn efg_to_lla(efg_pos: &[f64; 3]) -> Result<[f64; 3], String> {
     if efg_pos.iter().all(|&x| x == 0.0) {
         return Err("Input EFG position is zero vector.".to_string());
     }
-    unsafe {
+    stats::timed("EFGPosToLLH", || unsafe {
         EFGPosToLLH(efg_pos, &mut pos_lla);
-    }
+    });
     if pos_lla.iter().all(|&x| x == 0.0) {
         Err(get_last_error_message())
     } else {
@@ -876,6 +1666,16 @@ pub fn efg_to_lla(efg_pos: &[f64; 3]) -> Result<[f64; 3], String> {
     }
 }
 
+pub fn get_local_sidereal_time(ds50_utc: f64, longitude: f64) -> f64 {
+    let ds50_ut1 = time::utc_to_ut1(ds50_utc);
+    gst_to_local_sidereal_time(time::get_greenwich_angle(ds50_ut1), longitude)
+}
+
+/// Local sidereal time (radians) from a Greenwich angle (radians) and an east longitude (degrees).
+pub fn gst_to_local_sidereal_time(gst: f64, longitude: f64) -> f64 {
+    (gst + longitude.to_radians()).rem_euclid(2.0 * std::f64::consts::PI)
+}
+
 pub fn teme_to_topo(
     lst: f64,
     lat: f64,
@@ -885,9 +1685,9 @@ pub fn teme_to_topo(
     let mut xa_topo = [0.0; XA_TOPO_SIZE];
     let sat_pos = [sat_teme_posvel[0], sat_teme_posvel[1], sat_teme_posvel[2]];
     let sat_vel = [sat_teme_posvel[3], sat_teme_posvel[4], sat_teme_posvel[5]];
-    unsafe {
+    stats::timed("ECIToTopoComps", || unsafe {
         ECIToTopoComps(lst, lat, sen_teme_pos, &sat_pos, &sat_vel, &mut xa_topo);
-    }
+    });
 
     if xa_topo.iter().all(|&x| x == 0.0) {
         Err(get_last_error_message())
@@ -896,36 +1696,327 @@ pub fn teme_to_topo(
     }
 }
 
+// Serialises the JPL routines so a background sun/moon cache build never races a change of ephemeris file.
+static JPL_LOCK: Mutex<()> = Mutex::new(());
+
+fn lock_jpl() -> MutexGuard<'static, ()> {
+    JPL_LOCK.lock().unwrap_or_else(|e| e.into_inner())
+}
+
 pub fn get_jpl_sun_and_moon_position(ds50utc: f64) -> ([f64; 3], [f64; 3]) {
+    let _ = ensure_time_constants();
+    let _ = ensure_jpl_ephemeris();
     let mut sun_pos = [0.0; 3];
     let mut moon_pos = [0.0; 3];
-    unsafe {
+    let _jpl = lock_jpl();
+    stats::timed("JplCompSunMoonPos", || unsafe {
         JplCompSunMoonPos(ds50utc, &mut sun_pos, &mut moon_pos);
-    }
+    });
     (sun_pos, moon_pos)
 }
 
+// Chebyshev nodes (and coefficients) per axis in each sun/moon ephemeris segment
+const SUN_MOON_NODES: usize = 13;
+
+type SunMoonCoefficients = [[[f64; SUN_MOON_NODES]; 3]; 2];
+
+fn fit_sun_moon_segment(start: f64, end: f64, sample: impl Fn(f64) -> ([f64; 3], [f64; 3])) -> SunMoonCoefficients {
+    let n = SUN_MOON_NODES as f64;
+    let (mid, half) = ((start + end) / 2.0, (end - start) / 2.0);
+    let samples: Vec<([f64; 3], [f64; 3])> = (0..SUN_MOON_NODES)
+        .map(|k| sample(mid + half * (std::f64::consts::PI * (k as f64 + 0.5) / n).cos()))
+        .collect();
+    let mut coefficients = [[[0.0; SUN_MOON_NODES]; 3]; 2];
+    for j in 0..SUN_MOON_NODES {
+        for (k, (sun, moon)) in samples.iter().enumerate() {
+            let weight = 2.0 / n * (std::f64::consts::PI * j as f64 * (k as f64 + 0.5) / n).cos();
+            for axis in 0..3 {
+                coefficients[0][axis][j] += weight * sun[axis];
+                coefficients[1][axis][j] += weight * moon[axis];
+            }
+        }
+    }
+    for body in coefficients.iter_mut() {
+        for axis in body.iter_mut() {
+            axis[0] /= 2.0;
+        }
+    }
+    coefficients
+}
+
+fn evaluate_chebyshev(coefficients: &[f64; SUN_MOON_NODES], x: f64) -> f64 {
+    let (mut b1, mut b2) = (0.0, 0.0);
+    for &c in coefficients[1..].iter().rev() {
+        (b1, b2) = (2.0 * x * b1 - b2 + c, b1);
+    }
+    x * b1 - b2 + coefficients[0]
+}
+
+/// Sun and Moon positions fitted to Chebyshev segments over a time window.
+///
+/// Building samples `JplCompSunMoonPos` at 13 nodes per segment; lookups inside the window evaluate the fit (well
+/// below a metre for one-day segments) and lookups outside it fall back to the JPL routine.  Hits and misses are
+/// counted for both.
+pub struct SunMoonEphemeris {
+    pub start_ds50_utc: f64,
+    pub segment_days: f64,
+    segments: Vec<SunMoonCoefficients>,
+    hits: AtomicU64,
+    misses: AtomicU64,
+}
+
+impl SunMoonEphemeris {
+    pub fn new(start_ds50_utc: f64, stop_ds50_utc: f64, segment_days: f64) -> Result<Self, String> {
+        if segment_days <= 0.0 {
+            return Err(format!("Segment length must be positive: {}", segment_days));
+        }
+        if stop_ds50_utc <= start_ds50_utc {
+            return Err(format!(
+                "Stop time {} is not after start time {}",
+                stop_ds50_utc, start_ds50_utc
+            ));
+        }
+        let (sun, moon) = get_jpl_sun_and_moon_position(start_ds50_utc);
+        if sun.iter().chain(&moon).all(|&x| x == 0.0) {
+            return Err("JPL ephemeris is not loaded".to_string());
+        }
+        let count = ((stop_ds50_utc - start_ds50_utc) / segment_days).ceil() as usize;
+        let segments = (0..count)
+            .map(|i| {
+                let start = start_ds50_utc + i as f64 * segment_days;
+                fit_sun_moon_segment(start, start + segment_days, get_jpl_sun_and_moon_position)
+            })
+            .collect();
+        Ok(SunMoonEphemeris {
+            start_ds50_utc,
+            segment_days,
+            segments,
+            hits: AtomicU64::new(0),
+            misses: AtomicU64::new(0),
+        })
+    }
+
+    pub fn stop_ds50_utc(&self) -> f64 {
+        self.start_ds50_utc + self.segments.len() as f64 * self.segment_days
+    }
+
+    fn interpolate(&self, ds50_utc: f64) -> Option<([f64; 3], [f64; 3])> {
+        let offset = (ds50_utc - self.start_ds50_utc) / self.segment_days;
+        if !(0.0..=self.segments.len() as f64).contains(&offset) {
+            return None;
+        }
+        let index = (offset.floor() as usize).min(self.segments.len() - 1);
+        let x = 2.0 * (offset - index as f64) - 1.0;
+        let segment = &self.segments[index];
+        let body = |b: usize| [0, 1, 2].map(|axis| evaluate_chebyshev(&segment[b][axis], x));
+        Some((body(0), body(1)))
+    }
+
+    /// Return the (sun, moon) TEME positions in km, as [`get_jpl_sun_and_moon_position`].
+    pub fn get(&self, ds50_utc: f64) -> ([f64; 3], [f64; 3]) {
+        match self.interpolate(ds50_utc) {
+            Some(positions) => {
+                self.hits.fetch_add(1, Ordering::Relaxed);
+                positions
+            }
+            None => {
+                self.misses.fetch_add(1, Ordering::Relaxed);
+                get_jpl_sun_and_moon_position(ds50_utc)
+            }
+        }
+    }
+
+    pub fn get_many(&self, ds50_utcs: &[f64]) -> Vec<([f64; 3], [f64; 3])> {
+        ds50_utcs.iter().map(|&ds50_utc| self.get(ds50_utc)).collect()
+    }
+
+    /// Return the (hits, misses) counted since the table was built.
+    pub fn stats(&self) -> (u64, u64) {
+        (self.hits.load(Ordering::Relaxed), self.misses.load(Ordering::Relaxed))
+    }
+}
+
+static SUN_MOON_CACHE: LazyLock<RwLock<Option<Arc<SunMoonEphemeris>>>> = LazyLock::new(|| RwLock::new(None));
+
+// Bumped by every clear so a build that started before it is discarded instead of installing a stale table.
+static SUN_MOON_GENERATION: AtomicU64 = AtomicU64::new(0);
+
+fn sun_moon_cache() -> Option<Arc<SunMoonEphemeris>> {
+    SUN_MOON_CACHE.read().unwrap_or_else(|e| e.into_inner()).clone()
+}
+
+/// Build a [`SunMoonEphemeris`] for the window and use it for the `get_cached_sun_and_moon_*` lookups.
+///
+/// Fails without installing anything if the cache is cleared (e.g. by a new JPL file) while the table is built.
+pub fn load_sun_moon_cache(start_ds50_utc: f64, stop_ds50_utc: f64, segment_days: f64) -> Result<(), String> {
+    // Configuring the bundled JPL file clears the cache, so it must happen before the generation is read.
+    ensure_jpl_ephemeris()?;
+    let generation = SUN_MOON_GENERATION.load(Ordering::Acquire);
+    let ephemeris = SunMoonEphemeris::new(start_ds50_utc, stop_ds50_utc, segment_days)?;
+    let mut cache = SUN_MOON_CACHE.write().unwrap_or_else(|e| e.into_inner());
+    if SUN_MOON_GENERATION.load(Ordering::Acquire) != generation {
+        return Err("Sun/moon cache was cleared while it was being built".to_string());
+    }
+    *cache = Some(Arc::new(ephemeris));
+    Ok(())
+}
+
+/// Build the sun/moon cache on a background thread.  Lookups made before it is installed fall back to JPL; join the
+/// handle to wait for the table and receive any build error.
+pub fn preload_sun_moon_cache(
+    start_ds50_utc: f64,
+    stop_ds50_utc: f64,
+    segment_days: f64,
+) -> JoinHandle<Result<(), String>> {
+    std::thread::spawn(move || load_sun_moon_cache(start_ds50_utc, stop_ds50_utc, segment_days))
+}
+
+pub fn clear_sun_moon_cache() {
+    let mut cache = SUN_MOON_CACHE.write().unwrap_or_else(|e| e.into_inner());
+    SUN_MOON_GENERATION.fetch_add(1, Ordering::AcqRel);
+    *cache = None;
+}
+
+/// Return the (sun, moon) positions from the loaded cache, or from JPL when no cache covers `ds50_utc`.
+pub fn get_cached_sun_and_moon_position(ds50_utc: f64) -> ([f64; 3], [f64; 3]) {
+    match sun_moon_cache() {
+        Some(cache) => cache.get(ds50_utc),
+        None => get_jpl_sun_and_moon_position(ds50_utc),
+    }
+}
+
+pub fn get_cached_sun_and_moon_positions(ds50_utcs: &[f64]) -> Vec<([f64; 3], [f64; 3])> {
+    match sun_moon_cache() {
+        Some(cache) => cache.get_many(ds50_utcs),
+        None => ds50_utcs
+            .iter()
+            .map(|&ds50_utc| get_jpl_sun_and_moon_position(ds50_utc))
+            .collect(),
+    }
+}
+
+/// Return the loaded cache's (hits, misses), or `None` when no cache is loaded.
+pub fn get_sun_moon_cache_stats() -> Option<(u64, u64)> {
+    sun_moon_cache().map(|cache| cache.stats())
+}
+
 pub fn point_is_sunlit(ds50_tt: f64, teme_pos: &[f64; 3]) -> bool {
-    unsafe { IsPointSunlit(ds50_tt, teme_pos) == 1 }
+    let _ = ensure_jpl_ephemeris();
+    stats::timed("IsPointSunlit", || unsafe { IsPointSunlit(ds50_tt, teme_pos) == 1 })
 }
 
 pub fn get_earth_obstruction_angles(sat_teme_pos: &[f64; 3], sensor_teme_pos: &[f64; 3]) -> (f64, f64, f64) {
+    earth_obstruction_angles(environment::get_earth_constants().radius, sat_teme_pos, sensor_teme_pos)
+}
+
+fn earth_obstruction_angles(earth_radius: f64, sat_teme_pos: &[f64; 3], sensor_teme_pos: &[f64; 3]) -> (f64, f64, f64) {
     let mut earth_sensor_limb = 0.0;
     let mut earth_sensor_sat = 0.0;
     let mut sat_earth_sensor = 0.0;
-    unsafe {
+    stats::timed("EarthObstructionAngles", || unsafe {
         EarthObstructionAngles(
-            environment::get_earth_radius(),
+            earth_radius,
             sat_teme_pos,
             sensor_teme_pos,
             &mut earth_sensor_limb,
             &mut earth_sensor_sat,
             &mut sat_earth_sensor,
         );
-    }
+    });
     (earth_sensor_limb, earth_sensor_sat, sat_earth_sensor)
 }
 
+/// Compute the Earth obstruction angles for every (sensor, satellite) pair.
+///
+/// The Earth radius is read once for the whole batch.  Results are flattened in (sensor, satellite) order, so the
+/// angles of sensor `i` and satellite `j` are at index `i * sat_teme_positions.len() + j`.
+pub fn get_earth_obstruction_angles_batch(
+    sensor_teme_positions: &[[f64; 3]],
+    sat_teme_positions: &[[f64; 3]],
+) -> Vec<[f64; 3]> {
+    let earth_radius = environment::get_earth_constants().radius;
+    sensor_teme_positions
+        .iter()
+        .flat_map(|sensor| {
+            sat_teme_positions.iter().map(move |sat| {
+                let (earth_sensor_limb, earth_sensor_sat, sat_earth_sensor) =
+                    earth_obstruction_angles(earth_radius, sat, sensor);
+                [earth_sensor_limb, earth_sensor_sat, sat_earth_sensor]
+            })
+        })
+        .collect()
+}
+
+// Pairs below this count are checked on the calling thread.
+const LINE_OF_SIGHT_PARALLEL_PAIRS: usize = 16384;
+
+fn has_line_of_sight(observer: &[f64; 3], target: &[f64; 3], min_radius_sq: f64) -> bool {
+    let d = [
+        target[0] - observer[0],
+        target[1] - observer[1],
+        target[2] - observer[2],
+    ];
+    let dd = d[0] * d[0] + d[1] * d[1] + d[2] * d[2];
+    let s = -(observer[0] * d[0] + observer[1] * d[1] + observer[2] * d[2]) / dd;
+    // The endpoints are not tested, so the segment only climbs away from the Earth when its closest approach to the
+    // geocenter is not strictly between them.
+    if dd == 0.0 || s <= 0.0 || s >= 1.0 {
+        return true;
+    }
+    let closest = [observer[0] + s * d[0], observer[1] + s * d[1], observer[2] + s * d[2]];
+    closest[0] * closest[0] + closest[1] * closest[1] + closest[2] * closest[2] > min_radius_sq
+}
+
+fn fill_line_of_sight(observers: &[[f64; 3]], targets: &[[f64; 3]], min_radius_sq: f64, out: &mut [bool]) {
+    for (observer, row) in observers.iter().zip(out.chunks_mut(targets.len())) {
+        for (target, visible) in targets.iter().zip(row.iter_mut()) {
+            *visible = has_line_of_sight(observer, target, min_radius_sq);
+        }
+    }
+}
+
+/// Return the line-of-sight matrix between TEME observer and target positions (km).
+///
+/// A pair is visible when the segment between them stays above the Earth radius plus `grazing_height_km`.  The
+/// endpoints themselves are excluded, so a ground sensor sitting below that radius still sees targets the segment
+/// climbs toward.  The Earth radius is read once and large matrices are split across threads by observer.  Results are flattened in
+/// (observer, target) order.
+pub fn get_line_of_sight_matrix(
+    observer_teme_positions: &[[f64; 3]],
+    target_teme_positions: &[[f64; 3]],
+    grazing_height_km: f64,
+) -> Vec<bool> {
+    let min_radius = environment::get_earth_constants().radius + grazing_height_km;
+    let min_radius_sq = min_radius * min_radius;
+    let columns = target_teme_positions.len();
+    let mut visible = vec![false; observer_teme_positions.len() * columns];
+    if columns == 0 {
+        return visible;
+    }
+
+    let threads = std::thread::available_parallelism().map_or(1, |n| n.get());
+    if visible.len() < LINE_OF_SIGHT_PARALLEL_PAIRS || threads == 1 {
+        fill_line_of_sight(
+            observer_teme_positions,
+            target_teme_positions,
+            min_radius_sq,
+            &mut visible,
+        );
+        return visible;
+    }
+
+    let rows_per_thread = observer_teme_positions.len().div_ceil(threads);
+    std::thread::scope(|scope| {
+        for (observers, out) in observer_teme_positions
+            .chunks(rows_per_thread)
+            .zip(visible.chunks_mut(rows_per_thread * columns))
+        {
+            scope.spawn(move || fill_line_of_sight(observers, target_teme_positions, min_radius_sq, out));
+        }
+    });
+    visible
+}
+
 #[cfg(test)]
 mod tests {
     use super::*;
@@ -1077,6 +2168,27 @@ mod tests {
         assert_abs_diff_eq!(llh[2], 5085.218731, epsilon = 1.0e-5);
     }
 
+    #[test]
+    fn test_native_teme_to_lla_matches_dll() {
+        let _lock = TEST_LOCK.lock().unwrap();
+        let constants = environment::get_earth_constants();
+        let ds50_utc = 17687.91562858796;
+        let gst = time::get_greenwich_angles(&[ds50_utc], None).unwrap()[0];
+        for xyz in [
+            [6524.834, 6862.875, 6448.296],
+            [-33722.2, 3451.09, 14050.1],
+            [7000.0, 0.0, 0.0],
+            [100.0, -50.0, -6400.0],
+        ] {
+            let efg = gst_teme_to_efg_position(gst, &xyz);
+            let native = ellipsoid_efg_to_lla(&efg, constants.radius, constants.flattening);
+            let dll = time_teme_to_lla(ds50_utc, &xyz);
+            assert_abs_diff_eq!(native[0], dll[0], epsilon = 1.0e-7);
+            assert_abs_diff_eq!(native[1], dll[1], epsilon = 1.0e-7);
+            assert_abs_diff_eq!(native[2], dll[2], epsilon = 1.0e-5);
+        }
+    }
+
     #[test]
     fn test_time_teme_to_lla_without_tcon() {
         let _lock = TEST_LOCK.lock().unwrap();
@@ -1084,7 +2196,7 @@ mod tests {
         let ds50_utc = 17687.91562858796;
         let xyz = [6524.834, 6862.875, 6448.296];
         let llh = time_teme_to_lla(ds50_utc, &xyz);
-        initialize_time_constants();
+        initialize_time_constants().unwrap();
 
         assert_abs_diff_eq!(llh[0], 34.3524936102065, epsilon = 1.0e-9);
         assert_abs_diff_eq!(llh[1], 183.6827264765011, epsilon = 1.0e-9);
@@ -1098,7 +2210,7 @@ mod tests {
         let ds50_utc = 17687.91562858796;
         let llh = [34.3524936102065, 183.6827264765011, 5085.220665718614];
         let xyz = lla_to_teme(ds50_utc, &llh);
-        initialize_time_constants();
+        initialize_time_constants().unwrap();
 
         assert_abs_diff_eq!(xyz[0], 6524.834045160657, epsilon = 1.0e-9);
         assert_abs_diff_eq!(xyz[1], 6862.875047500358, epsilon = 1.0e-9);
@@ -1121,7 +2233,7 @@ mod tests {
         assert_abs_diff_eq!(az_el[1], 26.497513882129642, epsilon = 1.0e-10);
 
         let az_el_time = time_ra_dec_to_az_el(ds50_utc, &lla, ra, dec);
-        initialize_time_constants();
+        initialize_time_constants().unwrap();
         assert_abs_diff_eq!(az_el_time[0], az_el[0], epsilon = 1.0e-10);
         assert_abs_diff_eq!(az_el_time[1], az_el[1], epsilon = 1.0e-10);
     }
@@ -1202,4 +2314,314 @@ mod tests {
         assert_abs_diff_eq!(llh[1], 46.446417, epsilon = 1.0e-5);
         assert_abs_diff_eq!(llh[2], 5085.218731, epsilon = 1.0e-5);
     }
+
+    #[test]
+    fn test_convert_frames() {
+        let _lock = TEST_LOCK.lock().unwrap();
+        let teme = [
+            [
+                -3037.43125693340,
+                -446.126917413657,
+                6208.50743364866,
+                -5.9371856123,
+                -3.5138950093,
+                -3.1519934694,
+            ],
+            [7000.0, 0.0, 0.0, 0.0, 7.5, 0.0],
+        ];
+        let epochs = [25000.25, 25000.75];
+        let ecr = convert_frames(FRAME_TEME, FRAME_ECR, &epochs, &teme).unwrap();
+        let mut round_trip = ecr.clone();
+        convert_frames_in_place(FRAME_ECR, FRAME_J2000, &epochs, &mut round_trip).unwrap();
+        convert_frames_in_place(FRAME_J2000, FRAME_TEME, &epochs, &mut round_trip).unwrap();
+        let shared = convert_frames(FRAME_TEME, FRAME_J2000, &epochs[..1], &teme).unwrap();
+
+        let direct_ecr = teme_to_ecr(epochs[1], &teme[1]);
+        let direct_j2000 = teme_to_j2000(epochs[0], &teme[1]);
+        for i in 0..6 {
+            assert_abs_diff_eq!(ecr[1][i], direct_ecr[i], epsilon = 1.0e-9);
+            assert_abs_diff_eq!(shared[1][i], direct_j2000[i], epsilon = 1.0e-9);
+        }
+        for (a, b) in round_trip.iter().zip(&teme) {
+            for i in 0..6 {
+                assert_abs_diff_eq!(a[i], b[i], epsilon = 1.0e-7);
+            }
+        }
+        assert!(convert_frames(FRAME_TEME, FRAME_ECR, &[25000.0; 3], &teme).is_err());
+        assert!(convert_frame(FRAME_TEME, 7, 25000.0, &teme[0]).is_err());
+    }
+
+    #[test]
+    fn test_frame_plan_matches_direct_conversion() {
+        let _lock = TEST_LOCK.lock().unwrap();
+        let states: Vec<[f64; 6]> = (0..8)
+            .map(|i| {
+                let angle = i as f64 * 0.7;
+                [
+                    7000.0 * angle.cos(),
+                    7000.0 * angle.sin(),
+                    1200.0,
+                    -7.5 * angle.sin(),
+                    7.5 * angle.cos(),
+                    0.4,
+                ]
+            })
+            .collect();
+        let epochs = [26000.125, 26000.5];
+        for (from_frame, to_frame) in [
+            (FRAME_TEME, FRAME_J2000),
+            (FRAME_J2000, FRAME_ECR),
+            (FRAME_ECR, FRAME_TEME),
+        ] {
+            let plan = FramePlan::new(from_frame, to_frame, &epochs).unwrap();
+            let mut snapshot = states.clone();
+            convert_frames_in_place(from_frame, to_frame, &epochs[1..], &mut snapshot).unwrap();
+            for (i, state) in states.iter().enumerate() {
+                let direct = convert_frame(from_frame, to_frame, epochs[1], state).unwrap();
+                let planned = plan.apply(1, state).unwrap();
+                for k in 0..6 {
+                    assert_abs_diff_eq!(planned[k], direct[k], epsilon = 1.0e-9);
+                    assert_abs_diff_eq!(snapshot[i][k], direct[k], epsilon = 1.0e-9);
+                }
+            }
+            assert!(plan.apply(2, &states[0]).is_err());
+            assert!(plan.apply_in_place(&mut snapshot).is_err());
+        }
+        clear_rotation_cache();
+    }
+
+    #[test]
+    fn test_element_batches() {
+        let _lock = TEST_LOCK.lock().unwrap();
+        let keps = [
+            [26558.482, 0.006257, 54.935, 234.764, 165.472, 217.612],
+            [7200.0, 0.006257, 54.935, 234.764, 165.472, 217.612],
+            [f64::NAN, 0.0, 0.0, 0.0, 0.0, 0.0],
+        ];
+        let (cart, cart_failed) = keplerian_to_cartesian_batch(&keps);
+        let (back, back_failed) = cartesian_to_keplerian_batch(&cart[..2], Some(&[398600.8])).unwrap();
+        let (eqnx, _) = position_velocity_to_equinoctial_batch(&cart[..2], None).unwrap();
+        let (mean, _) = osculating_to_mean_batch(&keps[1..2]);
+        let (brouwer, brouwer_failed) = kozai_to_brouwer_batch(&[0.0005], &[30.0], &[8.2345678, 15.5]).unwrap();
+        let (kozai, _) = brouwer_to_kozai_batch(&[0.0005], &[30.0], &brouwer).unwrap();
+
+        assert_eq!(cart_failed, vec![false, false, true]);
+        assert!(cart[2].iter().all(|x| x.is_nan()));
+        assert_eq!(cart[1], keplerian_to_cartesian(&keps[1]));
+        assert_eq!(back_failed, vec![false, false]);
+        assert_eq!(eqnx[0], position_velocity_to_equinoctial(&cart[0]));
+        assert_eq!(mean[0], osculating_to_mean(&keps[1]));
+        for i in 0..6 {
+            assert_abs_diff_eq!(back[0][i], keps[0][i], epsilon = 1.0e-6);
+        }
+        assert_eq!(brouwer_failed, vec![false, false]);
+        assert_abs_diff_eq!(kozai[0], 8.2345678, epsilon = 1.0e-6);
+        assert_abs_diff_eq!(kozai[1], 15.5, epsilon = 1.0e-6);
+        assert!(cartesian_to_keplerian_batch(&cart, Some(&[1.0, 2.0])).is_err());
+    }
+
+    #[test]
+    fn test_transform_covariances() {
+        let _lock = TEST_LOCK.lock().unwrap();
+        let states = [
+            [
+                -3032.21272487,
+                -15025.7763831,
+                21806.4954366,
+                3.7543500202,
+                -0.889562019026,
+                -0.114933710268,
+            ],
+            [7000.0, 0.0, 0.0, 0.0, 7.5, 0.0],
+        ];
+        let mut cov = [[0.0; 6]; 6];
+        for (i, row) in cov.iter_mut().enumerate() {
+            for (j, value) in row.iter_mut().enumerate() {
+                *value = if i == j {
+                    (i + 1) as f64
+                } else {
+                    0.1 / (1.0 + (i as f64 - j as f64).abs())
+                };
+            }
+        }
+        let covs = [cov, cov];
+        let uvw = transform_covariances(COV_TEME_TO_UVW, &states, &[], &covs).unwrap();
+        let teme = transform_covariances(COV_UVW_TO_TEME, &states, &[], &uvw).unwrap();
+        let efg = transform_covariances(COV_TEME_TO_EFG, &[], &[25000.5], &covs).unwrap();
+        let lta21s: Vec<[f64; 21]> = covs.iter().map(matrix_to_lta21).collect();
+        let packed = transform_covariances_lta21(COV_TEME_TO_UVW, &states, &[], &lta21s).unwrap();
+
+        assert_eq!(uvw[1], covariance_teme_to_uvw(&states[1], &cov));
+        assert_eq!(efg[0], covariance_teme_to_efg(25000.5, &cov));
+        assert_eq!(lta21_to_matrix(&lta21s[0]), cov);
+        for n in 0..2 {
+            let unpacked = lta21_to_matrix(&packed[n]);
+            for i in 0..6 {
+                for j in 0..6 {
+                    assert_abs_diff_eq!(unpacked[i][j], uvw[n][i][j], epsilon = 1.0e-9);
+                    assert_abs_diff_eq!(teme[n][i][j], cov[i][j], epsilon = 1.0e-9);
+                }
+            }
+        }
+        assert!(transform_covariances(COV_TEME_TO_UVW, &states[..1], &[], &covs).is_err());
+        assert!(transform_covariances(COV_TEME_TO_EFG, &[], &[1.0, 2.0, 3.0], &covs).is_err());
+        assert!(transform_covariances(42, &states, &[], &covs).is_err());
+    }
+
+    #[test]
+    fn test_sun_moon_chebyshev_fit() {
+        let orbit = |t: f64| {
+            let (sin, cos) = (t * 0.23).sin_cos();
+            (
+                [1.5e8 * cos, 1.5e8 * sin, 1.0e3 * t],
+                [3.8e5 * sin, -3.8e5 * cos, 2.0e4 * sin],
+            )
+        };
+        let coefficients = fit_sun_moon_segment(100.0, 101.0, orbit);
+        for t in [100.0, 100.1, 100.37, 100.5, 100.99, 101.0] {
+            let (sun, moon) = orbit(t);
+            let x = 2.0 * (t - 100.0) - 1.0;
+            for axis in 0..3 {
+                assert_abs_diff_eq!(
+                    evaluate_chebyshev(&coefficients[0][axis], x),
+                    sun[axis],
+                    epsilon = 1.0e-6
+                );
+                assert_abs_diff_eq!(
+                    evaluate_chebyshev(&coefficients[1][axis], x),
+                    moon[axis],
+                    epsilon = 1.0e-6
+                );
+            }
+        }
+    }
+
+    #[test]
+    fn test_sun_moon_cache() {
+        let _lock = TEST_LOCK.lock().unwrap();
+        let start = 27000.0;
+        let (sun, moon) = get_jpl_sun_and_moon_position(start + 1.3);
+        load_sun_moon_cache(start, start + 3.0, 1.0).unwrap();
+        let (cached_sun, cached_moon) = get_cached_sun_and_moon_position(start + 1.3);
+        let outside = get_cached_sun_and_moon_positions(&[start - 1.0, start + 2.5]);
+        let stats = get_sun_moon_cache_stats();
+        clear_sun_moon_cache();
+
+        for axis in 0..3 {
+            assert_abs_diff_eq!(cached_sun[axis], sun[axis], epsilon = 1.0e-3);
+            assert_abs_diff_eq!(cached_moon[axis], moon[axis], epsilon = 1.0e-3);
+        }
+        assert_eq!(outside[0], get_jpl_sun_and_moon_position(start - 1.0));
+        assert_eq!(stats, Some((2, 1)));
+        assert!(get_sun_moon_cache_stats().is_none());
+
+        let generation = SUN_MOON_GENERATION.load(Ordering::Acquire);
+        preload_sun_moon_cache(start, start + 3.0, 1.0).join().unwrap().unwrap();
+        assert!(get_sun_moon_cache_stats().is_some());
+        clear_sun_moon_cache();
+        assert_eq!(SUN_MOON_GENERATION.load(Ordering::Acquire), generation + 1);
+    }
+
+    #[test]
+    fn test_sun_moon_cache_cold_start() {
+        let _lock = TEST_LOCK.lock().unwrap();
+        crate::reset_jpl_ephemeris();
+        load_sun_moon_cache(27000.0, 27002.0, 1.0).unwrap();
+        let installed = get_sun_moon_cache_stats();
+        clear_sun_moon_cache();
+        crate::reset_jpl_ephemeris();
+        let preloaded = preload_sun_moon_cache(27000.0, 27002.0, 1.0).join().unwrap();
+        let preload_installed = get_sun_moon_cache_stats();
+        clear_sun_moon_cache();
+
+        assert_eq!(installed, Some((0, 0)));
+        assert!(preloaded.is_ok());
+        assert!(preload_installed.is_some());
+    }
+
+    #[test]
+    fn test_angle_batches() {
+        let _lock = TEST_LOCK.lock().unwrap();
+        let lla = [33.81724, 106.66031, 1.510];
+        let epochs = [25000.25, 25000.5, 25000.75];
+        let (ras, decs) = ([10.0, 120.0, 250.0], [5.0, -20.0, 45.0]);
+        let (azs, els) = ra_dec_to_az_el_batch(&epochs, &lla, &ras, &decs, None, false).unwrap();
+        let (ras_back, decs_back) = az_el_to_ra_dec_batch(&epochs, &lla, &azs, &els, None, false).unwrap();
+        let (meme_ras, meme_decs) = topo_teme_to_meme_batch(2, &epochs[..1], &ras, &decs).unwrap();
+        let (teme_ras, teme_decs) = topo_meme_to_teme_batch(2, &epochs[..1], &meme_ras, &meme_decs).unwrap();
+        let (meme_azs, meme_els) = ra_dec_to_az_el_batch(&epochs, &lla, &meme_ras, &meme_decs, Some(2), false).unwrap();
+        let (corrected_azs, corrected_els) = ra_dec_to_az_el_batch(&epochs, &lla, &ras, &decs, None, true).unwrap();
+
+        assert_eq!([azs[1], els[1]], time_ra_dec_to_az_el(epochs[1], &lla, ras[1], decs[1]));
+        assert_eq!(
+            (meme_ras[2], meme_decs[2]),
+            topo_teme_to_meme(2, epochs[0], ras[2], decs[2])
+        );
+        for i in 0..3 {
+            assert_abs_diff_eq!(ras_back[i], ras[i], epsilon = 1.0e-7);
+            assert_abs_diff_eq!(decs_back[i], decs[i], epsilon = 1.0e-7);
+            assert_abs_diff_eq!(teme_ras[i], ras[i], epsilon = 1.0e-7);
+            assert_abs_diff_eq!(teme_decs[i], decs[i], epsilon = 1.0e-7);
+        }
+        for i in 0..3 {
+            // The correction must move each direction by the SAAL annual plus diurnal offset, not leave it unchanged.
+            let (annual_ra, annual_dec) = get_annual_aberration(epochs[i], ras[i], decs[i]);
+            let sensor_teme_pos = lla_to_teme(epochs[i], &lla);
+            let (diurnal_ra, diurnal_dec) = get_diurnal_aberration(epochs[i], &sensor_teme_pos, ras[i], decs[i]);
+            let (delta_ra, delta_dec) = (annual_ra + diurnal_ra, annual_dec + diurnal_dec);
+            let expected_offset = (delta_ra * decs[i].to_radians().cos()).hypot(delta_dec);
+            let [expected_az, expected_el] =
+                time_ra_dec_to_az_el(epochs[i], &lla, ras[i] - delta_ra, decs[i] - delta_dec);
+            let offset = ((corrected_azs[i] - azs[i]) * els[i].to_radians().cos()).hypot(corrected_els[i] - els[i]);
+
+            assert!(expected_offset > 1.0e-3);
+            assert_abs_diff_eq!(offset, expected_offset, epsilon = 1.0e-6);
+            assert_abs_diff_eq!(corrected_azs[i], expected_az, epsilon = 1.0e-9);
+            assert_abs_diff_eq!(corrected_els[i], expected_el, epsilon = 1.0e-9);
+        }
+        assert_abs_diff_eq!(meme_azs[0], azs[0], epsilon = 1.0e-4);
+        assert_abs_diff_eq!(meme_els[0], els[0], epsilon = 1.0e-4);
+        assert!(ra_dec_to_az_el_batch(&epochs[..2], &lla, &ras, &decs, None, false).is_err());
+        assert!(az_el_to_ra_dec_batch(&epochs, &lla, &azs, &els[..2], None, false).is_err());
+    }
+
+    #[test]
+    fn test_line_of_sight_batches() {
+        let _lock = TEST_LOCK.lock().unwrap();
+        let sensors = [[7000.0, 0.0, 0.0], [0.0, 42164.0, 0.0]];
+        let sats = [[-7000.0, 0.0, 0.0], [7000.0, 1000.0, 0.0], [0.0, 7200.0, 300.0]];
+        let angles = get_earth_obstruction_angles_batch(&sensors, &sats);
+        let (limb, sensor_sat, sat_sensor) = get_earth_obstruction_angles(&sats[2], &sensors[1]);
+        let visible = get_line_of_sight_matrix(&sensors, &sats, 0.0);
+
+        assert_eq!(angles.len(), 6);
+        assert_eq!(angles[5], [limb, sensor_sat, sat_sensor]);
+        assert_eq!(visible, vec![false, true, false, true, true, true]);
+        assert_eq!(get_line_of_sight_matrix(&sensors[1..], &sats[..1], 0.0), vec![true]);
+        assert_eq!(get_line_of_sight_matrix(&sensors[1..], &sats[..1], 100.0), vec![true]);
+        assert_eq!(get_line_of_sight_matrix(&sensors[1..], &sats[..1], 1000.0), vec![false]);
+        assert_eq!(get_line_of_sight_matrix(&sensors[..1], &sats[1..2], 1000.0), vec![true]);
+
+        let polar_site = [[0.0, 0.0, 6356.75]];
+        let overhead = [[0.0, 0.0, 7000.0], [0.0, 0.0, -7000.0]];
+        assert_eq!(get_line_of_sight_matrix(&polar_site, &overhead, 0.0), vec![true, false]);
+        assert_eq!(get_line_of_sight_matrix(&polar_site, &polar_site, 0.0), vec![true]);
+
+        let ring: Vec<[f64; 3]> = (0..200)
+            .map(|i| {
+                let angle = i as f64 * PI / 100.0;
+                [8000.0 * angle.cos(), 8000.0 * angle.sin(), 500.0 * (3.0 * angle).sin()]
+            })
+            .collect();
+        let radius_sq = (environment::get_earth_radius() + 50.0).powi(2);
+        let ring_visible = get_line_of_sight_matrix(&ring, &ring, 50.0);
+        for (i, observer) in ring.iter().enumerate() {
+            for (j, target) in ring.iter().enumerate() {
+                assert_eq!(
+                    ring_visible[i * ring.len() + j],
+                    has_line_of_sight(observer, target, radius_sq)
+                );
+            }
+        }
+    }
 }
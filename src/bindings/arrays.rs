@@ -0,0 +1,98 @@
+use std::borrow::Cow;
+
+use numpy::{
+    Element, PyArray1, PyArray2, PyArray3, PyArrayMethods, PyReadonlyArray1, PyReadonlyArray2, PyReadonlyArray3,
+    PyReadwriteArray2, PyUntypedArrayMethods,
+};
+use pyo3::exceptions::PyValueError;
+use pyo3::prelude::*;
+
+fn check_shape(shape: &[usize], trailing: &[usize]) -> PyResult<()> {
+    if shape[1..] != *trailing {
+        return Err(PyValueError::new_err(format!(
+            "Expected an (N, {}) array, got shape {:?}",
+            trailing.iter().map(usize::to_string).collect::<Vec<_>>().join(", "),
+            shape
+        )));
+    }
+    Ok(())
+}
+
+/// View a vector as a slice, copying only when it is not contiguous.
+pub(crate) fn values<'a, T: Element>(array: &'a PyReadonlyArray1<'_, T>) -> Cow<'a, [T]> {
+    match array.as_slice() {
+        Ok(values) => Cow::Borrowed(values),
+        Err(_) => Cow::Owned(array.as_array().to_vec()),
+    }
+}
+
+/// View an `(N, COLS)` float64 array as rows, copying only when it is not C-contiguous.
+pub(crate) fn rows<'a, const COLS: usize>(array: &'a PyReadonlyArray2<'_, f64>) -> PyResult<Cow<'a, [[f64; COLS]]>> {
+    check_shape(array.shape(), &[COLS])?;
+    Ok(match array.as_slice() {
+        Ok(values) => Cow::Borrowed(values.as_chunks::<COLS>().0),
+        Err(_) => Cow::Owned(
+            array
+                .as_array()
+                .rows()
+                .into_iter()
+                .map(|row| std::array::from_fn(|j| row[j]))
+                .collect(),
+        ),
+    })
+}
+
+/// View an `(N, ROWS, COLS)` float64 array as matrices, copying only when it is not C-contiguous.
+pub(crate) fn matrices<'a, const ROWS: usize, const COLS: usize>(
+    array: &'a PyReadonlyArray3<'_, f64>,
+) -> PyResult<Cow<'a, [[[f64; COLS]; ROWS]]>> {
+    check_shape(array.shape(), &[ROWS, COLS])?;
+    Ok(match array.as_slice() {
+        Ok(values) => Cow::Borrowed(values.as_chunks::<COLS>().0.as_chunks::<ROWS>().0),
+        Err(_) => Cow::Owned(
+            array
+                .as_array()
+                .outer_iter()
+                .map(|matrix| std::array::from_fn(|i| std::array::from_fn(|j| matrix[[i, j]])))
+                .collect(),
+        ),
+    })
+}
+
+/// Borrow a C-contiguous `(N, COLS)` float64 array as mutable rows.
+pub(crate) fn rows_mut<'a, const COLS: usize>(
+    array: &'a mut PyReadwriteArray2<'_, f64>,
+) -> PyResult<&'a mut [[f64; COLS]]> {
+    check_shape(array.shape(), &[COLS])?;
+    let values = array
+        .as_slice_mut()
+        .map_err(|err| PyValueError::new_err(err.to_string()))?;
+    Ok(values.as_chunks_mut::<COLS>().0)
+}
+
+/// Move row-major values into a new `(len / columns, columns)` float64 array without copying them.
+pub(crate) fn flat_to_array<'py>(
+    py: Python<'py>,
+    values: Vec<f64>,
+    columns: usize,
+) -> PyResult<Bound<'py, PyArray2<f64>>> {
+    let count = values.len().checked_div(columns).unwrap_or(0);
+    PyArray1::from_vec(py, values).reshape([count, columns])
+}
+
+/// Move rows into a new `(N, COLS)` float64 array without copying them.
+pub(crate) fn rows_to_array<'py, const COLS: usize>(
+    py: Python<'py>,
+    rows: Vec<[f64; COLS]>,
+) -> PyResult<Bound<'py, PyArray2<f64>>> {
+    flat_to_array(py, rows.into_flattened(), COLS)
+}
+
+/// Move matrices into a new `(N, ROWS, COLS)` float64 array without copying them.
+pub(crate) fn matrices_to_array<'py, const ROWS: usize, const COLS: usize>(
+    py: Python<'py>,
+    matrices: Vec<[[f64; COLS]; ROWS]>,
+) -> PyResult<Bound<'py, PyArray3<f64>>> {
+    let count = matrices.len();
+    PyArray1::from_vec(py, matrices.into_flattened().into_flattened()).reshape([count, ROWS, COLS])
+}
@@ -1,8 +1,15 @@
-use pyo3::exceptions::PyRuntimeError;
+use numpy::{
+    AllowTypeChange, IntoPyArray, PyArray1, PyArray2, PyArray3, PyArrayLike1, PyArrayLike2, PyArrayLike3,
+    PyArrayMethods,
+};
+use pyo3::exceptions::{PyRuntimeError, PyValueError};
 use pyo3::prelude::*;
+use std::sync::Mutex;
+use std::thread::JoinHandle;
 
 use crate::astro::{
-    brouwer_to_kozai, cartesian_to_keplerian, covariance_equinoctial_to_uvw, covariance_uvw_to_teme,
+    self, FramePlan, brouwer_to_kozai, cartesian_to_keplerian, convert_frame, convert_frames_in_place,
+    covariance_equinoctial_to_uvw, covariance_uvw_to_teme,
     ecr_to_efg, ecr_to_j2000, ecr_to_teme, efg_to_ecr, efg_to_j2000, efg_to_lla, efg_to_teme,
     equinoctial_to_keplerian, get_dll_info, get_earth_obstruction_angles, get_jpl_sun_and_moon_position,
     gst_ra_dec_to_az_el, gst_teme_to_lla, horizon_to_teme, j2000_to_ecr, j2000_to_efg, j2000_to_teme,
@@ -12,8 +19,26 @@ use crate::astro::{
     teme_to_efg, teme_to_j2000, teme_to_topo, time_ra_dec_to_az_el, time_teme_to_lla, topo_meme_to_teme,
     topo_teme_to_meme,
 };
+use super::arrays;
+use super::time_interface::{extract_ds50_utc, extract_ds50_utcs};
 use crate::DLL_VERSION;
 
+/// Converted `(N, 6)` rows and the `(N,)` mask of rows that failed to convert.
+type RowsWithMask<'py> = (Bound<'py, PyArray2<f64>>, Bound<'py, PyArray1<bool>>);
+/// Converted `(N,)` values and the `(N,)` mask of values that failed to convert.
+type ValuesWithMask<'py> = (Bound<'py, PyArray1<f64>>, Bound<'py, PyArray1<bool>>);
+
+fn rows_with_mask<'py>(py: Python<'py>, (rows, failed): (Vec<[f64; 6]>, Vec<bool>)) -> PyResult<RowsWithMask<'py>> {
+    Ok((arrays::rows_to_array(py, rows)?, failed.into_pyarray(py)))
+}
+
+/// Two `(N,)` angle columns, e.g. right ascension and declination.
+type AnglePair<'py> = (Bound<'py, PyArray1<f64>>, Bound<'py, PyArray1<f64>>);
+
+fn angle_pair<'py>(py: Python<'py>, (first, second): (Vec<f64>, Vec<f64>)) -> AnglePair<'py> {
+    (first.into_pyarray(py), second.into_pyarray(py))
+}
+
 #[pyclass]
 pub struct AstroInterface {
     info: String,
@@ -82,6 +107,105 @@ impl AstroInterface {
         Ok(position_velocity_mu_to_equinoctial(&posvel, mu))
     }
 
+    fn keplerian_to_cartesian_batch<'py>(
+        &self,
+        py: Python<'py>,
+        keps: PyArrayLike2<'py, f64, AllowTypeChange>,
+    ) -> PyResult<RowsWithMask<'py>> {
+        rows_with_mask(py, astro::keplerian_to_cartesian_batch(&arrays::rows::<6>(&keps)?))
+    }
+
+    #[pyo3(signature = (posvels, mu=None))]
+    fn cartesian_to_keplerian_batch<'py>(
+        &self,
+        py: Python<'py>,
+        posvels: PyArrayLike2<'py, f64, AllowTypeChange>,
+        mu: Option<PyArrayLike1<'py, f64, AllowTypeChange>>,
+    ) -> PyResult<RowsWithMask<'py>> {
+        let mu = mu.as_ref().map(|mu| arrays::values(mu));
+        let converted = astro::cartesian_to_keplerian_batch(&arrays::rows::<6>(&posvels)?, mu.as_deref())
+            .map_err(PyRuntimeError::new_err)?;
+        rows_with_mask(py, converted)
+    }
+
+    #[pyo3(signature = (posvels, mu=None))]
+    fn position_velocity_to_equinoctial_batch<'py>(
+        &self,
+        py: Python<'py>,
+        posvels: PyArrayLike2<'py, f64, AllowTypeChange>,
+        mu: Option<PyArrayLike1<'py, f64, AllowTypeChange>>,
+    ) -> PyResult<RowsWithMask<'py>> {
+        let mu = mu.as_ref().map(|mu| arrays::values(mu));
+        let converted = astro::position_velocity_to_equinoctial_batch(&arrays::rows::<6>(&posvels)?, mu.as_deref())
+            .map_err(PyRuntimeError::new_err)?;
+        rows_with_mask(py, converted)
+    }
+
+    fn keplerian_to_equinoctial_batch<'py>(
+        &self,
+        py: Python<'py>,
+        keps: PyArrayLike2<'py, f64, AllowTypeChange>,
+    ) -> PyResult<RowsWithMask<'py>> {
+        rows_with_mask(py, astro::keplerian_to_equinoctial_batch(&arrays::rows::<6>(&keps)?))
+    }
+
+    fn equinoctial_to_keplerian_batch<'py>(
+        &self,
+        py: Python<'py>,
+        eqnxs: PyArrayLike2<'py, f64, AllowTypeChange>,
+    ) -> PyResult<RowsWithMask<'py>> {
+        rows_with_mask(py, astro::equinoctial_to_keplerian_batch(&arrays::rows::<6>(&eqnxs)?))
+    }
+
+    fn osculating_to_mean_batch<'py>(
+        &self,
+        py: Python<'py>,
+        oscs: PyArrayLike2<'py, f64, AllowTypeChange>,
+    ) -> PyResult<RowsWithMask<'py>> {
+        rows_with_mask(py, astro::osculating_to_mean_batch(&arrays::rows::<6>(&oscs)?))
+    }
+
+    fn kozai_to_brouwer_batch<'py>(
+        &self,
+        py: Python<'py>,
+        eccentricities: PyArrayLike1<'py, f64, AllowTypeChange>,
+        inclinations: PyArrayLike1<'py, f64, AllowTypeChange>,
+        mean_motions: PyArrayLike1<'py, f64, AllowTypeChange>,
+    ) -> PyResult<ValuesWithMask<'py>> {
+        let (values, failed) = astro::kozai_to_brouwer_batch(
+            &arrays::values(&eccentricities),
+            &arrays::values(&inclinations),
+            &arrays::values(&mean_motions),
+        )
+        .map_err(PyRuntimeError::new_err)?;
+        Ok((values.into_pyarray(py), failed.into_pyarray(py)))
+    }
+
+    fn brouwer_to_kozai_batch<'py>(
+        &self,
+        py: Python<'py>,
+        eccentricities: PyArrayLike1<'py, f64, AllowTypeChange>,
+        inclinations: PyArrayLike1<'py, f64, AllowTypeChange>,
+        mean_motions: PyArrayLike1<'py, f64, AllowTypeChange>,
+    ) -> PyResult<ValuesWithMask<'py>> {
+        let (values, failed) = astro::brouwer_to_kozai_batch(
+            &arrays::values(&eccentricities),
+            &arrays::values(&inclinations),
+            &arrays::values(&mean_motions),
+        )
+        .map_err(PyRuntimeError::new_err)?;
+        Ok((values.into_pyarray(py), failed.into_pyarray(py)))
+    }
+
+    fn mean_motion_to_sma_batch<'py>(
+        &self,
+        py: Python<'py>,
+        mean_motions: PyArrayLike1<'py, f64, AllowTypeChange>,
+    ) -> PyResult<ValuesWithMask<'py>> {
+        let (values, failed) = astro::mean_motion_to_sma_batch(&arrays::values(&mean_motions));
+        Ok((values.into_pyarray(py), failed.into_pyarray(py)))
+    }
+
     fn set_jpl_ephemeris_file_path(&self, file_path: String) -> PyResult<()> {
         set_jpl_ephemeris_file_path(&file_path);
         Ok(())
@@ -167,6 +291,128 @@ impl AstroInterface {
         Ok(covariance_uvw_to_teme(&teme_posvel, &cov_uvw))
     }
 
+    fn covariance_teme_to_uvw(&self, teme_posvel: [f64; 6], cov_teme: [[f64; 6]; 6]) -> PyResult<[[f64; 6]; 6]> {
+        Ok(astro::covariance_teme_to_uvw(&teme_posvel, &cov_teme))
+    }
+
+    fn covariance_uvw_to_equinoctial(&self, teme_posvel: [f64; 6], cov_uvw: [[f64; 6]; 6]) -> PyResult<[[f64; 6]; 6]> {
+        Ok(astro::covariance_uvw_to_equinoctial(&teme_posvel, &cov_uvw))
+    }
+
+    fn covariance_teme_to_efg(&self, ds50_utc: f64, cov_teme: [[f64; 6]; 6]) -> PyResult<[[f64; 6]; 6]> {
+        Ok(astro::covariance_teme_to_efg(ds50_utc, &cov_teme))
+    }
+
+    fn covariance_efg_to_teme(&self, ds50_utc: f64, cov_efg: [[f64; 6]; 6]) -> PyResult<[[f64; 6]; 6]> {
+        Ok(astro::covariance_efg_to_teme(ds50_utc, &cov_efg))
+    }
+
+    fn covariance_teme_to_equinoctial(
+        &self,
+        teme_posvel: [f64; 6],
+        cov_teme: [[f64; 9]; 9],
+    ) -> PyResult<[[f64; 9]; 9]> {
+        Ok(astro::covariance_teme_to_equinoctial(&teme_posvel, &cov_teme))
+    }
+
+    fn propagate_covariance(
+        &self,
+        rms: f64,
+        consider: f64,
+        state_array: [f64; 54],
+        cov: [[f64; 9]; 9],
+    ) -> PyResult<[[f64; 6]; 6]> {
+        Ok(astro::propagate_covariance(rms, consider, &state_array, &cov))
+    }
+
+    fn matrix_to_lta21(&self, matrix: [[f64; 6]; 6]) -> PyResult<[f64; 21]> {
+        Ok(astro::matrix_to_lta21(&matrix))
+    }
+
+    fn lta21_to_matrix(&self, lta21: [f64; 21]) -> PyResult<[[f64; 6]; 6]> {
+        Ok(astro::lta21_to_matrix(&lta21))
+    }
+
+    #[pyo3(signature = (transform, covs, teme_posvels=None, ds50_utcs=None))]
+    fn transform_covariances<'py>(
+        &self,
+        py: Python<'py>,
+        transform: i32,
+        covs: PyArrayLike3<'py, f64, AllowTypeChange>,
+        teme_posvels: Option<PyArrayLike2<'py, f64, AllowTypeChange>>,
+        ds50_utcs: Option<&Bound<'py, PyAny>>,
+    ) -> PyResult<Bound<'py, PyArray3<f64>>> {
+        let teme_posvels = teme_posvels
+            .as_ref()
+            .map(|states| arrays::rows::<6>(states))
+            .transpose()?;
+        let ds50_utcs = ds50_utcs.map(extract_ds50_utcs).transpose()?.unwrap_or_default();
+        let converted = astro::transform_covariances(
+            transform,
+            teme_posvels.as_deref().unwrap_or_default(),
+            &ds50_utcs,
+            &arrays::matrices::<6, 6>(&covs)?,
+        )
+        .map_err(PyRuntimeError::new_err)?;
+        arrays::matrices_to_array(py, converted)
+    }
+
+    #[pyo3(signature = (transform, lta21s, teme_posvels=None, ds50_utcs=None))]
+    fn transform_covariances_lta21<'py>(
+        &self,
+        py: Python<'py>,
+        transform: i32,
+        lta21s: PyArrayLike2<'py, f64, AllowTypeChange>,
+        teme_posvels: Option<PyArrayLike2<'py, f64, AllowTypeChange>>,
+        ds50_utcs: Option<&Bound<'py, PyAny>>,
+    ) -> PyResult<Bound<'py, PyArray2<f64>>> {
+        let teme_posvels = teme_posvels
+            .as_ref()
+            .map(|states| arrays::rows::<6>(states))
+            .transpose()?;
+        let ds50_utcs = ds50_utcs.map(extract_ds50_utcs).transpose()?.unwrap_or_default();
+        let converted = astro::transform_covariances_lta21(
+            transform,
+            teme_posvels.as_deref().unwrap_or_default(),
+            &ds50_utcs,
+            &arrays::rows::<21>(&lta21s)?,
+        )
+        .map_err(PyRuntimeError::new_err)?;
+        arrays::rows_to_array(py, converted)
+    }
+
+    fn covariance_teme_to_equinoctial_batch<'py>(
+        &self,
+        py: Python<'py>,
+        teme_posvels: PyArrayLike2<'py, f64, AllowTypeChange>,
+        covs: PyArrayLike3<'py, f64, AllowTypeChange>,
+    ) -> PyResult<Bound<'py, PyArray3<f64>>> {
+        let converted = astro::covariance_teme_to_equinoctial_batch(
+            &arrays::rows::<6>(&teme_posvels)?,
+            &arrays::matrices::<9, 9>(&covs)?,
+        )
+        .map_err(PyRuntimeError::new_err)?;
+        arrays::matrices_to_array(py, converted)
+    }
+
+    fn propagate_covariances<'py>(
+        &self,
+        py: Python<'py>,
+        rms: f64,
+        consider: f64,
+        state_arrays: PyArrayLike2<'py, f64, AllowTypeChange>,
+        covs: PyArrayLike3<'py, f64, AllowTypeChange>,
+    ) -> PyResult<Bound<'py, PyArray3<f64>>> {
+        let propagated = astro::propagate_covariances(
+            rms,
+            consider,
+            &arrays::rows::<54>(&state_arrays)?,
+            &arrays::matrices::<9, 9>(&covs)?,
+        )
+        .map_err(PyRuntimeError::new_err)?;
+        arrays::matrices_to_array(py, propagated)
+    }
+
     fn gst_ra_dec_to_az_el(&self, gst: f64, lla: [f64; 3], ra: f64, dec: f64) -> PyResult<[f64; 2]> {
         Ok(gst_ra_dec_to_az_el(gst, &lla, ra, dec))
     }
@@ -181,13 +427,105 @@ impl AstroInterface {
         Ok(time_ra_dec_to_az_el(ds50_utc, &lla, ra, dec))
     }
 
-    fn horizon_to_teme(
+    fn time_az_el_to_ra_dec(&self, ds50_utc: f64, lla: [f64; 3], az: f64, el: f64) -> PyResult<[f64; 2]> {
+        Ok(astro::time_az_el_to_ra_dec(ds50_utc, &lla, az, el))
+    }
+
+    fn get_annual_aberration(&self, ds50_utc: f64, ra: f64, dec: f64) -> PyResult<(f64, f64)> {
+        Ok(astro::get_annual_aberration(ds50_utc, ra, dec))
+    }
+
+    fn get_diurnal_aberration(
         &self,
-        lst: f64,
-        lat: f64,
-        sensor_teme: [f64; 3],
-        xa_rae: [f64; 6],
-    ) -> PyResult<[f64; 6]> {
+        ds50_utc: f64,
+        sensor_teme_pos: [f64; 3],
+        ra: f64,
+        dec: f64,
+    ) -> PyResult<(f64, f64)> {
+        Ok(astro::get_diurnal_aberration(ds50_utc, &sensor_teme_pos, ra, dec))
+    }
+
+    fn topo_meme_to_teme_batch<'py>(
+        &self,
+        py: Python<'py>,
+        yr_of_equinox: i32,
+        ds50_utcs: &Bound<'py, PyAny>,
+        ras: PyArrayLike1<'py, f64, AllowTypeChange>,
+        decs: PyArrayLike1<'py, f64, AllowTypeChange>,
+    ) -> PyResult<AnglePair<'py>> {
+        let ds50_utcs = extract_ds50_utcs(ds50_utcs)?;
+        let converted =
+            astro::topo_meme_to_teme_batch(yr_of_equinox, &ds50_utcs, &arrays::values(&ras), &arrays::values(&decs))
+                .map_err(PyRuntimeError::new_err)?;
+        Ok(angle_pair(py, converted))
+    }
+
+    fn topo_teme_to_meme_batch<'py>(
+        &self,
+        py: Python<'py>,
+        yr_of_equinox: i32,
+        ds50_utcs: &Bound<'py, PyAny>,
+        ras: PyArrayLike1<'py, f64, AllowTypeChange>,
+        decs: PyArrayLike1<'py, f64, AllowTypeChange>,
+    ) -> PyResult<AnglePair<'py>> {
+        let ds50_utcs = extract_ds50_utcs(ds50_utcs)?;
+        let converted =
+            astro::topo_teme_to_meme_batch(yr_of_equinox, &ds50_utcs, &arrays::values(&ras), &arrays::values(&decs))
+                .map_err(PyRuntimeError::new_err)?;
+        Ok(angle_pair(py, converted))
+    }
+
+    #[allow(clippy::too_many_arguments)]
+    #[pyo3(signature = (ds50_utcs, lla, ras, decs, yr_of_equinox=None, aberration=false))]
+    fn ra_dec_to_az_el_batch<'py>(
+        &self,
+        py: Python<'py>,
+        ds50_utcs: &Bound<'py, PyAny>,
+        lla: [f64; 3],
+        ras: PyArrayLike1<'py, f64, AllowTypeChange>,
+        decs: PyArrayLike1<'py, f64, AllowTypeChange>,
+        yr_of_equinox: Option<i32>,
+        aberration: bool,
+    ) -> PyResult<AnglePair<'py>> {
+        let ds50_utcs = extract_ds50_utcs(ds50_utcs)?;
+        let converted = astro::ra_dec_to_az_el_batch(
+            &ds50_utcs,
+            &lla,
+            &arrays::values(&ras),
+            &arrays::values(&decs),
+            yr_of_equinox,
+            aberration,
+        )
+        .map_err(PyRuntimeError::new_err)?;
+        Ok(angle_pair(py, converted))
+    }
+
+    #[allow(clippy::too_many_arguments)]
+    #[pyo3(signature = (ds50_utcs, lla, azs, els, yr_of_equinox=None, aberration=false))]
+    fn az_el_to_ra_dec_batch<'py>(
+        &self,
+        py: Python<'py>,
+        ds50_utcs: &Bound<'py, PyAny>,
+        lla: [f64; 3],
+        azs: PyArrayLike1<'py, f64, AllowTypeChange>,
+        els: PyArrayLike1<'py, f64, AllowTypeChange>,
+        yr_of_equinox: Option<i32>,
+        aberration: bool,
+    ) -> PyResult<AnglePair<'py>> {
+        let ds50_utcs = extract_ds50_utcs(ds50_utcs)?;
+        let converted = astro::az_el_to_ra_dec_batch(
+            &ds50_utcs,
+            &lla,
+            &arrays::values(&azs),
+            &arrays::values(&els),
+            yr_of_equinox,
+            aberration,
+        )
+        .map_err(PyRuntimeError::new_err)?;
+        Ok(angle_pair(py, converted))
+    }
+
+    fn horizon_to_teme(&self, lst: f64, lat: f64, sensor_teme: [f64; 3], xa_rae: [f64; 6]) -> PyResult<[f64; 6]> {
         horizon_to_teme(lst, lat, &sensor_teme, &xa_rae).map_err(PyRuntimeError::new_err)
     }
 
@@ -217,6 +555,40 @@ impl AstroInterface {
         Ok(get_jpl_sun_and_moon_position(ds50utc))
     }
 
+    #[pyo3(signature = (start_ds50_utc, stop_ds50_utc, segment_days=1.0, background=false))]
+    fn load_sun_moon_cache(
+        &self,
+        start_ds50_utc: &Bound<'_, PyAny>,
+        stop_ds50_utc: &Bound<'_, PyAny>,
+        segment_days: f64,
+        background: bool,
+    ) -> PyResult<Option<PySunMoonCacheLoad>> {
+        let (start_ds50_utc, stop_ds50_utc) = (extract_ds50_utc(start_ds50_utc)?, extract_ds50_utc(stop_ds50_utc)?);
+        if background {
+            let handle = astro::preload_sun_moon_cache(start_ds50_utc, stop_ds50_utc, segment_days);
+            return Ok(Some(PySunMoonCacheLoad::new(handle)));
+        }
+        astro::load_sun_moon_cache(start_ds50_utc, stop_ds50_utc, segment_days).map_err(PyRuntimeError::new_err)?;
+        Ok(None)
+    }
+
+    fn get_cached_sun_and_moon_position(&self, ds50_utc: f64) -> PyResult<([f64; 3], [f64; 3])> {
+        Ok(astro::get_cached_sun_and_moon_position(ds50_utc))
+    }
+
+    fn get_cached_sun_and_moon_positions(&self, ds50_utcs: &Bound<'_, PyAny>) -> PyResult<Vec<([f64; 3], [f64; 3])>> {
+        Ok(astro::get_cached_sun_and_moon_positions(&extract_ds50_utcs(ds50_utcs)?))
+    }
+
+    fn get_sun_moon_cache_stats(&self) -> PyResult<Option<(u64, u64)>> {
+        Ok(astro::get_sun_moon_cache_stats())
+    }
+
+    fn clear_sun_moon_cache(&self) -> PyResult<()> {
+        astro::clear_sun_moon_cache();
+        Ok(())
+    }
+
     fn point_is_sunlit(&self, ds50_tt: f64, teme_pos: [f64; 3]) -> PyResult<bool> {
         Ok(point_is_sunlit(ds50_tt, &teme_pos))
     }
@@ -228,11 +600,205 @@ impl AstroInterface {
     ) -> PyResult<(f64, f64, f64)> {
         Ok(get_earth_obstruction_angles(&sat_teme_pos, &sensor_teme_pos))
     }
+
+    fn get_earth_obstruction_angles_batch<'py>(
+        &self,
+        py: Python<'py>,
+        sensor_teme_positions: PyArrayLike2<'py, f64, AllowTypeChange>,
+        sat_teme_positions: PyArrayLike2<'py, f64, AllowTypeChange>,
+    ) -> PyResult<Bound<'py, PyArray3<f64>>> {
+        let sensors = arrays::rows::<3>(&sensor_teme_positions)?;
+        let sats = arrays::rows::<3>(&sat_teme_positions)?;
+        let angles = astro::get_earth_obstruction_angles_batch(&sensors, &sats);
+        PyArray1::from_vec(py, angles.into_flattened()).reshape([sensors.len(), sats.len(), 3])
+    }
+
+    #[pyo3(signature = (observer_teme_positions, target_teme_positions, grazing_height_km=0.0))]
+    fn get_line_of_sight_matrix<'py>(
+        &self,
+        py: Python<'py>,
+        observer_teme_positions: PyArrayLike2<'py, f64, AllowTypeChange>,
+        target_teme_positions: PyArrayLike2<'py, f64, AllowTypeChange>,
+        grazing_height_km: f64,
+    ) -> PyResult<Bound<'py, PyArray2<bool>>> {
+        let observers = arrays::rows::<3>(&observer_teme_positions)?;
+        let targets = arrays::rows::<3>(&target_teme_positions)?;
+        let visible = py.detach(|| astro::get_line_of_sight_matrix(&observers, &targets, grazing_height_km));
+        PyArray1::from_vec(py, visible).reshape([observers.len(), targets.len()])
+    }
+
+    fn convert_frame(&self, from_frame: i32, to_frame: i32, ds50_utc: f64, posvel: [f64; 6]) -> PyResult<[f64; 6]> {
+        convert_frame(from_frame, to_frame, ds50_utc, &posvel).map_err(PyRuntimeError::new_err)
+    }
+
+    /// Convert `(N, 6)` states; `out` may be a C-contiguous float64 `(N, 6)` array, including `posvels` itself.
+    #[pyo3(signature = (from_frame, to_frame, ds50_utcs, posvels, out=None))]
+    fn convert_frames<'py>(
+        &self,
+        py: Python<'py>,
+        from_frame: i32,
+        to_frame: i32,
+        ds50_utcs: &Bound<'py, PyAny>,
+        posvels: &Bound<'py, PyAny>,
+        out: Option<Bound<'py, PyArray2<f64>>>,
+    ) -> PyResult<Bound<'py, PyArray2<f64>>> {
+        let ds50_utcs = extract_ds50_utcs(ds50_utcs)?;
+        let Some(out) = out else {
+            let posvels: PyArrayLike2<'py, f64, AllowTypeChange> = posvels.extract()?;
+            let mut converted = arrays::rows::<6>(&posvels)?.into_owned();
+            py.detach(|| convert_frames_in_place(from_frame, to_frame, &ds50_utcs, &mut converted))
+                .map_err(PyRuntimeError::new_err)?;
+            return arrays::rows_to_array(py, converted);
+        };
+        let source = if out.as_ptr() == posvels.as_ptr() {
+            None
+        } else {
+            let posvels: PyArrayLike2<'py, f64, AllowTypeChange> = posvels.extract()?;
+            Some(arrays::rows::<6>(&posvels)?.into_owned())
+        };
+        {
+            let mut writable = out
+                .try_readwrite()
+                .map_err(|err| PyValueError::new_err(err.to_string()))?;
+            let converted = arrays::rows_mut::<6>(&mut writable)?;
+            if let Some(source) = source {
+                if source.len() != converted.len() {
+                    return Err(PyValueError::new_err(format!(
+                        "Expected out to have {} rows, got {}",
+                        source.len(),
+                        converted.len()
+                    )));
+                }
+                converted.copy_from_slice(&source);
+            }
+            py.detach(|| convert_frames_in_place(from_frame, to_frame, &ds50_utcs, converted))
+                .map_err(PyRuntimeError::new_err)?;
+        }
+        Ok(out)
+    }
+
+    fn get_frame_rotation(&self, from_frame: i32, to_frame: i32, ds50_utc: f64) -> PyResult<[[f64; 6]; 6]> {
+        astro::get_frame_rotation(from_frame, to_frame, ds50_utc).map_err(PyRuntimeError::new_err)
+    }
+
+    fn clear_rotation_cache(&self) -> PyResult<()> {
+        astro::clear_rotation_cache();
+        Ok(())
+    }
+}
+
+#[pyclass(name = "FramePlan")]
+pub struct PyFramePlan {
+    inner: FramePlan,
+}
+
+#[pymethods]
+impl PyFramePlan {
+    #[new]
+    fn new(from_frame: i32, to_frame: i32, ds50_utcs: &Bound<'_, PyAny>) -> PyResult<Self> {
+        FramePlan::new(from_frame, to_frame, &extract_ds50_utcs(ds50_utcs)?)
+            .map(|inner| PyFramePlan { inner })
+            .map_err(PyRuntimeError::new_err)
+    }
+
+    #[getter(from_frame)]
+    fn get_from_frame(&self) -> PyResult<i32> {
+        Ok(self.inner.from_frame)
+    }
+
+    #[getter(to_frame)]
+    fn get_to_frame(&self) -> PyResult<i32> {
+        Ok(self.inner.to_frame)
+    }
+
+    #[getter(epochs)]
+    fn get_epochs(&self) -> PyResult<Vec<f64>> {
+        Ok(self.inner.epochs.clone())
+    }
+
+    #[getter(rotations)]
+    fn get_rotations(&self) -> PyResult<Vec<[[f64; 6]; 6]>> {
+        Ok(self.inner.rotations.clone())
+    }
+
+    fn apply(&self, posvels: Vec<[f64; 6]>) -> PyResult<Vec<[f64; 6]>> {
+        let mut converted = posvels;
+        self.inner
+            .apply_in_place(&mut converted)
+            .map_err(PyRuntimeError::new_err)?;
+        Ok(converted)
+    }
+}
+
+/// A background sun/moon cache build started by `AstroInterface.load_sun_moon_cache(..., background=True)`.
+#[pyclass(name = "SunMoonCacheLoad")]
+pub struct PySunMoonCacheLoad {
+    handle: Mutex<Option<JoinHandle<Result<(), String>>>>,
+    result: Mutex<Option<Result<(), String>>>,
+}
+
+impl PySunMoonCacheLoad {
+    fn new(handle: JoinHandle<Result<(), String>>) -> Self {
+        PySunMoonCacheLoad {
+            handle: Mutex::new(Some(handle)),
+            result: Mutex::new(None),
+        }
+    }
+
+    fn join(&self) -> Result<(), String> {
+        let mut result = self.result.lock().unwrap_or_else(|e| e.into_inner());
+        if let Some(handle) = self.handle.lock().unwrap_or_else(|e| e.into_inner()).take() {
+            *result = Some(
+                handle
+                    .join()
+                    .unwrap_or_else(|_| Err("Sun/moon cache build panicked".to_string())),
+            );
+        }
+        result.clone().unwrap_or(Ok(()))
+    }
+}
+
+#[pymethods]
+impl PySunMoonCacheLoad {
+    /// Block until the build finishes; raises if it failed or was discarded by a clear.
+    fn wait(&self, py: Python<'_>) -> PyResult<()> {
+        py.detach(|| self.join()).map_err(PyRuntimeError::new_err)
+    }
+
+    #[getter(done)]
+    fn get_done(&self) -> PyResult<bool> {
+        Ok(self
+            .handle
+            .lock()
+            .unwrap_or_else(|e| e.into_inner())
+            .as_ref()
+            .is_none_or(|handle| handle.is_finished()))
+    }
+
+    #[getter(error)]
+    fn get_error(&self, py: Python<'_>) -> PyResult<Option<String>> {
+        if !self.get_done()? {
+            return Ok(None);
+        }
+        Ok(py.detach(|| self.join()).err())
+    }
 }
 
 pub fn register_astro_interface(parent_module: &Bound<'_, PyModule>) -> PyResult<()> {
     parent_module.add_class::<AstroInterface>()?;
+    parent_module.add_class::<PyFramePlan>()?;
+    parent_module.add_class::<PySunMoonCacheLoad>()?;
     let class = parent_module.getattr("AstroInterface")?;
     class.setattr("XF_CONV_SGP42SGP", crate::astro::XF_CONV_SGP42SGP)?;
+    class.setattr("COV_TEME_TO_UVW", astro::COV_TEME_TO_UVW)?;
+    class.setattr("COV_UVW_TO_TEME", astro::COV_UVW_TO_TEME)?;
+    class.setattr("COV_EQNX_TO_UVW", astro::COV_EQNX_TO_UVW)?;
+    class.setattr("COV_UVW_TO_EQNX", astro::COV_UVW_TO_EQNX)?;
+    class.setattr("COV_TEME_TO_EFG", astro::COV_TEME_TO_EFG)?;
+    class.setattr("COV_EFG_TO_TEME", astro::COV_EFG_TO_TEME)?;
+    class.setattr("FRAME_J2000", astro::FRAME_J2000)?;
+    class.setattr("FRAME_TEME", astro::FRAME_TEME)?;
+    class.setattr("FRAME_EFG", astro::FRAME_EFG)?;
+    class.setattr("FRAME_ECR", astro::FRAME_ECR)?;
     Ok(())
 }
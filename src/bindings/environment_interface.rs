@@ -2,9 +2,8 @@ use pyo3::exceptions::PyRuntimeError;
 use pyo3::prelude::*;
 
 use crate::environment::{
-    get_dll_info, get_earth_flattening, get_earth_mu, get_earth_radius, get_earth_rotation_acceleration,
-    get_earth_rotation_rate, get_fundamental_catalog, get_geopotential_model, get_j2, get_j3, get_j4, get_j5,
-    load_from_file, set_fundamental_catalog, set_geopotential_model,
+    self, EarthConstants, EnvironmentGuard, get_dll_info, get_earth_constants, get_fundamental_catalog,
+    get_geopotential_model, load_from_file, set_fundamental_catalog, set_geopotential_model,
 };
 use crate::DLL_VERSION;
 
@@ -42,47 +41,47 @@ impl EnvironmentInterface {
 
     #[getter]
     fn earth_radius(&self) -> PyResult<f64> {
-        Ok(get_earth_radius())
+        Ok(get_earth_constants().radius)
     }
 
     #[getter]
     fn earth_rotation_rate(&self) -> PyResult<f64> {
-        Ok(get_earth_rotation_rate())
+        Ok(get_earth_constants().rotation_rate)
     }
 
     #[getter]
     fn earth_rotation_acceleration(&self) -> PyResult<f64> {
-        Ok(get_earth_rotation_acceleration())
+        Ok(get_earth_constants().rotation_acceleration)
     }
 
     #[getter]
     fn earth_mu(&self) -> PyResult<f64> {
-        Ok(get_earth_mu())
+        Ok(get_earth_constants().mu)
     }
 
     #[getter]
     fn earth_flattening(&self) -> PyResult<f64> {
-        Ok(get_earth_flattening())
+        Ok(get_earth_constants().flattening)
     }
 
     #[getter]
     fn j2(&self) -> PyResult<f64> {
-        Ok(get_j2())
+        Ok(get_earth_constants().j2)
     }
 
     #[getter]
     fn j3(&self) -> PyResult<f64> {
-        Ok(get_j3())
+        Ok(get_earth_constants().j3)
     }
 
     #[getter]
     fn j4(&self) -> PyResult<f64> {
-        Ok(get_j4())
+        Ok(get_earth_constants().j4)
     }
 
     #[getter]
     fn j5(&self) -> PyResult<f64> {
-        Ok(get_j5())
+        Ok(get_earth_constants().j5)
     }
 
     #[getter]
@@ -106,10 +105,135 @@ impl EnvironmentInterface {
         set_geopotential_model(geo_model);
         Ok(())
     }
+
+    #[getter]
+    fn earth_constants(&self) -> PyResult<PyEarthConstants> {
+        Ok(PyEarthConstants {
+            inner: get_earth_constants(),
+        })
+    }
+
+    #[getter]
+    fn earth_constants_version(&self) -> PyResult<u64> {
+        Ok(environment::get_earth_constants_version())
+    }
+
+    #[pyo3(signature = (geopotential_model=None, fundamental_catalog=None))]
+    fn profile(
+        &self,
+        geopotential_model: Option<i32>,
+        fundamental_catalog: Option<i32>,
+    ) -> PyResult<EnvironmentProfile> {
+        Ok(EnvironmentProfile {
+            geopotential_model,
+            fundamental_catalog,
+            guard: None,
+        })
+    }
+}
+
+#[pyclass(name = "EarthConstants", frozen)]
+pub struct PyEarthConstants {
+    inner: EarthConstants,
+}
+
+#[pymethods]
+impl PyEarthConstants {
+    #[getter(version)]
+    fn get_version(&self) -> PyResult<u64> {
+        Ok(self.inner.version)
+    }
+
+    #[getter(geopotential_model)]
+    fn get_geopotential_model(&self) -> PyResult<i32> {
+        Ok(self.inner.geopotential_model)
+    }
+
+    #[getter(fundamental_catalog)]
+    fn get_fundamental_catalog(&self) -> PyResult<i32> {
+        Ok(self.inner.fundamental_catalog)
+    }
+
+    #[getter(radius)]
+    fn get_radius(&self) -> PyResult<f64> {
+        Ok(self.inner.radius)
+    }
+
+    #[getter(mu)]
+    fn get_mu(&self) -> PyResult<f64> {
+        Ok(self.inner.mu)
+    }
+
+    #[getter(flattening)]
+    fn get_flattening(&self) -> PyResult<f64> {
+        Ok(self.inner.flattening)
+    }
+
+    #[getter(j2)]
+    fn get_j2(&self) -> PyResult<f64> {
+        Ok(self.inner.j2)
+    }
+
+    #[getter(j3)]
+    fn get_j3(&self) -> PyResult<f64> {
+        Ok(self.inner.j3)
+    }
+
+    #[getter(j4)]
+    fn get_j4(&self) -> PyResult<f64> {
+        Ok(self.inner.j4)
+    }
+
+    #[getter(j5)]
+    fn get_j5(&self) -> PyResult<f64> {
+        Ok(self.inner.j5)
+    }
+
+    #[getter(rotation_rate)]
+    fn get_rotation_rate(&self) -> PyResult<f64> {
+        Ok(self.inner.rotation_rate)
+    }
+
+    #[getter(rotation_acceleration)]
+    fn get_rotation_acceleration(&self) -> PyResult<f64> {
+        Ok(self.inner.rotation_acceleration)
+    }
+}
+
+#[pyclass]
+pub struct EnvironmentProfile {
+    geopotential_model: Option<i32>,
+    fundamental_catalog: Option<i32>,
+    guard: Option<EnvironmentGuard>,
+}
+
+#[pymethods]
+impl EnvironmentProfile {
+    fn __enter__(mut slf: PyRefMut<'_, Self>) -> PyResult<PyRefMut<'_, Self>> {
+        if slf.guard.is_some() {
+            return Err(PyRuntimeError::new_err("Environment profile is already active"));
+        }
+        let guard = environment::scoped_environment(slf.geopotential_model, slf.fundamental_catalog)
+            .map_err(PyRuntimeError::new_err)?;
+        slf.guard = Some(guard);
+        Ok(slf)
+    }
+
+    fn __exit__(
+        &mut self,
+        _exc_type: &Bound<'_, PyAny>,
+        _exc_value: &Bound<'_, PyAny>,
+        _traceback: &Bound<'_, PyAny>,
+    ) -> PyResult<bool> {
+        self.guard = None;
+        Ok(false)
+    }
 }
 
 pub fn register_environment_interface(parent_module: &Bound<'_, PyModule>) -> PyResult<()> {
     parent_module.add_class::<EnvironmentInterface>()?;
+    parent_module.add_class::<PyEarthConstants>()?;
+    parent_module.add_class::<EnvironmentProfile>()?;
     let class = parent_module.getattr("EnvironmentInterface")?;
     class.setattr("XF_FKMOD_4", crate::environment::XF_FKMOD_4)?;
     class.setattr("XF_FKMOD_5", crate::environment::XF_FKMOD_5)?;
@@ -0,0 +1,36 @@
+use pyo3::create_exception;
+use pyo3::exceptions::PyRuntimeError;
+use pyo3::prelude::*;
+
+use crate::DllError;
+
+create_exception!(
+    pysaal,
+    SaalError,
+    PyRuntimeError,
+    "Error reported by a SAAL DLL, with the DLL return code as `code`."
+);
+create_exception!(
+    pysaal,
+    PropagationError,
+    SaalError,
+    "SGP4 propagation failure, with one of the `SGP4Interface.GP_ERR_*` values (or another DLL code) as `code`."
+);
+
+fn with_code(err: PyErr, code: i32) -> PyErr {
+    Python::attach(|py| match err.value(py).setattr("code", code) {
+        Ok(()) => err,
+        Err(setattr_err) => setattr_err,
+    })
+}
+
+pub(crate) fn propagation_error(err: DllError) -> PyErr {
+    with_code(PropagationError::new_err(err.message), err.code)
+}
+
+pub fn register_errors(parent_module: &Bound<'_, PyModule>) -> PyResult<()> {
+    let py = parent_module.py();
+    parent_module.add("SaalError", py.get_type::<SaalError>())?;
+    parent_module.add("PropagationError", py.get_type::<PropagationError>())?;
+    Ok(())
+}
@@ -4,7 +4,7 @@ use pyo3::prelude::*;
 use crate::{
     initialize_time_constants, DLL_VERSION, get_dll_info, get_duplicate_key_mode, get_elset_key_mode, get_key_mode,
     get_last_error_message, get_last_info_message, load_from_file, reset_key_mode, set_duplicate_key_mode,
-    set_elset_key_mode, set_key_mode,
+    set_elset_key_mode, set_key_mode, warmup,
 };
 
 #[pyclass]
@@ -40,8 +40,7 @@ impl MainInterface {
     }
 
     fn initialize_time_constants(&self) -> PyResult<()> {
-        initialize_time_constants();
-        Ok(())
+        initialize_time_constants().map_err(PyRuntimeError::new_err)
     }
 
     #[getter]
@@ -91,8 +90,14 @@ impl MainInterface {
     #[classattr]
     const DLL_VERSION: &'static str = DLL_VERSION;
 }
+#[pyfunction(name = "warmup")]
+fn py_warmup() -> PyResult<()> {
+    warmup().map_err(PyRuntimeError::new_err)
+}
+
 pub fn register_main_interface(parent_module: &Bound<'_, PyModule>) -> PyResult<()> {
     parent_module.add_class::<MainInterface>()?;
+    parent_module.add_function(wrap_pyfunction!(py_warmup, parent_module)?)?;
     let class = parent_module.getattr("MainInterface")?;
     class.setattr("ALL_KEYMODE_NODUP", crate::ALL_KEYMODE_NODUP)?;
     class.setattr("ALL_KEYMODE_DMA", crate::ALL_KEYMODE_DMA)?;
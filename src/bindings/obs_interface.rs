@@ -1,8 +1,10 @@
+use numpy::{AllowTypeChange, PyArray2, PyArrayLike2};
 use pyo3::exceptions::PyRuntimeError;
 use pyo3::prelude::*;
 
+use super::arrays;
 use crate::DLL_VERSION;
-use crate::obs::{self, ParsedB3};
+use crate::obs::{self, ParsedB3, XA_OBS_SIZE, XA_OBSTATE_SIZE};
 
 #[pyclass]
 pub struct ObsInterface {
@@ -66,6 +68,148 @@ impl ObsInterface {
     fn get_keys(&self, order: i32) -> PyResult<Vec<i64>> {
         Ok(obs::get_keys(order))
     }
+
+    fn b3_to_csv(&self, card: String) -> PyResult<String> {
+        obs::b3_to_csv(&card).map_err(PyRuntimeError::new_err)
+    }
+
+    #[pyo3(signature = (csv, new_sat_num=0))]
+    fn csv_to_b3(&self, csv: String, new_sat_num: i32) -> PyResult<String> {
+        obs::csv_to_b3(&csv, new_sat_num).map_err(PyRuntimeError::new_err)
+    }
+
+    fn tty_to_csv(&self, card_1: String, card_2: String) -> PyResult<String> {
+        obs::tty_to_csv(&card_1, &card_2).map_err(PyRuntimeError::new_err)
+    }
+
+    #[pyo3(signature = (csv, new_sat_num=0))]
+    fn csv_to_tty(&self, csv: String, new_sat_num: i32) -> PyResult<(String, String)> {
+        obs::csv_to_tty(&csv, new_sat_num).map_err(PyRuntimeError::new_err)
+    }
+
+    fn array_to_lines(&self, xa_obs: [f64; XA_OBS_SIZE], obs_form: i32) -> PyResult<(String, String)> {
+        obs::array_to_lines(&xa_obs, obs_form).map_err(PyRuntimeError::new_err)
+    }
+
+    #[pyo3(signature = (input_path, output_path, input_form, output_form, new_sat_num=0))]
+    fn convert_file(
+        &self,
+        input_path: String,
+        output_path: String,
+        input_form: i32,
+        output_form: i32,
+        new_sat_num: i32,
+    ) -> PyResult<usize> {
+        obs::convert_file(&input_path, &output_path, input_form, output_form, new_sat_num)
+            .map_err(PyRuntimeError::new_err)
+    }
+
+    fn arrays_to_file(&self, xa_obs: Vec<[f64; XA_OBS_SIZE]>, obs_form: i32, output_path: String) -> PyResult<usize> {
+        obs::arrays_to_file(&xa_obs, obs_form, &output_path).map_err(PyRuntimeError::new_err)
+    }
+
+    fn get_array(&self, obs_key: i64) -> PyResult<[f64; XA_OBS_SIZE]> {
+        obs::get_array(obs_key).map_err(PyRuntimeError::new_err)
+    }
+
+    fn get_state(&self, obs_key: i64, range_km: f64) -> PyResult<[f64; XA_OBSTATE_SIZE]> {
+        obs::get_state(obs_key, range_km).map_err(PyRuntimeError::new_err)
+    }
+
+    fn array_to_state(&self, xa_obs: [f64; XA_OBS_SIZE]) -> PyResult<[f64; XA_OBSTATE_SIZE]> {
+        obs::array_to_state(&xa_obs).map_err(PyRuntimeError::new_err)
+    }
+
+    #[pyo3(signature = (obs_keys, range_km, columns=None))]
+    fn get_states<'py>(
+        &self,
+        py: Python<'py>,
+        obs_keys: Vec<i64>,
+        range_km: f64,
+        columns: Option<Vec<usize>>,
+    ) -> PyResult<Bound<'py, PyArray2<f64>>> {
+        let columns = columns.unwrap_or_default();
+        let states = obs::get_states(&obs_keys, range_km, &columns).map_err(PyRuntimeError::new_err)?;
+        arrays::flat_to_array(py, states, state_width(&columns))
+    }
+
+    #[pyo3(signature = (xa_obs, range_km=None, columns=None))]
+    fn arrays_to_states<'py>(
+        &self,
+        py: Python<'py>,
+        xa_obs: PyArrayLike2<'py, f64, AllowTypeChange>,
+        range_km: Option<f64>,
+        columns: Option<Vec<usize>>,
+    ) -> PyResult<Bound<'py, PyArray2<f64>>> {
+        let columns = columns.unwrap_or_default();
+        let states = obs::arrays_to_states(&arrays::rows::<XA_OBS_SIZE>(&xa_obs)?, range_km, &columns)
+            .map_err(PyRuntimeError::new_err)?;
+        arrays::flat_to_array(py, states, state_width(&columns))
+    }
+
+    fn build_tracks(&self, obs_keys: Vec<i64>, max_gap_seconds: f64) -> PyResult<(Vec<i64>, Vec<usize>)> {
+        obs::build_tracks_from_keys(&obs_keys, max_gap_seconds).map_err(PyRuntimeError::new_err)
+    }
+
+    #[allow(clippy::too_many_arguments)]
+    #[pyo3(signature = (sat_keys, sen_keys, start_ds50_utc, end_ds50_utc, step_seconds, observation_type, seed=None))]
+    fn simulate(
+        &self,
+        py: Python<'_>,
+        sat_keys: Vec<i64>,
+        sen_keys: Vec<i64>,
+        start_ds50_utc: f64,
+        end_ds50_utc: f64,
+        step_seconds: f64,
+        observation_type: i32,
+        seed: Option<u64>,
+    ) -> PyResult<Vec<PyParsedB3>> {
+        let observations = py
+            .detach(|| {
+                obs::simulate(
+                    &sat_keys,
+                    &sen_keys,
+                    start_ds50_utc,
+                    end_ds50_utc,
+                    step_seconds,
+                    observation_type,
+                    seed,
+                )
+            })
+            .map_err(PyRuntimeError::new_err)?;
+        Ok(observations.into_iter().map(PyParsedB3::from).collect())
+    }
+
+    #[allow(clippy::too_many_arguments)]
+    #[pyo3(signature = (
+        sat_keys, sen_keys, start_ds50_utc, end_ds50_utc, step_seconds, observation_type, output_path, seed=None
+    ))]
+    fn simulate_to_file(
+        &self,
+        py: Python<'_>,
+        sat_keys: Vec<i64>,
+        sen_keys: Vec<i64>,
+        start_ds50_utc: f64,
+        end_ds50_utc: f64,
+        step_seconds: f64,
+        observation_type: i32,
+        output_path: String,
+        seed: Option<u64>,
+    ) -> PyResult<usize> {
+        py.detach(|| {
+            obs::simulate_to_file(
+                &sat_keys,
+                &sen_keys,
+                start_ds50_utc,
+                end_ds50_utc,
+                step_seconds,
+                observation_type,
+                &output_path,
+                seed,
+            )
+        })
+        .map_err(PyRuntimeError::new_err)
+    }
 }
 
 #[pyclass(name = "ParsedB3")]
@@ -313,6 +457,14 @@ impl PyParsedB3 {
     }
 }
 
+fn state_width(columns: &[usize]) -> usize {
+    if columns.is_empty() {
+        XA_OBSTATE_SIZE
+    } else {
+        columns.len()
+    }
+}
+
 pub fn register_obs_interface(parent_module: &Bound<'_, PyModule>) -> PyResult<()> {
     parent_module.add_class::<ObsInterface>()?;
     parent_module.add_class::<PyParsedB3>()?;
@@ -329,5 +481,21 @@ pub fn register_obs_interface(parent_module: &Bound<'_, PyModule>) -> PyResult<(
     class.setattr("DUPOBSKEY", obs::DUPOBSKEY)?;
     class.setattr("OBS_KEYMODE_NODUP", obs::OBS_KEYMODE_NODUP)?;
     class.setattr("OBS_KEYMODE_DMA", obs::OBS_KEYMODE_DMA)?;
+    class.setattr("XA_OBSTATE_SATNUM", obs::XA_OBSTATE_SATNUM)?;
+    class.setattr("XA_OBSTATE_SENNUM", obs::XA_OBSTATE_SENNUM)?;
+    class.setattr("XA_OBSTATE_DS50UTC", obs::XA_OBSTATE_DS50UTC)?;
+    class.setattr("XA_OBSTATE_POSX", obs::XA_OBSTATE_POSX)?;
+    class.setattr("XA_OBSTATE_POSY", obs::XA_OBSTATE_POSY)?;
+    class.setattr("XA_OBSTATE_POSZ", obs::XA_OBSTATE_POSZ)?;
+    class.setattr("XA_OBSTATE_VELX", obs::XA_OBSTATE_VELX)?;
+    class.setattr("XA_OBSTATE_VELY", obs::XA_OBSTATE_VELY)?;
+    class.setattr("XA_OBSTATE_VELZ", obs::XA_OBSTATE_VELZ)?;
+    class.setattr("XA_OBSTATE_LAT", obs::XA_OBSTATE_LAT)?;
+    class.setattr("XA_OBSTATE_LON", obs::XA_OBSTATE_LON)?;
+    class.setattr("XA_OBSTATE_HGHT", obs::XA_OBSTATE_HGHT)?;
+    class.setattr("XA_OBSTATE_POSE", obs::XA_OBSTATE_POSE)?;
+    class.setattr("XA_OBSTATE_POSF", obs::XA_OBSTATE_POSF)?;
+    class.setattr("XA_OBSTATE_POSG", obs::XA_OBSTATE_POSG)?;
+    class.setattr("XA_OBSTATE_SIZE", obs::XA_OBSTATE_SIZE)?;
     Ok(())
 }
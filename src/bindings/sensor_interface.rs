@@ -1,9 +1,17 @@
+use numpy::ndarray::{Ix2, Ix3, Ix4};
+use numpy::{AllowTypeChange, PyArray, PyArray1, PyArrayLike2, PyArrayMethods};
 use pyo3::exceptions::PyRuntimeError;
 use pyo3::prelude::*;
 
+use super::arrays;
+use super::time_interface::extract_ds50_utcs;
+use crate::astro::XA_TOPO_SIZE;
 use crate::sensor::{self, ParsedSensor, XA_SEN_SIZE};
 use crate::DLL_VERSION;
 
+/// Topocentric components and the optional visibility mask of a sensor network batch.
+type NetworkTopo<'py, D, M> = (Bound<'py, PyArray<f64, D>>, Option<Bound<'py, PyArray<bool, M>>>);
+
 #[pyclass]
 pub struct SensorInterface {
     info: String,
@@ -78,6 +86,48 @@ impl SensorInterface {
     fn get_arrays(&self, sen_key: i64) -> PyResult<([f64; XA_SEN_SIZE], String)> {
         sensor::get_arrays(sen_key).map_err(PyRuntimeError::new_err)
     }
+
+    #[pyo3(signature = (sen_keys, sat_teme_posvels, ds50_utc, visibility=false))]
+    fn get_network_topo<'py>(
+        &self,
+        py: Python<'py>,
+        sen_keys: Vec<i64>,
+        sat_teme_posvels: PyArrayLike2<'py, f64, AllowTypeChange>,
+        ds50_utc: f64,
+        visibility: bool,
+    ) -> PyResult<NetworkTopo<'py, Ix3, Ix2>> {
+        let sat_teme_posvels = arrays::rows::<6>(&sat_teme_posvels)?;
+        let (topo, visible) = sensor::get_network_topo(&sen_keys, &sat_teme_posvels, ds50_utc, visibility)
+            .map_err(PyRuntimeError::new_err)?;
+        let shape = [sen_keys.len(), sat_teme_posvels.len()];
+        Ok((
+            PyArray1::from_vec(py, topo).reshape([shape[0], shape[1], XA_TOPO_SIZE])?,
+            visible
+                .map(|visible| PyArray1::from_vec(py, visible).reshape(shape))
+                .transpose()?,
+        ))
+    }
+
+    #[pyo3(signature = (sen_keys, sat_keys, ds50_utcs, visibility=false))]
+    fn get_network_topo_from_keys<'py>(
+        &self,
+        py: Python<'py>,
+        sen_keys: Vec<i64>,
+        sat_keys: Vec<i64>,
+        ds50_utcs: &Bound<'py, PyAny>,
+        visibility: bool,
+    ) -> PyResult<NetworkTopo<'py, Ix4, Ix3>> {
+        let ds50_utcs = extract_ds50_utcs(ds50_utcs)?;
+        let (topo, visible) = sensor::get_network_topo_from_keys(&sen_keys, &sat_keys, &ds50_utcs, visibility)
+            .map_err(PyRuntimeError::new_err)?;
+        let shape = [ds50_utcs.len(), sen_keys.len(), sat_keys.len()];
+        Ok((
+            PyArray1::from_vec(py, topo).reshape([shape[0], shape[1], shape[2], XA_TOPO_SIZE])?,
+            visible
+                .map(|visible| PyArray1::from_vec(py, visible).reshape(shape))
+                .transpose()?,
+        ))
+    }
 }
 
 #[pyclass(name = "ParsedSensor")]
@@ -1,6 +1,8 @@
 use pyo3::exceptions::PyRuntimeError;
 use pyo3::prelude::*;
 
+use super::errors::propagation_error;
+use super::time_interface::extract_ds50_utc;
 use crate::DLL_VERSION;
 use crate::sgp4::{self, XA_SGP4OUT_SIZE};
 use crate::tle;
@@ -46,48 +48,80 @@ impl SGP4Interface {
     }
 
     fn get_position_velocity_lla(&self, sat_key: i64, ds50_utc: f64) -> PyResult<(f64, [f64; 3], [f64; 3], [f64; 3])> {
-        sgp4::get_position_velocity_lla(sat_key, ds50_utc).map_err(PyRuntimeError::new_err)
+        sgp4::get_position_velocity_lla_with_code(sat_key, ds50_utc).map_err(propagation_error)
     }
 
     fn get_position_velocity(&self, sat_key: i64, ds50_utc: f64) -> PyResult<([f64; 3], [f64; 3])> {
-        sgp4::get_position_velocity(sat_key, ds50_utc).map_err(PyRuntimeError::new_err)
+        sgp4::get_position_velocity_with_code(sat_key, ds50_utc).map_err(propagation_error)
     }
 
     fn get_lla(&self, sat_key: i64, ds50_utc: f64) -> PyResult<[f64; 3]> {
-        sgp4::get_lla(sat_key, ds50_utc).map_err(PyRuntimeError::new_err)
+        sgp4::get_lla_with_code(sat_key, ds50_utc).map_err(propagation_error)
     }
 
     fn get_position(&self, sat_key: i64, ds50_utc: f64) -> PyResult<[f64; 3]> {
-        sgp4::get_position(sat_key, ds50_utc).map_err(PyRuntimeError::new_err)
+        sgp4::get_position_with_code(sat_key, ds50_utc).map_err(propagation_error)
     }
 
     fn get_full_state(&self, sat_key: i64, ds50_utc: f64) -> PyResult<[f64; XA_SGP4OUT_SIZE]> {
-        sgp4::get_full_state(sat_key, ds50_utc).map_err(PyRuntimeError::new_err)
+        sgp4::get_full_state_with_code(sat_key, ds50_utc).map_err(propagation_error)
     }
 
     fn get_equinoctial(&self, sat_key: i64, ds50_utc: f64) -> PyResult<[f64; 6]> {
-        sgp4::get_equinoctial(sat_key, ds50_utc).map_err(PyRuntimeError::new_err)
+        sgp4::get_equinoctial_with_code(sat_key, ds50_utc).map_err(propagation_error)
     }
 
     fn get_ephemeris(
         &self,
         sat_key: i64,
-        start: f64,
-        stop: f64,
+        start: &Bound<'_, PyAny>,
+        stop: &Bound<'_, PyAny>,
         step: f64,
         frame: i32,
     ) -> PyResult<Vec<f64>> {
+        let (start, stop) = (extract_ds50_utc(start)?, extract_ds50_utc(stop)?);
         sgp4::get_ephemeris(sat_key, start, stop, step, frame).map_err(PyRuntimeError::new_err)
     }
 
+    #[pyo3(signature = (sat_key, start, stop, step, split_antimeridian=false, tolerance_deg=None))]
+    fn get_ground_track(
+        &self,
+        sat_key: i64,
+        start: &Bound<'_, PyAny>,
+        stop: &Bound<'_, PyAny>,
+        step: f64,
+        split_antimeridian: bool,
+        tolerance_deg: Option<f64>,
+    ) -> PyResult<Vec<[f64; 4]>> {
+        let (start, stop) = (extract_ds50_utc(start)?, extract_ds50_utc(stop)?);
+        sgp4::get_ground_track(sat_key, start, stop, step, split_antimeridian, tolerance_deg)
+            .map_err(PyRuntimeError::new_err)
+    }
+
+    #[pyo3(signature = (sat_keys, start, stop, step, split_antimeridian=false, tolerance_deg=None))]
+    fn get_ground_tracks(
+        &self,
+        sat_keys: Vec<i64>,
+        start: &Bound<'_, PyAny>,
+        stop: &Bound<'_, PyAny>,
+        step: f64,
+        split_antimeridian: bool,
+        tolerance_deg: Option<f64>,
+    ) -> PyResult<Vec<Vec<[f64; 4]>>> {
+        let (start, stop) = (extract_ds50_utc(start)?, extract_ds50_utc(stop)?);
+        sgp4::get_ground_tracks(&sat_keys, start, stop, step, split_antimeridian, tolerance_deg)
+            .map_err(PyRuntimeError::new_err)
+    }
+
     fn array_to_ephemeris(
         &self,
         xa_tle: [f64; tle::XA_TLE_SIZE],
-        start: f64,
-        stop: f64,
+        start: &Bound<'_, PyAny>,
+        stop: &Bound<'_, PyAny>,
         step: f64,
         frame: i32,
     ) -> PyResult<Vec<f64>> {
+        let (start, stop) = (extract_ds50_utc(start)?, extract_ds50_utc(stop)?);
         sgp4::array_to_ephemeris(&xa_tle, start, stop, step, frame).map_err(PyRuntimeError::new_err)
     }
 
@@ -110,8 +144,24 @@ impl SGP4Interface {
         sgp4::fit_sgp4_array(epoch, &posvel, b_star).map_err(PyRuntimeError::new_err)
     }
 
-    fn get_positions_velocities(&self, sat_keys: Vec<i64>, ds50_utc: f64) -> PyResult<Vec<f64>> {
-        sgp4::get_positions_velocities(&sat_keys, ds50_utc).map_err(PyRuntimeError::new_err)
+    fn get_positions_velocities(&self, sat_keys: Vec<i64>, ds50_utc: &Bound<'_, PyAny>) -> PyResult<Vec<f64>> {
+        sgp4::get_positions_velocities(&sat_keys, extract_ds50_utc(ds50_utc)?).map_err(PyRuntimeError::new_err)
+    }
+
+    #[pyo3(signature = (sat_keys, ds50_utc, messages=false))]
+    #[allow(clippy::type_complexity)]
+    fn get_positions_velocities_with_status(
+        &self,
+        sat_keys: Vec<i64>,
+        ds50_utc: &Bound<'_, PyAny>,
+        messages: bool,
+    ) -> PyResult<(Vec<[f64; 6]>, Vec<i32>, Option<Vec<Option<String>>>)> {
+        let status = sgp4::get_positions_velocities_with_status(&sat_keys, extract_ds50_utc(ds50_utc)?, messages);
+        Ok((status.values, status.codes, status.messages))
+    }
+
+    fn get_error_description(&self, code: i32) -> PyResult<Option<&'static str>> {
+        Ok(sgp4::get_error_description(code))
     }
 
     fn set_license_directory(&self, lic_file_path: String) -> PyResult<()> {
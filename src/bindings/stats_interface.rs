@@ -0,0 +1,63 @@
+use pyo3::exceptions::PyValueError;
+use pyo3::prelude::*;
+use pyo3::types::PyDict;
+
+use crate::stats::{self, LATENCY_BUCKETS_NS};
+
+#[pyfunction(name = "stats")]
+fn py_stats(py: Python<'_>) -> PyResult<Bound<'_, PyDict>> {
+    let functions = PyDict::new(py);
+    for (name, function_stats) in stats::snapshot() {
+        let entry = PyDict::new(py);
+        entry.set_item("calls", function_stats.calls)?;
+        entry.set_item("errors", function_stats.errors)?;
+        entry.set_item("total_ns", function_stats.total_ns)?;
+        entry.set_item("max_ns", function_stats.max_ns)?;
+        entry.set_item("mean_ns", function_stats.mean_ns())?;
+        entry.set_item("buckets", function_stats.buckets.to_vec())?;
+        functions.set_item(name, entry)?;
+    }
+    let result = PyDict::new(py);
+    result.set_item("enabled", stats::is_enabled())?;
+    result.set_item("bucket_bounds_ns", LATENCY_BUCKETS_NS.to_vec())?;
+    result.set_item("functions", functions)?;
+    Ok(result)
+}
+
+#[pyfunction(name = "reset_stats")]
+fn py_reset_stats() {
+    stats::reset();
+}
+
+#[pyfunction(name = "enable_stats")]
+#[pyo3(signature = (enabled=true))]
+fn py_enable_stats(enabled: bool) {
+    stats::set_enabled(enabled);
+}
+
+#[pyfunction(name = "stats_enabled")]
+fn py_stats_enabled() -> bool {
+    stats::is_enabled()
+}
+
+#[pyfunction(name = "export_stats")]
+#[pyo3(signature = (format="json"))]
+fn py_export_stats(format: &str) -> PyResult<String> {
+    match format {
+        "json" => Ok(stats::to_json()),
+        "prometheus" => Ok(stats::to_prometheus()),
+        _ => Err(PyValueError::new_err(format!(
+            "Unknown stats format '{}', expected 'json' or 'prometheus'",
+            format
+        ))),
+    }
+}
+
+pub fn register_stats_interface(parent_module: &Bound<'_, PyModule>) -> PyResult<()> {
+    parent_module.add_function(wrap_pyfunction!(py_stats, parent_module)?)?;
+    parent_module.add_function(wrap_pyfunction!(py_reset_stats, parent_module)?)?;
+    parent_module.add_function(wrap_pyfunction!(py_enable_stats, parent_module)?)?;
+    parent_module.add_function(wrap_pyfunction!(py_stats_enabled, parent_module)?)?;
+    parent_module.add_function(wrap_pyfunction!(py_export_stats, parent_module)?)?;
+    Ok(())
+}
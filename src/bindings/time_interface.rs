@@ -1,12 +1,16 @@
-use pyo3::exceptions::PyRuntimeError;
+use numpy::{AllowTypeChange, IntoPyArray, PyArray1, PyArrayLike1, PyReadonlyArray1, PyReadonlyArrayDyn};
+use pyo3::exceptions::{PyRuntimeError, PyValueError};
 use pyo3::prelude::*;
+use std::borrow::Cow;
+use std::sync::Arc;
 
+use super::arrays;
 use crate::DLL_VERSION;
 use crate::time::{
-    clear_constants, constants_loaded, ds50_to_dtg15, ds50_to_dtg17, ds50_to_dtg19, ds50_to_dtg20,
+    self, clear_constants, constants_loaded, ds50_to_dtg15, ds50_to_dtg17, ds50_to_dtg19, ds50_to_dtg20,
     ds50_to_ymd_components, ds50_to_year_doy, dtg_to_ds50, get_dll_info,
     get_fk4_greenwich_angle, get_fk5_greenwich_angle, load_constants, tai_to_utc, tai_to_ut1,
-    utc_to_tai, utc_to_tt, utc_to_ut1, year_doy_to_ds50, ymd_components_to_ds50,
+    utc_to_tai, utc_to_tt, utc_to_ut1, year_doy_to_ds50, ymd_components_to_ds50, GreenwichTable, TimingTable,
 };
 
 #[pyclass]
@@ -120,6 +124,28 @@ impl TimeInterface {
         Ok(get_fk5_greenwich_angle(ds50_ut1))
     }
 
+    #[pyo3(signature = (ds50_utcs, catalog=None, cache=false))]
+    fn get_greenwich_angles(
+        &self,
+        ds50_utcs: &Bound<'_, PyAny>,
+        catalog: Option<i32>,
+        cache: bool,
+    ) -> PyResult<Vec<f64>> {
+        let ds50_utcs = extract_ds50_utcs(ds50_utcs)?;
+        if cache {
+            time::get_cached_greenwich_table(&ds50_utcs, catalog)
+                .map(|table| table.angles.clone())
+                .map_err(PyRuntimeError::new_err)
+        } else {
+            time::get_greenwich_angles(&ds50_utcs, catalog).map_err(PyRuntimeError::new_err)
+        }
+    }
+
+    fn clear_greenwich_cache(&self) -> PyResult<()> {
+        time::clear_greenwich_cache();
+        Ok(())
+    }
+
     #[getter]
     fn constants_loaded(&self) -> PyResult<bool> {
         Ok(constants_loaded())
@@ -132,9 +158,383 @@ impl TimeInterface {
     fn clear_constants(&self) -> PyResult<()> {
         clear_constants().map_err(PyRuntimeError::new_err)
     }
+
+    fn ds50_to_dtg20_batch<'py>(&self, py: Python<'py>, ds50_utcs: &Bound<'py, PyAny>) -> PyResult<Bound<'py, PyAny>> {
+        dtg_array(py, time::ds50_to_dtg20_batch(&extract_ds50_utcs(ds50_utcs)?))
+    }
+
+    fn ds50_to_dtg19_batch<'py>(&self, py: Python<'py>, ds50_utcs: &Bound<'py, PyAny>) -> PyResult<Bound<'py, PyAny>> {
+        dtg_array(py, time::ds50_to_dtg19_batch(&extract_ds50_utcs(ds50_utcs)?))
+    }
+
+    fn ds50_to_dtg17_batch<'py>(&self, py: Python<'py>, ds50_utcs: &Bound<'py, PyAny>) -> PyResult<Bound<'py, PyAny>> {
+        dtg_array(py, time::ds50_to_dtg17_batch(&extract_ds50_utcs(ds50_utcs)?))
+    }
+
+    fn ds50_to_dtg15_batch<'py>(&self, py: Python<'py>, ds50_utcs: &Bound<'py, PyAny>) -> PyResult<Bound<'py, PyAny>> {
+        dtg_array(py, time::ds50_to_dtg15_batch(&extract_ds50_utcs(ds50_utcs)?))
+    }
+
+    fn dtg_to_ds50_batch<'py>(&self, py: Python<'py>, dtgs: Vec<String>) -> PyResult<Bound<'py, PyArray1<f64>>> {
+        Ok(time::dtg_to_ds50_batch(&dtgs).into_pyarray(py))
+    }
+
+    fn datetime_to_ds50(&self, value: &Bound<'_, PyAny>) -> PyResult<f64> {
+        datetime_to_ds50_utc(value)
+    }
+
+    fn ds50_to_datetime<'py>(&self, py: Python<'py>, ds50_utc: f64) -> PyResult<Bound<'py, PyAny>> {
+        let (year, month, day, hour, minute, second, microsecond) = time::ds50_to_datetime_components(ds50_utc);
+        let datetime = py.import("datetime")?;
+        let utc = datetime.getattr("timezone")?.getattr("utc")?;
+        datetime
+            .getattr("datetime")?
+            .call1((year, month, day, hour, minute, second, microsecond, utc))
+    }
+
+    fn to_ds50_utc<'py>(&self, py: Python<'py>, epochs: &Bound<'py, PyAny>) -> PyResult<Bound<'py, PyArray1<f64>>> {
+        Ok(extract_ds50_utcs(epochs)?.into_pyarray(py))
+    }
+
+    fn to_ds50_tai<'py>(&self, py: Python<'py>, epochs: &Bound<'py, PyAny>) -> PyResult<Bound<'py, PyArray1<f64>>> {
+        Ok(time::utc_to_tai_batch(&extract_ds50_utcs(epochs)?).into_pyarray(py))
+    }
+
+    #[pyo3(signature = (ds50_utcs, unit="ns"))]
+    fn ds50_utc_to_datetime64<'py>(
+        &self,
+        py: Python<'py>,
+        ds50_utcs: PyArrayLike1<'py, f64, AllowTypeChange>,
+        unit: &str,
+    ) -> PyResult<Bound<'py, PyAny>> {
+        let values =
+            time::ds50_utc_to_datetime64(&arrays::values(&ds50_utcs), unit).map_err(PyRuntimeError::new_err)?;
+        datetime64_array(py, values, unit)
+    }
+
+    #[pyo3(signature = (ds50_tais, unit="ns"))]
+    fn ds50_tai_to_datetime64<'py>(
+        &self,
+        py: Python<'py>,
+        ds50_tais: PyArrayLike1<'py, f64, AllowTypeChange>,
+        unit: &str,
+    ) -> PyResult<Bound<'py, PyAny>> {
+        let values =
+            time::ds50_tai_to_datetime64(&arrays::values(&ds50_tais), unit).map_err(PyRuntimeError::new_err)?;
+        datetime64_array(py, values, unit)
+    }
+
+    fn get_constants_span(&self) -> PyResult<(i32, f64, f64)> {
+        Ok(time::get_constants_span())
+    }
+
+    fn get_constants_record(&self, ds50_utc: f64) -> PyResult<Option<[f64; 5]>> {
+        Ok(time::get_constants_record(ds50_utc))
+    }
+
+    fn utc_to_tai_batch<'py>(
+        &self,
+        py: Python<'py>,
+        ds50_utcs: &Bound<'py, PyAny>,
+    ) -> PyResult<Bound<'py, PyArray1<f64>>> {
+        Ok(time::utc_to_tai_batch(&extract_ds50_utcs(ds50_utcs)?).into_pyarray(py))
+    }
+
+    fn tai_to_utc_batch<'py>(
+        &self,
+        py: Python<'py>,
+        ds50_tais: PyArrayLike1<'py, f64, AllowTypeChange>,
+    ) -> PyResult<Bound<'py, PyArray1<f64>>> {
+        Ok(time::tai_to_utc_batch(&arrays::values(&ds50_tais)).into_pyarray(py))
+    }
+
+    fn utc_to_ut1_batch<'py>(
+        &self,
+        py: Python<'py>,
+        ds50_utcs: &Bound<'py, PyAny>,
+    ) -> PyResult<Bound<'py, PyArray1<f64>>> {
+        Ok(time::utc_to_ut1_batch(&extract_ds50_utcs(ds50_utcs)?).into_pyarray(py))
+    }
+
+    fn utc_to_tt_batch<'py>(
+        &self,
+        py: Python<'py>,
+        ds50_utcs: &Bound<'py, PyAny>,
+    ) -> PyResult<Bound<'py, PyArray1<f64>>> {
+        Ok(time::utc_to_tt_batch(&extract_ds50_utcs(ds50_utcs)?).into_pyarray(py))
+    }
+
+    fn tai_to_ut1_batch<'py>(
+        &self,
+        py: Python<'py>,
+        ds50_tais: PyArrayLike1<'py, f64, AllowTypeChange>,
+    ) -> PyResult<Bound<'py, PyArray1<f64>>> {
+        Ok(time::tai_to_ut1_batch(&arrays::values(&ds50_tais)).into_pyarray(py))
+    }
+
+    fn year_doy_to_ds50_batch<'py>(
+        &self,
+        py: Python<'py>,
+        years: PyArrayLike1<'py, i32, AllowTypeChange>,
+        doys: PyArrayLike1<'py, f64, AllowTypeChange>,
+    ) -> PyResult<Bound<'py, PyArray1<f64>>> {
+        let ds50_utcs = time::year_doy_to_ds50_batch(&arrays::values(&years), &arrays::values(&doys))
+            .map_err(PyRuntimeError::new_err)?;
+        Ok(ds50_utcs.into_pyarray(py))
+    }
+
+    fn ds50_to_year_doy_batch<'py>(
+        &self,
+        py: Python<'py>,
+        ds50_utcs: &Bound<'py, PyAny>,
+    ) -> PyResult<(Bound<'py, PyArray1<i32>>, Bound<'py, PyArray1<f64>>)> {
+        let (years, doys) = time::ds50_to_year_doy_batch(&extract_ds50_utcs(ds50_utcs)?);
+        Ok((years.into_pyarray(py), doys.into_pyarray(py)))
+    }
+
+    #[allow(clippy::type_complexity)]
+    fn ds50_to_ymd_components_batch<'py>(
+        &self,
+        py: Python<'py>,
+        ds50_utcs: &Bound<'py, PyAny>,
+    ) -> PyResult<(
+        Bound<'py, PyArray1<i32>>,
+        Bound<'py, PyArray1<i32>>,
+        Bound<'py, PyArray1<i32>>,
+        Bound<'py, PyArray1<i32>>,
+        Bound<'py, PyArray1<i32>>,
+        Bound<'py, PyArray1<f64>>,
+    )> {
+        let comps = time::ds50_to_ymd_components_batch(&extract_ds50_utcs(ds50_utcs)?);
+        Ok((
+            comps.years.into_pyarray(py),
+            comps.months.into_pyarray(py),
+            comps.days.into_pyarray(py),
+            comps.hours.into_pyarray(py),
+            comps.minutes.into_pyarray(py),
+            comps.seconds.into_pyarray(py),
+        ))
+    }
+
+    #[allow(clippy::too_many_arguments)]
+    fn ymd_components_to_ds50_batch<'py>(
+        &self,
+        py: Python<'py>,
+        years: PyArrayLike1<'py, i32, AllowTypeChange>,
+        months: PyArrayLike1<'py, i32, AllowTypeChange>,
+        days: PyArrayLike1<'py, i32, AllowTypeChange>,
+        hours: PyArrayLike1<'py, i32, AllowTypeChange>,
+        minutes: PyArrayLike1<'py, i32, AllowTypeChange>,
+        seconds: PyArrayLike1<'py, f64, AllowTypeChange>,
+    ) -> PyResult<Bound<'py, PyArray1<f64>>> {
+        let comps = time::YmdComponents {
+            years: arrays::values(&years).into_owned(),
+            months: arrays::values(&months).into_owned(),
+            days: arrays::values(&days).into_owned(),
+            hours: arrays::values(&hours).into_owned(),
+            minutes: arrays::values(&minutes).into_owned(),
+            seconds: arrays::values(&seconds).into_owned(),
+        };
+        let ds50_utcs = time::ymd_components_to_ds50_batch(&comps).map_err(PyRuntimeError::new_err)?;
+        Ok(ds50_utcs.into_pyarray(py))
+    }
+}
+
+/// Convert a `datetime` to ds50 UTC; naive values are taken as UTC.
+fn datetime_to_ds50_utc(value: &Bound<'_, PyAny>) -> PyResult<f64> {
+    let offset = value.call_method0("utcoffset")?;
+    let offset_seconds: f64 = if offset.is_none() {
+        0.0
+    } else {
+        offset.call_method0("total_seconds")?.extract()?
+    };
+    let ds50_utc = time::datetime_components_to_ds50(
+        value.getattr("year")?.extract()?,
+        value.getattr("month")?.extract()?,
+        value.getattr("day")?.extract()?,
+        value.getattr("hour")?.extract()?,
+        value.getattr("minute")?.extract()?,
+        value.getattr("second")?.extract()?,
+        value.getattr("microsecond")?.extract()?,
+    );
+    Ok(ds50_utc - offset_seconds / 86400.0)
+}
+
+/// Extract ds50 UTC epochs from floats, `datetime` objects or a `numpy.datetime64` array of any unit.
+///
+/// float64 and `datetime64` arrays are read in place; a `datetime64` array is viewed as its int64 ticks.
+pub(crate) fn extract_ds50_utcs(epochs: &Bound<'_, PyAny>) -> PyResult<Vec<f64>> {
+    if let Ok(values) = epochs.extract::<PyReadonlyArray1<'_, f64>>() {
+        return Ok(arrays::values(&values).into_owned());
+    }
+    if let Ok(dtype) = epochs.getattr("dtype")
+        && dtype.getattr("kind")?.extract::<String>()? == "M"
+    {
+        let numpy = epochs.py().import("numpy")?;
+        let (unit, count): (String, i64) = numpy.call_method1("datetime_data", (dtype,))?.extract()?;
+        let ticks = numpy
+            .call_method1("asarray", (epochs,))?
+            .call_method1("view", ("int64",))?;
+        let ticks: PyReadonlyArrayDyn<'_, i64> = ticks.extract()?;
+        let ticks = match ticks.as_slice() {
+            Ok(ticks) if count == 1 => Cow::Borrowed(ticks),
+            _ => Cow::Owned(
+                ticks
+                    .as_array()
+                    .iter()
+                    .map(|&tick| {
+                        if tick == time::DATETIME64_NAT {
+                            tick
+                        } else {
+                            tick * count
+                        }
+                    })
+                    .collect(),
+            ),
+        };
+        return time::datetime64_to_ds50_utc(&ticks, &unit).map_err(PyRuntimeError::new_err);
+    }
+    if let Ok(values) = epochs.extract::<Vec<f64>>() {
+        return Ok(values);
+    }
+    epochs.try_iter()?.map(|value| datetime_to_ds50_utc(&value?)).collect()
+}
+
+/// Extract one ds50 UTC epoch from a float, a `datetime` or a `numpy.datetime64` scalar.
+pub(crate) fn extract_ds50_utc(epoch: &Bound<'_, PyAny>) -> PyResult<f64> {
+    if let Ok(value) = epoch.extract::<f64>() {
+        return Ok(value);
+    }
+    if epoch.hasattr("dtype")? {
+        return match extract_ds50_utcs(epoch)?.as_slice() {
+            [ds50_utc] => Ok(*ds50_utc),
+            _ => Err(PyValueError::new_err("Expected a single epoch")),
+        };
+    }
+    datetime_to_ds50_utc(epoch)
+}
+
+/// Pack ASCII DTG strings into a fixed-width `numpy` str array without creating a Python string per value.
+fn dtg_array<'py>(py: Python<'py>, dtgs: Vec<String>) -> PyResult<Bound<'py, PyAny>> {
+    let width = dtgs.iter().map(String::len).max().unwrap_or(0).max(1);
+    let mut bytes = vec![0u8; dtgs.len() * width];
+    for (field, dtg) in bytes.chunks_exact_mut(width).zip(&dtgs) {
+        field[..dtg.len()].copy_from_slice(dtg.as_bytes());
+    }
+    PyArray1::from_vec(py, bytes)
+        .call_method1("view", (format!("S{width}"),))?
+        .call_method1("astype", (format!("U{width}"),))
+}
+
+fn datetime64_array<'py>(py: Python<'py>, values: Vec<i64>, unit: &str) -> PyResult<Bound<'py, PyAny>> {
+    PyArray1::from_vec(py, values).call_method1("view", (format!("datetime64[{unit}]"),))
+}
+
+#[pyclass(name = "TimingTable")]
+pub struct PyTimingTable {
+    inner: Arc<TimingTable>,
+}
+
+#[pymethods]
+impl PyTimingTable {
+    #[staticmethod]
+    fn snapshot() -> PyResult<Option<PyTimingTable>> {
+        Ok(time::get_timing_table().map(|inner| PyTimingTable { inner }))
+    }
+
+    fn __len__(&self) -> usize {
+        self.inner.len()
+    }
+
+    #[getter(span)]
+    fn get_span(&self) -> PyResult<(f64, f64)> {
+        Ok(self.inner.span())
+    }
+
+    fn utc_to_tai(&self, ds50_utcs: Vec<f64>) -> PyResult<Vec<f64>> {
+        Ok(ds50_utcs
+            .into_iter()
+            .map(|ds50_utc| self.inner.utc_to_tai(ds50_utc))
+            .collect())
+    }
+
+    fn tai_to_utc(&self, ds50_tais: Vec<f64>) -> PyResult<Vec<f64>> {
+        Ok(ds50_tais
+            .into_iter()
+            .map(|ds50_tai| self.inner.tai_to_utc(ds50_tai))
+            .collect())
+    }
+
+    fn utc_to_ut1(&self, ds50_utcs: Vec<f64>) -> PyResult<Vec<f64>> {
+        Ok(ds50_utcs
+            .into_iter()
+            .map(|ds50_utc| self.inner.utc_to_ut1(ds50_utc))
+            .collect())
+    }
+
+    fn utc_to_tt(&self, ds50_utcs: Vec<f64>) -> PyResult<Vec<f64>> {
+        Ok(ds50_utcs
+            .into_iter()
+            .map(|ds50_utc| self.inner.utc_to_tt(ds50_utc))
+            .collect())
+    }
+
+    fn tai_to_ut1(&self, ds50_tais: Vec<f64>) -> PyResult<Vec<f64>> {
+        Ok(ds50_tais
+            .into_iter()
+            .map(|ds50_tai| self.inner.tai_to_ut1(ds50_tai))
+            .collect())
+    }
+}
+
+#[pyclass(name = "GreenwichTable")]
+pub struct PyGreenwichTable {
+    inner: Arc<GreenwichTable>,
+}
+
+#[pymethods]
+impl PyGreenwichTable {
+    #[staticmethod]
+    #[pyo3(signature = (ds50_utcs, catalog=None))]
+    fn cached(ds50_utcs: &Bound<'_, PyAny>, catalog: Option<i32>) -> PyResult<PyGreenwichTable> {
+        let ds50_utcs = extract_ds50_utcs(ds50_utcs)?;
+        time::get_cached_greenwich_table(&ds50_utcs, catalog)
+            .map(|inner| PyGreenwichTable { inner })
+            .map_err(PyRuntimeError::new_err)
+    }
+
+    fn __len__(&self) -> usize {
+        self.inner.angles.len()
+    }
+
+    #[getter(catalog)]
+    fn get_catalog(&self) -> PyResult<i32> {
+        Ok(self.inner.catalog)
+    }
+
+    #[getter(ds50_utcs)]
+    fn get_ds50_utcs(&self) -> PyResult<Vec<f64>> {
+        Ok(self.inner.ds50_utcs.clone())
+    }
+
+    #[getter(ds50_ut1s)]
+    fn get_ds50_ut1s(&self) -> PyResult<Vec<f64>> {
+        Ok(self.inner.ds50_ut1s.clone())
+    }
+
+    #[getter(angles)]
+    fn get_angles(&self) -> PyResult<Vec<f64>> {
+        Ok(self.inner.angles.clone())
+    }
+
+    fn is_shared_with(&self, other: &PyGreenwichTable) -> bool {
+        Arc::ptr_eq(&self.inner, &other.inner)
+    }
 }
 
 pub fn register_time_func_interface(parent_module: &Bound<'_, PyModule>) -> PyResult<()> {
     parent_module.add_class::<TimeInterface>()?;
+    parent_module.add_class::<PyTimingTable>()?;
+    parent_module.add_class::<PyGreenwichTable>()?;
     Ok(())
 }
@@ -1,5 +1,6 @@
 use pyo3::exceptions::PyRuntimeError;
 use pyo3::prelude::*;
+use pyo3::types::PyString;
 
 use crate::DLL_VERSION;
 use crate::tle::{self, ParsedTLE, XA_TLE_SIZE};
@@ -79,8 +80,11 @@ impl TLEInterface {
         Ok(tle::get_keys(order))
     }
 
-    fn get_lines(&self, sat_key: i64) -> PyResult<(String, String)> {
-        tle::get_lines(sat_key).map_err(PyRuntimeError::new_err)
+    fn get_lines<'py>(&self, py: Python<'py>, sat_key: i64) -> PyResult<(Bound<'py, PyString>, Bound<'py, PyString>)> {
+        tle::with_lines(sat_key, |line_1, line_2| {
+            (PyString::new(py, line_1), PyString::new(py, line_2))
+        })
+        .map_err(PyRuntimeError::new_err)
     }
 
     fn get_arrays(&self, sat_key: i64) -> PyResult<([f64; XA_TLE_SIZE], String)> {
@@ -1,8 +1,10 @@
 // This wrapper file was generated automatically by the GenDllWrappers program.
 #![allow(non_snake_case)]
 #![allow(dead_code)]
-use crate::GetSetString;
+use crate::{astro, stats, with_buffer, with_str};
 use std::os::raw::c_char;
+use std::sync::atomic::{AtomicU64, Ordering};
+use std::sync::{LazyLock, RwLock};
 
 unsafe extern "C" {
 
@@ -212,11 +214,10 @@ pub const XF_FKMOD_5: i32 = 5;
 /// true
 /// ```
 pub fn get_dll_info() -> String {
-    let mut info_str = GetSetString::new();
-    unsafe {
-        EnvGetInfo(info_str.pointer());
-    }
-    info_str.value()
+    with_buffer(|info_str| {
+        stats::timed("EnvGetInfo", || unsafe { EnvGetInfo(info_str.pointer()) });
+        info_str.value()
+    })
 }
 
 /// Return the Earth radius from the current GEO model.
@@ -234,7 +235,7 @@ pub fn get_dll_info() -> String {
 /// 6378.135
 /// ```
 pub fn get_earth_radius() -> f64 {
-    unsafe { EnvGetGeoConst(XF_GEOCON_KMPER) }
+    stats::timed("EnvGetGeoConst", || unsafe { EnvGetGeoConst(XF_GEOCON_KMPER) })
 }
 
 /// Return the Earth rotation rate from the current FK model.
@@ -252,7 +253,7 @@ pub fn get_earth_radius() -> f64 {
 /// 0.017202791694070362
 /// ```
 pub fn get_earth_rotation_rate() -> f64 {
-    unsafe { EnvGetFkConst(XF_FKCON_C1) }
+    stats::timed("EnvGetFkConst", || unsafe { EnvGetFkConst(XF_FKCON_C1) })
 }
 
 /// Return the Earth rotation acceleration from the current FK model.
@@ -270,7 +271,7 @@ pub fn get_earth_rotation_rate() -> f64 {
 /// 5.075514194322695e-15
 /// ```
 pub fn get_earth_rotation_acceleration() -> f64 {
-    unsafe { EnvGetFkConst(XF_FKCON_C1DOT) }
+    stats::timed("EnvGetFkConst", || unsafe { EnvGetFkConst(XF_FKCON_C1DOT) })
 }
 
 /// Return the Earth's gravitational parameter from the current GEO model.
@@ -288,7 +289,7 @@ pub fn get_earth_rotation_acceleration() -> f64 {
 /// 398600.8
 /// ```
 pub fn get_earth_mu() -> f64 {
-    unsafe { EnvGetGeoConst(XF_GEOCON_MU) }
+    stats::timed("EnvGetGeoConst", || unsafe { EnvGetGeoConst(XF_GEOCON_MU) })
 }
 
 /// Return the Earth flattening (reciprocal) from the current GEO model.
@@ -306,7 +307,7 @@ pub fn get_earth_mu() -> f64 {
 /// 0.003352779454168
 /// ```
 pub fn get_earth_flattening() -> f64 {
-    unsafe { EnvGetGeoConst(XF_GEOCON_FF) }
+    stats::timed("EnvGetGeoConst", || unsafe { EnvGetGeoConst(XF_GEOCON_FF) })
 }
 
 /// Return the J2 coefficient from the current GEO model.
@@ -324,7 +325,7 @@ pub fn get_earth_flattening() -> f64 {
 /// 0.001082616
 /// ```
 pub fn get_j2() -> f64 {
-    unsafe { EnvGetGeoConst(XF_GEOCON_J2) }
+    stats::timed("EnvGetGeoConst", || unsafe { EnvGetGeoConst(XF_GEOCON_J2) })
 }
 
 /// Return the J3 coefficient from the current GEO model.
@@ -342,7 +343,7 @@ pub fn get_j2() -> f64 {
 /// -0.00000253881
 /// ```
 pub fn get_j3() -> f64 {
-    unsafe { EnvGetGeoConst(XF_GEOCON_J3) }
+    stats::timed("EnvGetGeoConst", || unsafe { EnvGetGeoConst(XF_GEOCON_J3) })
 }
 
 /// Return the J4 coefficient from the current GEO model.
@@ -360,7 +361,7 @@ pub fn get_j3() -> f64 {
 /// -0.00000165597
 /// ```
 pub fn get_j4() -> f64 {
-    unsafe { EnvGetGeoConst(XF_GEOCON_J4) }
+    stats::timed("EnvGetGeoConst", || unsafe { EnvGetGeoConst(XF_GEOCON_J4) })
 }
 
 /// Return the J5 coefficient from the current GEO model.
@@ -378,7 +379,7 @@ pub fn get_j4() -> f64 {
 /// -2.1848270e-07
 /// ```
 pub fn get_j5() -> f64 {
-    unsafe { EnvGetGeoConst(XF_GEOCON_J5) }
+    stats::timed("EnvGetGeoConst", || unsafe { EnvGetGeoConst(XF_GEOCON_J5) })
 }
 
 /// Load Earth constants and fundamental catalog settings from a file.
@@ -396,8 +397,11 @@ pub fn get_j5() -> f64 {
 /// true
 /// ```
 pub fn load_from_file(file_path: &str) -> Result<(), String> {
-    let mut env_file: GetSetString = file_path.into();
-    let result = unsafe { EnvLoadFile(env_file.pointer()) };
+    let result = with_str(file_path, |env_file| {
+        stats::timed_status("EnvLoadFile", || unsafe { EnvLoadFile(env_file.pointer()) })
+    });
+    astro::clear_rotation_cache();
+    invalidate_earth_constants();
     match result {
         0 => Ok(()),
         _ => Err(format!("Failed to load environment from file: {}", file_path)),
@@ -417,7 +421,7 @@ pub fn load_from_file(file_path: &str) -> Result<(), String> {
 /// 5
 /// ```
 pub fn get_fundamental_catalog() -> Result<i32, String> {
-    let fk_idx = unsafe { EnvGetFkIdx() };
+    let fk_idx = stats::timed("EnvGetFkIdx", || unsafe { EnvGetFkIdx() });
     match fk_idx {
         XF_FKMOD_4 => Ok(fk_idx),
         XF_FKMOD_5 => Ok(fk_idx),
@@ -438,25 +442,158 @@ pub fn get_fundamental_catalog() -> Result<i32, String> {
 /// 4
 /// ```
 pub fn set_fundamental_catalog(catalog: i32) {
-    unsafe {
+    stats::timed("EnvSetFkIdx", || unsafe {
         EnvSetFkIdx(catalog);
-    }
+    });
+    astro::clear_rotation_cache();
+    invalidate_earth_constants();
 }
 
 pub fn set_geopotential_model(geo_model: i32) {
-    unsafe {
+    stats::timed("EnvSetGeoIdx", || unsafe {
         EnvSetGeoIdx(geo_model);
-    }
+    });
+    invalidate_earth_constants();
 }
 
 pub fn get_geopotential_model() -> Result<i32, String> {
-    let geo_idx = unsafe { EnvGetGeoIdx() };
+    let geo_idx = stats::timed("EnvGetGeoIdx", || unsafe { EnvGetGeoIdx() });
     match geo_idx {
         XF_GEOMOD_UNKNOWN => Err("Unknown geopotential model".to_string()),
         _ => Ok(geo_idx),
     }
 }
 
+/// Immutable snapshot of the Earth constants for the current geopotential model and fundamental catalog.
+///
+/// `version` increases every time the environment is changed through this module, so callers can tell whether a
+/// snapshot they hold is still current.
+#[derive(Debug, Clone, Copy, PartialEq)]
+pub struct EarthConstants {
+    pub version: u64,
+    pub geopotential_model: i32,
+    pub fundamental_catalog: i32,
+    pub radius: f64,
+    pub mu: f64,
+    pub flattening: f64,
+    pub j2: f64,
+    pub j3: f64,
+    pub j4: f64,
+    pub j5: f64,
+    pub rotation_rate: f64,
+    pub rotation_acceleration: f64,
+}
+
+impl EarthConstants {
+    fn from_loaded(version: u64) -> Self {
+        EarthConstants {
+            version,
+            geopotential_model: stats::timed("EnvGetGeoIdx", || unsafe { EnvGetGeoIdx() }),
+            fundamental_catalog: stats::timed("EnvGetFkIdx", || unsafe { EnvGetFkIdx() }),
+            radius: get_earth_radius(),
+            mu: get_earth_mu(),
+            flattening: get_earth_flattening(),
+            j2: get_j2(),
+            j3: get_j3(),
+            j4: get_j4(),
+            j5: get_j5(),
+            rotation_rate: get_earth_rotation_rate(),
+            rotation_acceleration: get_earth_rotation_acceleration(),
+        }
+    }
+}
+
+static EARTH_CONSTANTS_VERSION: AtomicU64 = AtomicU64::new(0);
+static EARTH_CONSTANTS: LazyLock<RwLock<Option<EarthConstants>>> = LazyLock::new(|| RwLock::new(None));
+
+/// Return the Earth constants snapshot, reading the DLL only on first use after a change.
+///
+/// Example:
+/// ```rust
+/// let constants = saal::environment::get_earth_constants();
+/// println!("{:.3}", constants.radius);
+/// ```
+///
+/// Output:
+/// ```bash
+/// 6378.135
+/// ```
+pub fn get_earth_constants() -> EarthConstants {
+    if let Some(constants) = *EARTH_CONSTANTS.read().unwrap_or_else(|e| e.into_inner()) {
+        return constants;
+    }
+    let mut cached = EARTH_CONSTANTS.write().unwrap_or_else(|e| e.into_inner());
+    *cached.get_or_insert_with(|| EarthConstants::from_loaded(EARTH_CONSTANTS_VERSION.load(Ordering::Acquire)))
+}
+
+/// Return the current Earth constants version.
+pub fn get_earth_constants_version() -> u64 {
+    EARTH_CONSTANTS_VERSION.load(Ordering::Acquire)
+}
+
+/// Discard the Earth constants snapshot after the environment was changed outside this module.
+pub fn invalidate_earth_constants() {
+    let mut cached = EARTH_CONSTANTS.write().unwrap_or_else(|e| e.into_inner());
+    EARTH_CONSTANTS_VERSION.fetch_add(1, Ordering::AcqRel);
+    *cached = None;
+}
+
+/// Temporarily switched geopotential model and fundamental catalog, restored when dropped.
+#[derive(Debug)]
+pub struct EnvironmentGuard {
+    geopotential_model: Option<i32>,
+    fundamental_catalog: Option<i32>,
+}
+
+impl Drop for EnvironmentGuard {
+    fn drop(&mut self) {
+        if let Some(geo_model) = self.geopotential_model {
+            set_geopotential_model(geo_model);
+        }
+        if let Some(catalog) = self.fundamental_catalog {
+            set_fundamental_catalog(catalog);
+        }
+    }
+}
+
+/// Switch to the given geopotential model and/or fundamental catalog until the returned guard is dropped.
+///
+/// Example:
+/// ```rust
+/// {
+///     let _guard = saal::environment::scoped_environment(Some(saal::environment::XF_GEOMOD_WGS84), None).unwrap();
+///     println!("{}", saal::environment::get_earth_constants().geopotential_model);
+/// }
+/// println!("{}", saal::environment::get_earth_constants().geopotential_model);
+/// ```
+///
+/// Output:
+/// ```bash
+/// 84
+/// 72
+/// ```
+pub fn scoped_environment(geo_model: Option<i32>, catalog: Option<i32>) -> Result<EnvironmentGuard, String> {
+    let mut guard = EnvironmentGuard {
+        geopotential_model: None,
+        fundamental_catalog: None,
+    };
+    if let Some(geo_model) = geo_model {
+        guard.geopotential_model = Some(get_geopotential_model()?);
+        set_geopotential_model(geo_model);
+        if get_geopotential_model().is_err() {
+            return Err(format!("Unknown geopotential model: {geo_model}"));
+        }
+    }
+    if let Some(catalog) = catalog {
+        guard.fundamental_catalog = Some(get_fundamental_catalog()?);
+        set_fundamental_catalog(catalog);
+        if get_fundamental_catalog().is_err() {
+            return Err(format!("Unknown fundamental catalog index: {catalog}"));
+        }
+    }
+    Ok(guard)
+}
+
 #[cfg(test)]
 mod tests {
     use super::*;
@@ -556,4 +693,31 @@ mod tests {
         let result = load_from_file(path.to_str().unwrap());
         assert!(result.is_err());
     }
+
+    #[test]
+    fn test_earth_constants_snapshot() {
+        let _lock = TEST_LOCK.lock().unwrap();
+        let constants = get_earth_constants();
+
+        assert_eq!(constants.radius, get_earth_radius());
+        assert_eq!(constants.j2, get_j2());
+        assert_eq!(constants.mu, get_earth_mu());
+        assert_eq!(constants.fundamental_catalog, get_fundamental_catalog().unwrap());
+        assert_eq!(get_earth_constants(), constants);
+        {
+            let _guard = scoped_environment(Some(XF_GEOMOD_WGS84), Some(XF_FKMOD_4)).unwrap();
+            let scoped = get_earth_constants();
+            assert!(scoped.version > constants.version);
+            assert_eq!(scoped.geopotential_model, XF_GEOMOD_WGS84);
+            assert_eq!(scoped.fundamental_catalog, XF_FKMOD_4);
+            assert_eq!(scoped.radius, get_earth_radius());
+        }
+        let restored = get_earth_constants();
+        assert!(restored.version > constants.version);
+        assert_eq!(restored.geopotential_model, constants.geopotential_model);
+        assert_eq!(restored.fundamental_catalog, constants.fundamental_catalog);
+        assert_eq!(restored.radius, constants.radius);
+        assert!(scoped_environment(Some(XF_GEOMOD_UNKNOWN + 1), None).is_err());
+        assert_eq!(get_geopotential_model().unwrap(), constants.geopotential_model);
+    }
 }
@@ -1,7 +1,16 @@
 use crate::GETSETSTRLEN;
+use std::borrow::Cow;
+use std::cell::RefCell;
 use std::ffi::CStr;
 use std::os::raw::c_char;
 
+// Buffers kept per thread once returned by `with_buffers`; enough for the widest DLL signature in use.
+const POOL_LIMIT: usize = 8;
+
+thread_local! {
+    static POOL: RefCell<Vec<GetSetString>> = const { RefCell::new(Vec::new()) };
+}
+
 #[derive(Debug, Default)]
 pub struct GetSetString {
     buffer: Vec<u8>,
@@ -25,10 +34,34 @@ impl GetSetString {
         }
     }
 
+    /// Overwrite the buffer contents with `value`, reusing the existing allocation.
+    pub fn assign(&mut self, value: &str) {
+        let value = value.as_bytes();
+        let len = std::cmp::min(GETSETSTRLEN, value.len());
+        self.buffer[..len].copy_from_slice(&value[..len]);
+        self.buffer[len..].fill(0);
+    }
+
+    /// Zero the buffer so it can be reused as an output argument.
+    pub fn clear(&mut self) {
+        self.buffer.fill(0);
+    }
+
     pub fn pointer(&mut self) -> *mut c_char {
         self.buffer.as_mut_ptr() as *mut c_char
     }
 
+    /// Borrow the buffer contents up to the first NUL byte.
+    pub fn bytes(&self) -> &[u8] {
+        let len = self.buffer.iter().position(|&b| b == 0).unwrap_or(self.buffer.len());
+        &self.buffer[..len]
+    }
+
+    /// Borrow the buffer contents as text, only allocating when they are not valid UTF-8.
+    pub fn as_str(&self) -> Cow<'_, str> {
+        String::from_utf8_lossy(self.bytes())
+    }
+
     pub fn value(&self) -> String {
         let c_str = unsafe { CStr::from_ptr(self.buffer.as_ptr() as *const c_char) };
         c_str.to_string_lossy().to_string()
@@ -44,3 +77,70 @@ impl From<&str> for GetSetString {
         GetSetString { buffer }
     }
 }
+
+/// Run `f` with `N` zeroed buffers borrowed from this thread's pool.
+///
+/// Buffers are allocated only the first time a thread needs them and are returned to the pool afterwards, so the
+/// string arguments of a DLL call cost a memset instead of a heap allocation.  Nested calls draw separate buffers.
+pub fn with_buffers<const N: usize, R>(f: impl FnOnce(&mut [GetSetString; N]) -> R) -> R {
+    let mut buffers: [GetSetString; N] = POOL.with(|pool| {
+        let mut pool = pool.borrow_mut();
+        std::array::from_fn(|_| match pool.pop() {
+            Some(mut buffer) => {
+                buffer.clear();
+                buffer
+            }
+            None => GetSetString::new(),
+        })
+    });
+    let result = f(&mut buffers);
+    POOL.with(|pool| {
+        let mut pool = pool.borrow_mut();
+        for buffer in buffers {
+            if pool.len() < POOL_LIMIT {
+                pool.push(buffer);
+            }
+        }
+    });
+    result
+}
+
+/// Run `f` with a single zeroed buffer from this thread's pool.
+pub fn with_buffer<R>(f: impl FnOnce(&mut GetSetString) -> R) -> R {
+    with_buffers(|[buffer]: &mut [GetSetString; 1]| f(buffer))
+}
+
+/// Run `f` with a pooled buffer holding `value`.
+pub fn with_str<R>(value: &str, f: impl FnOnce(&mut GetSetString) -> R) -> R {
+    with_buffer(|buffer| {
+        buffer.assign(value);
+        f(buffer)
+    })
+}
+
+#[cfg(test)]
+mod tests {
+    use super::*;
+
+    #[test]
+    fn test_pooled_buffers() {
+        let first = with_str("1 25544U", |buffer| buffer.pointer() as usize);
+        let (second, text) = with_buffer(|buffer| (buffer.pointer() as usize, buffer.as_str().into_owned()));
+        assert_eq!(first, second);
+        assert_eq!(text, "");
+
+        let nested = with_str("outer", |outer| {
+            let inner = with_str("inner", |inner| inner.as_str().into_owned());
+            assert_ne!(outer.pointer() as usize, 0);
+            (outer.as_str().into_owned(), inner)
+        });
+        assert_eq!(nested, ("outer".to_string(), "inner".to_string()));
+
+        let pair = with_buffers(|[line_1, line_2]: &mut [GetSetString; 2]| {
+            line_1.assign("abc   ");
+            line_2.set(0, "de").unwrap();
+            (line_1.as_str().trim().to_string(), line_2.as_str().into_owned())
+        });
+        assert_eq!(pair, ("abc".to_string(), "de".to_string()));
+    }
+}
@@ -11,17 +11,20 @@ pub mod obs;
 pub mod satellite;
 pub mod sensor;
 pub mod sgp4;
+pub mod stats;
 #[cfg(test)]
 pub(crate) mod test_lock;
 pub mod time;
 pub mod tle;
 
 use ctor::ctor;
-pub use get_set_string::GetSetString;
+pub use get_set_string::{GetSetString, with_buffer, with_buffers, with_str};
 #[cfg(feature = "python")]
 use pyo3::prelude::*;
 use std::os::raw::c_char;
-use std::path::PathBuf;
+use std::path::{Path, PathBuf};
+use std::sync::Mutex;
+use std::sync::atomic::{AtomicBool, Ordering};
 
 unsafe extern "C" {
     //  Returns information about the DllMain DLL.
@@ -178,9 +181,70 @@ pub const DLL_VERSION: &str = env!("SAAL_MANIFEST_VERSION");
 
 /// Return the last error message reported by the DLL.
 pub fn get_last_error_message() -> String {
-    let mut msg = GetSetString::new();
-    unsafe { GetLastErrMsg(msg.pointer()) };
-    msg.value()
+    with_buffer(|msg| {
+        stats::timed("GetLastErrMsg", || unsafe { GetLastErrMsg(msg.pointer()) });
+        msg.value()
+    })
+}
+
+/// A nonzero DLL return code paired with the last error message reported by the DLL.
+#[derive(Debug, Clone, PartialEq)]
+pub struct DllError {
+    pub code: i32,
+    pub message: String,
+}
+
+impl DllError {
+    /// Capture the last error message for a failed call that returned `code`.
+    pub fn from_code(code: i32) -> Self {
+        DllError {
+            code,
+            message: get_last_error_message(),
+        }
+    }
+}
+
+impl std::fmt::Display for DllError {
+    fn fmt(&self, f: &mut std::fmt::Formatter<'_>) -> std::fmt::Result {
+        write!(f, "{}", self.message)
+    }
+}
+
+impl std::error::Error for DllError {}
+
+impl From<DllError> for String {
+    fn from(value: DllError) -> Self {
+        value.message
+    }
+}
+
+/// Per-element results of a batch call aligned with its inputs.
+///
+/// `codes` holds the DLL return code of each element (0 on success) and the `values` of failed elements are filled
+/// with NaN.  `messages` is only populated when requested because reading the DLL's last error buffer allocates a
+/// string per failure; it is `None` for successful elements.
+#[derive(Debug, Clone, PartialEq)]
+pub struct BatchStatus<T> {
+    pub values: Vec<T>,
+    pub codes: Vec<i32>,
+    pub messages: Option<Vec<Option<String>>>,
+}
+
+impl<T> BatchStatus<T> {
+    /// Return true when every element succeeded.
+    pub fn is_ok(&self) -> bool {
+        self.codes.iter().all(|&code| code == 0)
+    }
+
+    /// Return the indices of the failed elements.
+    pub fn failed(&self) -> Vec<usize> {
+        self.codes
+            .iter()
+            .enumerate()
+            .filter(|(_, code)| **code != 0)
+            .map(|(i, _)| i)
+            .collect()
+    }
 }
 
 /// Return the current global key mode for all keys.
@@ -196,7 +260,7 @@ pub fn get_last_error_message() -> String {
 /// 1
 /// ```
 pub fn get_key_mode() -> Result<i32, String> {
-    let key_mode = unsafe { GetAllKeyMode() };
+    let key_mode = stats::timed("GetAllKeyMode", || unsafe { GetAllKeyMode() });
     match key_mode {
         ALL_KEYMODE_DMA => Ok(key_mode),
         ALL_KEYMODE_NODUP => Ok(key_mode),
@@ -217,7 +281,7 @@ pub fn get_key_mode() -> Result<i32, String> {
 /// 0
 /// ```
 pub fn set_key_mode(key_mode: i32) -> Result<(), String> {
-    let result = unsafe { SetAllKeyMode(key_mode) };
+    let result = stats::timed_status("SetAllKeyMode", || unsafe { SetAllKeyMode(key_mode) });
     match result {
         0 => Ok(()),
         _ => Err(get_last_error_message()),
@@ -238,14 +302,15 @@ pub fn set_key_mode(key_mode: i32) -> Result<(), String> {
 /// 1
 /// ```
 pub fn reset_key_mode() {
-    unsafe { ResetAllKeyMode() };
+    stats::timed("ResetAllKeyMode", || unsafe { ResetAllKeyMode() });
 }
 
 /// Return the last informational message reported by the DLL.
 pub fn get_last_info_message() -> String {
-    let mut msg = GetSetString::new();
-    unsafe { GetLastInfoMsg(msg.pointer()) };
-    msg.value()
+    with_buffer(|msg| {
+        stats::timed("GetLastInfoMsg", || unsafe { GetLastInfoMsg(msg.pointer()) });
+        msg.value()
+    })
 }
 
 /// Return the DllMain DLL info string (version, build date, platform).
@@ -261,9 +326,10 @@ pub fn get_last_info_message() -> String {
 /// true
 /// ```
 pub fn get_dll_info() -> String {
-    let mut info = GetSetString::new();
-    unsafe { DllMainGetInfo(info.pointer()) };
-    info.value()
+    with_buffer(|info| {
+        stats::timed("DllMainGetInfo", || unsafe { DllMainGetInfo(info.pointer()) });
+        info.value()
+    })
 }
 
 /// Load DllMain parameters from a file.
@@ -281,8 +347,10 @@ pub fn get_dll_info() -> String {
 /// true
 /// ```
 pub fn load_from_file(file_path: &str) -> Result<(), String> {
-    let mut dll_path: GetSetString = file_path.into();
-    let result = unsafe { DllMainLoadFile(dll_path.pointer()) };
+    let result = with_str(file_path, |dll_path| {
+        stats::timed_status("DllMainLoadFile", || unsafe { DllMainLoadFile(dll_path.pointer()) })
+    });
+    environment::invalidate_earth_constants();
     match result {
         0 => Ok(()),
         _ => Err(get_last_error_message()),
@@ -302,7 +370,7 @@ pub fn load_from_file(file_path: &str) -> Result<(), String> {
 /// 1
 /// ```
 pub fn set_elset_key_mode(elset_key_mode: i32) -> Result<(), String> {
-    let result = unsafe { SetElsetKeyMode(elset_key_mode) };
+    let result = stats::timed_status("SetElsetKeyMode", || unsafe { SetElsetKeyMode(elset_key_mode) });
     match result {
         0 => Ok(()),
         _ => Err(get_last_error_message()),
@@ -322,7 +390,7 @@ pub fn set_elset_key_mode(elset_key_mode: i32) -> Result<(), String> {
 /// 0
 /// ```
 pub fn get_elset_key_mode() -> Result<i32, String> {
-    let elset_key_mode = unsafe { GetElsetKeyMode() };
+    let elset_key_mode = stats::timed("GetElsetKeyMode", || unsafe { GetElsetKeyMode() });
     match elset_key_mode {
         ELSET_KEYMODE_DMA => Ok(elset_key_mode),
         ELSET_KEYMODE_NODUP => Ok(elset_key_mode),
@@ -345,7 +413,7 @@ pub fn get_elset_key_mode() -> Result<i32, String> {
 /// 1
 /// ```
 pub fn set_duplicate_key_mode(dup_key_mode: i32) -> Result<(), String> {
-    let result = unsafe { SetDupKeyMode(dup_key_mode) };
+    let result = stats::timed_status("SetDupKeyMode", || unsafe { SetDupKeyMode(dup_key_mode) });
     match result {
         0 => Ok(()),
         _ => Err(get_last_error_message()),
@@ -365,7 +433,7 @@ pub fn set_duplicate_key_mode(dup_key_mode: i32) -> Result<(), String> {
 /// 0
 /// ```
 pub fn get_duplicate_key_mode() -> Result<i32, String> {
-    let dup_key_mode = unsafe { GetDupKeyMode() };
+    let dup_key_mode = stats::timed("GetDupKeyMode", || unsafe { GetDupKeyMode() });
     match dup_key_mode {
         DUPKEY_ZERO => Ok(dup_key_mode),
         DUPKEY_ACTUAL => Ok(dup_key_mode),
@@ -375,28 +443,149 @@ pub fn get_duplicate_key_mode() -> Result<i32, String> {
 
 #[ctor]
 fn initialize() {
+    if std::env::var("SAAL_STATS").is_ok_and(|value| !value.is_empty() && value != "0") {
+        stats::set_enabled(true);
+    }
     set_key_mode(ALL_KEYMODE_DMA).unwrap();
-    initialize_time_constants();
-    initialize_jpl_ephemeris();
-    initialize_sgp4_license();
 }
 
-pub fn initialize_time_constants() {
-    if let Some(path) = get_time_constants_path() {
-        time::load_constants(path.to_str().unwrap()).unwrap();
+/// One-shot initialisation of a DLL subsystem that runs on first use.
+///
+/// The flag is also set by the explicit setters (`time::load_constants`, `astro::set_jpl_ephemeris_file_path`,
+/// `sgp4::set_license_directory`) so the bundled defaults never replace a user's choice.  A failed initialisation is
+/// not retried; its error is kept and returned by every later `ensure` until a setter succeeds.
+struct LazyInit {
+    ready: AtomicBool,
+    failed: AtomicBool,
+    lock: Mutex<()>,
+    error: Mutex<Option<String>>,
+}
+
+impl LazyInit {
+    const fn new() -> Self {
+        LazyInit {
+            ready: AtomicBool::new(false),
+            failed: AtomicBool::new(false),
+            lock: Mutex::new(()),
+            error: Mutex::new(None),
+        }
+    }
+
+    fn ensure(&self, init: fn() -> Result<(), String>) -> Result<(), String> {
+        if self.ready.load(Ordering::Acquire) && !self.failed.load(Ordering::Acquire) {
+            return Ok(());
+        }
+        let _guard = self.lock.lock().unwrap_or_else(|e| e.into_inner());
+        if !self.ready.load(Ordering::Acquire) {
+            let result = init();
+            self.record(result.err());
+            self.ready.store(true, Ordering::Release);
+        }
+        match &*self.error.lock().unwrap_or_else(|e| e.into_inner()) {
+            Some(error) => Err(error.clone()),
+            None => Ok(()),
+        }
+    }
+
+    fn record(&self, error: Option<String>) {
+        let mut slot = self.error.lock().unwrap_or_else(|e| e.into_inner());
+        self.failed.store(error.is_some(), Ordering::Release);
+        *slot = error;
+    }
+
+    fn mark_ready(&self) {
+        self.record(None);
+        self.ready.store(true, Ordering::Release);
+    }
+
+    #[cfg(test)]
+    fn reset(&self) {
+        self.ready.store(false, Ordering::Release);
+    }
+}
+
+static TIME_CONSTANTS: LazyInit = LazyInit::new();
+static JPL_EPHEMERIS: LazyInit = LazyInit::new();
+static SGP4_LICENSE: LazyInit = LazyInit::new();
+
+/// Load the bundled timing constants unless constants were already loaded or cleared.
+///
+/// Called by every time-dependent conversion, so short-lived programs that only parse elsets never read the file.
+/// Conversions that cannot report errors carry on without constants, as the DLL does when none are loaded.
+pub fn ensure_time_constants() -> Result<(), String> {
+    TIME_CONSTANTS.ensure(initialize_time_constants)
+}
+
+/// Configure the bundled JPL ephemeris unless a file was already set; called by the sun/moon queries.
+pub fn ensure_jpl_ephemeris() -> Result<(), String> {
+    JPL_EPHEMERIS.ensure(initialize_jpl_ephemeris)
+}
+
+/// Point SGP4 at the bundled license unless a directory was already set; called before satellites are initialised.
+pub fn ensure_sgp4_license() -> Result<(), String> {
+    SGP4_LICENSE.ensure(initialize_sgp4_license)
+}
+
+pub(crate) fn mark_time_constants_ready() {
+    TIME_CONSTANTS.mark_ready();
+}
+
+pub(crate) fn mark_jpl_ephemeris_ready() {
+    JPL_EPHEMERIS.mark_ready();
+}
+
+pub(crate) fn mark_sgp4_license_ready() {
+    SGP4_LICENSE.mark_ready();
+}
+
+/// Forget that the JPL ephemeris was configured, so tests can exercise the first-use path.
+#[cfg(test)]
+pub(crate) fn reset_jpl_ephemeris() {
+    JPL_EPHEMERIS.reset();
+}
+
+/// Run every lazy initialisation now, for services that prefer paying the start-up cost before the first request.
+///
+/// Example:
+/// ```rust
+/// saal::warmup().unwrap();
+/// println!("{}", saal::time::constants_loaded());
+/// ```
+///
+/// Output:
+/// ```bash
+/// true
+/// ```
+pub fn warmup() -> Result<(), String> {
+    ensure_time_constants()?;
+    ensure_jpl_ephemeris()?;
+    ensure_sgp4_license()
+}
+
+pub fn initialize_time_constants() -> Result<(), String> {
+    match get_time_constants_path() {
+        Some(path) => time::load_constants(asset_path_str(&path)?),
+        None => Ok(()),
     }
 }
 
-pub fn initialize_jpl_ephemeris() {
+pub fn initialize_jpl_ephemeris() -> Result<(), String> {
     if let Some(path) = get_jpl_file_path() {
-        astro::set_jpl_ephemeris_file_path(path.to_str().unwrap());
+        astro::set_jpl_ephemeris_file_path(asset_path_str(&path)?);
     }
+    Ok(())
 }
 
-pub fn initialize_sgp4_license() {
+pub fn initialize_sgp4_license() -> Result<(), String> {
     if let Some(asset_dir) = get_asset_directory() {
-        sgp4::set_license_directory(asset_dir.to_str().unwrap());
+        sgp4::set_license_directory(asset_path_str(&asset_dir)?);
     }
+    Ok(())
+}
+
+fn asset_path_str(path: &Path) -> Result<&str, String> {
+    path.to_str()
+        .ok_or_else(|| format!("Asset path is not valid UTF-8: {}", path.display()))
 }
 
 fn asset_directory_override() -> Option<PathBuf> {
@@ -480,6 +669,33 @@ mod tests {
         let result = load_from_file(path.to_str().unwrap());
         assert!(result.is_err());
     }
+
+    #[test]
+    fn test_lazy_initialization() {
+        let _lock = TEST_LOCK.lock().unwrap();
+        warmup().unwrap();
+        assert!(time::constants_loaded());
+        assert!(!sgp4::get_license_directory().is_empty());
+
+        time::clear_constants().unwrap();
+        ensure_time_constants().unwrap();
+        let cleared = time::constants_loaded();
+        initialize_time_constants().unwrap();
+
+        assert!(!cleared);
+        assert!(time::constants_loaded());
+    }
+
+    #[test]
+    fn test_lazy_init_records_errors() {
+        static INIT: LazyInit = LazyInit::new();
+        let missing = Err("missing asset".to_string());
+
+        assert_eq!(INIT.ensure(|| Err("missing asset".to_string())), missing);
+        assert_eq!(INIT.ensure(|| Ok(())), missing);
+        INIT.mark_ready();
+        assert_eq!(INIT.ensure(|| Err("missing asset".to_string())), Ok(()));
+    }
 }
 
 #[cfg(feature = "python")]
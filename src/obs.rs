@@ -1,8 +1,15 @@
 // This wrapper file was generated automatically by the GenDllWrappers program.
 #![allow(non_snake_case)]
 #![allow(dead_code)]
-use crate::{GetSetString, IDX_ORDER_QUICK, astro, get_last_error_message, sensor::ParsedSensor};
+use crate::sensor::{self, RegisteredSensor, SensorLimits};
+use crate::{
+    GetSetString, IDX_ORDER_QUICK, astro, ensure_time_constants, get_last_error_message, sgp4, stats, time, tle,
+    with_buffer, with_buffers, with_str,
+};
+use std::fs::File;
+use std::io::{BufRead, BufReader, BufWriter, Write};
 use std::os::raw::c_char;
+use std::sync::Arc;
 
 unsafe extern "C" {
     //  Notes: This function has been deprecated since v9.0.
@@ -326,9 +333,10 @@ unsafe extern "C" {
 }
 
 pub fn get_dll_info() -> String {
-    let mut c_info = GetSetString::new();
-    unsafe { ObsGetInfo(c_info.pointer()) };
-    c_info.value()
+    with_buffer(|c_info| {
+        stats::timed("ObsGetInfo", || unsafe { ObsGetInfo(c_info.pointer()) });
+        c_info.value()
+    })
 }
 
 // Equinox indicator
@@ -689,38 +697,38 @@ pub static XA_OTCSV_SIZE: i32 = 64;
 
 // Indexes of observation data in an array
 // satellite number
-pub static XA_OBSTATE_SATNUM: i32 = 0;
+pub const XA_OBSTATE_SATNUM: usize = 0;
 // sensor number
-pub static XA_OBSTATE_SENNUM: i32 = 1;
+pub const XA_OBSTATE_SENNUM: usize = 1;
 // observation time in days since 1950 UTC
-pub static XA_OBSTATE_DS50UTC: i32 = 2;
+pub const XA_OBSTATE_DS50UTC: usize = 2;
 
 // position X/ECI (km)
-pub static XA_OBSTATE_POSX: i32 = 10;
+pub const XA_OBSTATE_POSX: usize = 10;
 // position Y/ECI (km)
-pub static XA_OBSTATE_POSY: i32 = 11;
+pub const XA_OBSTATE_POSY: usize = 11;
 // position Z/ECI (km)
-pub static XA_OBSTATE_POSZ: i32 = 12;
+pub const XA_OBSTATE_POSZ: usize = 12;
 // velocity X/ECI (km/s)
-pub static XA_OBSTATE_VELX: i32 = 13;
+pub const XA_OBSTATE_VELX: usize = 13;
 // velocity Y/ECI (km/s)
-pub static XA_OBSTATE_VELY: i32 = 14;
+pub const XA_OBSTATE_VELY: usize = 14;
 // velocity Z/ECI (km/s)
-pub static XA_OBSTATE_VELZ: i32 = 15;
+pub const XA_OBSTATE_VELZ: usize = 15;
 // geodetic latitude (deg)
-pub static XA_OBSTATE_LAT: i32 = 16;
+pub const XA_OBSTATE_LAT: usize = 16;
 // geodetic longitude (deg)
-pub static XA_OBSTATE_LON: i32 = 17;
+pub const XA_OBSTATE_LON: usize = 17;
 // geodetic height (km)
-pub static XA_OBSTATE_HGHT: i32 = 18;
+pub const XA_OBSTATE_HGHT: usize = 18;
 // position X/EFG (km)
-pub static XA_OBSTATE_POSE: i32 = 19;
+pub const XA_OBSTATE_POSE: usize = 19;
 // position Y/EFG (km)
-pub static XA_OBSTATE_POSF: i32 = 20;
+pub const XA_OBSTATE_POSF: usize = 20;
 // position Z/EFG (km)
-pub static XA_OBSTATE_POSG: i32 = 21;
+pub const XA_OBSTATE_POSG: usize = 21;
 
-pub static XA_OBSTATE_SIZE: i32 = 64;
+pub const XA_OBSTATE_SIZE: usize = 64;
 
 // Indexes of observation data available for each obs type (OT0: obs type 0, OT1: obs type 1, ...)
 // All obs types have these common data fields  XA_OBS_SECCLASS = 0, XA_OBS_SATNUM = 1, XA_OBS_SENNUM = 2, XA_OBS_DS50UTC = 3, and XA_OBS_OBSTYPE = 11
@@ -946,7 +954,9 @@ pub static XA_SELOB_SIZE: i32 = 128;
 // ========================= End of auto generated code ==========================
 
 pub fn load_file(b3_file: &str) -> Result<(), String> {
-    let result = unsafe { ObsLoadFile(GetSetString::from(b3_file).pointer()) };
+    let result = with_str(b3_file, |path| {
+        stats::timed_status("ObsLoadFile", || unsafe { ObsLoadFile(path.pointer()) })
+    });
     match result {
         0 => Ok(()),
         _ => Err(format!("Error loading B3 file: {}", b3_file)),
@@ -954,27 +964,27 @@ pub fn load_file(b3_file: &str) -> Result<(), String> {
 }
 
 pub fn clear() {
-    unsafe {
+    stats::timed("ObsRemoveAll", || unsafe {
         ObsRemoveAll();
-    }
+    })
 }
 
 pub fn remove(obs_key: i64) {
-    unsafe {
+    stats::timed("ObsRemove", || unsafe {
         ObsRemove(obs_key);
-    }
+    })
 }
 
 pub fn get_count() -> i32 {
-    unsafe { ObsGetCount() }
+    stats::timed("ObsGetCount", || unsafe { ObsGetCount() })
 }
 
 pub fn get_keys(order: i32) -> Vec<i64> {
     let count = get_count() as usize;
     let mut keys = vec![0_i64; count];
-    unsafe {
+    stats::timed("ObsGetLoaded", || unsafe {
         ObsGetLoaded(order, keys.as_mut_ptr());
-    }
+    });
     keys
 }
 
@@ -991,7 +1001,6 @@ pub fn parse_all() -> Result<Vec<ParsedB3>, String> {
 }
 
 pub fn parse_key(obs_key: i64) -> Result<ParsedB3, String> {
-    let mut sec_char = GetSetString::new();
     let mut sat_num: i32 = 0;
     let mut sen_num: i32 = 0;
     let mut obs_time_ds50utc: f64 = 0.0;
@@ -1002,7 +1011,6 @@ pub fn parse_key(obs_key: i64) -> Result<ParsedB3, String> {
     let mut el_rate: f64 = 0.0;
     let mut az_rate: f64 = 0.0;
     let mut range_accel: f64 = 0.0;
-    let mut obs_type = GetSetString::new();
     let mut track_ind: i32 = 0;
     let mut astat: i32 = 0;
     let mut site_tag: i32 = 0;
@@ -1011,33 +1019,36 @@ pub fn parse_key(obs_key: i64) -> Result<ParsedB3, String> {
     let mut _velocity: [f64; 3] = [0.0; 3];
     let mut _ext_arr: [f64; 128] = [0.0; 128];
 
-    let result = unsafe {
-        ObsGetAllFields(
-            obs_key,
-            sec_char.pointer(),
-            &mut sat_num,
-            &mut sen_num,
-            &mut obs_time_ds50utc,
-            &mut el_or_dec,
-            &mut az_or_ra,
-            &mut slant_range,
-            &mut range_rate_or_equinox,
-            &mut el_rate,
-            &mut az_rate,
-            &mut range_accel,
-            obs_type.pointer(),
-            &mut track_ind,
-            &mut astat,
-            &mut site_tag,
-            &mut spadoc_tag,
-            &mut position_arr,
-            &mut _velocity,
-            &mut _ext_arr,
-        )
-    };
+    let (result, classification, obs_type_char) = with_buffers(|[sec_char, obs_type]: &mut [GetSetString; 2]| {
+        let result = stats::timed("ObsGetAllFields", || unsafe {
+            ObsGetAllFields(
+                obs_key,
+                sec_char.pointer(),
+                &mut sat_num,
+                &mut sen_num,
+                &mut obs_time_ds50utc,
+                &mut el_or_dec,
+                &mut az_or_ra,
+                &mut slant_range,
+                &mut range_rate_or_equinox,
+                &mut el_rate,
+                &mut az_rate,
+                &mut range_accel,
+                obs_type.pointer(),
+                &mut track_ind,
+                &mut astat,
+                &mut site_tag,
+                &mut spadoc_tag,
+                &mut position_arr,
+                &mut _velocity,
+                &mut _ext_arr,
+            )
+        });
+        let obs_type_char = obs_type.bytes().first().copied().unwrap_or(b'X') as c_char;
+        (result, sec_char.as_str().trim().to_string(), obs_type_char)
+    });
 
-    let obs_type_char: c_char = obs_type.value().as_bytes().first().copied().unwrap_or(b'X') as c_char;
-    let b3_type = unsafe { ObsTypeCToI(obs_type_char) };
+    let b3_type = stats::timed("ObsTypeCToI", || unsafe { ObsTypeCToI(obs_type_char) });
     let mut azimuth: Option<f64> = None;
     let mut right_ascension: Option<f64> = None;
     let mut elevation: Option<f64> = None;
@@ -1103,15 +1114,14 @@ pub fn parse_key(obs_key: i64) -> Result<ParsedB3, String> {
     }
 
     if position.is_none()
-        && let Ok(sensor) = ParsedSensor::from_number(sen_num)
-        && let (Some(latitude), Some(longitude), Some(altitude)) = (sensor.latitude, sensor.longitude, sensor.altitude)
+        && let Ok(site) = sensor::get_registered_by_number(sen_num)
     {
-        position = Some(astro::llh_to_efg(&[latitude, longitude, altitude]));
+        position = site.efg;
     }
 
     match result {
         0 => Ok(ParsedB3 {
-            classification: sec_char.value().trim().to_string(),
+            classification,
             norad_id: sat_num,
             sensor_number: sen_num,
             epoch: obs_time_ds50utc,
@@ -1135,6 +1145,756 @@ pub fn parse_key(obs_key: i64) -> Result<ParsedB3, String> {
         _ => Err(get_last_error_message()),
     }
 }
+// Capacity of the buffered reader/writer used by the bulk file converters.
+const CONVERT_BUFFER_BYTES: usize = 1 << 20;
+
+fn is_text_form(obs_form: i32) -> bool {
+    obs_form == OBSFORM_B3 || obs_form == OBSFORM_TTY || obs_form == OBSFORM_CSV
+}
+
+fn trim_end_bytes(bytes: &[u8]) -> &[u8] {
+    let end = bytes
+        .iter()
+        .rposition(|b| !b.is_ascii_whitespace())
+        .map_or(0, |i| i + 1);
+    &bytes[..end]
+}
+
+fn read_card(reader: &mut impl BufRead, line: &mut String, line_number: &mut usize) -> Result<bool, String> {
+    loop {
+        line.clear();
+        let read = reader.read_line(line).map_err(|e| e.to_string())?;
+        if read == 0 {
+            return Ok(false);
+        }
+        *line_number += 1;
+        let len = line.trim_end_matches(['\r', '\n']).len();
+        line.truncate(len);
+        if !line.trim().is_empty() {
+            return Ok(true);
+        }
+    }
+}
+
+/// Observation format converter that reuses its DLL string buffers across calls.
+///
+/// Conversions always pass through the CSV form, which is the only form the DLL can convert to and from
+/// directly.  `new_sat_num` is applied when writing B3 or TTY cards from CSV (0 keeps the original number).
+pub struct ObsConverter {
+    card_1: GetSetString,
+    card_2: GetSetString,
+    csv: GetSetString,
+}
+
+impl Default for ObsConverter {
+    fn default() -> Self {
+        Self::new()
+    }
+}
+
+impl ObsConverter {
+    pub fn new() -> Self {
+        ObsConverter {
+            card_1: GetSetString::new(),
+            card_2: GetSetString::new(),
+            csv: GetSetString::new(),
+        }
+    }
+
+    fn load_csv(&mut self, input_form: i32, line_1: &str, line_2: &str) -> Result<(), String> {
+        let result = if input_form == OBSFORM_B3 {
+            self.card_1.assign(line_1);
+            self.csv.clear();
+            stats::timed("ObsB3ToCsv", || unsafe {
+                ObsB3ToCsv(self.card_1.pointer(), self.csv.pointer())
+            })
+        } else if input_form == OBSFORM_TTY {
+            self.card_1.assign(line_1);
+            self.card_2.assign(line_2);
+            self.csv.clear();
+            stats::timed("ObsTTYToCsv", || unsafe {
+                ObsTTYToCsv(self.card_1.pointer(), self.card_2.pointer(), self.csv.pointer())
+            })
+        } else if input_form == OBSFORM_CSV {
+            self.csv.assign(line_1);
+            0
+        } else {
+            return Err(format!("Unsupported input observation format: {}", input_form));
+        };
+        match result {
+            0 => Ok(()),
+            _ => Err(get_last_error_message()),
+        }
+    }
+
+    fn unload_csv(&mut self, output_form: i32, new_sat_num: i32) -> Result<(), String> {
+        let result = if output_form == OBSFORM_B3 {
+            self.card_1.clear();
+            stats::timed("ObsCsvToB3", || unsafe {
+                ObsCsvToB3(self.csv.pointer(), new_sat_num, self.card_1.pointer())
+            })
+        } else if output_form == OBSFORM_TTY {
+            self.card_1.clear();
+            self.card_2.clear();
+            stats::timed("ObsCsvToTTY", || unsafe {
+                ObsCsvToTTY(
+                    self.csv.pointer(),
+                    new_sat_num,
+                    self.card_1.pointer(),
+                    self.card_2.pointer(),
+                )
+            })
+        } else if output_form == OBSFORM_CSV {
+            0
+        } else {
+            return Err(format!("Unsupported output observation format: {}", output_form));
+        };
+        match result {
+            0 => Ok(()),
+            _ => Err(get_last_error_message()),
+        }
+    }
+
+    fn convert(
+        &mut self,
+        input_form: i32,
+        output_form: i32,
+        line_1: &str,
+        line_2: &str,
+        new_sat_num: i32,
+    ) -> Result<(), String> {
+        self.load_csv(input_form, line_1, line_2)?;
+        self.unload_csv(output_form, new_sat_num)
+    }
+
+    fn write_output(&self, writer: &mut impl Write, output_form: i32) -> std::io::Result<()> {
+        if output_form == OBSFORM_CSV {
+            writer.write_all(trim_end_bytes(self.csv.bytes()))?;
+        } else {
+            writer.write_all(trim_end_bytes(self.card_1.bytes()))?;
+            if output_form == OBSFORM_TTY {
+                writer.write_all(b"\n")?;
+                writer.write_all(trim_end_bytes(self.card_2.bytes()))?;
+            }
+        }
+        writer.write_all(b"\n")
+    }
+
+    pub fn b3_to_csv(&mut self, card: &str) -> Result<String, String> {
+        self.load_csv(OBSFORM_B3, card, "")?;
+        Ok(self.csv.value().trim_end().to_string())
+    }
+
+    pub fn csv_to_b3(&mut self, csv: &str, new_sat_num: i32) -> Result<String, String> {
+        self.convert(OBSFORM_CSV, OBSFORM_B3, csv, "", new_sat_num)?;
+        Ok(self.card_1.value().trim_end().to_string())
+    }
+
+    pub fn tty_to_csv(&mut self, card_1: &str, card_2: &str) -> Result<String, String> {
+        self.load_csv(OBSFORM_TTY, card_1, card_2)?;
+        Ok(self.csv.value().trim_end().to_string())
+    }
+
+    pub fn csv_to_tty(&mut self, csv: &str, new_sat_num: i32) -> Result<(String, String), String> {
+        self.convert(OBSFORM_CSV, OBSFORM_TTY, csv, "", new_sat_num)?;
+        Ok((
+            self.card_1.value().trim_end().to_string(),
+            self.card_2.value().trim_end().to_string(),
+        ))
+    }
+
+    pub fn array_to_lines(&mut self, xa_obs: &[f64; XA_OBS_SIZE], obs_form: i32) -> Result<(String, String), String> {
+        self.array_to_cards(xa_obs, obs_form)?;
+        Ok((
+            self.card_1.value().trim_end().to_string(),
+            self.card_2.value().trim_end().to_string(),
+        ))
+    }
+
+    fn array_to_cards(&mut self, xa_obs: &[f64; XA_OBS_SIZE], obs_form: i32) -> Result<(), String> {
+        if !is_text_form(obs_form) {
+            return Err(format!("Unsupported output observation format: {}", obs_form));
+        }
+        self.card_1.clear();
+        self.card_2.clear();
+        let result = stats::timed_status("ObsArrToLines", || unsafe {
+            ObsArrToLines(xa_obs, obs_form, self.card_1.pointer(), self.card_2.pointer())
+        });
+        match result {
+            0 => Ok(()),
+            _ => Err(get_last_error_message()),
+        }
+    }
+
+    fn write_cards(&self, writer: &mut impl Write, obs_form: i32) -> std::io::Result<()> {
+        writer.write_all(trim_end_bytes(self.card_1.bytes()))?;
+        if obs_form == OBSFORM_TTY {
+            writer.write_all(b"\n")?;
+            writer.write_all(trim_end_bytes(self.card_2.bytes()))?;
+        }
+        writer.write_all(b"\n")
+    }
+}
+
+pub fn b3_to_csv(card: &str) -> Result<String, String> {
+    ObsConverter::new().b3_to_csv(card)
+}
+
+pub fn csv_to_b3(csv: &str, new_sat_num: i32) -> Result<String, String> {
+    ObsConverter::new().csv_to_b3(csv, new_sat_num)
+}
+
+pub fn tty_to_csv(card_1: &str, card_2: &str) -> Result<String, String> {
+    ObsConverter::new().tty_to_csv(card_1, card_2)
+}
+
+pub fn csv_to_tty(csv: &str, new_sat_num: i32) -> Result<(String, String), String> {
+    ObsConverter::new().csv_to_tty(csv, new_sat_num)
+}
+
+pub fn array_to_lines(xa_obs: &[f64; XA_OBS_SIZE], obs_form: i32) -> Result<(String, String), String> {
+    ObsConverter::new().array_to_lines(xa_obs, obs_form)
+}
+
+/// Convert an observation file between the B3, TTY and CSV forms and return the number of observations written.
+///
+/// Blank lines are skipped and TTY observations are read as consecutive card pairs.  The input is streamed
+/// through a single [`ObsConverter`], so memory use does not grow with the file size.
+pub fn convert_file(
+    input_path: &str,
+    output_path: &str,
+    input_form: i32,
+    output_form: i32,
+    new_sat_num: i32,
+) -> Result<usize, String> {
+    if !is_text_form(input_form) {
+        return Err(format!("Unsupported input observation format: {}", input_form));
+    }
+    if !is_text_form(output_form) {
+        return Err(format!("Unsupported output observation format: {}", output_form));
+    }
+    let input = File::open(input_path).map_err(|e| format!("Error opening {}: {}", input_path, e))?;
+    let output = File::create(output_path).map_err(|e| format!("Error creating {}: {}", output_path, e))?;
+    let mut reader = BufReader::with_capacity(CONVERT_BUFFER_BYTES, input);
+    let mut writer = BufWriter::with_capacity(CONVERT_BUFFER_BYTES, output);
+    let mut converter = ObsConverter::new();
+    let mut line_1 = String::new();
+    let mut line_2 = String::new();
+    let mut line_number = 0;
+    let mut count = 0;
+
+    while read_card(&mut reader, &mut line_1, &mut line_number)
+        .map_err(|e| format!("Error reading {}: {}", input_path, e))?
+    {
+        if input_form == OBSFORM_TTY
+            && !read_card(&mut reader, &mut line_2, &mut line_number)
+                .map_err(|e| format!("Error reading {}: {}", input_path, e))?
+        {
+            return Err(format!(
+                "Incomplete TTY observation at line {} of {}",
+                line_number, input_path
+            ));
+        }
+        converter
+            .convert(input_form, output_form, &line_1, &line_2, new_sat_num)
+            .map_err(|e| format!("Error converting line {} of {}: {}", line_number, input_path, e))?;
+        converter
+            .write_output(&mut writer, output_form)
+            .map_err(|e| format!("Error writing {}: {}", output_path, e))?;
+        count += 1;
+    }
+    writer
+        .flush()
+        .map_err(|e| format!("Error writing {}: {}", output_path, e))?;
+    Ok(count)
+}
+
+/// Write XA_OBS arrays to a file in the requested form and return the number of observations written.
+pub fn arrays_to_file(xa_obs: &[[f64; XA_OBS_SIZE]], obs_form: i32, output_path: &str) -> Result<usize, String> {
+    if !is_text_form(obs_form) {
+        return Err(format!("Unsupported output observation format: {}", obs_form));
+    }
+    let output = File::create(output_path).map_err(|e| format!("Error creating {}: {}", output_path, e))?;
+    let mut writer = BufWriter::with_capacity(CONVERT_BUFFER_BYTES, output);
+    let mut converter = ObsConverter::new();
+    for (index, arr) in xa_obs.iter().enumerate() {
+        converter
+            .array_to_cards(arr, obs_form)
+            .map_err(|e| format!("Error converting observation {}: {}", index, e))?;
+        converter
+            .write_cards(&mut writer, obs_form)
+            .map_err(|e| format!("Error writing {}: {}", output_path, e))?;
+    }
+    writer
+        .flush()
+        .map_err(|e| format!("Error writing {}: {}", output_path, e))?;
+    Ok(xa_obs.len())
+}
+
+fn validate_state_columns(columns: &[usize]) -> Result<(), String> {
+    match columns.iter().find(|&&column| column >= XA_OBSTATE_SIZE) {
+        Some(column) => Err(format!("Invalid observation state column: {}", column)),
+        None => Ok(()),
+    }
+}
+
+fn push_state_columns(states: &mut Vec<f64>, xa_ob_state: &[f64; XA_OBSTATE_SIZE], columns: &[usize]) {
+    if columns.is_empty() {
+        states.extend_from_slice(xa_ob_state);
+    } else {
+        states.extend(columns.iter().map(|&column| xa_ob_state[column]));
+    }
+}
+
+fn is_angles_only(obs_type: i32) -> bool {
+    matches!(obs_type, 1 | 5 | 8 | 9)
+}
+
+pub fn get_array(obs_key: i64) -> Result<[f64; XA_OBS_SIZE], String> {
+    let mut xa_obs = [0.0; XA_OBS_SIZE];
+    let result = stats::timed_status("ObsDataToArray", || unsafe { ObsDataToArray(obs_key, &mut xa_obs) });
+    match result {
+        0 => Ok(xa_obs),
+        _ => Err(get_last_error_message()),
+    }
+}
+
+pub fn get_state(obs_key: i64, range_km: f64) -> Result<[f64; XA_OBSTATE_SIZE], String> {
+    ensure_time_constants()?;
+    let mut xa_ob_state = [0.0; XA_OBSTATE_SIZE];
+    let result = stats::timed_status("ObsGetStates", || unsafe {
+        ObsGetStates(obs_key, range_km, &mut xa_ob_state)
+    });
+    match result {
+        0 => Ok(xa_ob_state),
+        _ => Err(get_last_error_message()),
+    }
+}
+
+pub fn array_to_state(xa_obs: &[f64; XA_OBS_SIZE]) -> Result<[f64; XA_OBSTATE_SIZE], String> {
+    ensure_time_constants()?;
+    let mut xa_ob_state = [0.0; XA_OBSTATE_SIZE];
+    let result = stats::timed_status("ObsDataToStates", || unsafe {
+        ObsDataToStates(xa_obs, &mut xa_ob_state)
+    });
+    match result {
+        0 => Ok(xa_ob_state),
+        _ => Err(get_last_error_message()),
+    }
+}
+
+/// Compute XA_OBSTATE rows for loaded observations and return them flattened in key order.
+///
+/// Each row holds the requested `columns`, or all XA_OBSTATE_SIZE values when `columns` is empty.  `range_km` is the
+/// range assumed for angles-only observations.
+pub fn get_states(obs_keys: &[i64], range_km: f64, columns: &[usize]) -> Result<Vec<f64>, String> {
+    validate_state_columns(columns)?;
+    let width = if columns.is_empty() {
+        XA_OBSTATE_SIZE
+    } else {
+        columns.len()
+    };
+    let mut states = Vec::with_capacity(obs_keys.len() * width);
+    for &obs_key in obs_keys {
+        let xa_ob_state = get_state(obs_key, range_km)
+            .map_err(|e| format!("Error computing state for obs key {}: {}", obs_key, e))?;
+        push_state_columns(&mut states, &xa_ob_state, columns);
+    }
+    Ok(states)
+}
+
+/// Compute XA_OBSTATE rows from XA_OBS arrays and return them flattened in input order.
+///
+/// When `range_km` is given it is used as the range of angles-only observations that do not carry one.  Columns are
+/// selected as in [`get_states`].
+pub fn arrays_to_states(
+    xa_obs: &[[f64; XA_OBS_SIZE]],
+    range_km: Option<f64>,
+    columns: &[usize],
+) -> Result<Vec<f64>, String> {
+    validate_state_columns(columns)?;
+    let width = if columns.is_empty() {
+        XA_OBSTATE_SIZE
+    } else {
+        columns.len()
+    };
+    let mut states = Vec::with_capacity(xa_obs.len() * width);
+    for (index, arr) in xa_obs.iter().enumerate() {
+        let result = match range_km {
+            Some(range) if arr[XA_OBS_RANGE] == 0.0 && is_angles_only(arr[XA_OBS_OBSTYPE] as i32) => {
+                let mut ranged = *arr;
+                ranged[XA_OBS_RANGE] = range;
+                array_to_state(&ranged)
+            }
+            _ => array_to_state(arr),
+        };
+        let xa_ob_state = result.map_err(|e| format!("Error computing state for observation {}: {}", index, e))?;
+        push_state_columns(&mut states, &xa_ob_state, columns);
+    }
+    Ok(states)
+}
+
+// Track position indicators used by the B3 format
+const TRACK_START: i32 = 3;
+const TRACK_MIDDLE: i32 = 4;
+const TRACK_END: i32 = 5;
+
+fn split_tracks(records: &[(i32, i32, f64, i32)], max_gap_seconds: f64) -> (Vec<usize>, Vec<usize>) {
+    let max_gap = max_gap_seconds / 86400.0;
+    let mut order: Vec<usize> = (0..records.len()).collect();
+    order.sort_by(|&a, &b| {
+        let (sen_a, sat_a, epoch_a, _) = records[a];
+        let (sen_b, sat_b, epoch_b, _) = records[b];
+        sen_a
+            .cmp(&sen_b)
+            .then(sat_a.cmp(&sat_b))
+            .then(epoch_a.total_cmp(&epoch_b))
+    });
+
+    let mut offsets = Vec::new();
+    let mut previous: Option<(i32, i32, f64, i32)> = None;
+    for (position, &index) in order.iter().enumerate() {
+        let (sensor, satellite, epoch, track_position) = records[index];
+        let new_track = match previous {
+            None => true,
+            Some((prev_sensor, prev_satellite, prev_epoch, prev_track_position)) => {
+                sensor != prev_sensor
+                    || satellite != prev_satellite
+                    || epoch - prev_epoch > max_gap
+                    || track_position == TRACK_START
+                    || prev_track_position == TRACK_END
+            }
+        };
+        if new_track {
+            offsets.push(position);
+        }
+        previous = Some(records[index]);
+    }
+    offsets.push(order.len());
+    (order, offsets)
+}
+
+/// Group observations into tracks by sensor, satellite and time gap.
+///
+/// Observations are ordered by (sensor_number, norad_id, epoch).  A new track starts when the sensor or satellite
+/// changes, when consecutive epochs are more than `max_gap_seconds` apart, at a track-start indicator, or after a
+/// track-end indicator.  Returns the sort order as indices into `observations` and the track offsets into that
+/// order; track `i` spans `order[offsets[i]..offsets[i + 1]]`.
+pub fn build_tracks(observations: &[ParsedB3], max_gap_seconds: f64) -> (Vec<usize>, Vec<usize>) {
+    let records: Vec<(i32, i32, f64, i32)> = observations
+        .iter()
+        .map(|ob| (ob.sensor_number, ob.norad_id, ob.epoch, ob.track_position))
+        .collect();
+    split_tracks(&records, max_gap_seconds)
+}
+
+/// Group loaded observations into tracks without parsing them.
+///
+/// Returns the observation keys in track order and the track offsets into that list.  See [`build_tracks`] for the
+/// splitting rules.
+pub fn build_tracks_from_keys(obs_keys: &[i64], max_gap_seconds: f64) -> Result<(Vec<i64>, Vec<usize>), String> {
+    let mut records = Vec::with_capacity(obs_keys.len());
+    for &obs_key in obs_keys {
+        let xa_obs = get_array(obs_key).map_err(|e| format!("Error reading obs key {}: {}", obs_key, e))?;
+        records.push((
+            xa_obs[XA_OBS_SENNUM] as i32,
+            xa_obs[XA_OBS_SATNUM] as i32,
+            xa_obs[XA_OBS_DS50UTC],
+            xa_obs[XA_OBS_TRACKIND] as i32,
+        ));
+    }
+    let (order, offsets) = split_tracks(&records, max_gap_seconds);
+    Ok((order.into_iter().map(|index| obs_keys[index]).collect(), offsets))
+}
+
+// Seeded normal deviates (SplitMix64 + Box-Muller) so simulated noise is repeatable without an RNG dependency.
+struct GaussianRng {
+    state: u64,
+    spare: Option<f64>,
+}
+
+impl GaussianRng {
+    fn new(seed: u64) -> Self {
+        GaussianRng {
+            state: seed,
+            spare: None,
+        }
+    }
+
+    fn next_u64(&mut self) -> u64 {
+        self.state = self.state.wrapping_add(0x9E37_79B9_7F4A_7C15);
+        let mut z = self.state;
+        z = (z ^ (z >> 30)).wrapping_mul(0xBF58_476D_1CE4_E5B9);
+        z = (z ^ (z >> 27)).wrapping_mul(0x94D0_49BB_1331_11EB);
+        z ^ (z >> 31)
+    }
+
+    fn uniform(&mut self) -> f64 {
+        ((self.next_u64() >> 11) as f64 + 0.5) / (1u64 << 53) as f64
+    }
+
+    fn normal(&mut self) -> f64 {
+        if let Some(value) = self.spare.take() {
+            return value;
+        }
+        let radius = (-2.0 * self.uniform().ln()).sqrt();
+        let theta = 2.0 * std::f64::consts::PI * self.uniform();
+        self.spare = Some(radius * theta.sin());
+        radius * theta.cos()
+    }
+}
+
+fn add_noise(rng: &mut Option<GaussianRng>, value: f64, sigma: Option<f64>) -> f64 {
+    match (rng, sigma) {
+        (Some(rng), Some(sigma)) if sigma > 0.0 => value + sigma * rng.normal(),
+        _ => value,
+    }
+}
+
+struct SimulatedSensor {
+    registered: Arc<RegisteredSensor>,
+    limits: SensorLimits,
+    lla: [f64; 3],
+    efg: [f64; 3],
+}
+
+fn simulated_observation(
+    topo: &[f64; astro::XA_TOPO_SIZE],
+    observation_type: i32,
+    norad_id: i32,
+    epoch: f64,
+    site: &SimulatedSensor,
+    rng: &mut Option<GaussianRng>,
+) -> ParsedB3 {
+    let sensor = &site.registered.sensor;
+    let mut ob = ParsedB3 {
+        classification: String::from("U"),
+        norad_id,
+        sensor_number: sensor.number,
+        epoch,
+        elevation: None,
+        declination: None,
+        azimuth: None,
+        right_ascension: None,
+        range: None,
+        range_rate: None,
+        year_of_equinox: None,
+        elevation_rate: None,
+        azimuth_rate: None,
+        range_acceleration: None,
+        observation_type,
+        track_position: TRACK_MIDDLE,
+        association_status: 1,
+        site_tag: norad_id,
+        spadoc_tag: norad_id,
+        position: None,
+    };
+    if matches!(observation_type, 1 | 2 | 3 | 4 | 8) {
+        ob.azimuth = Some(add_noise(rng, topo[astro::XA_TOPO_AZ], sensor.azimuth_noise).rem_euclid(360.0));
+        ob.elevation = Some(add_noise(rng, topo[astro::XA_TOPO_EL], sensor.elevation_noise));
+    }
+    if matches!(observation_type, 5 | 9) {
+        ob.right_ascension = Some(add_noise(rng, topo[astro::XA_TOPO_RA], sensor.azimuth_noise).rem_euclid(360.0));
+        ob.declination = Some(add_noise(rng, topo[astro::XA_TOPO_DEC], sensor.elevation_noise));
+        ob.year_of_equinox = Some(EQUINOX_OBSTIME);
+    }
+    if matches!(observation_type, 2 | 3 | 4 | 6 | 8) {
+        ob.range = Some(add_noise(rng, topo[astro::XA_TOPO_RANGE], sensor.range_noise));
+    }
+    if matches!(observation_type, 0 | 3 | 4) {
+        ob.range_rate = Some(add_noise(rng, topo[astro::XA_TOPO_RANGEDOT], sensor.range_rate_noise));
+    }
+    if observation_type == 4 {
+        ob.azimuth_rate = Some(add_noise(rng, topo[astro::XA_TOPO_AZDOT], sensor.azimuth_rate_noise));
+        ob.elevation_rate = Some(add_noise(rng, topo[astro::XA_TOPO_ELDOT], sensor.elevation_rate_noise));
+        ob.range_acceleration = Some(0.0);
+    }
+    if matches!(observation_type, 8 | 9) {
+        ob.position = Some(site.efg);
+    }
+    ob
+}
+
+#[allow(clippy::too_many_arguments)]
+fn simulate_each(
+    sat_keys: &[i64],
+    sen_keys: &[i64],
+    start_ds50_utc: f64,
+    end_ds50_utc: f64,
+    step_seconds: f64,
+    observation_type: i32,
+    seed: Option<u64>,
+    mut emit: impl FnMut(ParsedB3) -> Result<(), String>,
+) -> Result<(), String> {
+    if !matches!(observation_type, 0 | 1 | 2 | 3 | 4 | 5 | 6 | 8 | 9) {
+        return Err(format!("Unsupported observation type: {}", observation_type));
+    }
+    if step_seconds <= 0.0 {
+        return Err(format!("Step must be positive: {}", step_seconds));
+    }
+    if end_ds50_utc < start_ds50_utc {
+        return Err(format!(
+            "End time {} is before start time {}",
+            end_ds50_utc, start_ds50_utc
+        ));
+    }
+
+    let mut norad_ids = Vec::with_capacity(sat_keys.len());
+    for &sat_key in sat_keys {
+        let (xa_tle, _) = tle::get_arrays(sat_key)?;
+        norad_ids.push(xa_tle[tle::XA_TLE_SATNUM] as i32);
+    }
+    let mut sites = Vec::with_capacity(sen_keys.len());
+    for &sen_key in sen_keys {
+        let registered = sensor::get_registered(sen_key)?;
+        let (lla, efg) = match (registered.lla, registered.efg) {
+            (Some(lla), Some(efg)) => (lla, efg),
+            _ => return Err(format!("Sensor {} has no fixed location", registered.sensor.number)),
+        };
+        let limits = match &registered.limits {
+            Some(limits) => limits.clone(),
+            None => return Err(format!("Sensor {} has no limits", registered.sensor.number)),
+        };
+        sites.push(SimulatedSensor {
+            registered,
+            limits,
+            lla,
+            efg,
+        });
+    }
+
+    let mut rng = seed.map(GaussianRng::new);
+    let mut pending: Vec<Option<ParsedB3>> = (0..sat_keys.len() * sites.len()).map(|_| None).collect();
+    let steps = ((end_ds50_utc - start_ds50_utc) * 86400.0 / step_seconds + 1.0e-9).floor() as usize;
+    let epochs: Vec<f64> = (0..=steps)
+        .map(|step| start_ds50_utc + step as f64 * step_seconds / 86400.0)
+        .collect();
+    let greenwich = time::get_cached_greenwich_table(&epochs, None)?;
+    for (&epoch, &greenwich_angle) in epochs.iter().zip(&greenwich.angles) {
+        let states = sgp4::get_positions_velocities_with_status(sat_keys, epoch, false);
+        for (sen_index, site) in sites.iter().enumerate() {
+            let lst = astro::gst_to_local_sidereal_time(greenwich_angle, site.lla[1]);
+            let sen_teme_pos = astro::gst_lla_to_teme(greenwich_angle, &site.lla);
+            for (sat_index, state) in states.values.iter().enumerate() {
+                let pair = sen_index * sat_keys.len() + sat_index;
+                let topo = match states.codes[sat_index] {
+                    sgp4::GP_ERR_NONE => Some(astro::teme_to_topo(lst, site.lla[0], &sen_teme_pos, state)?),
+                    _ => None,
+                };
+                if let Some(topo) = topo
+                    && site.limits.is_visible(
+                        topo[astro::XA_TOPO_AZ],
+                        topo[astro::XA_TOPO_EL],
+                        topo[astro::XA_TOPO_RANGE],
+                    )
+                {
+                    let mut ob =
+                        simulated_observation(&topo, observation_type, norad_ids[sat_index], epoch, site, &mut rng);
+                    match pending[pair].take() {
+                        Some(previous) => emit(previous)?,
+                        None => ob.track_position = TRACK_START,
+                    }
+                    pending[pair] = Some(ob);
+                } else if let Some(mut previous) = pending[pair].take() {
+                    if previous.track_position != TRACK_START {
+                        previous.track_position = TRACK_END;
+                    }
+                    emit(previous)?;
+                }
+            }
+        }
+    }
+    for mut previous in pending.into_iter().flatten() {
+        if previous.track_position != TRACK_START {
+            previous.track_position = TRACK_END;
+        }
+        emit(previous)?;
+    }
+    Ok(())
+}
+
+/// Simulate observations of SGP4-loaded satellites from loaded ground sensors.
+///
+/// Each sensor/satellite pair is sampled every `step_seconds` over the window.  Samples inside the sensor's
+/// azimuth/elevation and range limits become observations of `observation_type`, with track start/end indicators set
+/// per pass.  When `seed` is given, Gaussian noise with the sensor's sigmas is added.  The same seed always gives
+/// the same observations.  A satellite that fails to propagate at a step (e.g. after decay) is treated as not
+/// visible there, which closes any pass in progress, instead of aborting the whole run.
+#[allow(clippy::too_many_arguments)]
+pub fn simulate(
+    sat_keys: &[i64],
+    sen_keys: &[i64],
+    start_ds50_utc: f64,
+    end_ds50_utc: f64,
+    step_seconds: f64,
+    observation_type: i32,
+    seed: Option<u64>,
+) -> Result<Vec<ParsedB3>, String> {
+    let mut observations = Vec::new();
+    simulate_each(
+        sat_keys,
+        sen_keys,
+        start_ds50_utc,
+        end_ds50_utc,
+        step_seconds,
+        observation_type,
+        seed,
+        |ob| {
+            observations.push(ob);
+            Ok(())
+        },
+    )?;
+    observations.sort_by(|a, b| {
+        a.epoch
+            .total_cmp(&b.epoch)
+            .then(a.sensor_number.cmp(&b.sensor_number))
+            .then(a.norad_id.cmp(&b.norad_id))
+    });
+    Ok(observations)
+}
+
+/// Simulate observations as in [`simulate`] and stream them to a B3 file, returning the number written.
+///
+/// Cards are written as each pass sample is finalised, so the file is grouped by time step rather than strictly
+/// sorted.
+#[allow(clippy::too_many_arguments)]
+pub fn simulate_to_file(
+    sat_keys: &[i64],
+    sen_keys: &[i64],
+    start_ds50_utc: f64,
+    end_ds50_utc: f64,
+    step_seconds: f64,
+    observation_type: i32,
+    output_path: &str,
+    seed: Option<u64>,
+) -> Result<usize, String> {
+    let output = File::create(output_path).map_err(|e| format!("Error creating {}: {}", output_path, e))?;
+    let mut writer = BufWriter::with_capacity(CONVERT_BUFFER_BYTES, output);
+    let mut count = 0;
+    simulate_each(
+        sat_keys,
+        sen_keys,
+        start_ds50_utc,
+        end_ds50_utc,
+        step_seconds,
+        observation_type,
+        seed,
+        |ob| {
+            let line = ob.get_line()?;
+            writer
+                .write_all(line.as_bytes())
+                .and_then(|_| writer.write_all(b"\n"))
+                .map_err(|e| format!("Error writing {}: {}", output_path, e))?;
+            count += 1;
+            Ok(())
+        },
+    )?;
+    writer
+        .flush()
+        .map_err(|e| format!("Error writing {}: {}", output_path, e))?;
+    Ok(count)
+}
+
 pub struct ParsedB3 {
     pub classification: String,
     pub norad_id: i32,
@@ -1311,8 +2071,6 @@ impl ParsedB3 {
         Ok(())
     }
     pub fn from_line(b3_string: &str) -> Result<Self, String> {
-        let mut input_str: GetSetString = b3_string.into();
-        let mut sec_char = GetSetString::new();
         let mut sat_num: i32 = 0;
         let mut sen_num: i32 = 0;
         let mut obs_time_ds50utc: f64 = 0.0;
@@ -1323,38 +2081,42 @@ impl ParsedB3 {
         let mut el_rate: f64 = 0.0;
         let mut az_rate: f64 = 0.0;
         let mut range_accel: f64 = 0.0;
-        let mut obs_type = GetSetString::new();
         let mut track_ind: i32 = 0;
         let mut astat: i32 = 0;
         let mut site_tag: i32 = 0;
         let mut spadoc_tag: i32 = 0;
         let mut pos: [f64; 3] = [0.0; 3];
 
-        let result = unsafe {
-            ObsB3Parse(
-                input_str.pointer(),
-                sec_char.pointer(),
-                &mut sat_num,
-                &mut sen_num,
-                &mut obs_time_ds50utc,
-                &mut el_or_dec,
-                &mut az_or_ra,
-                &mut slant_range,
-                &mut range_rate_or_equinox,
-                &mut el_rate,
-                &mut az_rate,
-                &mut range_accel,
-                obs_type.pointer(),
-                &mut track_ind,
-                &mut astat,
-                &mut site_tag,
-                &mut spadoc_tag,
-                &mut pos,
-            )
-        };
-
-        let obs_type_char: c_char = obs_type.value().as_bytes().first().copied().unwrap_or(b'X') as c_char;
-        let b3_type = unsafe { ObsTypeCToI(obs_type_char) };
+        let (result, classification, obs_type_char) =
+            with_buffers(|[input_str, sec_char, obs_type]: &mut [GetSetString; 3]| {
+                input_str.assign(b3_string);
+                let result = stats::timed("ObsB3Parse", || unsafe {
+                    ObsB3Parse(
+                        input_str.pointer(),
+                        sec_char.pointer(),
+                        &mut sat_num,
+                        &mut sen_num,
+                        &mut obs_time_ds50utc,
+                        &mut el_or_dec,
+                        &mut az_or_ra,
+                        &mut slant_range,
+                        &mut range_rate_or_equinox,
+                        &mut el_rate,
+                        &mut az_rate,
+                        &mut range_accel,
+                        obs_type.pointer(),
+                        &mut track_ind,
+                        &mut astat,
+                        &mut site_tag,
+                        &mut spadoc_tag,
+                        &mut pos,
+                    )
+                });
+                let obs_type_char = obs_type.bytes().first().copied().unwrap_or(b'X') as c_char;
+                (result, sec_char.as_str().trim().to_string(), obs_type_char)
+            });
+
+        let b3_type = stats::timed("ObsTypeCToI", || unsafe { ObsTypeCToI(obs_type_char) });
         let mut azimuth: Option<f64> = None;
         let mut right_ascension: Option<f64> = None;
         let mut elevation: Option<f64> = None;
@@ -1422,7 +2184,7 @@ impl ParsedB3 {
 
         match result {
             0 => Ok(ParsedB3 {
-                classification: sec_char.value().trim().to_string(),
+                classification,
                 norad_id: sat_num,
                 sensor_number: sen_num,
                 epoch: obs_time_ds50utc,
@@ -1473,34 +2235,34 @@ impl ParsedB3 {
 
     pub fn get_line(&self) -> Result<String, String> {
         self._validate_fields()?;
-        let mut output_str = GetSetString::new();
-        let ob_type: c_char = unsafe { ObsTypeIToC(self.observation_type) };
+        let ob_type: c_char = stats::timed("ObsTypeIToC", || unsafe { ObsTypeIToC(self.observation_type) });
         let sec_char: c_char = self.classification.as_bytes().first().copied().unwrap_or(b'U') as c_char;
 
-        unsafe {
-            ObsFieldsToB3Card(
-                sec_char,
-                self.norad_id,
-                self.sensor_number,
-                self.epoch,
-                self.get_el_or_dec(),
-                self.get_az_or_ra(),
-                self.range.unwrap_or(0.0),
-                self.get_range_rate_or_equinox(),
-                self.elevation_rate.unwrap_or(0.0),
-                self.azimuth_rate.unwrap_or(0.0),
-                self.range_acceleration.unwrap_or(0.0),
-                ob_type,
-                self.track_position,
-                self.association_status,
-                self.site_tag,
-                self.spadoc_tag,
-                &self.position.unwrap_or([0.0, 0.0, 0.0]),
-                output_str.pointer(),
-            )
-        };
-
-        Ok(output_str.value().trim().to_string())
+        with_buffer(|output_str| {
+            stats::timed("ObsFieldsToB3Card", || unsafe {
+                ObsFieldsToB3Card(
+                    sec_char,
+                    self.norad_id,
+                    self.sensor_number,
+                    self.epoch,
+                    self.get_el_or_dec(),
+                    self.get_az_or_ra(),
+                    self.range.unwrap_or(0.0),
+                    self.get_range_rate_or_equinox(),
+                    self.elevation_rate.unwrap_or(0.0),
+                    self.azimuth_rate.unwrap_or(0.0),
+                    self.range_acceleration.unwrap_or(0.0),
+                    ob_type,
+                    self.track_position,
+                    self.association_status,
+                    self.site_tag,
+                    self.spadoc_tag,
+                    &self.position.unwrap_or([0.0, 0.0, 0.0]),
+                    output_str.pointer(),
+                )
+            });
+            Ok(output_str.as_str().trim().to_string())
+        })
     }
 }
 
@@ -1595,4 +2357,232 @@ mod tests {
         assert_abs_diff_eq!(parsed.position.unwrap()[1], 3706.326, epsilon = 1.0e-7);
         assert_abs_diff_eq!(parsed.position.unwrap()[2], 5814.97, epsilon = 1.0e-7);
     }
+
+    #[test]
+    fn test_b3_csv_round_trip() {
+        let _lock = TEST_LOCK.lock().unwrap();
+
+        let b3_card = "U0001151013352142520112J85202 2220398         -01207880+03706326+05814970 9 4  10001100011";
+        let mut converter = ObsConverter::new();
+        let csv = converter.b3_to_csv(b3_card).unwrap();
+        let b3 = converter.csv_to_b3(&csv, 0).unwrap();
+        let original = ParsedB3::from_line(b3_card).unwrap();
+        let round_trip = ParsedB3::from_line(&b3).unwrap();
+
+        assert_eq!(round_trip.norad_id, original.norad_id);
+        assert_eq!(round_trip.sensor_number, original.sensor_number);
+        assert_eq!(round_trip.observation_type, original.observation_type);
+        assert_abs_diff_eq!(round_trip.epoch, original.epoch, epsilon = 1.0e-7);
+        assert_abs_diff_eq!(
+            round_trip.declination.unwrap(),
+            original.declination.unwrap(),
+            epsilon = 1.0e-7
+        );
+        assert_abs_diff_eq!(
+            round_trip.right_ascension.unwrap(),
+            original.right_ascension.unwrap(),
+            epsilon = 1.0e-7
+        );
+    }
+
+    #[test]
+    fn test_convert_file_b3_to_csv_and_back() {
+        let _lock = TEST_LOCK.lock().unwrap();
+
+        let csv_path = std::env::temp_dir().join(format!("saal_convert_obs_{}.csv", std::process::id()));
+        let b3_path = std::env::temp_dir().join(format!("saal_convert_obs_{}.b3", std::process::id()));
+        let csv_count = convert_file(
+            "tests/data/test-b3-obs.txt",
+            csv_path.to_str().unwrap(),
+            OBSFORM_B3,
+            OBSFORM_CSV,
+            0,
+        )
+        .unwrap();
+        let b3_count = convert_file(
+            csv_path.to_str().unwrap(),
+            b3_path.to_str().unwrap(),
+            OBSFORM_CSV,
+            OBSFORM_B3,
+            0,
+        )
+        .unwrap();
+        let first_line = std::fs::read_to_string(&b3_path)
+            .unwrap()
+            .lines()
+            .next()
+            .unwrap()
+            .to_string();
+        let _ = std::fs::remove_file(&csv_path);
+        let _ = std::fs::remove_file(&b3_path);
+
+        assert_eq!(csv_count, 5053);
+        assert_eq!(b3_count, 5053);
+        let parsed = ParsedB3::from_line(&first_line).unwrap();
+        assert_eq!(parsed.norad_id, 1328);
+        assert_eq!(parsed.sensor_number, 354);
+    }
+
+    #[test]
+    fn test_convert_file_rejects_rf_form() {
+        let _lock = TEST_LOCK.lock().unwrap();
+
+        let path = std::env::temp_dir().join(format!("saal_convert_obs_rf_{}.txt", std::process::id()));
+        let result = convert_file(
+            "tests/data/test-b3-obs.txt",
+            path.to_str().unwrap(),
+            OBSFORM_B3,
+            OBSFORM_RF,
+            0,
+        );
+        let _ = std::fs::remove_file(&path);
+        assert!(result.is_err());
+    }
+
+    #[test]
+    fn test_get_states_matches_arrays_to_states() {
+        let _lock = TEST_LOCK.lock().unwrap();
+
+        crate::sensor::load_file("tests/data/sensors.dat").unwrap();
+        load_file("tests/data/test-b3-obs.txt").unwrap();
+        let keys: Vec<i64> = get_keys(IDX_ORDER_QUICK).into_iter().take(10).collect();
+        let columns = [
+            XA_OBSTATE_SATNUM,
+            XA_OBSTATE_SENNUM,
+            XA_OBSTATE_DS50UTC,
+            XA_OBSTATE_POSX,
+        ];
+        let states = get_states(&keys, 40000.0, &columns).unwrap();
+        let arrays: Vec<[f64; XA_OBS_SIZE]> = keys.iter().map(|&key| get_array(key).unwrap()).collect();
+        let full_states = arrays_to_states(&arrays, Some(40000.0), &[]).unwrap();
+        let parsed: Vec<ParsedB3> = keys.iter().map(|&key| parse_key(key).unwrap()).collect();
+        let bad_column = get_states(&keys, 40000.0, &[XA_OBSTATE_SIZE]);
+        clear();
+        crate::sensor::clear().unwrap();
+
+        assert_eq!(states.len(), keys.len() * columns.len());
+        assert_eq!(full_states.len(), keys.len() * XA_OBSTATE_SIZE);
+        assert!(bad_column.is_err());
+        for (i, obs) in parsed.iter().enumerate() {
+            let row = &states[i * columns.len()..(i + 1) * columns.len()];
+            let full_row = &full_states[i * XA_OBSTATE_SIZE..(i + 1) * XA_OBSTATE_SIZE];
+            assert_eq!(row[0] as i32, obs.norad_id);
+            assert_eq!(row[1] as i32, obs.sensor_number);
+            assert_abs_diff_eq!(row[2], obs.epoch, epsilon = 1.0e-9);
+            assert_abs_diff_eq!(row[3], full_row[XA_OBSTATE_POSX], epsilon = 1.0e-6);
+        }
+    }
+
+    #[test]
+    fn test_build_tracks_splits_on_gap_and_indicators() {
+        let _lock = TEST_LOCK.lock().unwrap();
+
+        let ob = |sensor_number: i32, norad_id: i32, seconds: f64, track_position: i32| ParsedB3 {
+            sensor_number,
+            norad_id,
+            epoch: 25934.0 + seconds / 86400.0,
+            track_position,
+            ..ParsedB3::default()
+        };
+        let observations = vec![
+            ob(500, 11111, 20.0, 4),
+            ob(500, 11111, 0.0, 3),
+            ob(510, 11111, 0.0, 4),
+            ob(500, 11111, 40.0, 5),
+            ob(500, 11111, 50.0, 3),
+            ob(500, 11111, 1000.0, 4),
+            ob(500, 22222, 10.0, 4),
+        ];
+        let (order, offsets) = build_tracks(&observations, 300.0);
+
+        assert_eq!(order, vec![1, 0, 3, 4, 5, 6, 2]);
+        assert_eq!(offsets, vec![0, 3, 4, 5, 6, 7]);
+    }
+
+    #[test]
+    fn test_build_tracks_from_keys() {
+        let _lock = TEST_LOCK.lock().unwrap();
+
+        load_file("tests/data/test-b3-obs.txt").unwrap();
+        let keys = get_keys(crate::IDX_ORDER_READ);
+        let (sorted_keys, offsets) = build_tracks_from_keys(&keys, 600.0).unwrap();
+        let first_track: Vec<[f64; XA_OBS_SIZE]> = sorted_keys[offsets[0]..offsets[1]]
+            .iter()
+            .map(|&key| get_array(key).unwrap())
+            .collect();
+        clear();
+
+        assert_eq!(sorted_keys.len(), keys.len());
+        assert_eq!(*offsets.last().unwrap(), keys.len());
+        assert!(offsets.windows(2).all(|pair| pair[0] < pair[1]));
+        for pair in first_track.windows(2) {
+            assert_eq!(pair[0][XA_OBS_SENNUM], pair[1][XA_OBS_SENNUM]);
+            assert_eq!(pair[0][XA_OBS_SATNUM], pair[1][XA_OBS_SATNUM]);
+            assert!(pair[1][XA_OBS_DS50UTC] - pair[0][XA_OBS_DS50UTC] <= 600.0 / 86400.0);
+        }
+    }
+
+    #[test]
+    fn test_simulate_is_repeatable() {
+        let _lock = TEST_LOCK.lock().unwrap();
+
+        let line_1 = "1 33333U 15058A   25363.54791667 +.00012345  10000-1  20000-1 4  900";
+        let line_2 = "2 33333  30.0000  40.0000 0005000  60.0000  70.0000  8.2345678012345";
+        let epoch = 27757.54791667;
+        sensor::load_file("tests/data/sensors.dat").unwrap();
+        sensor::prune_missing_locations().unwrap();
+        let sat_key = tle::load_lines(line_1, line_2);
+        sgp4::load(sat_key).unwrap();
+        let sen_keys = sensor::get_keys(crate::IDX_ORDER_READ);
+        let noisy = simulate(&[sat_key], &sen_keys, epoch, epoch + 0.25, 60.0, 2, Some(42)).unwrap();
+        let repeated = simulate(&[sat_key], &sen_keys, epoch, epoch + 0.25, 60.0, 2, Some(42)).unwrap();
+        let clean = simulate(&[sat_key], &sen_keys, epoch, epoch + 0.25, 60.0, 2, None).unwrap();
+        let bad_type = simulate(&[sat_key], &sen_keys, epoch, epoch + 0.25, 60.0, 7, None);
+        sgp4::remove(sat_key).unwrap();
+        tle::remove(sat_key);
+        sensor::clear().unwrap();
+
+        assert!(!noisy.is_empty());
+        assert!(bad_type.is_err());
+        assert_eq!(noisy.len(), repeated.len());
+        assert_eq!(noisy.len(), clean.len());
+        for (a, b) in noisy.iter().zip(&repeated) {
+            assert_eq!(a.get_line().unwrap(), b.get_line().unwrap());
+        }
+        for ob in &clean {
+            assert_eq!(ob.norad_id, 33333);
+            assert!(ob.epoch >= epoch && ob.epoch <= epoch + 0.25);
+            assert!(ob.elevation.is_some() && ob.azimuth.is_some() && ob.range.is_some());
+            assert!([TRACK_START, TRACK_MIDDLE, TRACK_END].contains(&ob.track_position));
+        }
+    }
+
+    #[test]
+    fn test_simulate_skips_failed_satellites() {
+        let _lock = TEST_LOCK.lock().unwrap();
+
+        let line_1 = "1 33333U 15058A   25363.54791667 +.00012345  10000-1  20000-1 4  900";
+        let line_2 = "2 33333  30.0000  40.0000 0005000  60.0000  70.0000  8.2345678012345";
+        let unloaded_1 = "1 44444U 15058B   25363.54791667 +.00012345  10000-1  20000-1 4  900";
+        let unloaded_2 = "2 44444  30.0000  40.0000 0005000  60.0000  70.0000  8.2345678012345";
+        let epoch = 27757.54791667;
+        sensor::load_file("tests/data/sensors.dat").unwrap();
+        sensor::prune_missing_locations().unwrap();
+        let sat_key = tle::load_lines(line_1, line_2);
+        let unloaded_key = tle::load_lines(unloaded_1, unloaded_2);
+        sgp4::load(sat_key).unwrap();
+        let sen_keys = sensor::get_keys(crate::IDX_ORDER_READ);
+        let alone = simulate(&[sat_key], &sen_keys, epoch, epoch + 0.25, 60.0, 2, None).unwrap();
+        let mixed = simulate(&[unloaded_key, sat_key], &sen_keys, epoch, epoch + 0.25, 60.0, 2, None).unwrap();
+        sgp4::remove(sat_key).unwrap();
+        tle::remove(sat_key);
+        tle::remove(unloaded_key);
+        sensor::clear().unwrap();
+
+        assert!(!alone.is_empty());
+        assert_eq!(alone.len(), mixed.len());
+        for (a, b) in alone.iter().zip(&mixed) {
+            assert_eq!(a.get_line().unwrap(), b.get_line().unwrap());
+        }
+    }
 }
@@ -1,6 +1,7 @@
 // This wrapper file was generated automatically by the GenDllWrappers program.
 #![allow(non_snake_case)]
 #![allow(dead_code)]
+use crate::stats;
 use std::os::raw::c_char;
 
 unsafe extern "C" {
@@ -405,14 +406,16 @@ pub fn get_relative_array(
     frame: i32,
 ) -> [f64; XA_DELTA_SIZE] {
     let mut xa_delta: [f64; XA_DELTA_SIZE] = [0.0; XA_DELTA_SIZE];
-    unsafe {
+    stats::timed("SatStateEphCom_OS", || unsafe {
         SatStateEphCom_OS(target_posvel, chase_posvel, utc_ds50, frame, &mut xa_delta);
-    }
+    });
     xa_delta
 }
 
 pub fn get_prior_nodal_crossing(sat_key: i64, tai_ds50: f64) -> f64 {
-    unsafe { GetNodalCrossingPriorToTime(sat_key, tai_ds50) }
+    stats::timed("GetNodalCrossingPriorToTime", || unsafe {
+        GetNodalCrossingPriorToTime(sat_key, tai_ds50)
+    })
 }
 
 #[cfg(test)]
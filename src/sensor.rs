@@ -1,8 +1,13 @@
 // This wrapper file was generated automatically by the GenDllWrappers program.
 #![allow(non_snake_case)]
 #![allow(dead_code)]
-use crate::{GetSetString, IDX_ORDER_QUICK, IDX_ORDER_READ, astro, get_last_error_message};
+use crate::{
+    GetSetString, IDX_ORDER_QUICK, IDX_ORDER_READ, astro, get_last_error_message, sgp4, stats, time, with_buffer,
+    with_buffers, with_str,
+};
+use std::collections::HashMap;
 use std::os::raw::c_char;
+use std::sync::{Arc, LazyLock, Mutex, MutexGuard};
 
 unsafe extern "C" {
     //  Notes: This function has been deprecated since v9.0.
@@ -273,9 +278,10 @@ unsafe extern "C" {
 }
 
 pub fn get_dll_info() -> String {
-    let mut c_info = GetSetString::new();
-    unsafe { SensorGetInfo(c_info.pointer()) };
-    c_info.value()
+    with_buffer(|c_info| {
+        stats::timed("SensorGetInfo", || unsafe { SensorGetInfo(c_info.pointer()) });
+        c_info.value()
+    })
 }
 
 // Sensor segment types
@@ -734,6 +740,7 @@ pub static OT_RRATE_SELOB: i32 = 999;
 
 // ========================= End of auto generated code ==========================
 
+#[derive(Clone, Debug)]
 pub struct ParsedSensor {
     pub key: i64,
     pub number: i32,
@@ -758,7 +765,7 @@ pub struct ParsedSensor {
 
 impl ParsedSensor {
     pub fn from_number(number: i32) -> Result<ParsedSensor, String> {
-        let key = unsafe { SensorGetSenKey(number) };
+        let key = stats::timed("SensorGetSenKey", || unsafe { SensorGetSenKey(number) });
         if key > 0 {
             ParsedSensor::from_key(key)
         } else {
@@ -768,7 +775,10 @@ impl ParsedSensor {
 
     pub fn from_key(key: i64) -> Result<ParsedSensor, String> {
         let (xa_sen, xs_sen) = get_arrays(key)?;
+        ParsedSensor::from_arrays(key, &xa_sen, &xs_sen)
+    }
 
+    pub fn from_arrays(key: i64, xa_sen: &[f64; XA_SEN_SIZE], xs_sen: &str) -> Result<ParsedSensor, String> {
         // get XS_SEN_DSCRPTN_3_24 + 24 characters
         let description = match xs_sen[XS_SEN_DSCRPTN_3_24..XS_SEN_DSCRPTN_3_24 + 24].trim() {
             "" => None,
@@ -792,7 +802,7 @@ impl ParsedSensor {
         } else {
             None
         };
-        let lla = get_lla(key)?;
+        let lla = lla_from_array(xa_sen)?;
         let mut latitude = None;
         let mut longitude = None;
         let mut altitude = None;
@@ -863,7 +873,7 @@ impl ParsedSensor {
 }
 
 pub fn parse_key(sen_key: i64) -> Result<ParsedSensor, String> {
-    ParsedSensor::from_key(sen_key)
+    Ok(get_registered(sen_key)?.sensor.clone())
 }
 
 pub fn prune_missing_locations() -> Result<(), String> {
@@ -883,9 +893,9 @@ pub fn parse_all() -> Result<Vec<ParsedSensor>, String> {
     let keys = get_keys(IDX_ORDER_READ);
     let mut sensors = Vec::new();
 
+    let mut registry = lock_registry();
     for key in keys {
-        let sensor = ParsedSensor::from_key(key)?;
-        sensors.push(sensor);
+        sensors.push(registry.get(key)?.sensor.clone());
     }
 
     Ok(sensors)
@@ -893,9 +903,11 @@ pub fn parse_all() -> Result<Vec<ParsedSensor>, String> {
 
 pub fn get_astronomical_ll(sen_key: i64) -> Result<[f64; 2], String> {
     let mut xa_sen = [0f64; XA_SEN_SIZE];
-    let mut xs_sen = GetSetString::new();
-
-    let result = unsafe { SensorDataToArray(sen_key, &mut xa_sen, xs_sen.pointer()) };
+    let result = with_buffer(|xs_sen| {
+        stats::timed_status("SensorDataToArray", || unsafe {
+            SensorDataToArray(sen_key, &mut xa_sen, xs_sen.pointer())
+        })
+    });
     if result != 0 {
         return Err(get_last_error_message());
     }
@@ -905,14 +917,20 @@ pub fn get_astronomical_ll(sen_key: i64) -> Result<[f64; 2], String> {
 
 pub fn get_lla(sen_key: i64) -> Result<Option<[f64; 3]>, String> {
     let mut xa_sen = [0f64; XA_SEN_SIZE];
-    let mut xs_sen = GetSetString::new();
-
-    let result = unsafe { SensorDataToArray(sen_key, &mut xa_sen, xs_sen.pointer()) };
+    let result = with_buffer(|xs_sen| {
+        stats::timed_status("SensorDataToArray", || unsafe {
+            SensorDataToArray(sen_key, &mut xa_sen, xs_sen.pointer())
+        })
+    });
 
     if result != 0 {
         return Err(get_last_error_message());
     }
 
+    lla_from_array(&xa_sen)
+}
+
+fn lla_from_array(xa_sen: &[f64; XA_SEN_SIZE]) -> Result<Option<[f64; 3]>, String> {
     match xa_sen[XA_SEN_GRN_LOCTYPE] as i32 {
         SENLOC_TYPE_LLH => Ok(Some([
             xa_sen[XA_SEN_GRN_POS1],
@@ -937,15 +955,17 @@ pub fn get_lla(sen_key: i64) -> Result<Option<[f64; 3]>, String> {
 pub fn get_keys(order: i32) -> Vec<i64> {
     let count = count_loaded();
     let mut keys = vec![0; count as usize];
-    unsafe {
+    stats::timed("SensorGetLoaded", || unsafe {
         SensorGetLoaded(order, keys.as_mut_ptr());
-    }
+    });
     keys
 }
 
 pub fn load_card(card: &str) -> Result<(), String> {
-    let mut input_card: GetSetString = card.into();
-    let result = unsafe { SensorLoadCard(input_card.pointer()) };
+    let result = with_str(card, |input_card| {
+        stats::timed_status("SensorLoadCard", || unsafe { SensorLoadCard(input_card.pointer()) })
+    });
+    invalidate_registry();
 
     match result {
         0 => Ok(()),
@@ -954,7 +974,8 @@ pub fn load_card(card: &str) -> Result<(), String> {
 }
 
 pub fn remove(sen_key: i64) -> Result<(), String> {
-    let result = unsafe { SensorRemove(sen_key) };
+    let result = stats::timed_status("SensorRemove", || unsafe { SensorRemove(sen_key) });
+    lock_registry().remove(sen_key);
     match result {
         0 => Ok(()),
         _ => Err(get_last_error_message()),
@@ -962,12 +983,14 @@ pub fn remove(sen_key: i64) -> Result<(), String> {
 }
 
 pub fn count_loaded() -> i32 {
-    unsafe { SensorGetCount() }
+    stats::timed("SensorGetCount", || unsafe { SensorGetCount() })
 }
 
 pub fn load_file(file_path: &str) -> Result<(), String> {
-    let mut input_file: GetSetString = file_path.into();
-    let result = unsafe { SensorLoadFile(input_file.pointer()) };
+    let result = with_str(file_path, |input_file| {
+        stats::timed_status("SensorLoadFile", || unsafe { SensorLoadFile(input_file.pointer()) })
+    });
+    invalidate_registry();
 
     match result {
         0 => Ok(()),
@@ -976,7 +999,8 @@ pub fn load_file(file_path: &str) -> Result<(), String> {
 }
 
 pub fn clear() -> Result<(), String> {
-    let result = unsafe { SensorRemoveAll() };
+    let result = stats::timed_status("SensorRemoveAll", || unsafe { SensorRemoveAll() });
+    invalidate_registry();
     match result {
         0 => Ok(()),
         _ => Err(get_last_error_message()),
@@ -985,16 +1009,374 @@ pub fn clear() -> Result<(), String> {
 
 pub fn get_arrays(sen_key: i64) -> Result<([f64; XA_SEN_SIZE], String), String> {
     let mut xa_sen = [0f64; XA_SEN_SIZE];
-    let mut xs_sen = GetSetString::new();
+    with_buffer(|xs_sen| {
+        let result = stats::timed_status("SensorDataToArray", || unsafe {
+            SensorDataToArray(sen_key, &mut xa_sen, xs_sen.pointer())
+        });
+        match result {
+            0 => Ok((xa_sen, xs_sen.value())),
+            _ => Err(get_last_error_message()),
+        }
+    })
+}
 
-    let result = unsafe { SensorDataToArray(sen_key, &mut xa_sen, xs_sen.pointer()) };
+#[derive(Clone, Debug)]
+pub struct SensorLimits {
+    pub view_type: String,
+    pub observation_type: String,
+    pub minimum_range: f64,
+    pub maximum_range: f64,
+    pub range_rate_limit: f64,
+    pub apply_range_limits: bool,
+    pub elevation_limits: [f64; 2],
+    pub azimuth_limits: [f64; 2],
+    pub elevation_limits_2: [f64; 2],
+    pub azimuth_limits_2: [f64; 2],
+    pub interval: f64,
+    pub maximum_points_per_pass: i32,
+    pub earth_limb: f64,
+    pub solar_exclusion_angle: f64,
+    pub lunar_exclusion_angle: f64,
+    pub minimum_illumination: f64,
+    pub twilight: f64,
+}
 
-    match result {
-        0 => Ok((xa_sen, xs_sen.value())),
-        _ => Err(get_last_error_message()),
+fn in_window(azimuth: f64, elevation: f64, azimuth_limits: [f64; 2], elevation_limits: [f64; 2]) -> bool {
+    let [el_min, el_max] = elevation_limits;
+    let el_max = if el_max > el_min { el_max } else { 90.0 };
+    if elevation < el_min || elevation > el_max {
+        return false;
+    }
+    let [az_min, az_max] = azimuth_limits;
+    if az_min == az_max {
+        true
+    } else if az_min < az_max {
+        azimuth >= az_min && azimuth <= az_max
+    } else {
+        azimuth >= az_min || azimuth <= az_max
+    }
+}
+
+impl SensorLimits {
+    /// Return whether a topocentric azimuth/elevation (deg) and range (km) fall inside the sensor limits.
+    ///
+    /// The secondary azimuth/elevation window is only consulted when it is populated.  Equal azimuth limits mean no
+    /// azimuth restriction and an unset upper elevation limit means 90 degrees.
+    pub fn is_visible(&self, azimuth: f64, elevation: f64, range: f64) -> bool {
+        let secondary_set = self.elevation_limits_2 != [0.0, 0.0] || self.azimuth_limits_2 != [0.0, 0.0];
+        let in_view = in_window(azimuth, elevation, self.azimuth_limits, self.elevation_limits)
+            || (secondary_set && in_window(azimuth, elevation, self.azimuth_limits_2, self.elevation_limits_2));
+        if !in_view {
+            return false;
+        }
+        if self.apply_range_limits {
+            if self.maximum_range > 0.0 && range > self.maximum_range {
+                return false;
+            }
+            if range < self.minimum_range {
+                return false;
+            }
+        }
+        true
+    }
+}
+
+pub fn get_limits(sen_key: i64) -> Result<SensorLimits, String> {
+    with_buffers(
+        |[view_type, obs_type, boresight_1, boresight_2]: &mut [GetSetString; 4]| {
+            let mut range_units = 0;
+            let mut maximum_range = 0.0;
+            let mut elevation_limits = [0.0; 2];
+            let mut azimuth_limits = [0.0; 2];
+            let mut interval = 0.0;
+            let mut visibility_flag = 0;
+            let mut range_limit_flag = 0;
+            let mut maximum_points_per_pass = 0;
+            let mut minimum_range = 0.0;
+            let mut planetary_restriction = 0;
+            let mut range_rate_limit = 0.0;
+            let result = stats::timed_status("SensorGet1L", || unsafe {
+                SensorGet1L(
+                    sen_key,
+                    view_type.pointer(),
+                    obs_type.pointer(),
+                    &mut range_units,
+                    &mut maximum_range,
+                    boresight_1.pointer(),
+                    &mut elevation_limits[0],
+                    &mut elevation_limits[1],
+                    &mut azimuth_limits[0],
+                    &mut azimuth_limits[1],
+                    &mut interval,
+                    &mut visibility_flag,
+                    &mut range_limit_flag,
+                    &mut maximum_points_per_pass,
+                    &mut minimum_range,
+                    &mut planetary_restriction,
+                    &mut range_rate_limit,
+                )
+            });
+            if result != 0 {
+                return Err(get_last_error_message());
+            }
+
+            let mut elevation_limits_2 = [0.0; 2];
+            let mut azimuth_limits_2 = [0.0; 2];
+            let mut earth_background = 0;
+            let mut earth_limb = 0.0;
+            let mut solar_exclusion_angle = 0.0;
+            let mut lunar_exclusion_angle = 0.0;
+            let mut minimum_illumination = 0.0;
+            let mut twilight = 0.0;
+            let result = stats::timed_status("SensorGet2L", || unsafe {
+                SensorGet2L(
+                    sen_key,
+                    boresight_2.pointer(),
+                    &mut elevation_limits_2[0],
+                    &mut elevation_limits_2[1],
+                    &mut azimuth_limits_2[0],
+                    &mut azimuth_limits_2[1],
+                    &mut earth_background,
+                    &mut earth_limb,
+                    &mut solar_exclusion_angle,
+                    &mut lunar_exclusion_angle,
+                    &mut minimum_illumination,
+                    &mut twilight,
+                )
+            });
+            if result != 0 {
+                return Err(get_last_error_message());
+            }
+
+            Ok(SensorLimits {
+                view_type: view_type.as_str().chars().take(1).collect(),
+                observation_type: obs_type.as_str().chars().take(1).collect(),
+                minimum_range,
+                maximum_range,
+                range_rate_limit,
+                apply_range_limits: range_limit_flag == 0,
+                elevation_limits,
+                azimuth_limits,
+                elevation_limits_2,
+                azimuth_limits_2,
+                interval,
+                maximum_points_per_pass,
+                earth_limb,
+                solar_exclusion_angle,
+                lunar_exclusion_angle,
+                minimum_illumination,
+                twilight,
+            })
+        },
+    )
+}
+
+/// Sensor data read once from the DLL along with derived site geometry.
+#[derive(Clone, Debug)]
+pub struct RegisteredSensor {
+    pub sensor: ParsedSensor,
+    pub limits: Option<SensorLimits>,
+    pub lla: Option<[f64; 3]>,
+    pub efg: Option<[f64; 3]>,
+}
+
+impl RegisteredSensor {
+    pub fn from_key(sen_key: i64) -> Result<RegisteredSensor, String> {
+        let (xa_sen, xs_sen) = get_arrays(sen_key)?;
+        let sensor = ParsedSensor::from_arrays(sen_key, &xa_sen, &xs_sen)?;
+        let limits = get_limits(sen_key).ok();
+        let lla = match (sensor.latitude, sensor.longitude, sensor.altitude) {
+            (Some(latitude), Some(longitude), Some(altitude)) => Some([latitude, longitude, altitude]),
+            _ => None,
+        };
+        let efg = lla.map(|lla| astro::llh_to_efg(&lla));
+        Ok(RegisteredSensor {
+            sensor,
+            limits,
+            lla,
+            efg,
+        })
     }
 }
 
+/// Cache of [`RegisteredSensor`] entries with O(1) lookup by sensor key and by sensor number.
+///
+/// Entries are read from the DLL on first use.  The process-wide registry is invalidated by this module's
+/// load/remove/clear functions; sensors changed through other DLL entry points require [`invalidate_registry`].
+#[derive(Default)]
+pub struct SensorRegistry {
+    by_key: HashMap<i64, Arc<RegisteredSensor>>,
+    by_number: HashMap<i32, i64>,
+}
+
+impl SensorRegistry {
+    pub fn new() -> Self {
+        Self::default()
+    }
+
+    pub fn get(&mut self, sen_key: i64) -> Result<Arc<RegisteredSensor>, String> {
+        if let Some(entry) = self.by_key.get(&sen_key) {
+            return Ok(entry.clone());
+        }
+        let entry = Arc::new(RegisteredSensor::from_key(sen_key)?);
+        self.by_number.insert(entry.sensor.number, sen_key);
+        self.by_key.insert(sen_key, entry.clone());
+        Ok(entry)
+    }
+
+    pub fn get_by_number(&mut self, number: i32) -> Result<Arc<RegisteredSensor>, String> {
+        let sen_key = match self.by_number.get(&number) {
+            Some(&sen_key) => sen_key,
+            None => match stats::timed("SensorGetSenKey", || unsafe { SensorGetSenKey(number) }) {
+                key if key > 0 => key,
+                _ => return Err(get_last_error_message()),
+            },
+        };
+        self.get(sen_key)
+    }
+
+    /// Read every loaded sensor into the registry.
+    pub fn load_all(&mut self) -> Result<(), String> {
+        for sen_key in get_keys(IDX_ORDER_QUICK) {
+            self.get(sen_key)?;
+        }
+        Ok(())
+    }
+
+    pub fn remove(&mut self, sen_key: i64) {
+        if let Some(entry) = self.by_key.remove(&sen_key) {
+            self.by_number.remove(&entry.sensor.number);
+        }
+    }
+
+    pub fn clear(&mut self) {
+        self.by_key.clear();
+        self.by_number.clear();
+    }
+
+    pub fn len(&self) -> usize {
+        self.by_key.len()
+    }
+
+    pub fn is_empty(&self) -> bool {
+        self.by_key.is_empty()
+    }
+}
+
+static REGISTRY: LazyLock<Mutex<SensorRegistry>> = LazyLock::new(|| Mutex::new(SensorRegistry::new()));
+
+fn lock_registry() -> MutexGuard<'static, SensorRegistry> {
+    REGISTRY.lock().unwrap_or_else(|poisoned| poisoned.into_inner())
+}
+
+pub fn get_registered(sen_key: i64) -> Result<Arc<RegisteredSensor>, String> {
+    lock_registry().get(sen_key)
+}
+
+pub fn get_registered_by_number(number: i32) -> Result<Arc<RegisteredSensor>, String> {
+    lock_registry().get_by_number(number)
+}
+
+pub fn invalidate_registry() {
+    lock_registry().clear();
+}
+
+fn network_sites(sen_keys: &[i64]) -> Result<Vec<(Arc<RegisteredSensor>, [f64; 3])>, String> {
+    let mut registry = lock_registry();
+    sen_keys
+        .iter()
+        .map(|&sen_key| {
+            let site = registry.get(sen_key)?;
+            match site.lla {
+                Some(lla) => Ok((site, lla)),
+                None => Err(format!("Sensor {} has no fixed location", site.sensor.number)),
+            }
+        })
+        .collect()
+}
+
+fn push_network_topo(
+    sites: &[(Arc<RegisteredSensor>, [f64; 3])],
+    sat_teme_posvels: &[[f64; 6]],
+    greenwich_angle: f64,
+    topo: &mut Vec<f64>,
+    visible: &mut Option<Vec<bool>>,
+) -> Result<(), String> {
+    for (site, lla) in sites {
+        let lst = astro::gst_to_local_sidereal_time(greenwich_angle, lla[1]);
+        let sen_teme_pos = astro::gst_lla_to_teme(greenwich_angle, lla);
+        for posvel in sat_teme_posvels {
+            if posvel.iter().any(|v| v.is_nan()) {
+                if let Some(visible) = visible.as_mut() {
+                    visible.push(false);
+                }
+                topo.extend_from_slice(&[f64::NAN; astro::XA_TOPO_SIZE]);
+                continue;
+            }
+            let xa_topo = astro::teme_to_topo(lst, lla[0], &sen_teme_pos, posvel)?;
+            if let Some(visible) = visible.as_mut() {
+                let (az, el, range) = (
+                    xa_topo[astro::XA_TOPO_AZ],
+                    xa_topo[astro::XA_TOPO_EL],
+                    xa_topo[astro::XA_TOPO_RANGE],
+                );
+                visible.push(match &site.limits {
+                    Some(limits) => limits.is_visible(az, el, range),
+                    None => el >= 0.0,
+                });
+            }
+            topo.extend_from_slice(&xa_topo);
+        }
+    }
+    Ok(())
+}
+
+/// Compute topocentric components of N TEME states from M sensors at a single epoch.
+///
+/// The result is flattened in (sensor, satellite, `XA_TOPO_*`) order, so the components of satellite `n` seen from
+/// sensor `m` start at `(m * N + n) * XA_TOPO_SIZE`.  The Greenwich angle is computed once and each sensor's TEME
+/// position and local sidereal time once per sensor.  When `visibility` is set, a mask in (sensor, satellite) order
+/// reports whether each satellite is inside the sensor's azimuth/elevation and range limits, or above the horizon for
+/// sensors without limits.  States containing NaN give NaN components and are never visible.
+pub fn get_network_topo(
+    sen_keys: &[i64],
+    sat_teme_posvels: &[[f64; 6]],
+    ds50_utc: f64,
+    visibility: bool,
+) -> Result<(Vec<f64>, Option<Vec<bool>>), String> {
+    let sites = network_sites(sen_keys)?;
+    let pairs = sites.len() * sat_teme_posvels.len();
+    let mut topo = Vec::with_capacity(pairs * astro::XA_TOPO_SIZE);
+    let mut visible = visibility.then(|| Vec::with_capacity(pairs));
+    let greenwich_angle = time::get_greenwich_angles(&[ds50_utc], None)?[0];
+    push_network_topo(&sites, sat_teme_posvels, greenwich_angle, &mut topo, &mut visible)?;
+    Ok((topo, visible))
+}
+
+/// Compute topocentric components of SGP4-loaded satellites from M sensors over T epochs.
+///
+/// Satellites are propagated together once per epoch and the Greenwich angles of the whole grid come from one shared
+/// [`time::GreenwichTable`].  The result is flattened in (time, sensor, satellite, `XA_TOPO_*`) order, with the
+/// optional visibility mask in (time, sensor, satellite) order as in [`get_network_topo`].  A satellite that fails to
+/// propagate at an epoch gets NaN components and is marked not visible there instead of failing the whole grid.
+pub fn get_network_topo_from_keys(
+    sen_keys: &[i64],
+    sat_keys: &[i64],
+    ds50_utcs: &[f64],
+    visibility: bool,
+) -> Result<(Vec<f64>, Option<Vec<bool>>), String> {
+    let sites = network_sites(sen_keys)?;
+    let pairs = ds50_utcs.len() * sites.len() * sat_keys.len();
+    let mut topo = Vec::with_capacity(pairs * astro::XA_TOPO_SIZE);
+    let mut visible = visibility.then(|| Vec::with_capacity(pairs));
+    let greenwich = time::get_cached_greenwich_table(ds50_utcs, None)?;
+    for (&ds50_utc, &greenwich_angle) in ds50_utcs.iter().zip(&greenwich.angles) {
+        let posvels = sgp4::get_positions_velocities_with_status(sat_keys, ds50_utc, false);
+        push_network_topo(&sites, &posvels.values, greenwich_angle, &mut topo, &mut visible)?;
+    }
+    Ok((topo, visible))
+}
+
 #[cfg(test)]
 mod tests {
     use super::*;
@@ -1078,4 +1460,135 @@ mod tests {
         assert!(sensor.elevation_rate_noise.is_none());
         assert_eq!(sensor.description.as_deref(), Some("SOCORRO CAM1"));
     }
+
+    #[test]
+    fn test_limits_visibility() {
+        let _lock = TEST_LOCK.lock().unwrap();
+        load_file("tests/data/sensors.dat").unwrap();
+        let keys = get_keys(IDX_ORDER_READ);
+        let (xa_sen, _) = get_arrays(keys[0]).unwrap();
+        let limits = get_limits(keys[0]).unwrap();
+        clear().unwrap();
+        assert_eq!(limits.apply_range_limits, xa_sen[XA_SEN_GEN_RNGLIMFLG] == 0.0);
+        assert_eq!(limits.maximum_range, xa_sen[XA_SEN_GEN_MAXRNG]);
+        assert_eq!(limits.minimum_range, xa_sen[XA_SEN_GEN_MINRNG]);
+    }
+
+    #[test]
+    fn test_limits_azimuth_wrap() {
+        let limits = SensorLimits {
+            view_type: "D".to_string(),
+            observation_type: "4".to_string(),
+            minimum_range: 100.0,
+            maximum_range: 5000.0,
+            range_rate_limit: 0.0,
+            apply_range_limits: true,
+            elevation_limits: [10.0, 0.0],
+            azimuth_limits: [300.0, 60.0],
+            elevation_limits_2: [0.0, 0.0],
+            azimuth_limits_2: [0.0, 0.0],
+            interval: 0.0,
+            maximum_points_per_pass: 0,
+            earth_limb: 0.0,
+            solar_exclusion_angle: 0.0,
+            lunar_exclusion_angle: 0.0,
+            minimum_illumination: 0.0,
+            twilight: 0.0,
+        };
+        assert!(limits.is_visible(10.0, 45.0, 1000.0));
+        assert!(limits.is_visible(330.0, 45.0, 1000.0));
+        assert!(!limits.is_visible(180.0, 45.0, 1000.0));
+        assert!(!limits.is_visible(10.0, 5.0, 1000.0));
+        assert!(!limits.is_visible(10.0, 45.0, 6000.0));
+        assert!(!limits.is_visible(10.0, 45.0, 50.0));
+    }
+
+    #[test]
+    fn test_registry_lookup_and_invalidation() {
+        let _lock = TEST_LOCK.lock().unwrap();
+        load_card(SENSOR_CARD).unwrap();
+        load_card(NOISE_CARD).unwrap();
+        let keys = get_keys(IDX_ORDER_READ);
+        let key = keys[keys.len() - 1];
+        let by_key = get_registered(key).unwrap();
+        let by_number = get_registered_by_number(211).unwrap();
+        let lla = by_key.lla.unwrap();
+        let efg = by_key.efg.unwrap();
+        remove(key).unwrap();
+        let removed = get_registered(key);
+        clear().unwrap();
+
+        assert!(Arc::ptr_eq(&by_key, &by_number));
+        assert_eq!(by_key.sensor.number, 211);
+        assert_eq!(efg, astro::llh_to_efg(&lla));
+        assert!(removed.is_err());
+    }
+
+    #[test]
+    fn test_network_topo_matches_single_calls() {
+        let _lock = TEST_LOCK.lock().unwrap();
+        let line_1 = "1 33333U 15058A   25363.54791667 +.00012345  10000-1  20000-1 4  900";
+        let line_2 = "2 33333  30.0000  40.0000 0005000  60.0000  70.0000  8.2345678012345";
+        let epoch = 27757.54791667;
+        load_file("tests/data/sensors.dat").unwrap();
+        prune_missing_locations().unwrap();
+        let sat_key = crate::tle::load_lines(line_1, line_2);
+        sgp4::load(sat_key).unwrap();
+        let sen_keys: Vec<i64> = get_keys(IDX_ORDER_READ).into_iter().take(3).collect();
+        let times = [epoch, epoch + 0.01];
+        let (topo, visible) = get_network_topo_from_keys(&sen_keys, &[sat_key], &times, true).unwrap();
+        let (pos, vel) = sgp4::get_position_velocity(sat_key, times[1]).unwrap();
+        let posvel = [pos[0], pos[1], pos[2], vel[0], vel[1], vel[2]];
+        let (state_topo, no_mask) = get_network_topo(&sen_keys, &[posvel], times[1], false).unwrap();
+        let site = get_registered(sen_keys[2]).unwrap();
+        let lla = site.lla.unwrap();
+        let lst = astro::get_local_sidereal_time(times[1], lla[1]);
+        let single = astro::teme_to_topo(lst, lla[0], &astro::lla_to_teme(times[1], &lla), &posvel).unwrap();
+        sgp4::remove(sat_key).unwrap();
+        crate::tle::remove(sat_key);
+        clear().unwrap();
+
+        assert_eq!(topo.len(), 2 * 3 * astro::XA_TOPO_SIZE);
+        assert_eq!(visible.unwrap().len(), 6);
+        assert!(no_mask.is_none());
+        assert_eq!(state_topo.len(), 3 * astro::XA_TOPO_SIZE);
+        for (a, b) in state_topo.iter().zip(&topo[3 * astro::XA_TOPO_SIZE..]) {
+            assert!((a - b).abs() < 1.0e-8);
+        }
+        for (a, b) in state_topo[2 * astro::XA_TOPO_SIZE..].iter().zip(&single) {
+            assert!((a - b).abs() < 1.0e-8);
+        }
+    }
+
+    #[test]
+    fn test_network_topo_marks_failed_satellites() {
+        let _lock = TEST_LOCK.lock().unwrap();
+        let line_1 = "1 33333U 15058A   25363.54791667 +.00012345  10000-1  20000-1 4  900";
+        let line_2 = "2 33333  30.0000  40.0000 0005000  60.0000  70.0000  8.2345678012345";
+        let epoch = 27757.54791667;
+        load_file("tests/data/sensors.dat").unwrap();
+        prune_missing_locations().unwrap();
+        let sat_key = crate::tle::load_lines(line_1, line_2);
+        sgp4::load(sat_key).unwrap();
+        let missing_key = 12345;
+        let sen_keys: Vec<i64> = get_keys(IDX_ORDER_READ).into_iter().take(2).collect();
+        let (topo, visible) = get_network_topo_from_keys(&sen_keys, &[missing_key, sat_key], &[epoch], true).unwrap();
+        let (loaded_topo, _) = get_network_topo_from_keys(&sen_keys, &[sat_key], &[epoch], false).unwrap();
+        sgp4::remove(sat_key).unwrap();
+        crate::tle::remove(sat_key);
+        clear().unwrap();
+
+        let visible = visible.unwrap();
+        assert_eq!(topo.len(), 2 * 2 * astro::XA_TOPO_SIZE);
+        for sensor in 0..2 {
+            let failed = &topo[2 * sensor * astro::XA_TOPO_SIZE..(2 * sensor + 1) * astro::XA_TOPO_SIZE];
+            let loaded = &topo[(2 * sensor + 1) * astro::XA_TOPO_SIZE..(2 * sensor + 2) * astro::XA_TOPO_SIZE];
+            assert!(failed.iter().all(|v| v.is_nan()));
+            assert!(!visible[2 * sensor]);
+            assert_eq!(
+                loaded,
+                &loaded_topo[sensor * astro::XA_TOPO_SIZE..(sensor + 1) * astro::XA_TOPO_SIZE]
+            );
+        }
+    }
 }
@@ -2,8 +2,10 @@
 #![allow(non_snake_case)]
 #![allow(dead_code)]
 use crate::{
-    GetSetString, get_last_error_message,
+    BatchStatus, DllError, GetSetString, astro, ensure_sgp4_license, ensure_time_constants, environment,
+    get_last_error_message, mark_sgp4_license_ready, stats, time,
     tle::{self, XA_TLE_AGOMGP},
+    with_buffer, with_buffers, with_str,
 };
 use std::os::raw::c_char;
 
@@ -221,21 +223,21 @@ unsafe extern "C" {
 }
 // Different return values of errCode from Sgp4 propagation
 // SGP4 propagates successfully
-pub static GP_ERR_NONE: i32 = 0;
+pub const GP_ERR_NONE: i32 = 0;
 // Bad FK model (FK5 must be selected)
-pub static GP_ERR_BADFK: i32 = 1;
+pub const GP_ERR_BADFK: i32 = 1;
 // A is negative
-pub static GP_ERR_ANEGATIVE: i32 = 2;
+pub const GP_ERR_ANEGATIVE: i32 = 2;
 // A is to large
-pub static GP_ERR_ATOOLARGE: i32 = 3;
+pub const GP_ERR_ATOOLARGE: i32 = 3;
 // Eccentricity is hyperbolic
-pub static GP_ERR_EHYPERPOLIC: i32 = 4;
+pub const GP_ERR_EHYPERPOLIC: i32 = 4;
 // Eccentricity is negative
-pub static GP_ERR_ENEGATIVE: i32 = 5;
+pub const GP_ERR_ENEGATIVE: i32 = 5;
 // Mean anomaly is too large
-pub static GP_ERR_MATOOLARGE: i32 = 6;
+pub const GP_ERR_MATOOLARGE: i32 = 6;
 // e**2 is too large
-pub static GP_ERR_E2TOOLARGE: i32 = 7;
+pub const GP_ERR_E2TOOLARGE: i32 = 7;
 
 // Different time types for passing to Sgp4PropAll
 // propagation time is in minutes since epoch
@@ -331,7 +333,7 @@ pub fn get_ephemeris(sat_key: i64, start: f64, stop: f64, step: f64, frame: i32)
     let array_size = num_steps * 7;
     let mut ephem_arr = vec![0.0; (array_size) as usize];
     let mut gen_ephem_pts = 0;
-    let result = unsafe {
+    let result = stats::timed_status("Sgp4GenEphems", || unsafe {
         Sgp4GenEphems(
             sat_key,
             start,
@@ -342,7 +344,7 @@ pub fn get_ephemeris(sat_key: i64, start: f64, stop: f64, step: f64, frame: i32)
             ephem_arr.as_mut_ptr(),
             &mut gen_ephem_pts,
         )
-    };
+    });
     match result {
         0 => {
             ephem_arr.truncate((gen_ephem_pts as usize) * 7);
@@ -359,12 +361,13 @@ pub fn array_to_ephemeris(
     step: f64,
     frame: i32,
 ) -> Result<Vec<f64>, String> {
+    ensure_initialized()?;
     let step_days = step / (24.0 * 60.0);
     let num_steps = (((stop - start) / step_days).ceil()) as i32 + 1;
     let array_size = num_steps * 7;
     let mut ephem_arr = vec![0.0; (array_size) as usize];
     let mut gen_ephem_pts = 0;
-    let result = unsafe {
+    let result = stats::timed_status("Sgp4GenEphems_OS", || unsafe {
         Sgp4GenEphems_OS(
             xa_tle,
             start,
@@ -375,7 +378,7 @@ pub fn array_to_ephemeris(
             ephem_arr.as_mut_ptr(),
             &mut gen_ephem_pts,
         )
-    };
+    });
     match result {
         0 => {
             ephem_arr.truncate((gen_ephem_pts as usize) * 7);
@@ -391,6 +394,7 @@ pub fn fit_xp_array(
     ballistic_coefficient: Option<f64>,
     srp_coefficient: Option<f64>,
 ) -> Result<[f64; tle::XA_TLE_SIZE], String> {
+    ensure_initialized()?;
     let pos = [posvel[0], posvel[1], posvel[2]];
     let vel = [posvel[3], posvel[4], posvel[5]];
     let mut xa_tle = [0.0; tle::XA_TLE_SIZE];
@@ -398,7 +402,9 @@ pub fn fit_xp_array(
     xa_tle[tle::XA_TLE_EPHTYPE] = tle::TLETYPE_XP as f64;
     xa_tle[XA_TLE_AGOMGP] = srp_coefficient.unwrap_or(0.0);
     xa_tle[tle::XA_TLE_BTERM] = ballistic_coefficient.unwrap_or(0.0);
-    let result = unsafe { Sgp4PosVelToTleArr(&pos, &vel, &mut xa_tle) };
+    let result = stats::timed_status("Sgp4PosVelToTleArr", || unsafe {
+        Sgp4PosVelToTleArr(&pos, &vel, &mut xa_tle)
+    });
     match result {
         0 => Ok(xa_tle),
         _ => Err(get_last_error_message()),
@@ -406,21 +412,31 @@ pub fn fit_xp_array(
 }
 
 pub fn fit_sgp4_array(epoch: f64, posvel: &[f64; 6], b_star: Option<f64>) -> Result<[f64; tle::XA_TLE_SIZE], String> {
+    ensure_initialized()?;
     let pos = [posvel[0], posvel[1], posvel[2]];
     let vel = [posvel[3], posvel[4], posvel[5]];
     let mut xa_tle = [0.0; tle::XA_TLE_SIZE];
     xa_tle[tle::XA_TLE_EPOCH] = epoch;
     xa_tle[tle::XA_TLE_EPHTYPE] = tle::TLETYPE_SGP4 as f64;
     xa_tle[tle::XA_TLE_BSTAR] = b_star.unwrap_or(0.0);
-    let result = unsafe { Sgp4PosVelToTleArr(&pos, &vel, &mut xa_tle) };
+    let result = stats::timed_status("Sgp4PosVelToTleArr", || unsafe {
+        Sgp4PosVelToTleArr(&pos, &vel, &mut xa_tle)
+    });
     match result {
         0 => Ok(xa_tle),
         _ => Err(get_last_error_message()),
     }
 }
 
+// Satellites can only be propagated after `Sgp4InitSat`, so the license and timing constants are set up there.
+fn ensure_initialized() -> Result<(), String> {
+    ensure_sgp4_license()?;
+    ensure_time_constants()
+}
+
 pub fn load(sat_key: i64) -> Result<(), String> {
-    let result = unsafe { Sgp4InitSat(sat_key) };
+    ensure_initialized()?;
+    let result = stats::timed_status("Sgp4InitSat", || unsafe { Sgp4InitSat(sat_key) });
     match result {
         0 => Ok(()),
         _ => Err(get_last_error_message()),
@@ -430,15 +446,64 @@ pub fn load(sat_key: i64) -> Result<(), String> {
 pub fn get_positions_velocities(sat_keys: &[i64], ds50_utc: f64) -> Result<Vec<f64>, String> {
     let num_of_sats = sat_keys.len() as i32;
     let mut ephem_arr = vec![0.0; (num_of_sats * 6) as usize];
-    let result = unsafe { Sgp4PropAllSats(sat_keys.as_ptr(), num_of_sats, ds50_utc, ephem_arr.as_mut_ptr()) };
+    let result = stats::timed_status("Sgp4PropAllSats", || unsafe {
+        Sgp4PropAllSats(sat_keys.as_ptr(), num_of_sats, ds50_utc, ephem_arr.as_mut_ptr())
+    });
     match result {
         0 => Ok(ephem_arr),
         _ => Err(get_last_error_message()),
     }
 }
 
+/// Propagate each satellite to `ds50_utc` independently, returning `[x, y, z, vx, vy, vz]` TEME rows with a status
+/// code per satellite.
+///
+/// Unlike [`get_positions_velocities`], a satellite that fails to propagate (e.g. a decayed elset returning one of the
+/// `GP_ERR_*` codes) only fills its own row with NaN.  DLL error messages are read for failed rows when `messages` is
+/// set; [`get_error_description`] gives the static meaning of a code without touching the DLL.
+pub fn get_positions_velocities_with_status(sat_keys: &[i64], ds50_utc: f64, messages: bool) -> BatchStatus<[f64; 6]> {
+    let mut values = vec![[f64::NAN; 6]; sat_keys.len()];
+    let mut codes = vec![GP_ERR_NONE; sat_keys.len()];
+    let mut failures = messages.then(|| vec![None; sat_keys.len()]);
+    for (i, &sat_key) in sat_keys.iter().enumerate() {
+        let mut pos = [0.0; 3];
+        let mut vel = [0.0; 3];
+        let result = stats::timed_status("Sgp4PropDs50UtcPosVel", || unsafe {
+            Sgp4PropDs50UtcPosVel(sat_key, ds50_utc, &mut pos, &mut vel)
+        });
+        if result == 0 {
+            values[i] = [pos[0], pos[1], pos[2], vel[0], vel[1], vel[2]];
+        } else {
+            codes[i] = result;
+            if let Some(failures) = failures.as_mut() {
+                failures[i] = Some(get_last_error_message());
+            }
+        }
+    }
+    BatchStatus {
+        values,
+        codes,
+        messages: failures,
+    }
+}
+
+/// Return the meaning of a `GP_ERR_*` propagation code, or `None` for codes outside that set.
+pub fn get_error_description(code: i32) -> Option<&'static str> {
+    match code {
+        GP_ERR_NONE => Some("SGP4 propagates successfully"),
+        GP_ERR_BADFK => Some("Bad FK model (FK5 must be selected)"),
+        GP_ERR_ANEGATIVE => Some("A is negative"),
+        GP_ERR_ATOOLARGE => Some("A is too large"),
+        GP_ERR_EHYPERPOLIC => Some("Eccentricity is hyperbolic"),
+        GP_ERR_ENEGATIVE => Some("Eccentricity is negative"),
+        GP_ERR_MATOOLARGE => Some("Mean anomaly is too large"),
+        GP_ERR_E2TOOLARGE => Some("e**2 is too large"),
+        _ => None,
+    }
+}
+
 pub fn remove(sat_key: i64) -> Result<(), String> {
-    let result = unsafe { Sgp4RemoveSat(sat_key) };
+    let result = stats::timed_status("Sgp4RemoveSat", || unsafe { Sgp4RemoveSat(sat_key) });
     match result {
         0 => Ok(()),
         _ => Err(get_last_error_message()),
@@ -446,7 +511,7 @@ pub fn remove(sat_key: i64) -> Result<(), String> {
 }
 
 pub fn clear() -> Result<(), String> {
-    let result = unsafe { Sgp4RemoveAllSats() };
+    let result = stats::timed_status("Sgp4RemoveAllSats", || unsafe { Sgp4RemoveAllSats() });
     match result {
         0 => Ok(()),
         _ => Err(get_last_error_message()),
@@ -456,98 +521,266 @@ pub fn clear() -> Result<(), String> {
 type MSEPosVelLLH = (f64, [f64; 3], [f64; 3], [f64; 3]);
 
 pub fn get_position_velocity_lla(sat_key: i64, ds50_utc: f64) -> Result<MSEPosVelLLH, String> {
+    get_position_velocity_lla_with_code(sat_key, ds50_utc).map_err(String::from)
+}
+
+/// [`get_position_velocity_lla`] keeping the DLL return code of a failed propagation.
+pub(crate) fn get_position_velocity_lla_with_code(sat_key: i64, ds50_utc: f64) -> Result<MSEPosVelLLH, DllError> {
     let mut mse = 0.0;
     let mut pos = [0.0; 3];
     let mut vel = [0.0; 3];
     let mut llh = [0.0; 3];
-    let result = unsafe { Sgp4PropDs50UTC(sat_key, ds50_utc, &mut mse, &mut pos, &mut vel, &mut llh) };
+    let result = stats::timed_status("Sgp4PropDs50UTC", || unsafe {
+        Sgp4PropDs50UTC(sat_key, ds50_utc, &mut mse, &mut pos, &mut vel, &mut llh)
+    });
     match result {
         0 => Ok((mse, pos, vel, llh)),
-        _ => Err(get_last_error_message()),
+        _ => Err(DllError::from_code(result)),
     }
 }
 
 pub fn get_position_velocity(sat_key: i64, ds50_utc: f64) -> Result<([f64; 3], [f64; 3]), String> {
+    get_position_velocity_with_code(sat_key, ds50_utc).map_err(String::from)
+}
+
+/// [`get_position_velocity`] keeping the DLL return code of a failed propagation.
+pub(crate) fn get_position_velocity_with_code(sat_key: i64, ds50_utc: f64) -> Result<([f64; 3], [f64; 3]), DllError> {
     let mut pos = [0.0; 3];
     let mut vel = [0.0; 3];
-    let result = unsafe { Sgp4PropDs50UtcPosVel(sat_key, ds50_utc, &mut pos, &mut vel) };
+    let result = stats::timed_status("Sgp4PropDs50UtcPosVel", || unsafe {
+        Sgp4PropDs50UtcPosVel(sat_key, ds50_utc, &mut pos, &mut vel)
+    });
     match result {
         0 => Ok((pos, vel)),
-        _ => Err(get_last_error_message()),
+        _ => Err(DllError::from_code(result)),
     }
 }
 
 pub fn get_lla(sat_key: i64, ds50_utc: f64) -> Result<[f64; 3], String> {
+    get_lla_with_code(sat_key, ds50_utc).map_err(String::from)
+}
+
+/// [`get_lla`] keeping the DLL return code of a failed propagation.
+pub(crate) fn get_lla_with_code(sat_key: i64, ds50_utc: f64) -> Result<[f64; 3], DllError> {
     let mut llh = [0.0; 3];
-    let result = unsafe { Sgp4PropDs50UtcLLH(sat_key, ds50_utc, &mut llh) };
+    let result = stats::timed_status("Sgp4PropDs50UtcLLH", || unsafe {
+        Sgp4PropDs50UtcLLH(sat_key, ds50_utc, &mut llh)
+    });
     match result {
         0 => Ok(llh),
-        _ => Err(get_last_error_message()),
+        _ => Err(DllError::from_code(result)),
     }
 }
 
 pub fn get_position(sat_key: i64, ds50_utc: f64) -> Result<[f64; 3], String> {
+    get_position_with_code(sat_key, ds50_utc).map_err(String::from)
+}
+
+/// [`get_position`] keeping the DLL return code of a failed propagation.
+pub(crate) fn get_position_with_code(sat_key: i64, ds50_utc: f64) -> Result<[f64; 3], DllError> {
     let mut pos = [0.0; 3];
-    let result = unsafe { Sgp4PropDs50UtcPos(sat_key, ds50_utc, &mut pos) };
+    let result = stats::timed_status("Sgp4PropDs50UtcPos", || unsafe {
+        Sgp4PropDs50UtcPos(sat_key, ds50_utc, &mut pos)
+    });
     match result {
         0 => Ok(pos),
-        _ => Err(get_last_error_message()),
+        _ => Err(DllError::from_code(result)),
     }
 }
 
 pub fn get_full_state(sat_key: i64, ds50_utc: f64) -> Result<[f64; XA_SGP4OUT_SIZE], String> {
+    get_full_state_with_code(sat_key, ds50_utc).map_err(String::from)
+}
+
+/// [`get_full_state`] keeping the DLL return code of a failed propagation.
+pub(crate) fn get_full_state_with_code(sat_key: i64, ds50_utc: f64) -> Result<[f64; XA_SGP4OUT_SIZE], DllError> {
     let mut all = [0.0; XA_SGP4OUT_SIZE];
-    let result = unsafe { Sgp4PropAll(sat_key, SGP4_TIMETYPE_DS50UTC, ds50_utc, &mut all) };
+    let result = stats::timed_status("Sgp4PropAll", || unsafe {
+        Sgp4PropAll(sat_key, SGP4_TIMETYPE_DS50UTC, ds50_utc, &mut all)
+    });
     match result {
         0 => Ok(all),
-        _ => Err(get_last_error_message()),
+        _ => Err(DllError::from_code(result)),
     }
 }
 
 pub fn get_equinoctial(sat_key: i64, ds50_utc: f64) -> Result<[f64; 6], String> {
+    get_equinoctial_with_code(sat_key, ds50_utc).map_err(String::from)
+}
+
+/// [`get_equinoctial`] keeping the DLL return code of a failed propagation.
+pub(crate) fn get_equinoctial_with_code(sat_key: i64, ds50_utc: f64) -> Result<[f64; 6], DllError> {
     let mut xa_eqnx = [0.0; 6];
     let mut xa_eqnx_dot = [0.0; 6];
-    let result = unsafe { XpGetNativeElts(sat_key, ds50_utc, &mut xa_eqnx, &mut xa_eqnx_dot) };
+    let result = stats::timed_status("XpGetNativeElts", || unsafe {
+        XpGetNativeElts(sat_key, ds50_utc, &mut xa_eqnx, &mut xa_eqnx_dot)
+    });
     match result {
         0 => Ok(xa_eqnx),
-        _ => Err(get_last_error_message()),
+        _ => Err(DllError::from_code(result)),
     }
 }
 
 pub fn get_dll_info() -> String {
-    let mut info = GetSetString::new();
-    unsafe {
-        Sgp4GetInfo(info.pointer());
-    }
-    info.value()
+    with_buffer(|info| {
+        stats::timed("Sgp4GetInfo", || unsafe { Sgp4GetInfo(info.pointer()) });
+        info.value()
+    })
 }
 
 pub fn get_count() -> i32 {
-    unsafe { Sgp4GetCount() }
+    stats::timed("Sgp4GetCount", || unsafe { Sgp4GetCount() })
 }
 
 pub fn set_license_directory(file_path: &str) {
-    let mut lic_file: GetSetString = file_path.into();
-    unsafe { Sgp4SetLicFilePath(lic_file.pointer()) };
+    with_str(file_path, |lic_file| {
+        stats::timed("Sgp4SetLicFilePath", || unsafe {
+            Sgp4SetLicFilePath(lic_file.pointer())
+        })
+    });
+    mark_sgp4_license_ready();
 }
 
 pub fn get_license_directory() -> String {
-    let mut c_str = GetSetString::new();
-    unsafe { Sgp4GetLicFilePath(c_str.pointer()) };
-    c_str.value().trim().to_string()
+    let _ = ensure_sgp4_license();
+    with_buffer(|c_str| {
+        stats::timed("Sgp4GetLicFilePath", || unsafe { Sgp4GetLicFilePath(c_str.pointer()) });
+        c_str.as_str().trim().to_string()
+    })
 }
 
 pub fn reepoch_tle(sat_key: i64, re_epoch_ds50_utc: f64) -> Result<(String, String), String> {
-    let mut line1_out = GetSetString::new();
-    let mut line2_out = GetSetString::new();
-    let result = unsafe { Sgp4ReepochTLE(sat_key, re_epoch_ds50_utc, line1_out.pointer(), line2_out.pointer()) };
-    match result {
-        0 => Ok((
-            line1_out.value().trim().to_string(),
-            line2_out.value().trim().to_string(),
-        )),
-        _ => Err(get_last_error_message()),
+    with_buffers(|[line1_out, line2_out]: &mut [GetSetString; 2]| {
+        let result = stats::timed_status("Sgp4ReepochTLE", || unsafe {
+            Sgp4ReepochTLE(sat_key, re_epoch_ds50_utc, line1_out.pointer(), line2_out.pointer())
+        });
+        match result {
+            0 => Ok((
+                line1_out.as_str().trim().to_string(),
+                line2_out.as_str().trim().to_string(),
+            )),
+            _ => Err(get_last_error_message()),
+        }
+    })
+}
+
+fn wrap_longitude(longitude: f64) -> f64 {
+    (longitude + 180.0).rem_euclid(360.0) - 180.0
+}
+
+fn split_at_antimeridian(points: &[[f64; 4]]) -> Vec<Vec<[f64; 4]>> {
+    let mut segments = vec![Vec::new()];
+    for (i, point) in points.iter().enumerate() {
+        if i > 0 {
+            let previous = points[i - 1];
+            let jump = point[2] - previous[2];
+            if jump.abs() > 180.0 {
+                // Interpolate the crossing on the unwrapped longitude and close/open the segments at +-180
+                let edge = if jump < 0.0 { 180.0 } else { -180.0 };
+                let unwrapped = point[2] + if jump < 0.0 { 360.0 } else { -360.0 };
+                let fraction = (edge - previous[2]) / (unwrapped - previous[2]);
+                let cross = |k: usize| previous[k] + fraction * (point[k] - previous[k]);
+                segments.last_mut().unwrap().push([cross(0), cross(1), edge, cross(3)]);
+                segments.push(vec![[cross(0), cross(1), -edge, cross(3)]]);
+            }
+        }
+        segments.last_mut().unwrap().push(*point);
     }
+    segments
+}
+
+fn simplify_track(points: &[[f64; 4]], tolerance_deg: f64) -> Vec<[f64; 4]> {
+    if points.len() < 3 {
+        return points.to_vec();
+    }
+    let mut keep = vec![false; points.len()];
+    keep[0] = true;
+    keep[points.len() - 1] = true;
+    let mut spans = vec![(0, points.len() - 1)];
+    while let Some((first, last)) = spans.pop() {
+        let (a, b) = (points[first], points[last]);
+        let (dx, dy) = (b[2] - a[2], b[1] - a[1]);
+        let length = dx.hypot(dy);
+        let mut farthest = (0.0, first);
+        for (i, p) in points.iter().enumerate().take(last).skip(first + 1) {
+            let distance = if length == 0.0 {
+                (p[2] - a[2]).hypot(p[1] - a[1])
+            } else {
+                (dx * (a[1] - p[1]) - dy * (a[2] - p[2])).abs() / length
+            };
+            if distance > farthest.0 {
+                farthest = (distance, i);
+            }
+        }
+        if farthest.0 > tolerance_deg {
+            keep[farthest.1] = true;
+            spans.push((first, farthest.1));
+            spans.push((farthest.1, last));
+        }
+    }
+    points.iter().zip(keep).filter(|(_, k)| *k).map(|(p, _)| *p).collect()
+}
+
+/// Generate the ground track of a loaded satellite as `[ds50_utc, latitude, longitude, altitude]` rows.
+///
+/// Points are propagated every `step_minutes` over the window and converted from TEME to geodetic coordinates in one
+/// native pass: one Greenwich angle table for the grid (shared across satellites on the same grid), a rotation about
+/// the pole and an ellipsoid conversion in Rust, with longitudes wrapped to [-180, 180).  With `split_antimeridian`,
+/// crossings are interpolated to +-180 and the segments are separated by a row of NaN so plotted lines do not wrap
+/// across the map.  A `tolerance_deg` drops points that lie within that many degrees (Douglas-Peucker on
+/// latitude/longitude) of the simplified track, keeping each segment's end points.
+pub fn get_ground_track(
+    sat_key: i64,
+    start: f64,
+    stop: f64,
+    step_minutes: f64,
+    split_antimeridian: bool,
+    tolerance_deg: Option<f64>,
+) -> Result<Vec<[f64; 4]>, String> {
+    let ephemeris = get_ephemeris(sat_key, start, stop, step_minutes, SGP4_EPHEM_ECI)?;
+    let epochs: Vec<f64> = ephemeris.chunks_exact(7).map(|row| row[0]).collect();
+    let greenwich = time::get_cached_greenwich_table(&epochs, None)?;
+    let earth = environment::get_earth_constants();
+    let points: Vec<[f64; 4]> = ephemeris
+        .chunks_exact(7)
+        .zip(&greenwich.angles)
+        .map(|(row, &gst)| {
+            let efg = astro::gst_teme_to_efg_position(gst, &[row[1], row[2], row[3]]);
+            let lla = astro::ellipsoid_efg_to_lla(&efg, earth.radius, earth.flattening);
+            [row[0], lla[0], wrap_longitude(lla[1]), lla[2]]
+        })
+        .collect();
+    let segments = if split_antimeridian {
+        split_at_antimeridian(&points)
+    } else {
+        vec![points]
+    };
+    let mut track = Vec::new();
+    for (i, segment) in segments.iter().enumerate() {
+        if i > 0 {
+            track.push([f64::NAN; 4]);
+        }
+        match tolerance_deg {
+            Some(tolerance_deg) => track.extend(simplify_track(segment, tolerance_deg)),
+            None => track.extend_from_slice(segment),
+        }
+    }
+    Ok(track)
+}
+
+/// Generate [`get_ground_track`] for each satellite.
+pub fn get_ground_tracks(
+    sat_keys: &[i64],
+    start: f64,
+    stop: f64,
+    step_minutes: f64,
+    split_antimeridian: bool,
+    tolerance_deg: Option<f64>,
+) -> Result<Vec<Vec<[f64; 4]>>, String> {
+    sat_keys
+        .iter()
+        .map(|&sat_key| get_ground_track(sat_key, start, stop, step_minutes, split_antimeridian, tolerance_deg))
+        .collect()
 }
 
 #[cfg(test)]
@@ -836,4 +1069,68 @@ mod tests {
         let info = get_dll_info();
         assert!(info.contains(DLL_VERSION));
     }
+
+    #[test]
+    fn test_ground_track() {
+        let _lock = TEST_LOCK.lock().unwrap();
+        let xp_key = tle::load_lines(XP_LINE_1, XP_LINE_2);
+        load(xp_key).unwrap();
+        let full = get_ground_track(xp_key, EPOCH, EPOCH + 1.0, 1.0, false, None).unwrap();
+        let split = get_ground_track(xp_key, EPOCH, EPOCH + 1.0, 1.0, true, None).unwrap();
+        let coarse = get_ground_track(xp_key, EPOCH, EPOCH + 1.0, 1.0, true, Some(0.5)).unwrap();
+        let lla = get_lla(xp_key, EPOCH).unwrap();
+        let _ = clear();
+        let _ = tle::clear();
+
+        assert_abs_diff_eq!(full[0][0], EPOCH, epsilon = 1.0e-9);
+        assert_abs_diff_eq!(full[0][1], lla[0], epsilon = 1.0e-4);
+        assert_abs_diff_eq!(full[0][2], lla[1] - 360.0, epsilon = 1.0e-4);
+        assert_abs_diff_eq!(full[0][3], lla[2], epsilon = 1.0e-2);
+        assert!(full.iter().all(|p| (-180.0..180.0).contains(&p[2])));
+        let breaks = split.iter().filter(|p| p[0].is_nan()).count();
+        assert!(breaks > 0);
+        assert_eq!(split.len(), full.len() + 3 * breaks);
+        for window in split.windows(2) {
+            if !window[0][0].is_nan() && !window[1][0].is_nan() {
+                assert!((window[1][2] - window[0][2]).abs() <= 180.0);
+            }
+        }
+        assert!(coarse.len() < split.len());
+        assert_eq!(coarse.iter().filter(|p| p[0].is_nan()).count(), breaks);
+    }
+
+    #[test]
+    fn test_positions_velocities_with_status() {
+        let _lock = TEST_LOCK.lock().unwrap();
+        let sgp4_key = tle::load_lines(SGP4_LINE_1, SGP4_LINE_2);
+        let xp_key = tle::load_lines(XP_LINE_1, XP_LINE_2);
+        load(sgp4_key).unwrap();
+        load(xp_key).unwrap();
+        let missing_key = 12345;
+        let sat_keys = [sgp4_key, missing_key, xp_key];
+        let quiet = get_positions_velocities_with_status(&sat_keys, EPOCH, false);
+        let verbose = get_positions_velocities_with_status(&sat_keys, EPOCH, true);
+        let error = get_position_velocity_with_code(missing_key, EPOCH).unwrap_err();
+        let _ = clear();
+        let _ = tle::clear();
+
+        assert!(!quiet.is_ok());
+        assert_eq!(quiet.failed(), vec![1]);
+        assert_eq!(quiet.codes[0], GP_ERR_NONE);
+        assert_eq!(quiet.codes[2], GP_ERR_NONE);
+        assert_ne!(quiet.codes[1], GP_ERR_NONE);
+        assert_eq!(quiet.codes[1], error.code);
+        assert!(quiet.messages.is_none());
+        assert_abs_diff_eq!(quiet.values[0][0], SGP4_X, epsilon = 1.0e-9);
+        assert_abs_diff_eq!(quiet.values[0][5], SGP4_VZ, epsilon = 1.0e-9);
+        assert!(quiet.values[1].iter().all(|v| v.is_nan()));
+        assert_abs_diff_eq!(quiet.values[2][0], XP_X, epsilon = 1.0e-9);
+        assert_abs_diff_eq!(quiet.values[2][5], XP_VZ, epsilon = 1.0e-9);
+        let messages = verbose.messages.unwrap();
+        assert!(messages[0].is_none());
+        assert!(messages[1].is_some());
+        assert!(messages[2].is_none());
+        assert_eq!(get_error_description(GP_ERR_ATOOLARGE), Some("A is too large"));
+        assert_eq!(get_error_description(-99), None);
+    }
 }
@@ -0,0 +1,244 @@
+//! Opt-in call statistics for the SAAL DLL entry points.
+//!
+//! Every `unsafe extern "C"` call site in the crate goes through [`timed`] or [`timed_status`].  While collection is
+//! disabled (the default) those wrappers are a single relaxed atomic load in front of the call; once enabled with
+//! [`set_enabled`] or the `SAAL_STATS` environment variable, each call records its count, cumulative and histogram
+//! latency and, for status-returning functions, its error count.
+use std::collections::HashMap;
+use std::fmt::Write;
+use std::sync::atomic::{AtomicBool, Ordering};
+use std::sync::{LazyLock, Mutex, MutexGuard};
+use std::time::Instant;
+
+/// Upper bounds (inclusive, nanoseconds) of the latency histogram buckets; the last bucket is unbounded.
+pub const LATENCY_BUCKETS_NS: [u64; 12] = [
+    500,
+    1_000,
+    2_500,
+    5_000,
+    10_000,
+    25_000,
+    50_000,
+    100_000,
+    250_000,
+    1_000_000,
+    10_000_000,
+    100_000_000,
+];
+
+/// Number of histogram buckets, including the unbounded overflow bucket.
+pub const BUCKET_COUNT: usize = LATENCY_BUCKETS_NS.len() + 1;
+
+/// Accumulated statistics for one DLL function.
+#[derive(Debug, Clone, Copy, PartialEq, Eq, Default)]
+pub struct FunctionStats {
+    pub calls: u64,
+    pub errors: u64,
+    pub total_ns: u64,
+    pub max_ns: u64,
+    /// Per-bucket (non-cumulative) call counts matching [`LATENCY_BUCKETS_NS`] plus the overflow bucket.
+    pub buckets: [u64; BUCKET_COUNT],
+}
+
+impl FunctionStats {
+    /// Mean latency in nanoseconds, or zero when the function has not been called.
+    pub fn mean_ns(&self) -> f64 {
+        if self.calls == 0 {
+            0.0
+        } else {
+            self.total_ns as f64 / self.calls as f64
+        }
+    }
+
+    fn record(&mut self, elapsed_ns: u64, failed: bool) {
+        self.calls += 1;
+        self.errors += failed as u64;
+        self.total_ns = self.total_ns.saturating_add(elapsed_ns);
+        self.max_ns = self.max_ns.max(elapsed_ns);
+        let bucket = LATENCY_BUCKETS_NS.partition_point(|&bound| bound < elapsed_ns);
+        self.buckets[bucket] += 1;
+    }
+}
+
+static ENABLED: AtomicBool = AtomicBool::new(false);
+
+static STATS: LazyLock<Mutex<HashMap<&'static str, FunctionStats>>> = LazyLock::new(|| Mutex::new(HashMap::new()));
+
+fn lock_stats() -> MutexGuard<'static, HashMap<&'static str, FunctionStats>> {
+    STATS.lock().unwrap_or_else(|e| e.into_inner())
+}
+
+/// Turn collection on or off; already recorded statistics are kept.
+pub fn set_enabled(enabled: bool) {
+    ENABLED.store(enabled, Ordering::Relaxed);
+}
+
+/// Whether DLL calls are currently being recorded.
+pub fn is_enabled() -> bool {
+    ENABLED.load(Ordering::Relaxed)
+}
+
+/// Discard all recorded statistics.
+pub fn reset() {
+    lock_stats().clear();
+}
+
+fn record(name: &'static str, started: Instant, failed: bool) {
+    let elapsed_ns = u64::try_from(started.elapsed().as_nanos()).unwrap_or(u64::MAX);
+    lock_stats().entry(name).or_default().record(elapsed_ns, failed);
+}
+
+/// Run a DLL call, recording its latency under `name` when collection is enabled.
+#[inline(always)]
+pub fn timed<T>(name: &'static str, call: impl FnOnce() -> T) -> T {
+    if !ENABLED.load(Ordering::Relaxed) {
+        return call();
+    }
+    let started = Instant::now();
+    let value = call();
+    record(name, started, false);
+    value
+}
+
+/// Run a DLL call that returns a SAAL status code, counting non-zero results as errors.
+#[inline(always)]
+pub fn timed_status(name: &'static str, call: impl FnOnce() -> i32) -> i32 {
+    if !ENABLED.load(Ordering::Relaxed) {
+        return call();
+    }
+    let started = Instant::now();
+    let status = call();
+    record(name, started, status != 0);
+    status
+}
+
+/// Statistics for every function called since the last [`reset`], sorted by function name.
+///
+/// Example:
+/// ```rust
+/// saal::stats::set_enabled(true);
+/// saal::time::ymd_components_to_ds50(2024, 1, 1, 0, 0, 0.0);
+/// let snapshot = saal::stats::snapshot();
+/// assert!(snapshot.iter().any(|(name, stats)| *name == "TimeComps2ToUTC" && stats.calls > 0));
+/// saal::stats::set_enabled(false);
+/// ```
+pub fn snapshot() -> Vec<(&'static str, FunctionStats)> {
+    let mut entries: Vec<_> = lock_stats().iter().map(|(name, stats)| (*name, *stats)).collect();
+    entries.sort_unstable_by_key(|(name, _)| *name);
+    entries
+}
+
+/// Statistics as a JSON document with the bucket bounds and one object per function.
+pub fn to_json() -> String {
+    let bounds = LATENCY_BUCKETS_NS.map(|bound| bound.to_string()).join(", ");
+    let mut json = format!(
+        "{{\n  \"enabled\": {},\n  \"bucket_bounds_ns\": [{}],\n  \"functions\": {{",
+        is_enabled(),
+        bounds
+    );
+    for (index, (name, stats)) in snapshot().iter().enumerate() {
+        let buckets = stats.buckets.map(|count| count.to_string()).join(", ");
+        let _ = write!(
+            json,
+            "{}\n    \"{}\": {{\"calls\": {}, \"errors\": {}, \"total_ns\": {}, \"max_ns\": {}, \"mean_ns\": {:.1}, \"buckets\": [{}]}}",
+            if index == 0 { "" } else { "," },
+            name,
+            stats.calls,
+            stats.errors,
+            stats.total_ns,
+            stats.max_ns,
+            stats.mean_ns(),
+            buckets
+        );
+    }
+    json.push_str("\n  }\n}\n");
+    json
+}
+
+/// Statistics in the Prometheus text exposition format.
+pub fn to_prometheus() -> String {
+    let snapshot = snapshot();
+    let mut text = String::new();
+    text.push_str("# HELP saal_ffi_calls_total Number of calls into the SAAL DLLs.\n");
+    text.push_str("# TYPE saal_ffi_calls_total counter\n");
+    for (name, stats) in &snapshot {
+        let _ = writeln!(text, "saal_ffi_calls_total{{function=\"{}\"}} {}", name, stats.calls);
+    }
+    text.push_str("# HELP saal_ffi_errors_total Number of SAAL DLL calls that returned an error status.\n");
+    text.push_str("# TYPE saal_ffi_errors_total counter\n");
+    for (name, stats) in &snapshot {
+        let _ = writeln!(text, "saal_ffi_errors_total{{function=\"{}\"}} {}", name, stats.errors);
+    }
+    text.push_str("# HELP saal_ffi_call_duration_seconds Latency of calls into the SAAL DLLs.\n");
+    text.push_str("# TYPE saal_ffi_call_duration_seconds histogram\n");
+    for (name, stats) in &snapshot {
+        let mut cumulative = 0;
+        for (bound, count) in LATENCY_BUCKETS_NS.iter().zip(stats.buckets.iter()) {
+            cumulative += count;
+            let _ = writeln!(
+                text,
+                "saal_ffi_call_duration_seconds_bucket{{function=\"{}\",le=\"{}\"}} {}",
+                name,
+                *bound as f64 / 1e9,
+                cumulative
+            );
+        }
+        let _ = writeln!(
+            text,
+            "saal_ffi_call_duration_seconds_bucket{{function=\"{}\",le=\"+Inf\"}} {}",
+            name, stats.calls
+        );
+        let _ = writeln!(
+            text,
+            "saal_ffi_call_duration_seconds_sum{{function=\"{}\"}} {}",
+            name,
+            stats.total_ns as f64 / 1e9
+        );
+        let _ = writeln!(
+            text,
+            "saal_ffi_call_duration_seconds_count{{function=\"{}\"}} {}",
+            name, stats.calls
+        );
+    }
+    text
+}
+
+#[cfg(test)]
+mod tests {
+    use super::*;
+    use crate::test_lock::TEST_LOCK;
+
+    #[test]
+    fn test_stats_collection() {
+        let _lock = TEST_LOCK.lock().unwrap();
+        set_enabled(false);
+        reset();
+        assert_eq!(timed("StatsTestCall", || 7), 7);
+        assert!(snapshot().iter().all(|(name, _)| *name != "StatsTestCall"));
+
+        set_enabled(true);
+        timed("StatsTestCall", || ());
+        assert_eq!(timed_status("StatsTestStatus", || 0), 0);
+        assert_eq!(timed_status("StatsTestStatus", || 2), 2);
+        set_enabled(false);
+
+        let snapshot = snapshot();
+        let call = snapshot.iter().find(|(name, _)| *name == "StatsTestCall").unwrap().1;
+        let status = snapshot.iter().find(|(name, _)| *name == "StatsTestStatus").unwrap().1;
+        assert_eq!(call.calls, 1);
+        assert_eq!(call.errors, 0);
+        assert_eq!(call.buckets.iter().sum::<u64>(), 1);
+        assert_eq!(status.calls, 2);
+        assert_eq!(status.errors, 1);
+
+        assert!(to_json().contains("\"StatsTestStatus\": {\"calls\": 2, \"errors\": 1"));
+        let prometheus = to_prometheus();
+        assert!(prometheus.contains("saal_ffi_calls_total{function=\"StatsTestCall\"} 1"));
+        assert!(
+            prometheus.contains("saal_ffi_call_duration_seconds_bucket{function=\"StatsTestStatus\",le=\"+Inf\"} 2")
+        );
+
+        reset();
+        assert!(snapshot().iter().all(|(name, _)| !name.starts_with("StatsTest")));
+    }
+}
@@ -1,8 +1,13 @@
 // This wrapper file was generated automatically by the GenDllWrappers program.
 #![allow(non_snake_case)]
 #![allow(dead_code)]
-use crate::{GetSetString, get_last_error_message};
+use crate::{
+    astro, ensure_time_constants, environment, get_last_error_message, mark_time_constants_ready, stats, with_buffer,
+    with_str,
+};
+use std::collections::VecDeque;
 use std::os::raw::c_char;
+use std::sync::{Arc, LazyLock, Mutex, RwLock};
 
 unsafe extern "C" {
     //  Returns the information about the TimeFunc DLL.  The information is placed in the string parameter you pass in.
@@ -183,11 +188,10 @@ unsafe extern "C" {
 /// true
 /// ```
 pub fn get_dll_info() -> String {
-    let mut info_str = GetSetString::new();
-    unsafe {
-        TimeFuncGetInfo(info_str.pointer());
-    }
-    info_str.value()
+    with_buffer(|info_str| {
+        stats::timed("TimeFuncGetInfo", || unsafe { TimeFuncGetInfo(info_str.pointer()) });
+        info_str.value()
+    })
 }
 
 /// Convert UTC date/time components to ds50 UTC.
@@ -205,7 +209,9 @@ pub fn get_dll_info() -> String {
 /// 2192.0
 /// ```
 pub fn ymd_components_to_ds50(year: i32, month: i32, day: i32, hour: i32, minute: i32, second: f64) -> f64 {
-    unsafe { TimeComps2ToUTC(year, month, day, hour, minute, second) }
+    stats::timed("TimeComps2ToUTC", || unsafe {
+        TimeComps2ToUTC(year, month, day, hour, minute, second)
+    })
 }
 
 /// Convert ds50 UTC to UTC date/time components.
@@ -229,7 +235,7 @@ pub fn ds50_to_ymd_components(ds50: f64) -> (i32, i32, i32, i32, i32, f64) {
     let mut hour = 0;
     let mut minute = 0;
     let mut second = 0.0;
-    unsafe {
+    stats::timed("UTCToTimeComps2", || unsafe {
         UTCToTimeComps2(
             ds50,
             &mut year,
@@ -239,7 +245,7 @@ pub fn ds50_to_ymd_components(ds50: f64) -> (i32, i32, i32, i32, i32, f64) {
             &mut minute,
             &mut second,
         )
-    };
+    });
     (year, month, day, hour, minute, second)
 }
 
@@ -258,8 +264,9 @@ pub fn ds50_to_ymd_components(ds50: f64) -> (i32, i32, i32, i32, i32, f64) {
 /// 2192.0
 /// ```
 pub fn dtg_to_ds50(dtg: &str) -> f64 {
-    let mut inout: GetSetString = dtg.into();
-    unsafe { DTGToUTC(inout.pointer()) }
+    with_str(dtg, |inout| {
+        stats::timed("DTGToUTC", || unsafe { DTGToUTC(inout.pointer()) })
+    })
 }
 
 /// Convert ds50 UTC to a DTG20 string.
@@ -277,9 +284,10 @@ pub fn dtg_to_ds50(dtg: &str) -> f64 {
 /// 1956/001 0000 00.000
 /// ```
 pub fn ds50_to_dtg20(ds50: f64) -> String {
-    let mut inout = GetSetString::new();
-    unsafe { UTCToDTG20(ds50, inout.pointer()) };
-    inout.value()
+    with_buffer(|inout| {
+        stats::timed("UTCToDTG20", || unsafe { UTCToDTG20(ds50, inout.pointer()) });
+        inout.value()
+    })
 }
 
 /// Convert ds50 UTC to a DTG19 string.
@@ -297,9 +305,10 @@ pub fn ds50_to_dtg20(ds50: f64) -> String {
 /// 1956Jan01000000.000
 /// ```
 pub fn ds50_to_dtg19(ds50: f64) -> String {
-    let mut inout = GetSetString::new();
-    unsafe { UTCToDTG19(ds50, inout.pointer()) };
-    inout.value()
+    with_buffer(|inout| {
+        stats::timed("UTCToDTG19", || unsafe { UTCToDTG19(ds50, inout.pointer()) });
+        inout.value()
+    })
 }
 
 /// Convert ds50 UTC to a DTG17 string.
@@ -317,9 +326,10 @@ pub fn ds50_to_dtg19(ds50: f64) -> String {
 /// 1956/001.00000000
 /// ```
 pub fn ds50_to_dtg17(ds50: f64) -> String {
-    let mut inout = GetSetString::new();
-    unsafe { UTCToDTG17(ds50, inout.pointer()) };
-    inout.value()
+    with_buffer(|inout| {
+        stats::timed("UTCToDTG17", || unsafe { UTCToDTG17(ds50, inout.pointer()) });
+        inout.value()
+    })
 }
 
 /// Convert ds50 UTC to a DTG15 string.
@@ -337,9 +347,369 @@ pub fn ds50_to_dtg17(ds50: f64) -> String {
 /// 56001000000.000
 /// ```
 pub fn ds50_to_dtg15(ds50: f64) -> String {
-    let mut inout = GetSetString::new();
-    unsafe { UTCToDTG15(ds50, inout.pointer()) };
-    inout.value()
+    with_buffer(|inout| {
+        stats::timed("UTCToDTG15", || unsafe { UTCToDTG15(ds50, inout.pointer()) });
+        inout.value()
+    })
+}
+
+// Epochs at or before 1956/001 are formatted as 1956/001 by the DLL.
+const DTG_MIN_DS50: f64 = 2192.0;
+// ds50 day number of 1970-01-01.
+const DS50_UNIX_EPOCH_DAY: i64 = 7306;
+const DTG_MONTHS: [&str; 12] = [
+    "Jan", "Feb", "Mar", "Apr", "May", "Jun", "Jul", "Aug", "Sep", "Oct", "Nov", "Dec",
+];
+
+fn days_from_civil(year: i64, month: i64, day: i64) -> i64 {
+    let year = if month <= 2 { year - 1 } else { year };
+    let era = year.div_euclid(400);
+    let yoe = year - era * 400;
+    let mp = if month > 2 { month - 3 } else { month + 9 };
+    let doe = yoe * 365 + yoe / 4 - yoe / 100 + (153 * mp + 2) / 5 + day - 1;
+    era * 146097 + doe - 719468
+}
+
+fn civil_from_days(days: i64) -> (i64, i64, i64) {
+    let z = days + 719468;
+    let era = z.div_euclid(146097);
+    let doe = z - era * 146097;
+    let yoe = (doe - doe / 1460 + doe / 36524 - doe / 146096) / 365;
+    let doy = doe - (365 * yoe + yoe / 4 - yoe / 100);
+    let mp = (5 * doy + 2) / 153;
+    let day = doy - (153 * mp + 2) / 5 + 1;
+    let month = if mp < 10 { mp + 3 } else { mp - 9 };
+    (
+        if month <= 2 {
+            yoe + era * 400 + 1
+        } else {
+            yoe + era * 400
+        },
+        month,
+        day,
+    )
+}
+
+fn ds50_year_start(year: i64) -> i64 {
+    days_from_civil(year, 1, 1) + DS50_UNIX_EPOCH_DAY
+}
+
+// Split ds50 into a day number and the rounded count of `ticks_per_day` ticks into that day.
+fn split_ds50(ds50: f64, ticks_per_day: i64) -> (i64, i64) {
+    let day = ds50.floor();
+    let ticks = ((ds50 - day) * ticks_per_day as f64).round() as i64;
+    if ticks >= ticks_per_day {
+        (day as i64 + 1, ticks - ticks_per_day)
+    } else {
+        (day as i64, ticks)
+    }
+}
+
+struct DtgFields {
+    year: i64,
+    month: i64,
+    day: i64,
+    doy: i64,
+    hour: i64,
+    minute: i64,
+    second: i64,
+    millis: i64,
+}
+
+impl DtgFields {
+    fn from_ds50(ds50: f64) -> Self {
+        let (day, millis) = split_ds50(ds50.max(DTG_MIN_DS50), 86_400_000);
+        let (year, month, day_of_month) = civil_from_days(day - DS50_UNIX_EPOCH_DAY);
+        DtgFields {
+            year,
+            month,
+            day: day_of_month,
+            doy: day - ds50_year_start(year) + 1,
+            hour: millis / 3_600_000,
+            minute: millis / 60_000 % 60,
+            second: millis / 1000 % 60,
+            millis: millis % 1000,
+        }
+    }
+}
+
+fn format_dtg20(ds50: f64) -> String {
+    let f = DtgFields::from_ds50(ds50);
+    format!(
+        "{:04}/{:03} {:02}{:02} {:02}.{:03}",
+        f.year, f.doy, f.hour, f.minute, f.second, f.millis
+    )
+}
+
+fn format_dtg19(ds50: f64) -> String {
+    let f = DtgFields::from_ds50(ds50);
+    format!(
+        "{:04}{}{:02}{:02}{:02}{:02}.{:03}",
+        f.year,
+        DTG_MONTHS[(f.month - 1) as usize],
+        f.day,
+        f.hour,
+        f.minute,
+        f.second,
+        f.millis
+    )
+}
+
+fn format_dtg17(ds50: f64) -> String {
+    let (day, fraction) = split_ds50(ds50.max(DTG_MIN_DS50), 100_000_000);
+    let (year, _, _) = civil_from_days(day - DS50_UNIX_EPOCH_DAY);
+    format!("{:04}/{:03}.{:08}", year, day - ds50_year_start(year) + 1, fraction)
+}
+
+fn format_dtg15(ds50: f64) -> String {
+    let f = DtgFields::from_ds50(ds50);
+    format!(
+        "{:02}{:03}{:02}{:02}{:02}.{:03}",
+        f.year % 100,
+        f.doy,
+        f.hour,
+        f.minute,
+        f.second,
+        f.millis
+    )
+}
+
+/// Two-digit years below this are in the 2000s, as in the DLL and TLE epochs: 57-99 are 1957-1999, 00-56 are
+/// 2000-2056.
+const TWO_DIGIT_YEAR_PIVOT: i64 = 57;
+
+fn two_digit_year(yy: i64) -> i64 {
+    if yy < TWO_DIGIT_YEAR_PIVOT {
+        2000 + yy
+    } else {
+        1900 + yy
+    }
+}
+
+fn time_of_day_days(hhmmss: &str) -> Option<f64> {
+    let hour: i64 = hhmmss.get(..2)?.parse().ok()?;
+    let minute: i64 = hhmmss.get(2..4)?.parse().ok()?;
+    let second: f64 = hhmmss.get(4..)?.parse().ok()?;
+    Some(((hour * 3600 + minute * 60) as f64 + second) / 86400.0)
+}
+
+fn parse_dtg(dtg: &str) -> Option<f64> {
+    let dtg = dtg.trim();
+    if !dtg.is_ascii() {
+        return None;
+    }
+    if dtg.bytes().any(|b| b.is_ascii_alphabetic()) {
+        // DTG19 "YYYYMonDDHHMMSS.SSS"
+        let year: i64 = dtg.get(..4)?.parse().ok()?;
+        let month = DTG_MONTHS
+            .iter()
+            .position(|&m| m.eq_ignore_ascii_case(dtg.get(4..7)?))? as i64
+            + 1;
+        let day: i64 = dtg.get(7..9)?.parse().ok()?;
+        let ds50_day = days_from_civil(year, month, day) + DS50_UNIX_EPOCH_DAY;
+        return Some(ds50_day as f64 + time_of_day_days(dtg.get(9..)?)?);
+    }
+
+    let compact: String = dtg.chars().filter(|c| c.is_ascii_digit() || *c == '.').collect();
+    let (year, rest) = match compact.find('.')? {
+        // DTG20 "YYYY/DDD HHMM SS.SSS"
+        13 => (compact[..4].parse().ok()?, &compact[4..]),
+        // DTG15 "YYDDDHHMMSS.SSS", also in its legacy spaced form "YY DDD HH MM SS.SSS"
+        11 => (two_digit_year(compact[..2].parse().ok()?), &compact[2..]),
+        // DTG17 "YYYY/DDD.DDDDDDDD"
+        7 => {
+            let year: i64 = compact[..4].parse().ok()?;
+            let doy: f64 = compact[4..].parse().ok()?;
+            return Some(ds50_year_start(year) as f64 + doy - 1.0);
+        }
+        _ => return None,
+    };
+    let doy: i64 = rest[..3].parse().ok()?;
+    Some((ds50_year_start(year) + doy - 1) as f64 + time_of_day_days(&rest[3..])?)
+}
+
+/// Format many ds50 UTC values as DTG20 strings without a DLL call per value.
+///
+/// Output matches [`ds50_to_dtg20`], including the clamp to 1956/001 for early epochs.
+///
+/// Example:
+/// ```rust
+/// let dtgs = saal::time::ds50_to_dtg20_batch(&[2192.0, 8431.5]);
+/// println!("{}", dtgs[1]);
+/// ```
+///
+/// Output:
+/// ```bash
+/// 1973/030 1200 00.000
+/// ```
+pub fn ds50_to_dtg20_batch(ds50_utcs: &[f64]) -> Vec<String> {
+    ds50_utcs.iter().map(|&ds50| format_dtg20(ds50)).collect()
+}
+
+/// Format many ds50 UTC values as DTG19 strings without a DLL call per value.
+pub fn ds50_to_dtg19_batch(ds50_utcs: &[f64]) -> Vec<String> {
+    ds50_utcs.iter().map(|&ds50| format_dtg19(ds50)).collect()
+}
+
+/// Format many ds50 UTC values as DTG17 strings without a DLL call per value.
+pub fn ds50_to_dtg17_batch(ds50_utcs: &[f64]) -> Vec<String> {
+    ds50_utcs.iter().map(|&ds50| format_dtg17(ds50)).collect()
+}
+
+/// Format many ds50 UTC values as DTG15 strings without a DLL call per value.
+pub fn ds50_to_dtg15_batch(ds50_utcs: &[f64]) -> Vec<String> {
+    ds50_utcs.iter().map(|&ds50| format_dtg15(ds50)).collect()
+}
+
+/// Parse many DTG15/17/19/20 strings to ds50 UTC.
+///
+/// The canonical layouts are parsed natively; anything else falls back to [`dtg_to_ds50`].
+///
+/// Example:
+/// ```rust
+/// let ds50 = saal::time::dtg_to_ds50_batch(&["1956/001 0000 00.000", "1973Jan30120000.000"]);
+/// println!("{:.1} {:.1}", ds50[0], ds50[1]);
+/// ```
+///
+/// Output:
+/// ```bash
+/// 2192.0 8431.5
+/// ```
+pub fn dtg_to_ds50_batch<S: AsRef<str>>(dtgs: &[S]) -> Vec<f64> {
+    dtgs.iter()
+        .map(|dtg| parse_dtg(dtg.as_ref()).unwrap_or_else(|| dtg_to_ds50(dtg.as_ref())))
+        .collect()
+}
+
+/// NumPy's `NaT` sentinel for `datetime64` integer values.
+pub const DATETIME64_NAT: i64 = i64::MIN;
+
+fn datetime64_ticks_per_day(unit: &str) -> Result<i64, String> {
+    match unit {
+        "D" => Ok(1),
+        "h" => Ok(24),
+        "m" => Ok(1440),
+        "s" => Ok(86_400),
+        "ms" => Ok(86_400_000),
+        "us" => Ok(86_400_000_000),
+        "ns" => Ok(86_400_000_000_000),
+        _ => Err(format!("Unsupported datetime64 unit {unit}")),
+    }
+}
+
+/// Convert UTC calendar components to ds50 UTC without a DLL call.
+///
+/// Example:
+/// ```rust
+/// let ds50 = saal::time::datetime_components_to_ds50(1973, 1, 30, 12, 0, 0, 0);
+/// println!("{ds50:.1}");
+/// ```
+///
+/// Output:
+/// ```bash
+/// 8431.5
+/// ```
+pub fn datetime_components_to_ds50(
+    year: i32,
+    month: i32,
+    day: i32,
+    hour: i32,
+    minute: i32,
+    second: i32,
+    microsecond: i32,
+) -> f64 {
+    let micros = ((hour as i64 * 60 + minute as i64) * 60 + second as i64) * 1_000_000 + microsecond as i64;
+    (days_from_civil(year as i64, month as i64, day as i64) + DS50_UNIX_EPOCH_DAY) as f64
+        + micros as f64 / 86_400_000_000.0
+}
+
+/// Convert ds50 UTC to (year, month, day, hour, minute, second, microsecond), rounded to the microsecond.
+pub fn ds50_to_datetime_components(ds50_utc: f64) -> (i32, i32, i32, i32, i32, i32, i32) {
+    let (day, micros) = split_ds50(ds50_utc, 86_400_000_000);
+    let (year, month, day_of_month) = civil_from_days(day - DS50_UNIX_EPOCH_DAY);
+    (
+        year as i32,
+        month as i32,
+        day_of_month as i32,
+        (micros / 3_600_000_000) as i32,
+        (micros / 60_000_000 % 60) as i32,
+        (micros / 1_000_000 % 60) as i32,
+        (micros % 1_000_000) as i32,
+    )
+}
+
+/// Convert `datetime64` integer values in `unit` ("D", "h", "m", "s", "ms", "us" or "ns") to ds50 UTC.
+///
+/// `datetime64` has no leap-second representation, so its days map one-to-one onto ds50 UTC days.  `NaT` becomes NaN.
+///
+/// Example:
+/// ```rust
+/// let ds50 = saal::time::datetime64_to_ds50_utc(&[97_243_200], "s").unwrap();
+/// println!("{:.1}", ds50[0]);
+/// ```
+///
+/// Output:
+/// ```bash
+/// 8431.5
+/// ```
+pub fn datetime64_to_ds50_utc(values: &[i64], unit: &str) -> Result<Vec<f64>, String> {
+    let ticks_per_day = datetime64_ticks_per_day(unit)?;
+    Ok(values
+        .iter()
+        .map(|&value| {
+            if value == DATETIME64_NAT {
+                f64::NAN
+            } else {
+                (value.div_euclid(ticks_per_day) + DS50_UNIX_EPOCH_DAY) as f64
+                    + value.rem_euclid(ticks_per_day) as f64 / ticks_per_day as f64
+            }
+        })
+        .collect())
+}
+
+/// Convert ds50 UTC values to `datetime64` integers in `unit`, rounded to the unit; NaN becomes `NaT`.
+pub fn ds50_utc_to_datetime64(ds50_utcs: &[f64], unit: &str) -> Result<Vec<i64>, String> {
+    let ticks_per_day = datetime64_ticks_per_day(unit)?;
+    Ok(ds50_utcs
+        .iter()
+        .map(|&ds50_utc| {
+            if ds50_utc.is_finite() {
+                let (day, ticks) = split_ds50(ds50_utc, ticks_per_day);
+                (day - DS50_UNIX_EPOCH_DAY) * ticks_per_day + ticks
+            } else {
+                DATETIME64_NAT
+            }
+        })
+        .collect())
+}
+
+/// Convert `datetime64` UTC values to ds50 TAI, applying leap seconds from the loaded timing constants.
+pub fn datetime64_to_ds50_tai(values: &[i64], unit: &str) -> Result<Vec<f64>, String> {
+    Ok(datetime64_to_ds50_utc(values, unit)?
+        .into_iter()
+        .map(|ds50_utc| {
+            if ds50_utc.is_nan() {
+                ds50_utc
+            } else {
+                utc_to_tai(ds50_utc)
+            }
+        })
+        .collect())
+}
+
+/// Convert ds50 TAI values to `datetime64` UTC integers, applying leap seconds from the loaded timing constants.
+pub fn ds50_tai_to_datetime64(ds50_tais: &[f64], unit: &str) -> Result<Vec<i64>, String> {
+    let ds50_utcs: Vec<f64> = ds50_tais
+        .iter()
+        .map(|&ds50_tai| {
+            if ds50_tai.is_finite() {
+                tai_to_utc(ds50_tai)
+            } else {
+                f64::NAN
+            }
+        })
+        .collect();
+    ds50_utc_to_datetime64(&ds50_utcs, unit)
 }
 
 /// Convert year and day-of-year to ds50 UTC.
@@ -357,7 +727,7 @@ pub fn ds50_to_dtg15(ds50: f64) -> String {
 /// 2192.0
 /// ```
 pub fn year_doy_to_ds50(year: i32, doy: f64) -> f64 {
-    unsafe { YrDaysToUTC(year, doy) }
+    stats::timed("YrDaysToUTC", || unsafe { YrDaysToUTC(year, doy) })
 }
 
 /// Convert ds50 UTC to year and day-of-year.
@@ -377,7 +747,7 @@ pub fn year_doy_to_ds50(year: i32, doy: f64) -> f64 {
 pub fn ds50_to_year_doy(ds50: f64) -> (i32, f64) {
     let mut year = 0;
     let mut doy = 0.0;
-    unsafe { UTCToYrDays(ds50, &mut year, &mut doy) };
+    stats::timed("UTCToYrDays", || unsafe { UTCToYrDays(ds50, &mut year, &mut doy) });
     (year, doy)
 }
 
@@ -396,7 +766,8 @@ pub fn ds50_to_year_doy(ds50: f64) -> (i32, f64) {
 /// 8431.0
 /// ```
 pub fn tai_to_utc(ds50_tai: f64) -> f64 {
-    unsafe { TAIToUTC(ds50_tai) }
+    let _ = ensure_time_constants();
+    stats::timed("TAIToUTC", || unsafe { TAIToUTC(ds50_tai) })
 }
 
 /// Convert ds50 UTC to ds50 TAI using loaded time constants.
@@ -414,7 +785,8 @@ pub fn tai_to_utc(ds50_tai: f64) -> f64 {
 /// 8431.000138888889
 /// ```
 pub fn utc_to_tai(ds50_utc: f64) -> f64 {
-    unsafe { UTCToTAI(ds50_utc) }
+    let _ = ensure_time_constants();
+    stats::timed("UTCToTAI", || unsafe { UTCToTAI(ds50_utc) })
 }
 
 /// Convert ds50 UTC to ds50 UT1 using loaded time constants.
@@ -433,7 +805,8 @@ pub fn utc_to_tai(ds50_utc: f64) -> f64 {
 /// 8431.00000830081
 /// ```
 pub fn utc_to_ut1(ds50_utc: f64) -> f64 {
-    unsafe { UTCToUT1(ds50_utc) }
+    let _ = ensure_time_constants();
+    stats::timed("UTCToUT1", || unsafe { UTCToUT1(ds50_utc) })
 }
 
 /// Convert ds50 UTC to ds50 TT (ET) using loaded time constants.
@@ -451,7 +824,8 @@ pub fn utc_to_ut1(ds50_utc: f64) -> f64 {
 /// 8431.00051138889
 /// ```
 pub fn utc_to_tt(ds50_utc: f64) -> f64 {
-    unsafe { UTCToET(ds50_utc) }
+    let _ = ensure_time_constants();
+    stats::timed("UTCToET", || unsafe { UTCToET(ds50_utc) })
 }
 
 /// Convert ds50 TAI to ds50 UT1 using loaded time constants.
@@ -469,7 +843,158 @@ pub fn utc_to_tt(ds50_utc: f64) -> f64 {
 /// 8431.00000830081
 /// ```
 pub fn tai_to_ut1(ds50_tai: f64) -> f64 {
-    unsafe { TAIToUT1(ds50_tai) }
+    let _ = ensure_time_constants();
+    stats::timed("TAIToUT1", || unsafe { TAIToUT1(ds50_tai) })
+}
+
+/// Convert many ds50 UTC values to ds50 TAI in one native loop.
+///
+/// Example:
+/// ```rust
+/// let tai = saal::time::utc_to_tai_batch(&[8431.0, 8432.0]);
+/// println!("{:.15}", tai[1]);
+/// ```
+///
+/// Output:
+/// ```bash
+/// 8432.000138888889
+/// ```
+pub fn utc_to_tai_batch(ds50_utcs: &[f64]) -> Vec<f64> {
+    ds50_utcs.iter().map(|&ds50_utc| utc_to_tai(ds50_utc)).collect()
+}
+
+/// Convert many ds50 TAI values to ds50 UTC in one native loop.
+pub fn tai_to_utc_batch(ds50_tais: &[f64]) -> Vec<f64> {
+    ds50_tais.iter().map(|&ds50_tai| tai_to_utc(ds50_tai)).collect()
+}
+
+/// Convert many ds50 UTC values to ds50 UT1 in one native loop.
+pub fn utc_to_ut1_batch(ds50_utcs: &[f64]) -> Vec<f64> {
+    ds50_utcs.iter().map(|&ds50_utc| utc_to_ut1(ds50_utc)).collect()
+}
+
+/// Convert many ds50 UTC values to ds50 TT (ET) in one native loop.
+pub fn utc_to_tt_batch(ds50_utcs: &[f64]) -> Vec<f64> {
+    ds50_utcs.iter().map(|&ds50_utc| utc_to_tt(ds50_utc)).collect()
+}
+
+/// Convert many ds50 TAI values to ds50 UT1 in one native loop.
+pub fn tai_to_ut1_batch(ds50_tais: &[f64]) -> Vec<f64> {
+    ds50_tais.iter().map(|&ds50_tai| tai_to_ut1(ds50_tai)).collect()
+}
+
+fn validate_component_lengths(name: &str, len: usize, rows: usize) -> Result<(), String> {
+    if len == rows {
+        Ok(())
+    } else {
+        Err(format!("Expected {rows} {name} values, got {len}"))
+    }
+}
+
+/// Convert many year/day-of-year pairs to ds50 UTC.
+///
+/// Example:
+/// ```rust
+/// let ds50 = saal::time::year_doy_to_ds50_batch(&[1956, 1973], &[1.0, 1.0]).unwrap();
+/// println!("{:.1} {:.1}", ds50[0], ds50[1]);
+/// ```
+///
+/// Output:
+/// ```bash
+/// 2192.0 8402.0
+/// ```
+pub fn year_doy_to_ds50_batch(years: &[i32], doys: &[f64]) -> Result<Vec<f64>, String> {
+    validate_component_lengths("day-of-year", doys.len(), years.len())?;
+    Ok(years
+        .iter()
+        .zip(doys)
+        .map(|(&year, &doy)| year_doy_to_ds50(year, doy))
+        .collect())
+}
+
+/// Convert many ds50 UTC values to (years, days-of-year) columns.
+pub fn ds50_to_year_doy_batch(ds50_utcs: &[f64]) -> (Vec<i32>, Vec<f64>) {
+    ds50_utcs.iter().map(|&ds50_utc| ds50_to_year_doy(ds50_utc)).unzip()
+}
+
+/// Date/time components as parallel columns, one row per epoch.
+#[derive(Debug, Clone, Default, PartialEq)]
+pub struct YmdComponents {
+    pub years: Vec<i32>,
+    pub months: Vec<i32>,
+    pub days: Vec<i32>,
+    pub hours: Vec<i32>,
+    pub minutes: Vec<i32>,
+    pub seconds: Vec<f64>,
+}
+
+impl YmdComponents {
+    fn with_capacity(rows: usize) -> Self {
+        YmdComponents {
+            years: Vec::with_capacity(rows),
+            months: Vec::with_capacity(rows),
+            days: Vec::with_capacity(rows),
+            hours: Vec::with_capacity(rows),
+            minutes: Vec::with_capacity(rows),
+            seconds: Vec::with_capacity(rows),
+        }
+    }
+
+    pub fn len(&self) -> usize {
+        self.years.len()
+    }
+
+    pub fn is_empty(&self) -> bool {
+        self.years.is_empty()
+    }
+}
+
+/// Convert many ds50 UTC values to date/time component columns.
+///
+/// Example:
+/// ```rust
+/// let comps = saal::time::ds50_to_ymd_components_batch(&[2192.0, 8431.5]);
+/// println!("{}-{:02}-{:02} {:02}h", comps.years[1], comps.months[1], comps.days[1], comps.hours[1]);
+/// ```
+///
+/// Output:
+/// ```bash
+/// 1973-01-30 12h
+/// ```
+pub fn ds50_to_ymd_components_batch(ds50_utcs: &[f64]) -> YmdComponents {
+    let mut comps = YmdComponents::with_capacity(ds50_utcs.len());
+    for &ds50_utc in ds50_utcs {
+        let (year, month, day, hour, minute, second) = ds50_to_ymd_components(ds50_utc);
+        comps.years.push(year);
+        comps.months.push(month);
+        comps.days.push(day);
+        comps.hours.push(hour);
+        comps.minutes.push(minute);
+        comps.seconds.push(second);
+    }
+    comps
+}
+
+/// Convert date/time component columns to ds50 UTC.
+pub fn ymd_components_to_ds50_batch(comps: &YmdComponents) -> Result<Vec<f64>, String> {
+    let rows = comps.len();
+    validate_component_lengths("month", comps.months.len(), rows)?;
+    validate_component_lengths("day", comps.days.len(), rows)?;
+    validate_component_lengths("hour", comps.hours.len(), rows)?;
+    validate_component_lengths("minute", comps.minutes.len(), rows)?;
+    validate_component_lengths("second", comps.seconds.len(), rows)?;
+    Ok((0..rows)
+        .map(|i| {
+            ymd_components_to_ds50(
+                comps.years[i],
+                comps.months[i],
+                comps.days[i],
+                comps.hours[i],
+                comps.minutes[i],
+                comps.seconds[i],
+            )
+        })
+        .collect())
 }
 
 /// Load timing constants from a file.
@@ -487,8 +1012,12 @@ pub fn tai_to_ut1(ds50_tai: f64) -> f64 {
 /// true
 /// ```
 pub fn load_constants(path: &str) -> Result<(), String> {
-    let path = std::ffi::CString::new(path).unwrap();
-    let err_code = unsafe { TConLoadFile(path.as_ptr()) };
+    let path = std::ffi::CString::new(path).map_err(|e| e.to_string())?;
+    let err_code = stats::timed_status("TConLoadFile", || unsafe { TConLoadFile(path.as_ptr()) });
+    mark_time_constants_ready();
+    astro::clear_rotation_cache();
+    invalidate_timing_table();
+    clear_greenwich_cache();
     if err_code == 0 {
         Ok(())
     } else {
@@ -513,7 +1042,7 @@ pub fn load_constants(path: &str) -> Result<(), String> {
 /// 1.7712987335192203
 /// ```
 pub fn get_fk4_greenwich_angle(ds50_ut1: f64) -> f64 {
-    unsafe { ThetaGrnwchFK4(ds50_ut1) }
+    stats::timed("ThetaGrnwchFK4", || unsafe { ThetaGrnwchFK4(ds50_ut1) })
 }
 
 /// Compute Greenwich right ascension using the FK5 catalog at ds50 UT1.
@@ -533,13 +1062,138 @@ pub fn get_fk4_greenwich_angle(ds50_ut1: f64) -> f64 {
 /// 1.7713027012394775
 /// ```
 pub fn get_fk5_greenwich_angle(ds50_ut1: f64) -> f64 {
-    unsafe { ThetaGrnwchFK5(ds50_ut1) }
+    stats::timed("ThetaGrnwchFK5", || unsafe { ThetaGrnwchFK5(ds50_ut1) })
+}
+
+/// Compute Greenwich right ascension at ds50 UT1 using the currently selected fundamental catalog.
+///
+/// Units: returns radians; input is days since 1950-01-01 00:00:00 UT1.
+///
+/// Example:
+/// ```rust
+/// let utc = saal::time::ymd_components_to_ds50(1973, 1, 2, 0, 0, 0.0);
+/// let ut1 = saal::time::utc_to_ut1(utc);
+/// let ang = saal::time::get_greenwich_angle(ut1);
+/// println!("{ang:.16}");
+/// ```
+///
+/// Output:
+/// ```bash
+/// 1.7713027012394775
+/// ```
+pub fn get_greenwich_angle(ds50_ut1: f64) -> f64 {
+    stats::timed("ThetaGrnwch", || unsafe {
+        ThetaGrnwch(ds50_ut1, environment::EnvGetFkPtr())
+    })
+}
+
+fn greenwich_angle_for(catalog: i32) -> Result<fn(f64) -> f64, String> {
+    match catalog {
+        environment::XF_FKMOD_4 => Ok(get_fk4_greenwich_angle),
+        environment::XF_FKMOD_5 => Ok(get_fk5_greenwich_angle),
+        _ => Err(format!("Unsupported fundamental catalog {catalog}")),
+    }
+}
+
+/// Compute UTC to UT1 and Greenwich right ascension for every epoch of a ds50 UTC grid in one pass.
+///
+/// `catalog` selects `XF_FKMOD_4` or `XF_FKMOD_5`; `None` uses the catalog currently set in the environment.
+/// Units: returns radians.
+///
+/// Example:
+/// ```rust
+/// let utc = saal::time::ymd_components_to_ds50(1973, 1, 2, 0, 0, 0.0);
+/// let angles = saal::time::get_greenwich_angles(&[utc], Some(saal::environment::XF_FKMOD_4)).unwrap();
+/// println!("{:.16}", angles[0]);
+/// ```
+///
+/// Output:
+/// ```bash
+/// 1.7712987335192203
+/// ```
+pub fn get_greenwich_angles(ds50_utcs: &[f64], catalog: Option<i32>) -> Result<Vec<f64>, String> {
+    let angle = match catalog {
+        Some(catalog) => greenwich_angle_for(catalog)?,
+        None => get_greenwich_angle,
+    };
+    Ok(ds50_utcs.iter().map(|&ds50_utc| angle(utc_to_ut1(ds50_utc))).collect())
+}
+
+/// Greenwich right ascension for a ds50 UTC grid, shareable across callers.
+#[derive(Debug, Clone, PartialEq)]
+pub struct GreenwichTable {
+    pub catalog: i32,
+    pub ds50_utcs: Vec<f64>,
+    pub ds50_ut1s: Vec<f64>,
+    pub angles: Vec<f64>,
+}
+
+impl GreenwichTable {
+    pub fn new(ds50_utcs: &[f64], catalog: Option<i32>) -> Result<Self, String> {
+        let catalog = match catalog {
+            Some(catalog) => catalog,
+            None => environment::get_fundamental_catalog()?,
+        };
+        let angle = greenwich_angle_for(catalog)?;
+        let ds50_ut1s = utc_to_ut1_batch(ds50_utcs);
+        let angles = ds50_ut1s.iter().map(|&ds50_ut1| angle(ds50_ut1)).collect();
+        Ok(GreenwichTable {
+            catalog,
+            ds50_utcs: ds50_utcs.to_vec(),
+            ds50_ut1s,
+            angles,
+        })
+    }
+
+    fn matches(&self, ds50_utcs: &[f64], catalog: i32) -> bool {
+        self.catalog == catalog
+            && self.ds50_utcs.len() == ds50_utcs.len()
+            && self
+                .ds50_utcs
+                .iter()
+                .zip(ds50_utcs)
+                .all(|(a, b)| a.to_bits() == b.to_bits())
+    }
+}
+
+const GREENWICH_CACHE_CAPACITY: usize = 8;
+
+static GREENWICH_CACHE: LazyLock<Mutex<VecDeque<Arc<GreenwichTable>>>> =
+    LazyLock::new(|| Mutex::new(VecDeque::with_capacity(GREENWICH_CACHE_CAPACITY)));
+
+/// Return the Greenwich table for a grid, reusing a cached table built for the same grid and catalog.
+///
+/// The cache keeps the most recently used grids and is cleared whenever timing constants change.
+pub fn get_cached_greenwich_table(ds50_utcs: &[f64], catalog: Option<i32>) -> Result<Arc<GreenwichTable>, String> {
+    let catalog = match catalog {
+        Some(catalog) => catalog,
+        None => environment::get_fundamental_catalog()?,
+    };
+    let mut cache = GREENWICH_CACHE.lock().unwrap_or_else(|e| e.into_inner());
+    if let Some(i) = cache.iter().position(|table| table.matches(ds50_utcs, catalog)) {
+        let table = cache.remove(i).unwrap();
+        cache.push_front(table.clone());
+        return Ok(table);
+    }
+    let table = Arc::new(GreenwichTable::new(ds50_utcs, Some(catalog))?);
+    if cache.len() == GREENWICH_CACHE_CAPACITY {
+        cache.pop_back();
+    }
+    cache.push_front(table.clone());
+    Ok(table)
+}
+
+pub fn clear_greenwich_cache() {
+    GREENWICH_CACHE.lock().unwrap_or_else(|e| e.into_inner()).clear();
 }
 
 /// Return whether timing constants are loaded.
 ///
+/// This only queries the DLL; it does not load the bundled constants (see [`crate::ensure_time_constants`]).
+///
 /// Example:
 /// ```rust
+/// saal::ensure_time_constants().unwrap();
 /// let loaded = saal::time::constants_loaded();
 /// println!("{loaded}");
 /// ```
@@ -549,17 +1203,169 @@ pub fn get_fk5_greenwich_angle(ds50_ut1: f64) -> f64 {
 /// true
 /// ```
 pub fn constants_loaded() -> bool {
-    unsafe { IsTConFileLoaded() != 0 }
+    stats::timed("IsTConFileLoaded", || unsafe { IsTConFileLoaded() != 0 })
 }
 
 pub fn clear_constants() -> Result<(), String> {
-    let err_code = unsafe { TConRemoveAll() };
+    let err_code = stats::timed_status("TConRemoveAll", || unsafe { TConRemoveAll() });
+    mark_time_constants_ready();
+    astro::clear_rotation_cache();
+    invalidate_timing_table();
+    clear_greenwich_cache();
     match err_code {
         0 => Ok(()),
         _ => Err(get_last_error_message()),
     }
 }
 
+/// Return the number of loaded timing constant records and the (first, last) ds50 UTC they cover.
+///
+/// Example:
+/// ```rust
+/// let (count, start, stop) = saal::time::get_constants_span();
+/// println!("{}", count > 0 && start < stop);
+/// ```
+///
+/// Output:
+/// ```bash
+/// true
+/// ```
+pub fn get_constants_span() -> (i32, f64, f64) {
+    let _ = ensure_time_constants();
+    let mut count = 0;
+    let mut start = 0.0;
+    let mut stop = 0.0;
+    stats::timed("TConTimeSpan", || unsafe {
+        TConTimeSpan(&mut count, &mut start, &mut stop)
+    });
+    (count, start, stop)
+}
+
+/// Return the timing constants record in effect at ds50 UTC.
+///
+/// The record is `[tai_minus_utc, ut1_minus_utc, ut1_rate, polar_x, polar_y]` (seconds, seconds, ms/day, arcsec,
+/// arcsec), or `None` when no record covers the epoch.
+pub fn get_constants_record(ds50_utc: f64) -> Option<[f64; 5]> {
+    let _ = ensure_time_constants();
+    let mut record = [0.0; 5];
+    let [tai_minus_utc, ut1_minus_utc, ut1_rate, polar_x, polar_y] = &mut record;
+    stats::timed("UTCToTConRec", || unsafe {
+        UTCToTConRec(ds50_utc, tai_minus_utc, ut1_minus_utc, ut1_rate, polar_x, polar_y)
+    });
+    (record[0] != 0.0).then_some(record)
+}
+
+const TT_MINUS_TAI_DAYS: f64 = 32.184 / 86400.0;
+
+/// Immutable snapshot of the loaded timing constants for conversions without FFI.
+///
+/// The DLL conversions are sampled once per UTC day across the table span.  TAI-UTC is held constant within a day
+/// and UT1-TAI, which stays continuous across leap seconds, is interpolated linearly between days.  Epochs outside the
+/// span use the nearest day.  Lookups are binary searches over sorted arrays, so a table can be shared across
+/// threads and used without holding any SAAL state.
+#[derive(Debug, Clone, PartialEq)]
+pub struct TimingTable {
+    ds50_utcs: Vec<f64>,
+    ds50_tais: Vec<f64>,
+    tai_minus_utc: Vec<f64>,
+    ut1_minus_tai: Vec<f64>,
+}
+
+impl TimingTable {
+    /// Snapshot the timing constants currently loaded in the DLL, or `None` when none are loaded.
+    pub fn from_loaded() -> Option<Self> {
+        let (count, start, stop) = get_constants_span();
+        if count <= 0 || !constants_loaded() || stop < start {
+            return None;
+        }
+
+        let first = start.floor();
+        let days = (stop - first).ceil() as usize + 1;
+        let mut table = TimingTable {
+            ds50_utcs: Vec::with_capacity(days),
+            ds50_tais: Vec::with_capacity(days),
+            tai_minus_utc: Vec::with_capacity(days),
+            ut1_minus_tai: Vec::with_capacity(days),
+        };
+        for day in 0..days {
+            let ds50_utc = first + day as f64;
+            let ds50_tai = utc_to_tai(ds50_utc);
+            table.ds50_utcs.push(ds50_utc);
+            table.ds50_tais.push(ds50_tai);
+            table.tai_minus_utc.push(ds50_tai - ds50_utc);
+            table.ut1_minus_tai.push(utc_to_ut1(ds50_utc) - ds50_tai);
+        }
+        Some(table)
+    }
+
+    pub fn len(&self) -> usize {
+        self.ds50_utcs.len()
+    }
+
+    pub fn is_empty(&self) -> bool {
+        self.ds50_utcs.is_empty()
+    }
+
+    /// Return the first and last sampled ds50 UTC.
+    pub fn span(&self) -> (f64, f64) {
+        (self.ds50_utcs[0], self.ds50_utcs[self.len() - 1])
+    }
+
+    fn index(keys: &[f64], ds50: f64) -> usize {
+        keys.partition_point(|&key| key <= ds50).saturating_sub(1)
+    }
+
+    fn ut1_minus_tai_at(&self, i: usize, ds50_utc: f64) -> f64 {
+        if i + 1 == self.len() || ds50_utc <= self.ds50_utcs[i] {
+            return self.ut1_minus_tai[i];
+        }
+        let fraction = (ds50_utc - self.ds50_utcs[i]) / (self.ds50_utcs[i + 1] - self.ds50_utcs[i]);
+        self.ut1_minus_tai[i] + fraction * (self.ut1_minus_tai[i + 1] - self.ut1_minus_tai[i])
+    }
+
+    pub fn utc_to_tai(&self, ds50_utc: f64) -> f64 {
+        ds50_utc + self.tai_minus_utc[Self::index(&self.ds50_utcs, ds50_utc)]
+    }
+
+    pub fn tai_to_utc(&self, ds50_tai: f64) -> f64 {
+        ds50_tai - self.tai_minus_utc[Self::index(&self.ds50_tais, ds50_tai)]
+    }
+
+    pub fn utc_to_ut1(&self, ds50_utc: f64) -> f64 {
+        let i = Self::index(&self.ds50_utcs, ds50_utc);
+        ds50_utc + self.tai_minus_utc[i] + self.ut1_minus_tai_at(i, ds50_utc)
+    }
+
+    pub fn utc_to_tt(&self, ds50_utc: f64) -> f64 {
+        self.utc_to_tai(ds50_utc) + TT_MINUS_TAI_DAYS
+    }
+
+    pub fn tai_to_ut1(&self, ds50_tai: f64) -> f64 {
+        let i = Self::index(&self.ds50_tais, ds50_tai);
+        ds50_tai + self.ut1_minus_tai_at(i, ds50_tai - self.tai_minus_utc[i])
+    }
+}
+
+static TIMING_TABLE: LazyLock<RwLock<Option<Arc<TimingTable>>>> = LazyLock::new(|| RwLock::new(None));
+
+/// Return the shared snapshot of the loaded timing constants, taking it on first use.
+///
+/// The snapshot is discarded whenever constants are loaded or cleared through this module.
+pub fn get_timing_table() -> Option<Arc<TimingTable>> {
+    if let Some(table) = TIMING_TABLE.read().unwrap_or_else(|e| e.into_inner()).as_ref() {
+        return Some(table.clone());
+    }
+    let mut cached = TIMING_TABLE.write().unwrap_or_else(|e| e.into_inner());
+    if cached.is_none() {
+        *cached = TimingTable::from_loaded().map(Arc::new);
+    }
+    cached.clone()
+}
+
+fn invalidate_timing_table() {
+    *TIMING_TABLE.write().unwrap_or_else(|e| e.into_inner()) = None;
+}
+
 #[cfg(test)]
 mod tests {
     use super::*;
@@ -616,6 +1422,7 @@ mod tests {
     #[test]
     fn test_constants_loaded() {
         let _lock = TEST_LOCK.lock().unwrap();
+        crate::ensure_time_constants().unwrap();
         assert!(constants_loaded());
     }
 
@@ -644,5 +1451,185 @@ mod tests {
 
         assert_abs_diff_eq!(fk4, 1.7712987335192203, epsilon = 1.0e-7);
         assert_abs_diff_eq!(fk5, 1.7713027012394775, epsilon = 1.0e-7);
+        assert_abs_diff_eq!(get_greenwich_angle(ut1), fk5, epsilon = 1.0e-12);
+    }
+
+    #[test]
+    fn test_batch_conversions() {
+        let _lock = TEST_LOCK.lock().unwrap();
+        let ds50_utcs = [2192.0, 8431.0, 8431.5, 25000.125];
+        let tais = utc_to_tai_batch(&ds50_utcs);
+        let comps = ds50_to_ymd_components_batch(&ds50_utcs);
+        let (years, doys) = ds50_to_year_doy_batch(&ds50_utcs);
+
+        for (i, &ds50_utc) in ds50_utcs.iter().enumerate() {
+            assert_eq!(tais[i], utc_to_tai(ds50_utc));
+            assert_eq!(tai_to_utc_batch(&tais)[i], tai_to_utc(tais[i]));
+            assert_eq!(utc_to_ut1_batch(&ds50_utcs)[i], utc_to_ut1(ds50_utc));
+            assert_eq!(utc_to_tt_batch(&ds50_utcs)[i], utc_to_tt(ds50_utc));
+            assert_eq!(tai_to_ut1_batch(&tais)[i], tai_to_ut1(tais[i]));
+            assert_eq!((years[i], doys[i]), ds50_to_year_doy(ds50_utc));
+        }
+        assert_eq!(comps.len(), 4);
+        assert_eq!(
+            (comps.years[2], comps.months[2], comps.days[2], comps.hours[2]),
+            (1973, 1, 30, 12)
+        );
+        for (actual, expected) in ymd_components_to_ds50_batch(&comps).unwrap().iter().zip(ds50_utcs) {
+            assert_abs_diff_eq!(*actual, expected, epsilon = 1.0e-9);
+        }
+        for (actual, expected) in year_doy_to_ds50_batch(&years, &doys).unwrap().iter().zip(ds50_utcs) {
+            assert_abs_diff_eq!(*actual, expected, epsilon = 1.0e-9);
+        }
+        assert!(year_doy_to_ds50_batch(&years, &doys[..2]).is_err());
+    }
+
+    #[test]
+    fn test_timing_table_matches_dll() {
+        let _lock = TEST_LOCK.lock().unwrap();
+        let table = get_timing_table().unwrap();
+        let (count, _, _) = get_constants_span();
+        let (start, stop) = table.span();
+        let record = get_constants_record(start + 0.5).unwrap();
+
+        assert!(count > 0);
+        assert!(record[0] > 0.0);
+        assert!(Arc::ptr_eq(&table, &get_timing_table().unwrap()));
+        let mut ds50_utc = start;
+        while ds50_utc <= stop {
+            let ds50_tai = utc_to_tai(ds50_utc);
+            assert_abs_diff_eq!(table.utc_to_tai(ds50_utc), ds50_tai, epsilon = 1.0e-11);
+            assert_abs_diff_eq!(table.tai_to_utc(ds50_tai), tai_to_utc(ds50_tai), epsilon = 1.0e-11);
+            assert_abs_diff_eq!(table.utc_to_tt(ds50_utc), utc_to_tt(ds50_utc), epsilon = 1.0e-11);
+            assert_abs_diff_eq!(table.utc_to_ut1(ds50_utc), utc_to_ut1(ds50_utc), epsilon = 1.0e-9);
+            assert_abs_diff_eq!(table.tai_to_ut1(ds50_tai), tai_to_ut1(ds50_tai), epsilon = 1.0e-9);
+            ds50_utc += 0.37;
+        }
+
+        clear_constants().unwrap();
+        assert!(get_timing_table().is_none());
+        crate::initialize_time_constants().unwrap();
+        assert!(get_timing_table().is_some());
+    }
+
+    #[test]
+    fn test_dtg_batches_match_dll() {
+        let _lock = TEST_LOCK.lock().unwrap();
+        let mut ds50s = vec![
+            0.0,
+            2192.0,
+            2192.5,
+            8431.0,
+            8431.9999999999,
+            18262.0,
+            25000.123456789,
+            36524.75,
+            38716.5,
+            38717.5,
+            40541.999,
+        ];
+        // Run past 2056 so two-digit DTG15 years on both sides of the DLL's pivot are compared.
+        let mut ds50 = 2192.0;
+        while ds50 < 40542.0 {
+            ds50s.push(ds50);
+            ds50 += 3.7171717171;
+        }
+        let dtg20s = ds50_to_dtg20_batch(&ds50s);
+        let dtg19s = ds50_to_dtg19_batch(&ds50s);
+        let dtg17s = ds50_to_dtg17_batch(&ds50s);
+        let dtg15s = ds50_to_dtg15_batch(&ds50s);
+
+        for (i, &ds50) in ds50s.iter().enumerate() {
+            assert_eq!(dtg20s[i], ds50_to_dtg20(ds50));
+            assert_eq!(dtg19s[i], ds50_to_dtg19(ds50));
+            assert_eq!(dtg17s[i], ds50_to_dtg17(ds50));
+            assert_eq!(dtg15s[i], ds50_to_dtg15(ds50));
+        }
+        for dtgs in [&dtg20s, &dtg19s, &dtg17s, &dtg15s] {
+            for (parsed, dtg) in dtg_to_ds50_batch(dtgs).iter().zip(dtgs.iter()) {
+                assert_abs_diff_eq!(*parsed, dtg_to_ds50(dtg), epsilon = 1.0e-10);
+            }
+        }
+        let legacy = dtg_to_ds50_batch(&["73 030 12 00 00.000", "1973/030 1200"]);
+        assert_abs_diff_eq!(legacy[0], 8431.5, epsilon = 1.0e-10);
+        assert_eq!(legacy[1], dtg_to_ds50("1973/030 1200"));
+        for dtg in [
+            "56001000000.000",
+            "57001000000.000",
+            "99365120000.000",
+            "00001000000.000",
+        ] {
+            assert_abs_diff_eq!(dtg_to_ds50_batch(&[dtg])[0], dtg_to_ds50(dtg), epsilon = 1.0e-10);
+        }
+    }
+
+    #[test]
+    fn test_datetime64_conversions() {
+        let _lock = TEST_LOCK.lock().unwrap();
+        let ds50_utcs = [2192.0, 8431.5, 18262.123456789, 25000.999];
+        let nanos = ds50_utc_to_datetime64(&ds50_utcs, "ns").unwrap();
+        let seconds = ds50_utc_to_datetime64(&ds50_utcs, "s").unwrap();
+        let tais = datetime64_to_ds50_tai(&nanos, "ns").unwrap();
+
+        assert_eq!(seconds[1], 97_243_200);
+        assert_eq!(ds50_utc_to_datetime64(&[f64::NAN], "ms").unwrap(), vec![DATETIME64_NAT]);
+        assert!(datetime64_to_ds50_utc(&[DATETIME64_NAT], "D").unwrap()[0].is_nan());
+        assert!(datetime64_to_ds50_utc(&[0], "fortnight").is_err());
+        assert_eq!(datetime64_to_ds50_utc(&[-7305, 0], "D").unwrap(), vec![1.0, 7306.0]);
+        for (i, &ds50_utc) in ds50_utcs.iter().enumerate() {
+            assert_abs_diff_eq!(
+                datetime64_to_ds50_utc(&nanos, "ns").unwrap()[i],
+                ds50_utc,
+                epsilon = 1.0e-11
+            );
+            assert_abs_diff_eq!(tais[i], utc_to_tai(ds50_utc), epsilon = 1.0e-11);
+            let (year, month, day, hour, minute, second, micros) = ds50_to_datetime_components(ds50_utc);
+            let native = datetime_components_to_ds50(year, month, day, hour, minute, second, micros);
+            assert_abs_diff_eq!(native, ds50_utc, epsilon = 1.0e-10);
+            let (dll_year, dll_month, dll_day, dll_hour, dll_minute, _) = ds50_to_ymd_components(ds50_utc);
+            assert_eq!(
+                (year, month, day, hour, minute),
+                (dll_year, dll_month, dll_day, dll_hour, dll_minute)
+            );
+        }
+        assert_eq!(
+            ds50_tai_to_datetime64(&tais, "ms").unwrap(),
+            ds50_utc_to_datetime64(&ds50_utcs, "ms").unwrap()
+        );
+    }
+
+    #[test]
+    fn test_greenwich_angle_grid() {
+        let _lock = TEST_LOCK.lock().unwrap();
+        let grid: Vec<f64> = (0..48).map(|i| 8403.0 + i as f64 / 48.0).collect();
+        let fk4 = get_greenwich_angles(&grid, Some(environment::XF_FKMOD_4)).unwrap();
+        let fk5 = get_greenwich_angles(&grid, Some(environment::XF_FKMOD_5)).unwrap();
+        let current = get_greenwich_angles(&grid, None).unwrap();
+        let table = get_cached_greenwich_table(&grid, Some(environment::XF_FKMOD_5)).unwrap();
+
+        assert_abs_diff_eq!(fk4[0], 1.7712987335192203, epsilon = 1.0e-7);
+        assert_abs_diff_eq!(fk5[0], 1.7713027012394775, epsilon = 1.0e-7);
+        for (i, &ds50_utc) in grid.iter().enumerate() {
+            let ds50_ut1 = utc_to_ut1(ds50_utc);
+            assert_eq!(fk4[i], get_fk4_greenwich_angle(ds50_ut1));
+            assert_eq!(fk5[i], get_fk5_greenwich_angle(ds50_ut1));
+            assert_eq!(current[i], get_greenwich_angle(ds50_ut1));
+            assert_eq!(table.ds50_ut1s[i], ds50_ut1);
+        }
+        assert_eq!(table.angles, fk5);
+        assert!(Arc::ptr_eq(
+            &table,
+            &get_cached_greenwich_table(&grid, Some(environment::XF_FKMOD_5)).unwrap()
+        ));
+        assert!(!Arc::ptr_eq(
+            &table,
+            &get_cached_greenwich_table(&grid, Some(environment::XF_FKMOD_4)).unwrap()
+        ));
+        clear_greenwich_cache();
+        assert!(!Arc::ptr_eq(
+            &table,
+            &get_cached_greenwich_table(&grid, Some(environment::XF_FKMOD_5)).unwrap()
+        ));
+        assert!(get_greenwich_angles(&grid, Some(3)).is_err());
     }
 }
@@ -2,7 +2,7 @@
 #![allow(non_snake_case)]
 #![allow(dead_code)]
 
-use crate::{GetSetString, get_last_error_message};
+use crate::{GetSetString, get_last_error_message, stats, with_buffer, with_buffers, with_str};
 use std::os::raw::c_char;
 use std::result::Result;
 
@@ -865,12 +865,13 @@ fn get_designator_string(xs_tle: &str) -> Option<String> {
 }
 
 fn join_xs_tle(classification: &str, designator: &Option<String>) -> Result<String, String> {
-    let mut xs_tle = GetSetString::new();
-    xs_tle.set(XS_TLE_SECCLASS_0_1, classification)?;
-    if let Some(desig) = designator {
-        xs_tle.set(XS_TLE_SATNAME_1_12, desig)?;
-    }
-    Ok(xs_tle.value())
+    with_buffer(|xs_tle| {
+        xs_tle.set(XS_TLE_SECCLASS_0_1, classification)?;
+        if let Some(desig) = designator {
+            xs_tle.set(XS_TLE_SATNAME_1_12, desig)?;
+        }
+        Ok(xs_tle.value())
+    })
 }
 
 impl From<([f64; XA_TLE_SIZE], String)> for ParsedTLE {
@@ -976,37 +977,40 @@ impl From<ParsedTLE> for ([f64; XA_TLE_SIZE], String) {
 }
 
 pub fn get_dll_info() -> String {
-    let mut c_info = GetSetString::new();
-    unsafe { TleGetInfo(c_info.pointer()) };
-    c_info.value()
+    with_buffer(|c_info| {
+        stats::timed("TleGetInfo", || unsafe { TleGetInfo(c_info.pointer()) });
+        c_info.value()
+    })
 }
 
 pub fn lines_to_arrays(line_1: &str, line_2: &str) -> Result<([f64; XA_TLE_SIZE], String), String> {
     let mut xa_tle = [0.0; XA_TLE_SIZE];
-    let mut xs_tle = GetSetString::new();
-    let mut c_line_1: GetSetString = line_1.into();
-    let mut c_line_2: GetSetString = line_2.into();
-    let result = unsafe {
-        TleLinesToArray(
-            c_line_1.pointer(),
-            c_line_2.pointer(),
-            xa_tle.as_mut_ptr() as *mut [f64; XA_TLE_SIZE],
-            xs_tle.pointer(),
-        )
-    };
-    match result {
-        0 => Ok((xa_tle, xs_tle.value())),
-        _ => Err(get_last_error_message()),
-    }
+    with_buffers(|[xs_tle, c_line_1, c_line_2]: &mut [GetSetString; 3]| {
+        c_line_1.assign(line_1);
+        c_line_2.assign(line_2);
+        let result = stats::timed_status("TleLinesToArray", || unsafe {
+            TleLinesToArray(
+                c_line_1.pointer(),
+                c_line_2.pointer(),
+                xa_tle.as_mut_ptr() as *mut [f64; XA_TLE_SIZE],
+                xs_tle.pointer(),
+            )
+        });
+        match result {
+            0 => Ok((xa_tle, xs_tle.value())),
+            _ => Err(get_last_error_message()),
+        }
+    })
 }
 
 pub fn remove(sat_key: i64) {
-    unsafe { TleRemoveSat(sat_key) };
+    stats::timed("TleRemoveSat", || unsafe { TleRemoveSat(sat_key) });
 }
 
 pub fn load_file(file_path: &str) -> Result<i32, String> {
-    let mut tle_path: GetSetString = file_path.into();
-    let result = unsafe { TleLoadFile(tle_path.pointer()) };
+    let result = with_str(file_path, |tle_path| {
+        stats::timed("TleLoadFile", || unsafe { TleLoadFile(tle_path.pointer()) })
+    });
     match result {
         n if n >= 0 => Ok(n),
         _ => Err(get_last_error_message()),
@@ -1014,7 +1018,7 @@ pub fn load_file(file_path: &str) -> Result<i32, String> {
 }
 
 pub fn clear() -> Result<(), String> {
-    let result = unsafe { TleRemoveAllSats() };
+    let result = stats::timed_status("TleRemoveAllSats", || unsafe { TleRemoveAllSats() });
     match result {
         0 => Ok(()),
         _ => Err(get_last_error_message()),
@@ -1022,7 +1026,7 @@ pub fn clear() -> Result<(), String> {
 }
 
 pub fn get_count() -> i32 {
-    unsafe { TleGetCount() }
+    stats::timed("TleGetCount", || unsafe { TleGetCount() })
 }
 
 pub fn parse_lines(line_1: &str, line_2: &str) -> Result<ParsedTLE, String> {
@@ -1032,42 +1036,56 @@ pub fn parse_lines(line_1: &str, line_2: &str) -> Result<ParsedTLE, String> {
 
 pub fn get_arrays(sat_key: i64) -> Result<([f64; XA_TLE_SIZE], String), String> {
     let mut xa_tle = [0.0; XA_TLE_SIZE];
-    let mut xs_tle = GetSetString::new();
-    let result = unsafe {
-        TleDataToArray(
-            sat_key,
-            xa_tle.as_mut_ptr() as *mut [f64; XA_TLE_SIZE],
-            xs_tle.pointer(),
-        )
-    };
-    match result {
-        0 => Ok((xa_tle, xs_tle.value())),
-        _ => Err(get_last_error_message()),
-    }
+    with_buffer(|xs_tle| {
+        let result = stats::timed_status("TleDataToArray", || unsafe {
+            TleDataToArray(
+                sat_key,
+                xa_tle.as_mut_ptr() as *mut [f64; XA_TLE_SIZE],
+                xs_tle.pointer(),
+            )
+        });
+        match result {
+            0 => Ok((xa_tle, xs_tle.value())),
+            _ => Err(get_last_error_message()),
+        }
+    })
 }
 
 pub fn get_lines(sat_key: i64) -> Result<(String, String), String> {
-    let mut line_1 = GetSetString::new();
-    let mut line_2 = GetSetString::new();
-    let result = unsafe { TleGetLines(sat_key, line_1.pointer(), line_2.pointer()) };
-    match result {
-        0 => Ok((line_1.value().trim().to_string(), line_2.value().trim().to_string())),
-        _ => Err(get_last_error_message()),
-    }
+    with_lines(sat_key, |line_1, line_2| (line_1.to_string(), line_2.to_string()))
+}
+
+/// Call `f` with borrowed, trimmed views of a loaded TLE's lines.
+///
+/// The lines live in this thread's pooled DLL buffers, so callers that only need to read or re-encode them (e.g.
+/// into Python strings) avoid the intermediate `String` copies made by [`get_lines`].
+pub fn with_lines<R>(sat_key: i64, f: impl FnOnce(&str, &str) -> R) -> Result<R, String> {
+    with_buffers(|[line_1, line_2]: &mut [GetSetString; 2]| {
+        let result = stats::timed_status("TleGetLines", || unsafe {
+            TleGetLines(sat_key, line_1.pointer(), line_2.pointer())
+        });
+        match result {
+            0 => Ok(f(line_1.as_str().trim(), line_2.as_str().trim())),
+            _ => Err(get_last_error_message()),
+        }
+    })
 }
 
 pub fn get_keys(order: i32) -> Vec<i64> {
     let count = get_count() as usize;
     let mut keys = vec![0_i64; count];
-    unsafe {
+    stats::timed("TleGetLoaded", || unsafe {
         TleGetLoaded(order, keys.as_mut_ptr());
-    }
+    });
     keys
 }
 
 pub fn load_arrays(xa_tle: [f64; XA_TLE_SIZE], xs_tle: &str) -> Result<i64, String> {
-    let mut c_xs_tle: GetSetString = xs_tle.into();
-    let key = unsafe { TleAddSatFrArray(&xa_tle, c_xs_tle.pointer()) };
+    let key = with_str(xs_tle, |c_xs_tle| {
+        stats::timed("TleAddSatFrArray", || unsafe {
+            TleAddSatFrArray(&xa_tle, c_xs_tle.pointer())
+        })
+    });
     if key > 0 {
         Ok(key)
     } else {
@@ -1076,37 +1094,45 @@ pub fn load_arrays(xa_tle: [f64; XA_TLE_SIZE], xs_tle: &str) -> Result<i64, Stri
 }
 
 pub fn load_lines(line_1: &str, line_2: &str) -> i64 {
-    unsafe {
-        let mut c_line_1: GetSetString = line_1.into();
-        let mut c_line_2: GetSetString = line_2.into();
-        TleAddSatFrLines(c_line_1.pointer(), c_line_2.pointer())
-    }
+    with_buffers(|[c_line_1, c_line_2]: &mut [GetSetString; 2]| {
+        c_line_1.assign(line_1);
+        c_line_2.assign(line_2);
+        stats::timed("TleAddSatFrLines", || unsafe {
+            TleAddSatFrLines(c_line_1.pointer(), c_line_2.pointer())
+        })
+    })
 }
 
 pub fn arrays_to_lines(xa_tle: [f64; XA_TLE_SIZE], xs_tle: &str) -> Result<(String, String), String> {
-    let mut c_line_1 = GetSetString::new();
-    let mut c_line_2 = GetSetString::new();
-    let mut c_xs_tle: GetSetString = xs_tle.into();
-    unsafe { TleGPArrayToLines(&xa_tle, c_xs_tle.pointer(), c_line_1.pointer(), c_line_2.pointer()) };
-
-    Ok((c_line_1.value().trim().to_string(), c_line_2.value().trim().to_string()))
+    with_buffers(|[c_line_1, c_line_2, c_xs_tle]: &mut [GetSetString; 3]| {
+        c_xs_tle.assign(xs_tle);
+        stats::timed("TleGPArrayToLines", || unsafe {
+            TleGPArrayToLines(&xa_tle, c_xs_tle.pointer(), c_line_1.pointer(), c_line_2.pointer())
+        });
+        Ok((
+            c_line_1.as_str().trim().to_string(),
+            c_line_2.as_str().trim().to_string(),
+        ))
+    })
 }
 
 pub fn get_check_sums(line_1: &str, line_2: &str) -> Result<(i32, i32), String> {
     let mut chk_sum_1: i32 = 0;
     let mut chk_sum_2: i32 = 0;
     let mut err_code: i32 = 0;
-    let mut c_line_1: GetSetString = line_1.into();
-    let mut c_line_2: GetSetString = line_2.into();
-    unsafe {
-        GetCheckSums(
-            c_line_1.pointer(),
-            c_line_2.pointer(),
-            &mut chk_sum_1,
-            &mut chk_sum_2,
-            &mut err_code,
-        )
-    };
+    with_buffers(|[c_line_1, c_line_2]: &mut [GetSetString; 2]| {
+        c_line_1.assign(line_1);
+        c_line_2.assign(line_2);
+        stats::timed("GetCheckSums", || unsafe {
+            GetCheckSums(
+                c_line_1.pointer(),
+                c_line_2.pointer(),
+                &mut chk_sum_1,
+                &mut chk_sum_2,
+                &mut err_code,
+            )
+        });
+    });
     if err_code == 0 {
         Ok((chk_sum_1, chk_sum_2))
     } else {
@@ -22,7 +22,38 @@ Example:
 
 from __future__ import annotations
 
-from typing import Optional
+from datetime import datetime
+from typing import Any, Literal, Optional, Sequence, Union
+
+import numpy as np
+from numpy.typing import ArrayLike, NDArray
+
+# ds50 UTC floats or a float64 array, datetime objects (naive values are UTC) or a numpy.datetime64 array of any unit.
+Epochs = Union[Sequence[float], Sequence[datetime], NDArray[np.float64], NDArray[np.datetime64]]
+# A single ds50 UTC float, datetime or numpy.datetime64 scalar.  Batch and window arguments accept these forms;
+# per-state functions (e.g. get_lla, convert_frame) keep plain float ds50 UTC epochs.
+Epoch = Union[float, datetime, Any]
+
+def warmup() -> None:
+    """Load timing constants, the JPL ephemeris and the SGP4 license now instead of on first use.
+
+    Raises RuntimeError if a bundled asset cannot be loaded.
+    """
+
+def stats() -> dict[str, Any]:
+    """Return per-function DLL call counts, error counts and latency histograms recorded since the last reset."""
+
+def reset_stats() -> None:
+    """Discard all recorded DLL call statistics."""
+
+def enable_stats(enabled: bool = True) -> None:
+    """Turn DLL call instrumentation on or off (off by default, or on when SAAL_STATS is set)."""
+
+def stats_enabled() -> bool:
+    """Return whether DLL calls are currently being recorded."""
+
+def export_stats(format: Literal["json", "prometheus"] = "json") -> str:
+    """Return the recorded statistics as a JSON document or in the Prometheus text format."""
 
 class MainInterface:
     """Access DllMain settings, messages, and key modes."""
@@ -70,7 +101,7 @@ class MainInterface:
         ...
 
     def initialize_time_constants(self) -> None:
-        """Load time constants from the configured asset directory, if present."""
+        """Load time constants from the configured asset directory, if present; raises RuntimeError if loading fails."""
         ...
 
     @property
@@ -213,6 +244,16 @@ class AstroInterface:
     """Astronomical conversion utilities."""
 
     XF_CONV_SGP42SGP: int
+    COV_TEME_TO_UVW: int
+    COV_UVW_TO_TEME: int
+    COV_EQNX_TO_UVW: int
+    COV_UVW_TO_EQNX: int
+    COV_TEME_TO_EFG: int
+    COV_EFG_TO_TEME: int
+    FRAME_J2000: int
+    FRAME_TEME: int
+    FRAME_EFG: int
+    FRAME_ECR: int
 
     def __init__(self) -> None: ...
     @property
@@ -231,6 +272,24 @@ class AstroInterface:
     def osculating_to_mean(self, osc: list[float]) -> list[float]: ...
     def position_velocity_to_equinoctial(self, posvel: list[float]) -> list[float]: ...
     def position_velocity_mu_to_equinoctial(self, posvel: list[float], mu: float) -> list[float]: ...
+    def keplerian_to_cartesian_batch(self, keps: ArrayLike) -> tuple[NDArray[np.float64], NDArray[np.bool_]]:
+        """Convert (N, 6) rows; failed rows are NaN and flagged in the (N,) mask."""
+    def cartesian_to_keplerian_batch(
+        self, posvels: ArrayLike, mu: Optional[ArrayLike] = None
+    ) -> tuple[NDArray[np.float64], NDArray[np.bool_]]: ...
+    def position_velocity_to_equinoctial_batch(
+        self, posvels: ArrayLike, mu: Optional[ArrayLike] = None
+    ) -> tuple[NDArray[np.float64], NDArray[np.bool_]]: ...
+    def keplerian_to_equinoctial_batch(self, keps: ArrayLike) -> tuple[NDArray[np.float64], NDArray[np.bool_]]: ...
+    def equinoctial_to_keplerian_batch(self, eqnxs: ArrayLike) -> tuple[NDArray[np.float64], NDArray[np.bool_]]: ...
+    def osculating_to_mean_batch(self, oscs: ArrayLike) -> tuple[NDArray[np.float64], NDArray[np.bool_]]: ...
+    def kozai_to_brouwer_batch(
+        self, eccentricities: ArrayLike, inclinations: ArrayLike, mean_motions: ArrayLike
+    ) -> tuple[NDArray[np.float64], NDArray[np.bool_]]: ...
+    def brouwer_to_kozai_batch(
+        self, eccentricities: ArrayLike, inclinations: ArrayLike, mean_motions: ArrayLike
+    ) -> tuple[NDArray[np.float64], NDArray[np.bool_]]: ...
+    def mean_motion_to_sma_batch(self, mean_motions: ArrayLike) -> tuple[NDArray[np.float64], NDArray[np.bool_]]: ...
     def set_jpl_ephemeris_file_path(self, file_path: str) -> None: ...
     def j2000_to_teme(self, ds50_utc: float, j2000_posvel: list[float]) -> list[float]: ...
     def j2000_to_efg(self, ds50_utc: float, j2000_posvel: list[float]) -> list[float]: ...
@@ -250,16 +309,131 @@ class AstroInterface:
     def topo_teme_to_meme(self, yr_of_equinox: int, ds50_utc: float, ra: float, dec: float) -> tuple[float, float]: ...
     def covariance_equinoctial_to_uvw(self, teme_posvel: list[float], cov_eqnx: list[list[float]]) -> list[list[float]]: ...
     def covariance_uvw_to_teme(self, teme_posvel: list[float], cov_uvw: list[list[float]]) -> list[list[float]]: ...
+    def covariance_teme_to_uvw(self, teme_posvel: list[float], cov_teme: list[list[float]]) -> list[list[float]]: ...
+    def covariance_uvw_to_equinoctial(self, teme_posvel: list[float], cov_uvw: list[list[float]]) -> list[list[float]]: ...
+    def covariance_teme_to_efg(self, ds50_utc: float, cov_teme: list[list[float]]) -> list[list[float]]: ...
+    def covariance_efg_to_teme(self, ds50_utc: float, cov_efg: list[list[float]]) -> list[list[float]]: ...
+    def covariance_teme_to_equinoctial(self, teme_posvel: list[float], cov_teme: list[list[float]]) -> list[list[float]]: ...
+    def propagate_covariance(
+        self, rms: float, consider: float, state_array: list[float], cov: list[list[float]]
+    ) -> list[list[float]]: ...
+    def matrix_to_lta21(self, matrix: list[list[float]]) -> list[float]: ...
+    def lta21_to_matrix(self, lta21: list[float]) -> list[list[float]]: ...
+    def transform_covariances(
+        self,
+        transform: int,
+        covs: ArrayLike,
+        teme_posvels: Optional[ArrayLike] = None,
+        ds50_utcs: Optional[Epochs] = None,
+    ) -> NDArray[np.float64]:
+        """Apply a COV_* transform to (N, 6, 6) matrices, with (N, 6) TEME states or epochs as the transform needs."""
+    def transform_covariances_lta21(
+        self,
+        transform: int,
+        lta21s: ArrayLike,
+        teme_posvels: Optional[ArrayLike] = None,
+        ds50_utcs: Optional[Epochs] = None,
+    ) -> NDArray[np.float64]:
+        """Apply a COV_* transform to (N, 21) lower-triangle rows."""
+    def covariance_teme_to_equinoctial_batch(self, teme_posvels: ArrayLike, covs: ArrayLike) -> NDArray[np.float64]:
+        """Convert (N, 9, 9) TEME covariances to equinoctial."""
+    def propagate_covariances(
+        self, rms: float, consider: float, state_arrays: ArrayLike, covs: ArrayLike
+    ) -> NDArray[np.float64]:
+        """Propagate (N, 9, 9) covariances with (N, 54) state transition arrays to (N, 6, 6)."""
     def gst_ra_dec_to_az_el(self, gst: float, lla: list[float], ra: float, dec: float) -> list[float]: ...
     def time_ra_dec_to_az_el(self, ds50_utc: float, lla: list[float], ra: float, dec: float) -> list[float]: ...
+    def time_az_el_to_ra_dec(self, ds50_utc: float, lla: list[float], az: float, el: float) -> list[float]: ...
+    def get_annual_aberration(self, ds50_utc: float, ra: float, dec: float) -> tuple[float, float]: ...
+    def get_diurnal_aberration(
+        self, ds50_utc: float, sensor_teme_pos: list[float], ra: float, dec: float
+    ) -> tuple[float, float]: ...
+    def topo_meme_to_teme_batch(
+        self, yr_of_equinox: int, ds50_utcs: Epochs, ras: ArrayLike, decs: ArrayLike
+    ) -> tuple[NDArray[np.float64], NDArray[np.float64]]: ...
+    def topo_teme_to_meme_batch(
+        self, yr_of_equinox: int, ds50_utcs: Epochs, ras: ArrayLike, decs: ArrayLike
+    ) -> tuple[NDArray[np.float64], NDArray[np.float64]]: ...
+    def ra_dec_to_az_el_batch(
+        self,
+        ds50_utcs: Epochs,
+        lla: list[float],
+        ras: ArrayLike,
+        decs: ArrayLike,
+        yr_of_equinox: Optional[int] = None,
+        aberration: bool = False,
+    ) -> tuple[NDArray[np.float64], NDArray[np.float64]]: ...
+    def az_el_to_ra_dec_batch(
+        self,
+        ds50_utcs: Epochs,
+        lla: list[float],
+        azs: ArrayLike,
+        els: ArrayLike,
+        yr_of_equinox: Optional[int] = None,
+        aberration: bool = False,
+    ) -> tuple[NDArray[np.float64], NDArray[np.float64]]: ...
     def horizon_to_teme(self, lst: float, lat: float, sensor_teme: list[float], xa_rae: list[float]) -> list[float]: ...
     def gst_teme_to_lla(self, gst: float, teme_pos: list[float]) -> list[float]: ...
     def time_teme_to_lla(self, ds50_utc: float, teme_pos: list[float]) -> list[float]: ...
     def efg_to_lla(self, efg_pos: list[float]) -> list[float]: ...
     def teme_to_topo(self, lst: float, lat: float, sen_teme_pos: list[float], sat_teme_posvel: list[float]) -> list[float]: ...
     def get_jpl_sun_and_moon_position(self, ds50utc: float) -> tuple[list[float], list[float]]: ...
+    def load_sun_moon_cache(
+        self, start_ds50_utc: Epoch, stop_ds50_utc: Epoch, segment_days: float = 1.0, background: bool = False
+    ) -> Optional[SunMoonCacheLoad]: ...
+    def get_cached_sun_and_moon_position(self, ds50_utc: float) -> tuple[list[float], list[float]]: ...
+    def get_cached_sun_and_moon_positions(self, ds50_utcs: Epochs) -> list[tuple[list[float], list[float]]]: ...
+    def get_sun_moon_cache_stats(self) -> Optional[tuple[int, int]]: ...
+    def clear_sun_moon_cache(self) -> None: ...
     def point_is_sunlit(self, ds50_tt: float, teme_pos: list[float]) -> bool: ...
     def get_earth_obstruction_angles(self, sat_teme_pos: list[float], sensor_teme_pos: list[float]) -> tuple[float, float, float]: ...
+    def get_earth_obstruction_angles_batch(
+        self, sensor_teme_positions: ArrayLike, sat_teme_positions: ArrayLike
+    ) -> NDArray[np.float64]:
+        """(M, N, 3) obstruction angles of N (N, 3) satellite positions from M (M, 3) sensor positions."""
+    def get_line_of_sight_matrix(
+        self,
+        observer_teme_positions: ArrayLike,
+        target_teme_positions: ArrayLike,
+        grazing_height_km: float = 0.0,
+    ) -> NDArray[np.bool_]:
+        """(M, N) line-of-sight mask; the endpoints are not tested against the grazing height."""
+    def convert_frame(self, from_frame: int, to_frame: int, ds50_utc: float, posvel: list[float]) -> list[float]: ...
+    def convert_frames(
+        self,
+        from_frame: int,
+        to_frame: int,
+        ds50_utcs: Epochs,
+        posvels: ArrayLike,
+        out: Optional[NDArray[np.float64]] = None,
+    ) -> NDArray[np.float64]:
+        """Convert (N, 6) states with one shared or N epochs; `out` (which may be `posvels`) receives the result."""
+    def get_frame_rotation(self, from_frame: int, to_frame: int, ds50_utc: float) -> list[list[float]]: ...
+    def clear_rotation_cache(self) -> None: ...
+
+class SunMoonCacheLoad:
+    """A sun/moon cache build running on a background thread."""
+
+    @property
+    def done(self) -> bool: ...
+    @property
+    def error(self) -> Optional[str]: ...
+    def wait(self) -> None:
+        """Block until the cache is installed; raises RuntimeError if the build failed or was cleared."""
+
+class FramePlan:
+    """Frame rotations precomputed for a set of epochs."""
+
+    def __init__(self, from_frame: int, to_frame: int, ds50_utcs: Epochs) -> None: ...
+    @property
+    def from_frame(self) -> int: ...
+    @property
+    def to_frame(self) -> int: ...
+    @property
+    def epochs(self) -> list[float]: ...
+    @property
+    def rotations(self) -> list[list[list[float]]]: ...
+    def apply(self, posvels: list[list[float]]) -> list[list[float]]: ...
 
 class EnvironmentInterface:
     """Access Earth constants and fundamental catalog settings."""
@@ -532,6 +706,73 @@ class EnvironmentInterface:
         """Set the geopotential model index."""
         ...
 
+    @property
+    def earth_constants(self) -> EarthConstants:
+        """Frozen snapshot of the Earth constants, refreshed only when the environment changes."""
+        ...
+
+    @property
+    def earth_constants_version(self) -> int:
+        """Counter that increases every time the geopotential model, catalog or environment file changes."""
+        ...
+
+    def profile(
+        self, geopotential_model: Optional[int] = None, fundamental_catalog: Optional[int] = None
+    ) -> EnvironmentProfile:
+        """Return a context manager that switches the geopotential model and/or catalog and restores them on exit.
+
+        Example:
+            ```python
+            from saal import EnvironmentInterface
+
+            env = EnvironmentInterface()
+            with env.profile(geopotential_model=84):
+                print(env.geopotential_model)
+            print(env.geopotential_model)
+            ```
+
+            Output:
+            ```bash
+            84
+            72
+            ```
+        """
+        ...
+
+class EarthConstants:
+    """Immutable Earth constants for one geopotential model and fundamental catalog."""
+
+    @property
+    def version(self) -> int: ...
+    @property
+    def geopotential_model(self) -> int: ...
+    @property
+    def fundamental_catalog(self) -> int: ...
+    @property
+    def radius(self) -> float: ...
+    @property
+    def mu(self) -> float: ...
+    @property
+    def flattening(self) -> float: ...
+    @property
+    def j2(self) -> float: ...
+    @property
+    def j3(self) -> float: ...
+    @property
+    def j4(self) -> float: ...
+    @property
+    def j5(self) -> float: ...
+    @property
+    def rotation_rate(self) -> float: ...
+    @property
+    def rotation_acceleration(self) -> float: ...
+
+class EnvironmentProfile:
+    """Context manager returned by EnvironmentInterface.profile."""
+
+    def __enter__(self) -> EnvironmentProfile: ...
+    def __exit__(self, exc_type: Any, exc_value: Any, traceback: Any) -> bool: ...
+
 class TimeInterface:
     """Time conversion utilities and time constants access.
 
@@ -712,9 +953,24 @@ class TimeInterface:
         """
         ...
 
+    def get_greenwich_angles(
+        self, ds50_utcs: Epochs, catalog: Optional[int] = None, cache: bool = False
+    ) -> list[float]:
+        """Compute UTC to UT1 and Greenwich right ascension (radians) for a ds50 UTC grid in one pass.
+
+        `catalog` selects EnvironmentInterface.XF_FKMOD_4 or XF_FKMOD_5; None uses the current catalog.
+        With `cache`, the angles come from the shared table for the same grid and catalog (see
+        GreenwichTable.cached); the returned list is still a copy.
+        """
+        ...
+
+    def clear_greenwich_cache(self) -> None:
+        """Drop cached Greenwich angle tables."""
+        ...
+
     @property
     def constants_loaded(self) -> bool:
-        """Return whether timing constants are loaded."""
+        """Return whether timing constants are loaded, without loading the bundled ones."""
         ...
 
     def time_constants_loaded(self) -> bool:
@@ -739,6 +995,164 @@ class TimeInterface:
         """Clear loaded timing constants."""
         ...
 
+    def ds50_to_dtg20_batch(self, ds50_utcs: Epochs) -> NDArray[np.str_]:
+        """Format ds50 UTC values as a fixed-width DTG20 str array natively; values match ds50_to_dtg20."""
+        ...
+
+    def ds50_to_dtg19_batch(self, ds50_utcs: Epochs) -> NDArray[np.str_]:
+        """Format ds50 UTC values as a fixed-width DTG19 str array natively; values match ds50_to_dtg19."""
+        ...
+
+    def ds50_to_dtg17_batch(self, ds50_utcs: Epochs) -> NDArray[np.str_]:
+        """Format ds50 UTC values as a fixed-width DTG17 str array natively; values match ds50_to_dtg17."""
+        ...
+
+    def ds50_to_dtg15_batch(self, ds50_utcs: Epochs) -> NDArray[np.str_]:
+        """Format ds50 UTC values as a fixed-width DTG15 str array natively; values match ds50_to_dtg15."""
+        ...
+
+    def dtg_to_ds50_batch(self, dtgs: Union[Sequence[str], NDArray[np.str_]]) -> NDArray[np.float64]:
+        """Parse DTG15/17/19/20 strings to ds50 UTC, falling back to the DLL for other layouts."""
+        ...
+
+    def datetime_to_ds50(self, value: datetime) -> float:
+        """Convert a datetime to ds50 UTC; naive values are taken as UTC."""
+        ...
+
+    def ds50_to_datetime(self, ds50_utc: float) -> datetime:
+        """Convert ds50 UTC to a timezone-aware UTC datetime, rounded to the microsecond."""
+        ...
+
+    def to_ds50_utc(self, epochs: Epochs) -> NDArray[np.float64]:
+        """Convert floats, datetimes or a numpy.datetime64 array to ds50 UTC."""
+        ...
+
+    def to_ds50_tai(self, epochs: Epochs) -> NDArray[np.float64]:
+        """Convert floats, datetimes or a numpy.datetime64 array to ds50 TAI using the loaded leap seconds."""
+        ...
+
+    def ds50_utc_to_datetime64(self, ds50_utcs: ArrayLike, unit: str = "ns") -> NDArray[np.datetime64]:
+        """Convert ds50 UTC values to a numpy.datetime64 array; NaN becomes NaT."""
+        ...
+
+    def ds50_tai_to_datetime64(self, ds50_tais: ArrayLike, unit: str = "ns") -> NDArray[np.datetime64]:
+        """Convert ds50 TAI values to a UTC numpy.datetime64 array using the loaded leap seconds."""
+        ...
+
+    def get_constants_span(self) -> tuple[int, float, float]:
+        """Return the loaded record count and the first and last ds50 UTC they cover."""
+        ...
+
+    def get_constants_record(self, ds50_utc: float) -> Optional[list[float]]:
+        """Return [tai_minus_utc, ut1_minus_utc, ut1_rate, polar_x, polar_y] in effect at ds50 UTC, if any."""
+        ...
+
+    def utc_to_tai_batch(self, ds50_utcs: Epochs) -> NDArray[np.float64]:
+        """Convert many ds50 UTC values to ds50 TAI in one native loop."""
+        ...
+
+    def tai_to_utc_batch(self, ds50_tais: ArrayLike) -> NDArray[np.float64]:
+        """Convert many ds50 TAI values to ds50 UTC in one native loop."""
+        ...
+
+    def utc_to_ut1_batch(self, ds50_utcs: Epochs) -> NDArray[np.float64]:
+        """Convert many ds50 UTC values to ds50 UT1 in one native loop."""
+        ...
+
+    def utc_to_tt_batch(self, ds50_utcs: Epochs) -> NDArray[np.float64]:
+        """Convert many ds50 UTC values to ds50 TT in one native loop."""
+        ...
+
+    def tai_to_ut1_batch(self, ds50_tais: ArrayLike) -> NDArray[np.float64]:
+        """Convert many ds50 TAI values to ds50 UT1 in one native loop."""
+        ...
+
+    def year_doy_to_ds50_batch(self, years: ArrayLike, doys: ArrayLike) -> NDArray[np.float64]:
+        """Convert year and day-of-year columns to ds50 UTC."""
+        ...
+
+    def ds50_to_year_doy_batch(self, ds50_utcs: Epochs) -> tuple[NDArray[np.int32], NDArray[np.float64]]:
+        """Convert ds50 UTC values to (years, days-of-year) columns."""
+        ...
+
+    def ds50_to_ymd_components_batch(
+        self, ds50_utcs: Epochs
+    ) -> tuple[
+        NDArray[np.int32],
+        NDArray[np.int32],
+        NDArray[np.int32],
+        NDArray[np.int32],
+        NDArray[np.int32],
+        NDArray[np.float64],
+    ]:
+        """Convert ds50 UTC values to (years, months, days, hours, minutes, seconds) columns."""
+        ...
+
+    def ymd_components_to_ds50_batch(
+        self,
+        years: ArrayLike,
+        months: ArrayLike,
+        days: ArrayLike,
+        hours: ArrayLike,
+        minutes: ArrayLike,
+        seconds: ArrayLike,
+    ) -> NDArray[np.float64]:
+        """Convert UTC date/time component columns to ds50 UTC."""
+        ...
+
+class TimingTable:
+    """Immutable in-memory snapshot of the loaded timing constants.
+
+    Conversions use binary search over daily samples instead of DLL calls.
+    """
+
+    @staticmethod
+    def snapshot() -> Optional[TimingTable]:
+        """Return the shared snapshot, or None when no timing constants are loaded."""
+        ...
+
+    def __len__(self) -> int: ...
+    @property
+    def span(self) -> tuple[float, float]: ...
+    def utc_to_tai(self, ds50_utcs: list[float]) -> list[float]: ...
+    def tai_to_utc(self, ds50_tais: list[float]) -> list[float]: ...
+    def utc_to_ut1(self, ds50_utcs: list[float]) -> list[float]: ...
+    def utc_to_tt(self, ds50_utcs: list[float]) -> list[float]: ...
+    def tai_to_ut1(self, ds50_tais: list[float]) -> list[float]: ...
+
+class GreenwichTable:
+    """Shared UT1 and Greenwich angle (radians) table for one ds50 UTC grid and FK catalog.
+
+    Tables are cached per grid and catalog and reused by network topo and observation simulation
+    until timing constants change.
+    """
+
+    @staticmethod
+    def cached(ds50_utcs: Epochs, catalog: Optional[int] = None) -> GreenwichTable:
+        """Return the cached table for the grid, building it on first use."""
+        ...
+
+    def __len__(self) -> int: ...
+    @property
+    def catalog(self) -> int: ...
+    @property
+    def ds50_utcs(self) -> list[float]: ...
+    @property
+    def ds50_ut1s(self) -> list[float]: ...
+    @property
+    def angles(self) -> list[float]: ...
+    def is_shared_with(self, other: GreenwichTable) -> bool:
+        """Return whether both objects refer to the same cached table."""
+        ...
+
+class SaalError(RuntimeError):
+    """Error reported by a SAAL DLL."""
+
+    code: int
+
+class PropagationError(SaalError):
+    """SGP4 propagation failure carrying a ``GP_ERR_*`` (or other DLL) code."""
+
 class SGP4Interface:
     """Access SGP4 propagation helpers."""
 
@@ -774,16 +1188,34 @@ class SGP4Interface:
     def get_ephemeris(
         self,
         sat_key: int,
-        start: float,
-        stop: float,
+        start: Epoch,
+        stop: Epoch,
         step: float,
         frame: int,
     ) -> list[float]: ...
+    def get_ground_track(
+        self,
+        sat_key: int,
+        start: Epoch,
+        stop: Epoch,
+        step: float,
+        split_antimeridian: bool = False,
+        tolerance_deg: Optional[float] = None,
+    ) -> list[list[float]]: ...
+    def get_ground_tracks(
+        self,
+        sat_keys: list[int],
+        start: Epoch,
+        stop: Epoch,
+        step: float,
+        split_antimeridian: bool = False,
+        tolerance_deg: Optional[float] = None,
+    ) -> list[list[list[float]]]: ...
     def array_to_ephemeris(
         self,
         xa_tle: list[float],
-        start: float,
-        stop: float,
+        start: Epoch,
+        stop: Epoch,
         step: float,
         frame: int,
     ) -> list[float]: ...
@@ -800,7 +1232,11 @@ class SGP4Interface:
         posvel: list[float],
         b_star: Optional[float],
     ) -> list[float]: ...
-    def get_positions_velocities(self, sat_keys: list[int], ds50_utc: float) -> list[float]: ...
+    def get_positions_velocities(self, sat_keys: list[int], ds50_utc: Epoch) -> list[float]: ...
+    def get_positions_velocities_with_status(
+        self, sat_keys: list[int], ds50_utc: Epoch, messages: bool = False
+    ) -> tuple[list[list[float]], list[int], Optional[list[Optional[str]]]]: ...
+    def get_error_description(self, code: int) -> Optional[str]: ...
     def set_license_directory(self, lic_file_path: str) -> None: ...
     def get_license_directory(self) -> str: ...
     def reepoch_tle(self, sat_key: int, re_epoch_ds50_utc: float) -> tuple[str, str]: ...
@@ -848,6 +1284,22 @@ class ObsInterface:
     DUPOBSKEY: int
     OBS_KEYMODE_NODUP: int
     OBS_KEYMODE_DMA: int
+    XA_OBSTATE_SATNUM: int
+    XA_OBSTATE_SENNUM: int
+    XA_OBSTATE_DS50UTC: int
+    XA_OBSTATE_POSX: int
+    XA_OBSTATE_POSY: int
+    XA_OBSTATE_POSZ: int
+    XA_OBSTATE_VELX: int
+    XA_OBSTATE_VELY: int
+    XA_OBSTATE_VELZ: int
+    XA_OBSTATE_LAT: int
+    XA_OBSTATE_LON: int
+    XA_OBSTATE_HGHT: int
+    XA_OBSTATE_POSE: int
+    XA_OBSTATE_POSF: int
+    XA_OBSTATE_POSG: int
+    XA_OBSTATE_SIZE: int
 
     def __init__(self) -> None: ...
 
@@ -861,6 +1313,56 @@ class ObsInterface:
     def remove(self, obs_key: int) -> None: ...
     def get_count(self) -> int: ...
     def get_keys(self, order: int) -> list[int]: ...
+    def b3_to_csv(self, card: str) -> str: ...
+    def csv_to_b3(self, csv: str, new_sat_num: int = 0) -> str: ...
+    def tty_to_csv(self, card_1: str, card_2: str) -> str: ...
+    def csv_to_tty(self, csv: str, new_sat_num: int = 0) -> tuple[str, str]: ...
+    def array_to_lines(self, xa_obs: list[float], obs_form: int) -> tuple[str, str]: ...
+    def convert_file(
+        self,
+        input_path: str,
+        output_path: str,
+        input_form: int,
+        output_form: int,
+        new_sat_num: int = 0,
+    ) -> int: ...
+    def arrays_to_file(self, xa_obs: list[list[float]], obs_form: int, output_path: str) -> int: ...
+    def get_array(self, obs_key: int) -> list[float]: ...
+    def get_state(self, obs_key: int, range_km: float) -> list[float]: ...
+    def array_to_state(self, xa_obs: list[float]) -> list[float]: ...
+    def get_states(
+        self, obs_keys: list[int], range_km: float, columns: Optional[list[int]] = None
+    ) -> NDArray[np.float64]:
+        """XA_OBSTATE rows as an (N, XA_OBSTATE_SIZE) array, or (N, len(columns)) when columns are selected."""
+    def arrays_to_states(
+        self,
+        xa_obs: ArrayLike,
+        range_km: Optional[float] = None,
+        columns: Optional[list[int]] = None,
+    ) -> NDArray[np.float64]:
+        """XA_OBSTATE rows for an (N, XA_OBS_SIZE) array, shaped as in get_states."""
+    def build_tracks(self, obs_keys: list[int], max_gap_seconds: float) -> tuple[list[int], list[int]]: ...
+    def simulate(
+        self,
+        sat_keys: list[int],
+        sen_keys: list[int],
+        start_ds50_utc: float,
+        end_ds50_utc: float,
+        step_seconds: float,
+        observation_type: int,
+        seed: Optional[int] = None,
+    ) -> list[ParsedB3]: ...
+    def simulate_to_file(
+        self,
+        sat_keys: list[int],
+        sen_keys: list[int],
+        start_ds50_utc: float,
+        end_ds50_utc: float,
+        step_seconds: float,
+        observation_type: int,
+        output_path: str,
+        seed: Optional[int] = None,
+    ) -> int: ...
 
 class ParsedSensor:
     """Parsed representation of a sensor."""
@@ -916,6 +1418,25 @@ class SensorInterface:
     def load_file(self, file_path: str) -> None: ...
     def clear(self) -> None: ...
     def get_arrays(self, sen_key: int) -> tuple[list[float], str]: ...
+    def get_network_topo(
+        self,
+        sen_keys: list[int],
+        sat_teme_posvels: ArrayLike,
+        ds50_utc: float,
+        visibility: bool = False,
+    ) -> tuple[NDArray[np.float64], Optional[NDArray[np.bool_]]]:
+        """(M, N, XA_TOPO_SIZE) components of N (N, 6) TEME states from M sensors, with an (M, N) visibility mask."""
+    def get_network_topo_from_keys(
+        self,
+        sen_keys: list[int],
+        sat_keys: list[int],
+        ds50_utcs: Epochs,
+        visibility: bool = False,
+    ) -> tuple[NDArray[np.float64], Optional[NDArray[np.bool_]]]:
+        """(T, M, N, XA_TOPO_SIZE) components over T epochs, with a (T, M, N) visibility mask.
+
+        Satellites that fail to propagate at an epoch get NaN components and are not visible there.
+        """
 
 class ParsedTLE:
     """Parsed representation of a TLE."""
@@ -974,13 +1495,27 @@ class TLEInterface:
 __all__ = [
     "MainInterface",
     "AstroInterface",
+    "FramePlan",
+    "SunMoonCacheLoad",
     "EnvironmentInterface",
+    "EarthConstants",
+    "EnvironmentProfile",
     "SGP4Interface",
     "ObsInterface",
     "ParsedB3",
     "SensorInterface",
     "ParsedSensor",
     "TimeInterface",
+    "TimingTable",
+    "GreenwichTable",
     "TLEInterface",
     "ParsedTLE",
+    "SaalError",
+    "PropagationError",
+    "warmup",
+    "stats",
+    "reset_stats",
+    "enable_stats",
+    "stats_enabled",
+    "export_stats",
 ]
@@ -1,8 +1,11 @@
 import math
+import subprocess
+import sys
 
+import numpy as np
 import pytest
 
-from pysaal import AstroInterface, MainInterface, TimeInterface
+from pysaal import AstroInterface, FramePlan, MainInterface, TimeInterface
 
 
 def hour_min_sec_to_deg(hr: float, mn: float, sc: float) -> float:
@@ -238,3 +241,165 @@ def test_point_is_sunlit() -> None:
     assert interface.point_is_sunlit(ds50_tt, pt) is False
     pt[1] = -2025.7763831
     assert interface.point_is_sunlit(ds50_tt, pt) is True
+
+
+def test_ra_dec_batches() -> None:
+    interface = AstroInterface()
+    lla = [33.81724, 106.66031, 1.510]
+    epochs = [25000.25, 25000.5, 25000.75]
+    ras = [10.0, 120.0, 250.0]
+    decs = [5.0, -20.0, 45.0]
+    azs, els = interface.ra_dec_to_az_el_batch(epochs, lla, ras, decs)
+    ras_back, decs_back = interface.az_el_to_ra_dec_batch(epochs, lla, azs, els)
+    meme_ras, meme_decs = interface.topo_teme_to_meme_batch(2, epochs[:1], ras, decs)
+
+    assert azs.shape == els.shape == (3,)
+    assert [azs[1], els[1]] == pytest.approx(interface.time_ra_dec_to_az_el(epochs[1], lla, ras[1], decs[1]))
+    assert (meme_ras[2], meme_decs[2]) == pytest.approx(interface.topo_teme_to_meme(2, epochs[0], ras[2], decs[2]))
+    assert ras_back == pytest.approx(ras, abs=1.0e-7)
+    assert decs_back == pytest.approx(decs, abs=1.0e-7)
+    with pytest.raises(RuntimeError):
+        interface.ra_dec_to_az_el_batch(epochs[:2], lla, ras, decs)
+
+
+def test_line_of_sight_matrix() -> None:
+    interface = AstroInterface()
+    sensors = [[7000.0, 0.0, 0.0], [0.0, 42164.0, 0.0]]
+    sats = [[-7000.0, 0.0, 0.0], [7000.0, 1000.0, 0.0], [0.0, 7200.0, 300.0]]
+    angles = interface.get_earth_obstruction_angles_batch(sensors, sats)
+
+    assert angles.shape == (2, 3, 3)
+    assert angles[1, 2] == pytest.approx(list(interface.get_earth_obstruction_angles(sats[2], sensors[1])))
+    visible = interface.get_line_of_sight_matrix(sensors, sats)
+    assert visible.dtype == np.bool_
+    assert visible.tolist() == [[False, True, False], [True, True, True]]
+    assert interface.get_line_of_sight_matrix(sensors[1:], sats[:1], 1000.0).tolist() == [[False]]
+    polar_site = [[0.0, 0.0, 6356.75]]
+    assert interface.get_line_of_sight_matrix(polar_site, [[0.0, 0.0, 7000.0]]).tolist() == [[True]]
+
+
+def test_convert_frames() -> None:
+    interface = AstroInterface()
+    teme = np.array([[7000.0, 0.0, 0.0, 0.0, 7.5, 0.0], [0.0, 42164.0, 0.0, -3.07, 0.0, 0.0]])
+    epochs = [25000.25, 25000.75]
+    ecr = interface.convert_frames(AstroInterface.FRAME_TEME, AstroInterface.FRAME_ECR, epochs, teme)
+    back = interface.convert_frames(AstroInterface.FRAME_ECR, AstroInterface.FRAME_TEME, epochs, ecr)
+    single = interface.convert_frame(AstroInterface.FRAME_TEME, AstroInterface.FRAME_ECR, epochs[1], list(teme[1]))
+
+    assert ecr.shape == (2, 6)
+    assert ecr[1] == pytest.approx(single)
+    assert np.allclose(back, teme, rtol=0.0, atol=1.0e-7)
+    with pytest.raises(RuntimeError):
+        interface.convert_frames(AstroInterface.FRAME_TEME, AstroInterface.FRAME_ECR, [25000.0] * 3, teme)
+
+
+def test_convert_frames_out() -> None:
+    interface = AstroInterface()
+    teme = np.array([[7000.0, 0.0, 0.0, 0.0, 7.5, 0.0], [0.0, 42164.0, 0.0, -3.07, 0.0, 0.0]])
+    expected = interface.convert_frames(AstroInterface.FRAME_TEME, AstroInterface.FRAME_J2000, [25000.5], teme.tolist())
+    out = np.empty_like(teme)
+    result = interface.convert_frames(AstroInterface.FRAME_TEME, AstroInterface.FRAME_J2000, [25000.5], teme, out=out)
+    in_place = teme.copy()
+    interface.convert_frames(AstroInterface.FRAME_TEME, AstroInterface.FRAME_J2000, [25000.5], in_place, out=in_place)
+
+    assert result is out
+    assert np.array_equal(out, expected)
+    assert np.array_equal(in_place, expected)
+    with pytest.raises(ValueError):
+        interface.convert_frames(AstroInterface.FRAME_TEME, AstroInterface.FRAME_J2000, [25000.5], teme, out=out[:1])
+
+
+def test_frame_plan() -> None:
+    interface = AstroInterface()
+    states = [[7000.0, 0.0, 1200.0, 0.0, 7.5, 0.4], [0.0, 42164.0, 0.0, -3.07, 0.0, 0.0]]
+    plan = FramePlan(AstroInterface.FRAME_TEME, AstroInterface.FRAME_J2000, [26000.5])
+    converted = plan.apply(states)
+    direct = interface.convert_frames(AstroInterface.FRAME_TEME, AstroInterface.FRAME_J2000, [26000.5], states)
+    interface.clear_rotation_cache()
+
+    assert plan.epochs == [26000.5]
+    assert len(plan.rotations) == 1
+    for row, expected in zip(converted, direct):
+        assert row == pytest.approx(expected, abs=1.0e-9)
+
+
+def test_element_batches() -> None:
+    interface = AstroInterface()
+    keps = [[26558.482, 0.006257, 54.935, 234.764, 165.472, 217.612], [math.nan, 0.0, 0.0, 0.0, 0.0, 0.0]]
+    cart, failed = interface.keplerian_to_cartesian_batch(keps)
+    back, back_failed = interface.cartesian_to_keplerian_batch(cart[:1], mu=[398600.8])
+    sma, _ = interface.mean_motion_to_sma_batch([2.0, 15.5])
+
+    assert cart.shape == (2, 6)
+    assert failed.tolist() == [False, True]
+    assert np.isnan(cart[1]).all()
+    assert cart[0] == pytest.approx(interface.keplerian_to_cartesian(keps[0]))
+    assert back_failed.tolist() == [False]
+    assert back[0] == pytest.approx(keps[0], abs=1.0e-6)
+    assert sma[1] == pytest.approx(interface.mean_motion_to_sma(15.5))
+    with pytest.raises(RuntimeError):
+        interface.cartesian_to_keplerian_batch(cart, mu=[1.0, 2.0, 3.0])
+
+
+def test_transform_covariances() -> None:
+    interface = AstroInterface()
+    state = [7000.0, 0.0, 0.0, 0.0, 7.5, 0.0]
+    cov = [[float(i + 1) if i == j else 0.05 for j in range(6)] for i in range(6)]
+    uvw = interface.transform_covariances(AstroInterface.COV_TEME_TO_UVW, [cov, cov], teme_posvels=[state, state])
+    teme = interface.transform_covariances(AstroInterface.COV_UVW_TO_TEME, uvw, teme_posvels=[state, state])
+    packed = interface.transform_covariances_lta21(
+        AstroInterface.COV_TEME_TO_EFG, [interface.matrix_to_lta21(cov)], ds50_utcs=[25000.5]
+    )
+
+    assert uvw.shape == (2, 6, 6)
+    assert packed.shape == (1, 21)
+    assert np.array_equal(uvw[0], interface.covariance_teme_to_uvw(state, cov))
+    assert np.allclose(teme[1], cov, rtol=0.0, atol=1.0e-9)
+    efg = interface.covariance_teme_to_efg(25000.5, cov)
+    assert np.allclose(interface.lta21_to_matrix(list(packed[0])), efg, rtol=0.0, atol=1.0e-9)
+    with pytest.raises(RuntimeError):
+        interface.transform_covariances(AstroInterface.COV_TEME_TO_UVW, [cov, cov], teme_posvels=[state])
+
+
+def test_sun_moon_cache() -> None:
+    interface = AstroInterface()
+    start = 27000.0
+    direct = interface.get_jpl_sun_and_moon_position(start + 0.4)
+    assert interface.load_sun_moon_cache(start, start + 2.0) is None
+    cached = interface.get_cached_sun_and_moon_positions([start + 0.4, start - 1.0])
+    stats = interface.get_sun_moon_cache_stats()
+    interface.clear_sun_moon_cache()
+
+    assert cached[0][0] == pytest.approx(direct[0], abs=1.0e-3)
+    assert cached[0][1] == pytest.approx(direct[1], abs=1.0e-3)
+    assert stats == (1, 1)
+    assert interface.get_sun_moon_cache_stats() is None
+
+    load = interface.load_sun_moon_cache(start, start + 2.0, background=True)
+    assert load is not None
+    load.wait()
+    assert load.done
+    assert load.error is None
+    assert interface.get_sun_moon_cache_stats() is not None
+    interface.clear_sun_moon_cache()
+
+
+COLD_START_SCRIPT = """
+from pysaal import AstroInterface
+
+interface = AstroInterface()
+interface.load_sun_moon_cache(27000.0, 27002.0)
+print(interface.get_sun_moon_cache_stats() is not None)
+interface.clear_sun_moon_cache()
+load = interface.load_sun_moon_cache(27000.0, 27002.0, background=True)
+load.wait()
+print(interface.get_sun_moon_cache_stats() is not None)
+"""
+
+
+def test_sun_moon_cache_cold_start() -> None:
+    # A fresh interpreter, so the cache build is the first thing to touch the JPL ephemeris.
+    result = subprocess.run([sys.executable, "-c", COLD_START_SCRIPT], capture_output=True, text=True, check=False)
+
+    assert result.returncode == 0, result.stderr
+    assert result.stdout.split() == ["True", "True"]
@@ -74,3 +74,22 @@ def test_load_from_file_missing() -> None:
         missing_path.unlink()
     with pytest.raises(RuntimeError):
         EnvironmentInterface(str(missing_path))
+
+
+def test_earth_constants_snapshot() -> None:
+    interface = EnvironmentInterface()
+    constants = interface.earth_constants
+
+    assert constants.radius == interface.earth_radius
+    assert constants.j2 == 0.001082616
+    assert constants.version == interface.earth_constants_version
+    with interface.profile(geopotential_model=84, fundamental_catalog=EnvironmentInterface.XF_FKMOD_4):
+        assert interface.geopotential_model == 84
+        assert interface.fundamental_catalog == 4
+        assert interface.earth_constants.version > constants.version
+    assert interface.geopotential_model == constants.geopotential_model
+    assert interface.fundamental_catalog == constants.fundamental_catalog
+    assert interface.earth_radius == constants.radius
+    with pytest.raises(RuntimeError):
+        with interface.profile(geopotential_model=101):
+            pass
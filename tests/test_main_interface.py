@@ -1,9 +1,11 @@
 from pathlib import Path
+import json
 import tempfile
 
 import pytest
 
-from pysaal import MainInterface
+import pysaal
+from pysaal import MainInterface, SGP4Interface, TimeInterface
 
 
 def test_get_dll_info() -> None:
@@ -36,3 +38,35 @@ def test_load_from_file_missing() -> None:
         missing_path.unlink()
     with pytest.raises(RuntimeError):
         MainInterface(str(missing_path))
+
+
+def test_warmup() -> None:
+    pysaal.warmup()
+    pysaal.warmup()
+
+    assert TimeInterface().constants_loaded
+    assert SGP4Interface().get_license_directory() != ""
+
+
+def test_stats() -> None:
+    pysaal.enable_stats()
+    pysaal.reset_stats()
+    try:
+        TimeInterface().year_doy_to_ds50(2024, 1.0)
+        assert pysaal.stats_enabled()
+        snapshot = pysaal.stats()
+        entry = snapshot["functions"]["YrDaysToUTC"]
+        assert entry["calls"] >= 1
+        assert entry["errors"] == 0
+        assert sum(entry["buckets"]) == entry["calls"]
+        assert len(entry["buckets"]) == len(snapshot["bucket_bounds_ns"]) + 1
+
+        exported = json.loads(pysaal.export_stats())
+        assert exported["functions"]["YrDaysToUTC"]["calls"] == entry["calls"]
+        assert 'saal_ffi_calls_total{function="YrDaysToUTC"}' in pysaal.export_stats("prometheus")
+        with pytest.raises(ValueError):
+            pysaal.export_stats("xml")
+    finally:
+        pysaal.enable_stats(False)
+        pysaal.reset_stats()
+    assert pysaal.stats()["functions"] == {}
@@ -1,9 +1,14 @@
 import threading
+from pathlib import Path
 from typing import Generator
 
 import pytest
 
-from pysaal import MainInterface, ObsInterface, ParsedB3, TimeInterface, SensorInterface
+from pysaal import MainInterface, ObsInterface, ParsedB3, SGP4Interface, SensorInterface, TimeInterface, TLEInterface
+
+XP_LINE_1 = "1 33333U 15058A   25363.54791667 +.00012345  10000-1  20000-1 4  900"
+XP_LINE_2 = "2 33333  30.0000  40.0000 0005000  60.0000  70.0000  8.2345678012345"
+EPOCH = 27757.54791667
 
 LOCK = threading.RLock()
 
@@ -124,3 +129,94 @@ def test_load_file() -> None:
         if ob.position:
             with_pos += 1
     assert with_pos == 5053
+
+
+def test_b3_csv_round_trip(obs: ObsInterface) -> None:
+    b3_card = "U0001151013352142520112J85202 2220398         -01207880+03706326+05814970 9 4  10001100011"
+    csv = obs.b3_to_csv(b3_card)
+    original = obs.parse_line(b3_card)
+    round_trip = obs.parse_line(obs.csv_to_b3(csv))
+
+    assert round_trip.norad_id == original.norad_id
+    assert round_trip.sensor_number == original.sensor_number
+    assert round_trip.epoch == pytest.approx(original.epoch, rel=0.0, abs=1.0e-7)
+    assert round_trip.declination == pytest.approx(original.declination, rel=0.0, abs=1.0e-7)
+    assert round_trip.right_ascension == pytest.approx(original.right_ascension, rel=0.0, abs=1.0e-7)
+
+
+def test_convert_file(obs: ObsInterface, tmp_path: Path) -> None:
+    csv_path = tmp_path / "obs.csv"
+    b3_path = tmp_path / "obs.b3"
+    csv_count = obs.convert_file(
+        "tests/data/test-b3-obs.txt", str(csv_path), ObsInterface.OBSFORM_B3, ObsInterface.OBSFORM_CSV
+    )
+    b3_count = obs.convert_file(str(csv_path), str(b3_path), ObsInterface.OBSFORM_CSV, ObsInterface.OBSFORM_B3)
+
+    assert csv_count == 5053
+    assert b3_count == 5053
+    first = obs.parse_line(b3_path.read_text().splitlines()[0])
+    assert first.norad_id == 1328
+    assert first.sensor_number == 354
+
+
+def test_get_states_columns(obs: ObsInterface) -> None:
+    sensor_interface = SensorInterface()
+    sensor_interface.load_file("tests/data/sensors.dat")
+    obs.load_file("tests/data/test-b3-obs.txt")
+    keys = obs.get_keys(MainInterface.IDX_ORDER_READ)[:10]
+    columns = [ObsInterface.XA_OBSTATE_SATNUM, ObsInterface.XA_OBSTATE_DS50UTC, ObsInterface.XA_OBSTATE_POSX]
+    states = obs.get_states(keys, 40000.0, columns)
+    full_states = obs.arrays_to_states([obs.get_array(key) for key in keys], 40000.0)
+    parsed = [obs.parse_key(key) for key in keys]
+    obs.clear()
+    sensor_interface.clear()
+
+    assert states.shape == (len(keys), len(columns))
+    assert full_states.shape == (len(keys), ObsInterface.XA_OBSTATE_SIZE)
+    for row, full_row, ob in zip(states, full_states, parsed):
+        assert int(row[0]) == ob.norad_id
+        assert row[1] == pytest.approx(ob.epoch, rel=0.0, abs=1.0e-9)
+        assert row[2] == pytest.approx(full_row[ObsInterface.XA_OBSTATE_POSX], rel=0.0, abs=1.0e-6)
+
+
+def test_build_tracks(obs: ObsInterface) -> None:
+    obs.load_file("tests/data/test-b3-obs.txt")
+    keys = obs.get_keys(MainInterface.IDX_ORDER_READ)
+    sorted_keys, offsets = obs.build_tracks(keys, 600.0)
+    first_track = [obs.get_array(key) for key in sorted_keys[offsets[0] : offsets[1]]]
+    obs.clear()
+
+    assert sorted(sorted_keys) == sorted(keys)
+    assert offsets[0] == 0
+    assert offsets[-1] == len(keys)
+    assert all(a < b for a, b in zip(offsets, offsets[1:]))
+    for first, second in zip(first_track, first_track[1:]):
+        assert first[1] == second[1]
+        assert first[2] == second[2]
+
+
+def test_simulate_is_repeatable(obs: ObsInterface, tmp_path: Path) -> None:
+    tle = TLEInterface()
+    sgp4 = SGP4Interface()
+    sensor_interface = SensorInterface()
+    sensor_interface.load_file("tests/data/sensors.dat")
+    sensor_interface.prune_missing_locations()
+    sat_key = tle.load_lines(XP_LINE_1, XP_LINE_2)
+    sgp4.load(sat_key)
+    sen_keys = sensor_interface.get_keys(MainInterface.IDX_ORDER_READ)
+    noisy = obs.simulate([sat_key], sen_keys, EPOCH, EPOCH + 0.25, 60.0, 2, 42)
+    repeated = obs.simulate([sat_key], sen_keys, EPOCH, EPOCH + 0.25, 60.0, 2, 42)
+    output_path = tmp_path / "simulated.b3"
+    written = obs.simulate_to_file([sat_key], sen_keys, EPOCH, EPOCH + 0.25, 60.0, 2, str(output_path), 42)
+    sgp4.clear()
+    tle.clear()
+    sensor_interface.clear()
+
+    assert noisy
+    assert written == len(noisy)
+    assert len(output_path.read_text().splitlines()) == written
+    assert [ob.get_line() for ob in noisy] == [ob.get_line() for ob in repeated]
+    for ob in noisy:
+        assert ob.norad_id == 33333
+        assert EPOCH <= ob.epoch <= EPOCH + 0.25
+        assert ob.track_position in (3, 4, 5)
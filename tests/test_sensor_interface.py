@@ -34,6 +34,7 @@ XA_SEN_GEN_ELBIAS = 117
 XA_SEN_GEN_RGBIAS = 118
 XA_SEN_GEN_RRBIAS = 119
 XA_SEN_GEN_TIMEBIAS = 120
+XA_TOPO_SIZE = 10
 
 
 @pytest.fixture()
@@ -61,7 +62,7 @@ def test_load_file(sensor: SensorInterface) -> None:
 def test_get_arrays(sensor: SensorInterface) -> None:
     sensor.load_card(SENSOR_CARD)
     sensor.load_card(NOISE_CARD)
-    keys = sensor.get_keys(2)
+    keys = sensor.get_keys(MainInterface.IDX_ORDER_READ)
     key = keys[-1]
     xa_sen, xs_sen = sensor.get_arrays(key)
     sensor.clear()
@@ -91,3 +92,28 @@ def test_get_arrays(sensor: SensorInterface) -> None:
     assert xa_sen[XA_SEN_GEN_RRBIAS] == pytest.approx(0.0)
     assert xa_sen[XA_SEN_GEN_TIMEBIAS] == pytest.approx(0.0)
     assert xs_sen.strip() == "U33SOCORRO CAM1"
+
+
+def test_parse_key_after_remove(sensor: SensorInterface) -> None:
+    sensor.load_card(SENSOR_CARD)
+    sensor.load_card(NOISE_CARD)
+    key = sensor.get_keys(MainInterface.IDX_ORDER_READ)[-1]
+    parsed = sensor.parse_key(key)
+    assert parsed.number == 211
+    sensor.remove(key)
+    with pytest.raises(RuntimeError):
+        sensor.parse_key(key)
+
+
+def test_get_network_topo(sensor: SensorInterface) -> None:
+    sensor.load_card(SENSOR_CARD)
+    sensor.load_card(NOISE_CARD)
+    key = sensor.get_keys(MainInterface.IDX_ORDER_READ)[-1]
+    states = [[7000.0, 0.0, 0.0, 0.0, 7.5, 0.0], [0.0, 42164.0, 0.0, -3.07, 0.0, 0.0]]
+    topo, visible = sensor.get_network_topo([key, key], states, 27757.5, visibility=True)
+    single, no_mask = sensor.get_network_topo([key], states[1:], 27757.5)
+    assert topo.shape == (2, 2, XA_TOPO_SIZE)
+    assert visible is not None and visible.shape == (2, 2)
+    assert no_mask is None
+    assert single[0, 0] == pytest.approx(topo[0, 1])
+    assert topo[1] == pytest.approx(topo[0])
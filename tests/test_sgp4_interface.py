@@ -1,9 +1,11 @@
+import math
 import threading
+from datetime import datetime, timedelta, timezone
 from typing import Generator
 
 import pytest
 
-from pysaal import MainInterface, SGP4Interface, TLEInterface
+from pysaal import MainInterface, PropagationError, SaalError, SGP4Interface, TimeInterface, TLEInterface
 
 SGP4_LINE_1 = "1 22222C 15058A   25363.54791667 +.00012345  10000-1  20000-1 2 0900"
 SGP4_LINE_2 = "2 22222  30.0000  40.0000 0005000  60.0000  70.0000  1.2345678012345"
@@ -248,3 +250,68 @@ def test_get_positions_velocities(tle: TLEInterface, sgp4: SGP4Interface) -> Non
     assert all_posvel[9] == pytest.approx(xp_vel[0], abs=1.0e-9)
     assert all_posvel[10] == pytest.approx(xp_vel[1], abs=1.0e-9)
     assert all_posvel[11] == pytest.approx(xp_vel[2], abs=1.0e-9)
+
+
+def test_datetime_epochs(tle: TLEInterface, sgp4: SGP4Interface) -> None:
+    xp_key = tle.load_lines(XP_LINE_1, XP_LINE_2)
+    sgp4.load(xp_key)
+    start = datetime(2025, 12, 30, tzinfo=timezone.utc)
+    ds50_start = TimeInterface().ymd_components_to_ds50(2025, 12, 30, 0, 0, 0.0)
+    stop = start + timedelta(hours=2)
+
+    by_float = sgp4.get_ephemeris(xp_key, ds50_start, ds50_start + 2.0 / 24.0, 10.0, 1)
+    by_datetime = sgp4.get_ephemeris(xp_key, start, stop, 10.0, 1)
+
+    assert by_datetime == pytest.approx(by_float, abs=1.0e-6)
+    assert sgp4.get_positions_velocities([xp_key], start) == pytest.approx(
+        sgp4.get_positions_velocities([xp_key], ds50_start), abs=1.0e-6
+    )
+    track_by_float = sgp4.get_ground_track(xp_key, ds50_start, ds50_start + 2.0 / 24.0, 10.0)
+    track_by_datetime = sgp4.get_ground_track(xp_key, start, stop, 10.0)
+    assert len(track_by_datetime) == len(track_by_float)
+    for row, expected in zip(track_by_datetime, track_by_float):
+        assert row == pytest.approx(expected, abs=1.0e-6)
+
+
+def test_get_ground_tracks(tle: TLEInterface, sgp4: SGP4Interface) -> None:
+    xp_key = tle.load_lines(XP_LINE_1, XP_LINE_2)
+    sgp4.load(xp_key)
+
+    full = sgp4.get_ground_tracks([xp_key, xp_key], EPOCH, EPOCH + 1.0, 1.0)[0]
+    split = sgp4.get_ground_track(xp_key, EPOCH, EPOCH + 1.0, 1.0, split_antimeridian=True)
+    coarse = sgp4.get_ground_track(xp_key, EPOCH, EPOCH + 1.0, 1.0, split_antimeridian=True, tolerance_deg=0.5)
+
+    assert full[0][0] == pytest.approx(EPOCH)
+    assert all(-180.0 <= row[2] < 180.0 for row in full)
+    breaks = sum(1 for row in split if math.isnan(row[0]))
+    assert breaks > 0
+    assert len(split) == len(full) + 3 * breaks
+    assert len(coarse) < len(split)
+
+
+def test_get_positions_velocities_with_status(tle: TLEInterface, sgp4: SGP4Interface) -> None:
+    sgp4_key = tle.load_lines(SGP4_LINE_1, SGP4_LINE_2)
+    xp_key = tle.load_lines(XP_LINE_1, XP_LINE_2)
+    sgp4.load(sgp4_key)
+    sgp4.load(xp_key)
+    missing_key = 12345
+
+    posvels, codes, messages = sgp4.get_positions_velocities_with_status([sgp4_key, missing_key, xp_key], EPOCH)
+    _, _, verbose = sgp4.get_positions_velocities_with_status([sgp4_key, missing_key, xp_key], EPOCH, messages=True)
+    with pytest.raises(PropagationError) as excinfo:
+        sgp4.get_position_velocity(missing_key, EPOCH)
+
+    assert codes[0] == SGP4Interface.GP_ERR_NONE
+    assert codes[1] != SGP4Interface.GP_ERR_NONE
+    assert codes[2] == SGP4Interface.GP_ERR_NONE
+    assert messages is None
+    assert posvels[0][0] == pytest.approx(SGP4_X, abs=1.0e-9)
+    assert all(math.isnan(v) for v in posvels[1])
+    assert posvels[2][0] == pytest.approx(XP_X, abs=1.0e-9)
+    assert verbose is not None
+    assert verbose[0] is None and verbose[1] and verbose[2] is None
+    assert isinstance(excinfo.value, SaalError)
+    assert isinstance(excinfo.value, RuntimeError)
+    assert excinfo.value.code == codes[1]
+    assert sgp4.get_error_description(SGP4Interface.GP_ERR_ATOOLARGE) == "A is too large"
+    assert sgp4.get_error_description(-99) is None
@@ -1,6 +1,10 @@
+import math
+from datetime import datetime, timedelta, timezone
+
+import numpy as np
 import pytest
 
-from pysaal import MainInterface, TimeInterface
+from pysaal import EnvironmentInterface, GreenwichTable, MainInterface, TimeInterface, TimingTable
 
 
 def test_get_dll_info() -> None:
@@ -34,6 +38,49 @@ def test_ds50_to_dtg_formats() -> None:
     assert ti.ds50_to_dtg15(2192.0) == "56001000000.000"
 
 
+def test_dtg_batches() -> None:
+    ti = TimeInterface()
+    utcs = [2192.0, 8431.5, 18262.123456789, 25000.999]
+    dtg20s = ti.ds50_to_dtg20_batch(utcs)
+
+    assert dtg20s.dtype == np.dtype("<U20")
+    assert dtg20s.tolist() == [ti.ds50_to_dtg20(utc) for utc in utcs]
+    assert ti.ds50_to_dtg19_batch(utcs).tolist() == [ti.ds50_to_dtg19(utc) for utc in utcs]
+    assert ti.ds50_to_dtg17_batch(utcs).tolist() == [ti.ds50_to_dtg17(utc) for utc in utcs]
+    assert ti.ds50_to_dtg15_batch(utcs).tolist() == [ti.ds50_to_dtg15(utc) for utc in utcs]
+    assert ti.dtg_to_ds50_batch(dtg20s) == pytest.approx([ti.dtg_to_ds50(dtg) for dtg in dtg20s], abs=1.0e-10)
+
+
+def test_datetime_conversions() -> None:
+    ti = TimeInterface()
+    value = datetime(1973, 1, 30, 12, 0, 0, 250000, tzinfo=timezone.utc)
+    offset = datetime(1973, 1, 30, 14, 0, 0, 250000, tzinfo=timezone(timedelta(hours=2)))
+    ds50 = ti.datetime_to_ds50(value)
+
+    assert ds50 == pytest.approx(8431.5 + 0.25 / 86400.0, abs=1.0e-11)
+    assert ti.datetime_to_ds50(value.replace(tzinfo=None)) == ds50
+    assert ti.datetime_to_ds50(offset) == pytest.approx(ds50, abs=1.0e-11)
+    assert ti.ds50_to_datetime(ds50) == value
+    assert ti.to_ds50_utc([value, offset]) == pytest.approx([ds50, ds50], abs=1.0e-11)
+    assert ti.to_ds50_tai([value]) == pytest.approx([ti.utc_to_tai(ds50)], abs=1.0e-11)
+    assert ti.utc_to_tai_batch([value]).tolist() == ti.to_ds50_tai([value]).tolist()
+
+
+def test_datetime64_conversions() -> None:
+    ti = TimeInterface()
+    values = np.array(["1973-01-30T12:00:00", "NaT", "2018-06-01T00:00:00.5"], dtype="datetime64[ms]")
+    ds50s = ti.to_ds50_utc(values)
+
+    assert ds50s[0] == pytest.approx(8431.5, abs=1.0e-11)
+    assert math.isnan(ds50s[1])
+    assert ti.to_ds50_utc(values.astype("datetime64[ns]"))[2] == pytest.approx(ds50s[2], abs=1.0e-11)
+    assert np.array_equal(ti.ds50_utc_to_datetime64(ds50s, "ms"), values, equal_nan=True)
+    tais = ti.to_ds50_tai(values[[0, 2]])
+    assert np.array_equal(ti.ds50_tai_to_datetime64(tais, "ms"), values[[0, 2]])
+    assert ti.to_ds50_utc(values[::2]).tolist() == ds50s[::2].tolist()
+    assert ti.to_ds50_utc(values.reshape(3, 1))[2] == ds50s[2]
+
+
 def test_year_doy_conversions() -> None:
     ti = TimeInterface()
     ds50 = ti.year_doy_to_ds50(1956, 1.0)
@@ -44,6 +91,14 @@ def test_year_doy_conversions() -> None:
 
 def test_constants_loaded() -> None:
     ti = TimeInterface()
+    ti.utc_to_tai(25000.0)
+    assert ti.constants_loaded
+
+    ti.clear_constants()
+    cleared = ti.constants_loaded
+    MainInterface().initialize_time_constants()
+
+    assert not cleared
     assert ti.constants_loaded
 
 
@@ -61,6 +116,45 @@ def test_conversions() -> None:
     assert ti.tai_to_ut1(tai) == pytest.approx(ut1, abs=1.0e-10)
 
 
+def test_batch_conversions() -> None:
+    ti = TimeInterface()
+    utcs = [2192.0, 8431.0, 8431.5]
+    tais = ti.utc_to_tai_batch(utcs)
+
+    assert tais[1] == pytest.approx(8431.000138888889, abs=1.0e-10)
+    assert ti.tai_to_utc_batch(tais) == pytest.approx(utcs, abs=1.0e-10)
+    assert tais.dtype == np.float64
+    assert ti.utc_to_ut1_batch(utcs).tolist() == [ti.utc_to_ut1(utc) for utc in utcs]
+    assert ti.utc_to_tt_batch(utcs).tolist() == [ti.utc_to_tt(utc) for utc in utcs]
+    assert ti.tai_to_ut1_batch(tais).tolist() == [ti.tai_to_ut1(tai) for tai in tais.tolist()]
+
+    years, doys = ti.ds50_to_year_doy_batch(utcs)
+    assert ti.year_doy_to_ds50_batch(years, doys) == pytest.approx(utcs, abs=1.0e-9)
+    comps = ti.ds50_to_ymd_components_batch(utcs)
+    assert [column[2] for column in comps] == pytest.approx([1973, 1, 30, 12, 0, 0.0])
+    assert comps[0].dtype == np.int32
+    assert ti.ymd_components_to_ds50_batch(*comps) == pytest.approx(utcs, abs=1.0e-9)
+    with pytest.raises(RuntimeError):
+        ti.year_doy_to_ds50_batch(years, doys[:1])
+
+
+def test_timing_table() -> None:
+    ti = TimeInterface()
+    table = TimingTable.snapshot()
+    assert table is not None
+    start, stop = table.span
+    utcs = [start + (stop - start) * i / 50.0 for i in range(51)]
+    tais = ti.utc_to_tai_batch(utcs)
+
+    assert len(table) > 0
+    assert ti.get_constants_span()[0] > 0
+    assert ti.get_constants_record(utcs[25]) is not None
+    assert table.utc_to_tai(utcs) == pytest.approx(tais, abs=1.0e-11)
+    assert table.tai_to_utc(tais) == pytest.approx(utcs, abs=1.0e-11)
+    assert table.utc_to_ut1(utcs) == pytest.approx(ti.utc_to_ut1_batch(utcs), abs=1.0e-9)
+    assert table.tai_to_ut1(tais) == pytest.approx(ti.tai_to_ut1_batch(tais), abs=1.0e-9)
+
+
 def test_greenwich_angles() -> None:
     ti = TimeInterface()
     utc = ti.ymd_components_to_ds50(1973, 1, 2, 0, 0, 0.0)
@@ -70,3 +164,24 @@ def test_greenwich_angles() -> None:
 
     assert fk4 == pytest.approx(1.7712987335192203, abs=1.0e-7)
     assert fk5 == pytest.approx(1.7713027012394775, abs=1.0e-7)
+
+
+def test_greenwich_angle_grid() -> None:
+    ti = TimeInterface()
+    utcs = [8403.0 + i / 24.0 for i in range(24)]
+    fk4 = ti.get_greenwich_angles(utcs, EnvironmentInterface.XF_FKMOD_4)
+    fk5 = ti.get_greenwich_angles(utcs, EnvironmentInterface.XF_FKMOD_5, cache=True)
+
+    assert fk4[0] == pytest.approx(1.7712987335192203, abs=1.0e-7)
+    assert fk5 == [ti.get_fk5_greenwich_angle(ut1) for ut1 in ti.utc_to_ut1_batch(utcs)]
+    assert ti.get_greenwich_angles(utcs, EnvironmentInterface.XF_FKMOD_5, cache=True) == fk5
+    table = GreenwichTable.cached(utcs, EnvironmentInterface.XF_FKMOD_5)
+    assert len(table) == len(utcs)
+    assert table.catalog == EnvironmentInterface.XF_FKMOD_5
+    assert table.angles == fk5
+    assert table.is_shared_with(GreenwichTable.cached(utcs, EnvironmentInterface.XF_FKMOD_5))
+    assert not table.is_shared_with(GreenwichTable.cached(utcs, EnvironmentInterface.XF_FKMOD_4))
+    ti.clear_greenwich_cache()
+    assert not table.is_shared_with(GreenwichTable.cached(utcs, EnvironmentInterface.XF_FKMOD_5))
+    with pytest.raises(RuntimeError):
+        ti.get_greenwich_angles(utcs, 3)